@@ -0,0 +1,359 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""End-to-end performance regression gate.
+
+Each scenario runs one whole offline path against a fixed registry: a clean
+``run_builder`` build of one ecosystem, or ``ComponentScanner.scan_all_components``
+over a collector source tree. Registries are either the checked-in
+``ecosystem-registry`` or a synthetic one at a multiple of ``SYNTHETIC_BASE``.
+
+Every scenario runs in a fresh process, so its peak RSS is its own, with the
+parsed-YAML cache disabled so every run parses the same bytes. The recorded
+metrics are compared with a stored baseline; a metric regresses when it grows by
+more than its tolerance (a fraction of the baseline value). Wall time also gets
+``WALL_SLACK_SECONDS`` of absolute slack so sub-second scenarios do not fail on
+scheduling noise. Baselines are machine-specific: refresh them with
+``--update-baseline`` on the machine that runs the gate.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from collector_watcher.component_scanner import ComponentScanner
+from explorer_db_builder.main import run_builder
+from explorer_db_builder.profiling import peak_rss_bytes
+from watcher_common.yaml_cache import CACHE_DIR_ENV_VAR
+
+from build_benchmarks.micro import Scale
+from build_benchmarks.synthetic_registry import (
+    generate_collector_registry,
+    generate_collector_repo,
+    generate_configuration_registry,
+    generate_javaagent_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+BASELINE_FORMAT = 1
+
+REGISTRY_DIR = "ecosystem-registry"
+OUTPUT_DIR = "ecosystem-explorer/public/data"
+
+BUILD_ECOSYSTEMS = ("javaagent", "configuration", "collector")
+SCAN = "scan"
+
+CHECKED_IN = "checked-in"
+
+# The synthetic registry at factor 1. Factors scale the items per version; the
+# number of versions stays fixed so runs stay short.
+SYNTHETIC_BASE = Scale(
+    javaagent_versions=10,
+    instrumentations=100,
+    collector_versions=5,
+    components=200,
+    schema_types=100,
+)
+SYNTHETIC_FACTORS = (1, 4)
+
+# Largest allowed growth over the baseline, as a fraction of the baseline value.
+DEFAULT_TOLERANCES = {
+    "wall_seconds": 0.25,
+    "peak_rss_bytes": 0.15,
+    "files_written": 0.0,
+    "output_bytes": 0.02,
+    "components": 0.0,
+}
+
+WALL_SLACK_SECONDS = 0.5
+
+
+class Scenario:
+    """One end-to-end run: an ecosystem build (or a scan) against one registry."""
+
+    def __init__(self, ecosystem: str, registry: str, factor: int = 1) -> None:
+        """
+        Args:
+            ecosystem: A run_builder ecosystem, or "scan" for ComponentScanner
+            registry: "checked-in" or "synthetic"
+            factor: Multiple of SYNTHETIC_BASE for synthetic registries
+        """
+        self.ecosystem = ecosystem
+        self.registry = registry
+        self.factor = factor
+
+    @property
+    def registry_name(self) -> str:
+        return CHECKED_IN if self.registry == CHECKED_IN else f"synthetic-x{self.factor}"
+
+    @property
+    def name(self) -> str:
+        return f"{self.ecosystem}/{self.registry_name}"
+
+    def scale(self) -> Scale:
+        return Scale(
+            javaagent_versions=SYNTHETIC_BASE.javaagent_versions,
+            instrumentations=SYNTHETIC_BASE.instrumentations * self.factor,
+            collector_versions=SYNTHETIC_BASE.collector_versions,
+            components=SYNTHETIC_BASE.components * self.factor,
+            schema_types=SYNTHETIC_BASE.schema_types * self.factor,
+        )
+
+
+def default_scenarios() -> list[Scenario]:
+    """Every ecosystem against the checked-in registry and each synthetic factor, then the scans."""
+    scenarios = []
+    for ecosystem in BUILD_ECOSYSTEMS:
+        scenarios.append(Scenario(ecosystem, CHECKED_IN))
+        scenarios.extend(Scenario(ecosystem, "synthetic", factor) for factor in SYNTHETIC_FACTORS)
+    scenarios.extend(Scenario(SCAN, "synthetic", factor) for factor in SYNTHETIC_FACTORS)
+    return scenarios
+
+
+def _prepare_registry(scenario: Scenario, workdir: Path, checked_in_registry: Path) -> Path:
+    """Return the registry (or, for scans, the source tree) a scenario reads, generating it once per workdir."""
+    if scenario.registry == CHECKED_IN:
+        return checked_in_registry.resolve()
+
+    scale = scenario.scale()
+    if scenario.ecosystem == SCAN:
+        target = workdir / "registries" / f"collector-repo-{scenario.registry_name}"
+        if not target.exists():
+            generate_collector_repo(target, scale.components)
+        return target
+
+    target = workdir / "registries" / scenario.registry_name
+    if scenario.ecosystem == "javaagent" and not (target / "java" / "javaagent").exists():
+        generate_javaagent_registry(target / "java" / "javaagent", scale.javaagent_versions, scale.instrumentations)
+    elif scenario.ecosystem == "configuration" and not (target / "configuration").exists():
+        generate_configuration_registry(target / "configuration", types=scale.schema_types)
+    elif scenario.ecosystem == "collector" and not (target / "collector").exists():
+        generate_collector_registry(target / "collector", scale.collector_versions, scale.components)
+    return target
+
+
+def process_peak_rss_bytes() -> int:
+    """Peak RSS of this process's own address space.
+
+    Linux folds the parent's high-water mark into ``ru_maxrss`` across fork and
+    exec, so a child spawned by a parent that has generated a large registry
+    would report the parent's peak. ``VmHWM`` is reset by exec; elsewhere fall
+    back to ``ru_maxrss``.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return peak_rss_bytes()
+
+
+def _directory_totals(directory: Path) -> tuple[int, int]:
+    files = 0
+    total_bytes = 0
+    for path in directory.rglob("*"):
+        if path.is_file():
+            files += 1
+            total_bytes += path.stat().st_size
+    return files, total_bytes
+
+
+def _run_in_process(ecosystem: str, source: str, rundir: str) -> dict[str, Any]:
+    """Run one scenario in the current (fresh) process and measure it."""
+    os.environ[CACHE_DIR_ENV_VAR] = ""
+
+    if ecosystem == SCAN:
+        start = time.perf_counter()
+        components = ComponentScanner(source).scan_all_components()
+        wall_seconds = time.perf_counter() - start
+        return {
+            "exit_code": 0,
+            "wall_seconds": wall_seconds,
+            "peak_rss_bytes": process_peak_rss_bytes(),
+            "components": sum(len(found) for found in components.values()),
+        }
+
+    # The builder reads and writes paths relative to the repository root.
+    os.chdir(rundir)
+    os.symlink(source, REGISTRY_DIR, target_is_directory=True)
+    start = time.perf_counter()
+    exit_code = run_builder(clean=True, ecosystem=ecosystem)
+    wall_seconds = time.perf_counter() - start
+    files, output_bytes = _directory_totals(Path(OUTPUT_DIR) / ecosystem)
+    return {
+        "exit_code": exit_code,
+        "wall_seconds": wall_seconds,
+        "peak_rss_bytes": process_peak_rss_bytes(),
+        "files_written": files,
+        "output_bytes": output_bytes,
+    }
+
+
+def run_scenario(scenario: Scenario, workdir: Path, checked_in_registry: Path, repeat: int = 3) -> dict[str, Any]:
+    """Run a scenario repeat times, each in a fresh process, keeping the best of each metric.
+
+    Raises:
+        RuntimeError: If the build fails
+    """
+    source = _prepare_registry(scenario, workdir, checked_in_registry)
+    best: dict[str, Any] = {}
+    for attempt in range(repeat):
+        rundir = workdir / "runs" / scenario.name.replace("/", "-") / str(attempt)
+        shutil.rmtree(rundir, ignore_errors=True)
+        rundir.mkdir(parents=True)
+        # spawn, not fork: a forked child would inherit the parent's peak RSS.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            metrics = executor.submit(_run_in_process, scenario.ecosystem, str(source), str(rundir)).result()
+        shutil.rmtree(rundir, ignore_errors=True)
+        if metrics.pop("exit_code") != 0:
+            raise RuntimeError(f"Scenario {scenario.name} failed")
+        for key, value in metrics.items():
+            best[key] = min(best[key], value) if key in best else value
+    best["wall_seconds"] = round(best["wall_seconds"], 3)
+    logger.info(f"{scenario.name}: {best}")
+    return best
+
+
+def run_scenarios(
+    scenarios: list[Scenario], checked_in_registry: str | Path = REGISTRY_DIR, repeat: int = 3
+) -> dict[str, dict[str, Any]]:
+    """Run every scenario and return ``{scenario name: metrics}``.
+
+    Synthetic registries are generated in a temporary directory shared by the
+    scenarios that use them, and removed afterwards.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="build-benchmarks-e2e-") as workdir:
+        for scenario in scenarios:
+            results[scenario.name] = run_scenario(scenario, Path(workdir), Path(checked_in_registry), repeat)
+    return results
+
+
+def load_baseline(path: str | Path) -> dict[str, Any] | None:
+    """Read a baseline file, or None if there is none.
+
+    Raises:
+        ValueError: If the file is not a baseline this version understands
+    """
+    baseline_path = Path(path)
+    if not baseline_path.exists():
+        return None
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"Unsupported baseline format {baseline.get('format')!r} in {path}")
+    return baseline
+
+
+def write_baseline(
+    path: str | Path, results: dict[str, dict[str, Any]], previous: dict[str, Any] | None = None
+) -> None:
+    """Write results as the new baseline, keeping the previous baseline's tolerances and other scenarios."""
+    scenarios = dict((previous or {}).get("scenarios", {}))
+    scenarios.update(results)
+    baseline = {
+        "format": BASELINE_FORMAT,
+        "tolerances": (previous or {}).get("tolerances", DEFAULT_TOLERANCES),
+        "scenarios": dict(sorted(scenarios.items())),
+    }
+    baseline_path = Path(path)
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+
+class Comparison:
+    """One metric of one scenario, checked against its baseline value."""
+
+    def __init__(self, scenario: str, metric: str, baseline: float | None, current: float, tolerance: float) -> None:
+        self.scenario = scenario
+        self.metric = metric
+        self.baseline = baseline
+        self.current = current
+        self.tolerance = tolerance
+
+    @property
+    def limit(self) -> float | None:
+        if self.baseline is None:
+            return None
+        limit = self.baseline * (1 + self.tolerance)
+        if self.metric == "wall_seconds":
+            limit += WALL_SLACK_SECONDS
+        return limit
+
+    @property
+    def regressed(self) -> bool:
+        return self.limit is not None and self.current > self.limit
+
+    @property
+    def change(self) -> float | None:
+        if not self.baseline:
+            return None
+        return self.current / self.baseline - 1
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, Any], tolerances: dict[str, float] | None = None
+) -> list[Comparison]:
+    """Check every result metric against the baseline.
+
+    Tolerances come from DEFAULT_TOLERANCES, overridden by the baseline file's
+    ``tolerances``, overridden by tolerances. A scenario or metric the baseline
+    does not have is reported with no limit and never regresses.
+    """
+    effective = {**DEFAULT_TOLERANCES, **baseline.get("tolerances", {}), **(tolerances or {})}
+    comparisons = []
+    for scenario, metrics in results.items():
+        expected = baseline.get("scenarios", {}).get(scenario, {})
+        for metric, value in metrics.items():
+            comparisons.append(Comparison(scenario, metric, expected.get(metric), value, effective.get(metric, 0.0)))
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Human-readable table of comparisons."""
+    rows = [("scenario", "metric", "baseline", "current", "change", "limit", "status")]
+    for comparison in comparisons:
+        if comparison.baseline is None:
+            status = "new"
+        else:
+            status = "REGRESSED" if comparison.regressed else "ok"
+        rows.append(
+            (
+                comparison.scenario,
+                comparison.metric,
+                "-" if comparison.baseline is None else f"{comparison.baseline:,}",
+                f"{comparison.current:,}",
+                "-" if comparison.change is None else f"{comparison.change:+.1%}",
+                "-" if comparison.limit is None else f"{comparison.limit:,.3f}".rstrip("0").rstrip("."),
+                status,
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(
+            [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+            + [cell.rjust(width) for cell, width in zip(row[2:6], widths[2:6])]
+            + [row[6]]
+        )
+        for row in rows
+    )
@@ -0,0 +1,326 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""CLI for generating synthetic registries and running the micro-benchmarks."""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+from pathlib import Path
+
+from build_benchmarks.end_to_end import (
+    DEFAULT_TOLERANCES,
+    REGISTRY_DIR,
+    compare,
+    default_scenarios,
+    format_comparisons,
+    load_baseline,
+    run_scenarios,
+    write_baseline,
+)
+from build_benchmarks.micro import BENCHMARKS, RESULT_FORMAT, Scale, format_results, run_benchmarks
+from build_benchmarks.synthetic_registry import (
+    generate_collector_registry,
+    generate_configuration_registry,
+    generate_javaagent_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = "ecosystem-automation/build-benchmarks/baselines/end-to-end.json"
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure logging for the application.
+
+    Args:
+        level: Logging level (default: INFO)
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+
+
+def _add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = Scale()
+    parser.add_argument(
+        "--javaagent-versions",
+        type=int,
+        default=defaults.javaagent_versions,
+        metavar="N",
+        help=f"Javaagent release versions (default: {defaults.javaagent_versions})",
+    )
+    parser.add_argument(
+        "--instrumentations",
+        type=int,
+        default=defaults.instrumentations,
+        metavar="N",
+        help=f"Instrumentations per javaagent version (default: {defaults.instrumentations})",
+    )
+    parser.add_argument(
+        "--collector-versions",
+        type=int,
+        default=defaults.collector_versions,
+        metavar="N",
+        help=f"Collector release versions (default: {defaults.collector_versions})",
+    )
+    parser.add_argument(
+        "--components",
+        type=int,
+        default=defaults.components,
+        metavar="N",
+        help=f"Collector components per version (default: {defaults.components})",
+    )
+    parser.add_argument(
+        "--schema-types",
+        type=int,
+        default=defaults.schema_types,
+        metavar="N",
+        help=f"Object types in the configuration schema (default: {defaults.schema_types})",
+    )
+
+
+def _scale(args: argparse.Namespace) -> Scale:
+    return Scale(
+        javaagent_versions=args.javaagent_versions,
+        instrumentations=args.instrumentations,
+        collector_versions=args.collector_versions,
+        components=args.components,
+        schema_types=args.schema_types,
+    )
+
+
+def generate(output_dir: str, scale: Scale) -> int:
+    """Write synthetic javaagent, configuration and collector registries under output_dir.
+
+    The layout mirrors ``ecosystem-registry`` (``java/javaagent``, ``configuration``,
+    ``collector``). Returns 0 on success, 1 on failure.
+    """
+    root = Path(output_dir)
+    try:
+        javaagent = generate_javaagent_registry(
+            root / "java" / "javaagent", scale.javaagent_versions, scale.instrumentations
+        )
+        logger.info(f"Wrote {len(javaagent)} javaagent versions x {scale.instrumentations} instrumentations")
+        configuration = generate_configuration_registry(root / "configuration", types=scale.schema_types)
+        logger.info(f"Wrote {len(configuration)} configuration schema versions x {scale.schema_types} types")
+        collector = generate_collector_registry(root / "collector", scale.collector_versions, scale.components)
+        logger.info(f"Wrote {len(collector)} collector versions x {scale.components} components")
+    except OSError as e:
+        logger.error(f"Failed to write synthetic registry: {e}")
+        return 1
+    return 0
+
+
+def run_micro(scale: Scale, names: list[str] | None, repeat: int, output: str | None) -> int:
+    """Run the micro-benchmarks, log a results table and optionally write them as JSON.
+
+    Returns 0 on success, 1 if the results could not be written.
+    """
+    results = run_benchmarks(scale, names, repeat)
+    logger.info("")
+    logger.info(format_results(results))
+
+    if output:
+        report = {
+            "format": RESULT_FORMAT,
+            "python": platform.python_version(),
+            "scale": scale.to_dict(),
+            "results": [result.to_dict() for result in results],
+        }
+        try:
+            report_path = Path(output)
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        except OSError as e:
+            logger.error(f"Failed to write benchmark results to {output}: {e}")
+            return 1
+        logger.info(f"Wrote {output}")
+    return 0
+
+
+def run_end_to_end(
+    baseline_path: str,
+    scenario_names: list[str] | None = None,
+    tolerances: dict[str, float] | None = None,
+    update_baseline: bool = False,
+    registry_dir: str = REGISTRY_DIR,
+    repeat: int = 3,
+) -> int:
+    """Run the end-to-end scenarios and compare them with the baseline.
+
+    Returns:
+        0 if nothing regressed (or the baseline was updated), 1 if a metric
+        regressed, a scenario failed or the baseline could not be read or written
+    """
+    scenarios = default_scenarios()
+    if scenario_names:
+        unknown = set(scenario_names) - {scenario.name for scenario in scenarios}
+        if unknown:
+            logger.error(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+            return 1
+        scenarios = [scenario for scenario in scenarios if scenario.name in scenario_names]
+
+    try:
+        baseline = load_baseline(baseline_path)
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to read baseline {baseline_path}: {e}")
+        return 1
+
+    try:
+        results = run_scenarios(scenarios, registry_dir, repeat)
+    except RuntimeError as e:
+        logger.error(str(e))
+        return 1
+
+    if update_baseline:
+        try:
+            write_baseline(baseline_path, results, baseline)
+        except OSError as e:
+            logger.error(f"Failed to write baseline {baseline_path}: {e}")
+            return 1
+        logger.info(f"Updated baseline {baseline_path} with {len(results)} scenarios")
+        return 0
+
+    if baseline is None:
+        logger.error(f"No baseline at {baseline_path}; run with --update-baseline to record one")
+        return 1
+
+    comparisons = compare(results, baseline, tolerances)
+    logger.info("")
+    logger.info(format_comparisons(comparisons))
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        logger.error(f"{len(regressions)} metric(s) regressed beyond tolerance")
+        return 1
+    logger.info("No regressions")
+    return 0
+
+
+def _tolerance(value: str) -> tuple[str, float]:
+    metric, separator, fraction = value.partition("=")
+    if not separator or metric not in DEFAULT_TOLERANCES:
+        raise argparse.ArgumentTypeError(f"expected METRIC=FRACTION with METRIC one of {', '.join(DEFAULT_TOLERANCES)}")
+    try:
+        return metric, float(fraction)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid fraction {fraction!r}") from None
+
+
+def main() -> None:
+    """Main entry point for the CLI."""
+    parser = argparse.ArgumentParser(
+        description="Synthetic registries and micro-benchmarks for the explorer database builder",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="Write synthetic registries to a directory")
+    generate_parser.add_argument("output_dir", metavar="DIR", help="Directory to write the registries under")
+    _add_scale_arguments(generate_parser)
+
+    micro_parser = commands.add_parser("micro", help="Benchmark the builder's hot functions")
+    _add_scale_arguments(micro_parser)
+    micro_parser.add_argument(
+        "--benchmark",
+        action="append",
+        choices=list(BENCHMARKS),
+        default=None,
+        dest="benchmarks",
+        help="Benchmark to run; repeat the flag to run several (default: all)",
+    )
+    micro_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Timed runs per benchmark; the fastest is reported (default: 3)",
+    )
+    micro_parser.add_argument(
+        "--output",
+        default=None,
+        metavar="PATH",
+        help="Write the results as JSON to PATH",
+    )
+
+    e2e_parser = commands.add_parser("e2e", help="End-to-end builds and scans compared with a stored baseline")
+    e2e_parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        metavar="PATH",
+        help=f"Baseline file (default: {DEFAULT_BASELINE})",
+    )
+    e2e_parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in default_scenarios()],
+        default=None,
+        dest="scenarios",
+        help="Scenario to run; repeat the flag to run several (default: all)",
+    )
+    e2e_parser.add_argument(
+        "--tolerance",
+        action="append",
+        type=_tolerance,
+        default=[],
+        metavar="METRIC=FRACTION",
+        help="Override a metric's tolerance, e.g. wall_seconds=0.5 allows 50%% growth",
+    )
+    e2e_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record the results as the new baseline instead of comparing",
+    )
+    e2e_parser.add_argument(
+        "--registry-dir",
+        default=REGISTRY_DIR,
+        metavar="PATH",
+        help=f"Checked-in registry used by the checked-in scenarios (default: {REGISTRY_DIR})",
+    )
+    e2e_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Runs per scenario; the best of each metric is kept (default: 3)",
+    )
+
+    args = parser.parse_args()
+    if getattr(args, "repeat", 1) < 1:
+        parser.error("--repeat must be at least 1")
+
+    configure_logging()
+
+    if args.command == "generate":
+        exit_code = generate(args.output_dir, _scale(args))
+    elif args.command == "micro":
+        exit_code = run_micro(_scale(args), args.benchmarks, args.repeat, args.output)
+    else:
+        exit_code = run_end_to_end(
+            args.baseline,
+            args.scenarios,
+            dict(args.tolerance),
+            args.update_baseline,
+            args.registry_dir,
+            args.repeat,
+        )
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Micro-benchmarks for the builder's hot functions.
+
+Each benchmark prepares its input from the synthetic registry generators, then
+times the function alone: wall time is the best of ``repeat`` runs, and memory is
+the peak of Python allocations made during one further run, traced with
+:mod:`tracemalloc` (so timings are not slowed by tracing). Inputs are built in
+memory rather than read back from YAML, so parsing cost never leaks into a
+function's numbers; only ``remove_orphans``, which walks a store on disk, touches
+the filesystem.
+"""
+
+import gc
+import logging
+import shutil
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from collector_watcher.metadata_parser import MetadataParserV1
+from explorer_db_builder.content_hashing import content_hash
+from explorer_db_builder.database_writer import DatabaseWriter
+from explorer_db_builder.instrumentation_transformer import transform_instrumentation_format
+from explorer_db_builder.metadata_backfiller import backfill_metadata
+from explorer_db_builder.readme_sanitizer import sanitize_readme
+from explorer_db_builder.schema_resolver import SchemaResolver
+from watcher_common.content_hashing import compute_content_hash
+
+from build_benchmarks.synthetic_registry import (
+    JAVAAGENT_FILE_FORMATS,
+    REVISION_INTERVAL,
+    component_counts,
+    javaagent_file_format,
+    javaagent_versions,
+    make_configuration_registry,
+    make_javaagent_inventory,
+    make_raw_component_metadata,
+    make_readme,
+)
+
+logger = logging.getLogger(__name__)
+
+RESULT_FORMAT = 1
+
+
+class Scale:
+    """How large the synthetic inputs are."""
+
+    def __init__(
+        self,
+        javaagent_versions: int = 100,
+        instrumentations: int = 1000,
+        collector_versions: int = 50,
+        components: int = 2000,
+        schema_types: int = 200,
+    ) -> None:
+        """
+        Args:
+            javaagent_versions: Javaagent versions fed to backfill_metadata
+            instrumentations: Instrumentations per javaagent version
+            collector_versions: Collector versions whose metadata is parsed
+            components: Collector components per version
+            schema_types: $defs types in the synthetic configuration schema
+        """
+        self.javaagent_versions = javaagent_versions
+        self.instrumentations = instrumentations
+        self.collector_versions = collector_versions
+        self.components = components
+        self.schema_types = schema_types
+
+    def to_dict(self) -> dict[str, int]:
+        return dict(vars(self))
+
+
+class BenchmarkResult:
+    """Throughput and memory for one benchmarked function."""
+
+    def __init__(self, name: str, items: int, seconds: float, peak_bytes: int, repeat: int) -> None:
+        self.name = name
+        self.items = items
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+        self.repeat = repeat
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "items": self.items,
+            "seconds": round(self.seconds, 6),
+            "items_per_second": round(self.items_per_second, 1),
+            "peak_bytes": self.peak_bytes,
+            "repeat": self.repeat,
+        }
+
+
+def measure(
+    name: str, items: int, setup: Callable[[], Any], run: Callable[[Any], Any], repeat: int = 3
+) -> BenchmarkResult:
+    """Time run(setup()) repeat times, then trace the allocations of one more run.
+
+    setup is called before every run and is never measured, so a benchmark that
+    consumes its input (e.g. deleting files) gets a fresh one each time.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        argument = setup()
+        gc.collect()
+        start = time.perf_counter()
+        run(argument)
+        best = min(best, time.perf_counter() - start)
+
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = BenchmarkResult(name, items, best, peak, repeat)
+    logger.info(f"{name}: {result.items_per_second:,.0f} items/s, peak {peak / (1024 * 1024):.1f} MB")
+    return result
+
+
+def _transform_benchmarks(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    for file_format in JAVAAGENT_FILE_FORMATS:
+        inventory = make_javaagent_inventory(0, scale.instrumentations, file_format)
+        items = len(inventory["libraries"]) + len(inventory["custom"])
+        yield measure(
+            f"transform_instrumentation_format[{file_format}]",
+            items,
+            lambda inventory=inventory: inventory,
+            transform_instrumentation_format,
+            repeat,
+        )
+        if file_format == 0.6:
+            yield measure(
+                f"transform_instrumentation_format[{file_format},shared]",
+                items,
+                lambda inventory=inventory: inventory,
+                lambda data: transform_instrumentation_format(data, share_definitions=True),
+                repeat,
+            )
+
+
+def _backfill_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    versions = javaagent_versions(scale.javaagent_versions)
+    inventories = {
+        version: transform_instrumentation_format(
+            make_javaagent_inventory(index, scale.instrumentations, javaagent_file_format(index, len(versions))),
+            share_definitions=True,
+        )
+        for index, version in enumerate(versions)
+    }
+    # The backfiller copies rather than mutates, so one set of inventories serves every run.
+    yield measure(
+        "backfill_metadata",
+        len(versions) * scale.instrumentations,
+        lambda: inventories,
+        lambda data: backfill_metadata(list(data), data.__getitem__, ("libraries", "custom")),
+        repeat,
+    )
+
+
+def _content_hash_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    libraries = transform_instrumentation_format(make_javaagent_inventory(0, scale.instrumentations, 0.5))["libraries"]
+
+    def run(items: list[dict[str, Any]]) -> None:
+        for item in items:
+            content_hash(item)
+
+    yield measure("content_hash", len(libraries), lambda: libraries, run, repeat)
+
+
+def _sanitize_readme_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    readmes = [
+        make_readme(f"synthetic-library-{index:05d}", index // REVISION_INTERVAL)
+        for index in range(scale.instrumentations)
+    ]
+
+    def run(items: list[str]) -> None:
+        for markdown in items:
+            sanitize_readme(markdown)
+
+    yield measure("sanitize_readme", len(readmes), lambda: readmes, run, repeat)
+
+
+def _schema_resolver_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    registry = make_configuration_registry(scale.schema_types)
+    entry_file = next(iter(registry))
+    yield measure(
+        "SchemaResolver.resolve",
+        scale.schema_types,
+        lambda: registry,
+        lambda data: SchemaResolver(data).resolve(entry_file),
+        repeat,
+    )
+
+
+def _metadata_parser_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    raw_metadata = []
+    for version_index in range(scale.collector_versions):
+        index = 0
+        for component_type, count in component_counts(scale.components).items():
+            for _ in range(count):
+                raw_metadata.append(make_raw_component_metadata(index, component_type, version_index))
+                index += 1
+    parser = MetadataParserV1()
+
+    def run(items: list[dict[str, Any]]) -> None:
+        for raw in items:
+            parser.parse(raw)
+
+    yield measure("MetadataParserV1.parse", len(raw_metadata), lambda: raw_metadata, run, repeat)
+
+
+def _remove_orphans_benchmark(scale: Scale, repeat: int) -> Iterator[BenchmarkResult]:
+    """Sweep a store where the oldest of two revisions of every library is orphaned.
+
+    Each run gets a fresh copy of the store and no reachability manifest, so it
+    measures the cold path: every live content file is read to find its README.
+    """
+    with tempfile.TemporaryDirectory(prefix="build-benchmarks-") as workdir:
+        template = Path(workdir) / "template"
+        writer = DatabaseWriter(str(template))
+        versions = javaagent_versions(2)
+        for version_index, version in enumerate(versions):
+            inventory = transform_instrumentation_format(
+                make_javaagent_inventory(version_index * REVISION_INTERVAL, scale.instrumentations, 0.5)
+            )
+            libraries = []
+            for library in inventory["libraries"]:
+                readme = make_readme(library["name"], version_index)
+                markdown_hash = compute_content_hash(readme)
+                writer.write_markdown(library["name"], markdown_hash, readme)
+                libraries.append({**library, "markdown_hash": markdown_hash})
+            library_map = writer.write_libraries(libraries)
+        writer.write_version_index(versions[-1], library_map)
+        files = sum(1 for path in template.rglob("*") if path.is_file())
+
+        def setup() -> DatabaseWriter:
+            store = Path(workdir) / "store"
+            shutil.rmtree(store, ignore_errors=True)
+            shutil.copytree(template, store)
+            return DatabaseWriter(str(store))
+
+        yield measure("remove_orphans", files, setup, lambda store_writer: store_writer.remove_orphans(), repeat)
+
+
+BENCHMARKS: dict[str, Callable[[Scale, int], Iterator[BenchmarkResult]]] = {
+    "transform_instrumentation_format": _transform_benchmarks,
+    "backfill_metadata": _backfill_benchmark,
+    "content_hash": _content_hash_benchmark,
+    "sanitize_readme": _sanitize_readme_benchmark,
+    "SchemaResolver.resolve": _schema_resolver_benchmark,
+    "MetadataParserV1.parse": _metadata_parser_benchmark,
+    "remove_orphans": _remove_orphans_benchmark,
+}
+
+
+def run_benchmarks(scale: Scale, names: list[str] | None = None, repeat: int = 3) -> list[BenchmarkResult]:
+    """Run the named benchmarks (all of them by default) at the given scale.
+
+    Raises:
+        KeyError: If a name is not in BENCHMARKS
+    """
+    results = []
+    for name in names or list(BENCHMARKS):
+        results.extend(BENCHMARKS[name](scale, repeat))
+    return results
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    """Human-readable table of benchmark results."""
+    rows = [("benchmark", "items", "seconds", "items/s", "peak MB")]
+    for result in results:
+        rows.append(
+            (
+                result.name,
+                f"{result.items:,}",
+                f"{result.seconds:.4f}",
+                f"{result.items_per_second:,.0f}",
+                f"{result.peak_bytes / (1024 * 1024):.1f}",
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join([row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])])
+        for row in rows
+    )
@@ -0,0 +1,569 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Synthetic registries shaped like the real ones, at any scale.
+
+The generated trees are written through the same inventory managers the watchers
+use, so the builder reads them exactly as it reads ``ecosystem-registry``:
+
+- javaagent: one ``instrumentation.yaml`` per version, the oldest versions in file
+  format 0.1 and the newest in 0.6 (each format gets an equal share), plus a
+  README per instrumentation.
+- configuration: a declarative configuration schema split across files, with
+  local, cross-file and circular ``$ref`` chains for ``SchemaResolver``.
+- collector source tree: a checkout-shaped directory of components with raw
+  ``metadata.yaml`` files, for ``ComponentScanner``.
+- collector: core and contrib inventories from ``MINIMUM_VERSION`` upwards, with
+  component metadata produced by ``MetadataParserV1`` from raw mdatagen-style
+  ``metadata.yaml`` content, plus a README per component.
+
+Output is a pure function of the arguments, so two trees generated at the same
+scale are byte-identical and benchmark runs are comparable. Content drifts the way
+the real registries do: most instrumentations are unchanged between adjacent
+versions, descriptions are revised every few releases, and fields such as
+``display_name`` appear part-way through the history so backfill has work to do.
+"""
+
+from pathlib import Path
+from typing import Any
+
+from collector_watcher.inventory_manager import InventoryManager
+from collector_watcher.metadata_parser import MetadataParserV1
+from collector_watcher.type_defs import COMPONENT_TYPES
+from explorer_db_builder.collector_builder import MINIMUM_VERSION
+from explorer_db_builder.configuration_builder import ROOT_SCHEMA_FILE
+from explorer_db_builder.content_hashing import content_hash
+from semantic_version import Version
+from watcher_common import yaml_io
+from watcher_common.inventory_manager import JavaagentInventoryManager
+
+JAVAAGENT_FILE_FORMATS = (0.1, 0.2, 0.3, 0.5, 0.6)
+
+# Share of collector components per type, roughly as in contrib.
+COMPONENT_TYPE_WEIGHTS = {
+    "receiver": 45,
+    "processor": 14,
+    "exporter": 20,
+    "extension": 15,
+    "connector": 6,
+}
+
+# Versions between description revisions of an item.
+REVISION_INTERVAL = 10
+
+# $defs types per schema file; also the depth of each file's $ref chain.
+SCHEMA_TYPES_PER_FILE = 25
+
+# Number of configurations and metrics shared between instrumentations, like the
+# common HTTP and database options in the real registry.
+SHARED_CONFIGURATION_POOL = 40
+SHARED_METRIC_POOL = 30
+
+_SIGNALS = ("traces", "metrics", "logs")
+_STABILITIES = ("development", "alpha", "beta", "stable")
+_VALUE_TYPES = ("int", "double")
+
+
+def javaagent_versions(count: int) -> list[Version]:
+    """The synthetic javaagent release versions, oldest first."""
+    return [Version(major=2, minor=index, patch=0) for index in range(count)]
+
+
+def javaagent_file_format(version_index: int, version_count: int) -> float:
+    """File format for a version: the formats split the history into equal, ascending runs."""
+    return JAVAAGENT_FILE_FORMATS[version_index * len(JAVAAGENT_FILE_FORMATS) // version_count]
+
+
+def collector_versions(count: int) -> list[Version]:
+    """The synthetic collector release versions, oldest first, starting at the builder's minimum."""
+    return [Version(major=0, minor=MINIMUM_VERSION.minor + index, patch=0) for index in range(count)]
+
+
+def _shared_configuration(slot: int) -> dict[str, Any]:
+    return {
+        "name": f"otel.instrumentation.common.option-{slot}",
+        "declarative_name": f"java.common.option_{slot}",
+        "description": f"Shared option {slot} applied by every instrumentation of its kind.",
+        "type": "boolean" if slot % 2 else "list",
+        "default": bool(slot % 4 == 1) if slot % 2 else "",
+    }
+
+
+def _shared_metric(slot: int) -> dict[str, Any]:
+    return {
+        "name": f"shared.client.operation.duration.{slot}",
+        "description": f"Duration of shared client operations ({slot}).",
+        "instrument": "histogram",
+        "data_type": "HISTOGRAM",
+        "unit": "s",
+        "attributes": [
+            {"name": "server.address", "type": "STRING"},
+            {"name": "server.port", "type": "LONG"},
+            {"name": f"shared.attribute.{slot}", "type": "STRING"},
+        ],
+    }
+
+
+def make_instrumentation(index: int, version_index: int) -> dict[str, Any]:
+    """One instrumentation in the inline 0.5 shape, as it looks at the given version."""
+    name = f"synthetic-library-{index:05d}-1.0"
+    revision = (version_index + index) // REVISION_INTERVAL
+    instrumentation: dict[str, Any] = {"name": name}
+    # Display names arrive part-way through the history for a third of the items.
+    if index % 3 or version_index >= REVISION_INTERVAL:
+        instrumentation["display_name"] = f"Synthetic Library {index}"
+    instrumentation.update(
+        {
+            "description": f"Instruments synthetic library {index} (revision {revision}).",
+            "semantic_conventions": ["HTTP_CLIENT_SPANS", "HTTP_CLIENT_METRICS"]
+            if index % 2
+            else ["DATABASE_CLIENT_SPANS"],
+            "library_link": f"https://example.com/libraries/{index}",
+            "source_path": f"instrumentation/{name}",
+            "minimum_java_version": 8 + (index % 3) * 4,
+            "scope": {
+                "name": f"io.opentelemetry.{name}",
+                "schema_url": "https://opentelemetry.io/schemas/1.37.0",
+            },
+            "has_javaagent": True,
+            "has_standalone_library": index % 4 == 0,
+            "javaagent_target_versions": [f"com.example:synthetic-{index}:[1.0,)"],
+        }
+    )
+    if index % 7 == 0:
+        instrumentation["disabled_by_default"] = True
+
+    configurations = [_shared_configuration((index + offset) % SHARED_CONFIGURATION_POOL) for offset in range(3)]
+    configurations.append(
+        {
+            "name": f"otel.instrumentation.synthetic-{index}.enabled",
+            "declarative_name": f"java.synthetic_{index}.enabled",
+            "description": f"Enables synthetic library {index} instrumentation.",
+            "type": "boolean",
+            "default": True,
+            "examples": ["true", "false"],
+        }
+    )
+    instrumentation["configurations"] = configurations
+
+    metrics = [_shared_metric(index % SHARED_METRIC_POOL)]
+    if index % 2:
+        metrics.append(
+            {
+                "name": f"synthetic.{index}.connections",
+                "description": f"Open connections held by synthetic library {index}.",
+                "instrument": "updowncounter",
+                "data_type": "LONG_SUM",
+                "unit": "{connection}",
+                "attributes": [{"name": "pool.name", "type": "STRING"}],
+            }
+        )
+    instrumentation["telemetry"] = [
+        {
+            "when": "default",
+            "metrics": metrics,
+            "spans": [
+                {
+                    "span_kind": "CLIENT",
+                    "attributes": [
+                        {"name": "server.address", "type": "STRING"},
+                        {"name": "server.port", "type": "LONG"},
+                    ],
+                }
+            ],
+        }
+    ]
+    return instrumentation
+
+
+def _downgrade_library(library: dict[str, Any], file_format: float) -> dict[str, Any]:
+    """Rewrite an inline 0.5 library in an older format (the inverse of the transformer)."""
+    downgraded = dict(library)
+    downgraded.pop("has_javaagent", None)
+    downgraded["configurations"] = [
+        {key: value for key, value in config.items() if key not in ("declarative_name", "examples")}
+        for config in library["configurations"]
+    ]
+    if file_format <= 0.2:
+        telemetry = []
+        for entry in library["telemetry"]:
+            entry = dict(entry)
+            entry["metrics"] = [
+                {("type" if key == "data_type" else key): value for key, value in metric.items()}
+                for metric in entry["metrics"]
+            ]
+            telemetry.append(entry)
+        downgraded["telemetry"] = telemetry
+    if file_format == 0.1:
+        target_versions = {"javaagent": downgraded.pop("javaagent_target_versions")}
+        if downgraded.pop("has_standalone_library"):
+            target_versions["library"] = [f"com.example:{library['name']}-library:1.0"]
+        downgraded["target_versions"] = target_versions
+    return downgraded
+
+
+def _to_definition_refs(
+    library: dict[str, Any], configuration_defs: dict[str, Any], metric_defs: dict[str, Any]
+) -> dict[str, Any]:
+    """Rewrite an inline 0.5 library as 0.6 refs, adding its definitions to the catalogs."""
+    converted = dict(library)
+    refs = []
+    for config in converted.pop("configurations"):
+        key = config["name"].removeprefix("otel.instrumentation.")
+        configuration_defs.setdefault(key, config)
+        refs.append(key)
+    converted["configuration_refs"] = refs
+
+    telemetry = []
+    for entry in library["telemetry"]:
+        entry = dict(entry)
+        metric_refs = []
+        for metric in entry.pop("metrics"):
+            key = f"{metric['name']}-{content_hash(metric)[:8]}"
+            metric_defs.setdefault(key, metric)
+            metric_refs.append(key)
+        entry["metric_refs"] = metric_refs
+        telemetry.append(entry)
+    converted["telemetry"] = telemetry
+    return converted
+
+
+def make_javaagent_inventory(version_index: int, instrumentations: int, file_format: float) -> dict[str, Any]:
+    """A complete ``instrumentation.yaml`` document for one version in the given file format."""
+    custom_count = max(1, instrumentations // 100)
+    libraries = [make_instrumentation(index, version_index) for index in range(instrumentations - custom_count)]
+    custom = [
+        {
+            "name": f"synthetic-custom-{index}",
+            "display_name": f"Synthetic Custom {index}",
+            "description": f"Custom instrumentation {index}.",
+            "source_path": f"instrumentation/synthetic-custom-{index}",
+        }
+        for index in range(custom_count)
+    ]
+
+    if file_format == 0.6:
+        configuration_defs: dict[str, Any] = {}
+        metric_defs: dict[str, Any] = {}
+        libraries = [_to_definition_refs(library, configuration_defs, metric_defs) for library in libraries]
+        return {
+            "file_format": file_format,
+            "definitions": {
+                "configurations": dict(sorted(configuration_defs.items())),
+                "metrics": dict(sorted(metric_defs.items())),
+            },
+            "libraries": libraries,
+            "custom": custom,
+        }
+    if file_format < 0.5:
+        libraries = [_downgrade_library(library, file_format) for library in libraries]
+    return {"file_format": file_format, "libraries": libraries, "custom": custom}
+
+
+def make_readme(name: str, revision: int) -> str:
+    """README markdown with the parts the sanitizer strips: a status section, comments and badges."""
+    return (
+        f"# {name}\n"
+        "\n"
+        "<!-- status autogenerated section -->\n"
+        "| Status    |           |\n"
+        "| --------- | --------- |\n"
+        "| Stability | [beta]    |\n"
+        "\n"
+        "[beta]: https://github.com/open-telemetry/opentelemetry-collector#beta\n"
+        "<!-- end autogenerated section -->\n"
+        "\n"
+        f"Revision {revision} of the {name} documentation. <!-- reviewed -->\n"
+        "\n"
+        "## Configuration\n"
+        "\n"
+        "Settings follow the [beta] stability guarantees.\n"
+        "\n"
+        "```yaml\n"
+        "# <!-- not a comment inside a code block -->\n"
+        f"{name}:\n"
+        "  endpoint: localhost:4317\n"
+        "```\n"
+        "\n" + "".join(f"- Option {option}: tunes behaviour {option} of {name}.\n" for option in range(20))
+    )
+
+
+def generate_javaagent_registry(
+    inventory_dir: str | Path, versions: int = 100, instrumentations: int = 1000, readmes: bool = True
+) -> list[Version]:
+    """Write a synthetic javaagent registry.
+
+    Args:
+        inventory_dir: Directory to write into (the equivalent of ``ecosystem-registry/java/javaagent``)
+        versions: Number of release versions
+        instrumentations: Instrumentations per version, including ~1% custom ones
+        readmes: Whether to write a README per library
+
+    Returns:
+        The versions written, oldest first
+    """
+    manager = JavaagentInventoryManager(str(inventory_dir))
+    written = javaagent_versions(versions)
+    for version_index, version in enumerate(written):
+        file_format = javaagent_file_format(version_index, versions)
+        inventory = make_javaagent_inventory(version_index, instrumentations, file_format)
+        manager.save_versioned_inventory(version, inventory)
+        if readmes:
+            manager.save_library_readmes(
+                version,
+                (
+                    (library["name"], make_readme(library["name"], (version_index + index) // REVISION_INTERVAL))
+                    for index, library in enumerate(inventory["libraries"])
+                ),
+            )
+    return written
+
+
+def make_raw_component_metadata(index: int, component_type: str, version_index: int) -> dict[str, Any]:
+    """Raw ``metadata.yaml`` content for a component, in upstream mdatagen's (unsorted) shape."""
+    revision = (version_index + index) // REVISION_INTERVAL
+    signals = [_SIGNALS[(index + offset) % len(_SIGNALS)] for offset in range(1 + index % len(_SIGNALS))]
+    raw: dict[str, Any] = {
+        "type": f"synthetic{index}",
+        "status": {
+            "class": component_type,
+            "stability": {_STABILITIES[index % len(_STABILITIES)]: list(reversed(signals))},
+            "distributions": ["contrib", "core"] if index % 10 == 0 else ["contrib"],
+            "codeowners": {"active": [f"owner-{index % 17}", f"owner-{index % 11}"]},
+            "disable_codecov_badge": True,
+        },
+        "description": f"Synthetic {component_type} {index}\n  (revision {revision}).",
+    }
+    if index % 3 or version_index >= REVISION_INTERVAL:
+        raw["display_name"] = f"Synthetic {component_type.title()} {index}"
+    if component_type == "receiver" or index % 4 == 0:
+        raw["resource_attributes"] = {
+            f"synthetic.{index}.resource.{slot}": {
+                "description": f"Resource attribute {slot}.",
+                "enabled": slot == 0,
+                "type": "string",
+            }
+            for slot in range(3)
+        }
+        raw["attributes"] = {
+            "direction": {"description": "Direction of\nthe operation.", "type": "string", "enum": ["write", "read"]},
+            "state": {"description": "Connection state.", "type": "string", "enum": ["used", "idle", "free"]},
+        }
+        raw["metrics"] = {
+            f"synthetic.{index}.metric.{slot}": {
+                "enabled": slot % 2 == 0,
+                "description": f"Synthetic metric {slot}.",
+                "unit": "{operations}",
+                "sum": {
+                    "value_type": _VALUE_TYPES[slot % 2],
+                    "monotonic": True,
+                    "aggregation_temporality": "cumulative",
+                },
+                "attributes": ["state", "direction"],
+            }
+            for slot in range(8)
+        }
+    if index % 9 == 0:
+        raw["tests"] = {"config": None}
+    return raw
+
+
+def component_counts(components: int) -> dict[str, int]:
+    """How many of the components are of each type, following ``COMPONENT_TYPE_WEIGHTS``."""
+    total_weight = sum(COMPONENT_TYPE_WEIGHTS.values())
+    counts = {
+        component_type: components * weight // total_weight for component_type, weight in COMPONENT_TYPE_WEIGHTS.items()
+    }
+    counts["receiver"] += components - sum(counts.values())
+    return counts
+
+
+def generate_collector_repo(repo_dir: str | Path, components: int = 2000, version_index: int = 0) -> int:
+    """Write a collector source tree shaped like a contrib checkout, for ``ComponentScanner``.
+
+    Each component gets a directory under its type with a Go file and its raw
+    ``metadata.yaml``. Every tenth extension is nested under ``extension/storage``,
+    every twentieth component has no metadata, and each type also holds an
+    ``internal`` package the scanner must skip.
+
+    Args:
+        repo_dir: Directory to write the tree into
+        components: Number of components
+        version_index: History position, as for :func:`make_raw_component_metadata`
+
+    Returns:
+        The number of components written
+    """
+    root = Path(repo_dir)
+    index = 0
+    for component_type, count in component_counts(components).items():
+        (root / component_type / "internal").mkdir(parents=True, exist_ok=True)
+        (root / component_type / "internal" / "shared.go").write_text("package internal\n", encoding="utf-8")
+        for _ in range(count):
+            name = f"synthetic{index}{component_type}"
+            parent = root / component_type
+            if component_type == "extension" and index % 10 == 0:
+                parent = parent / "storage"
+            component_dir = parent / name
+            component_dir.mkdir(parents=True, exist_ok=True)
+            (component_dir / "factory.go").write_text(f"package {name}\n", encoding="utf-8")
+            if index % 20:
+                with open(component_dir / "metadata.yaml", "w", encoding="utf-8") as f:
+                    yaml_io.safe_dump(
+                        make_raw_component_metadata(index, component_type, version_index),
+                        f,
+                        default_flow_style=False,
+                        sort_keys=False,
+                    )
+            index += 1
+    return index
+
+
+def make_collector_inventory(version_index: int, components: int) -> dict[str, dict[str, list[dict[str, Any]]]]:
+    """Per-distribution component lists for one version, ``{distribution: {type: [component, ...]}}``.
+
+    Every tenth component is in core, the rest in contrib; metadata is the parsed
+    form the collector watcher stores.
+    """
+    parser = MetadataParserV1()
+    inventories: dict[str, dict[str, list[dict[str, Any]]]] = {
+        "core": {component_type: [] for component_type in COMPONENT_TYPES},
+        "contrib": {component_type: [] for component_type in COMPONENT_TYPES},
+    }
+    index = 0
+    for component_type, count in component_counts(components).items():
+        for _ in range(count):
+            raw = make_raw_component_metadata(index, component_type, version_index)
+            distribution = "core" if index % 10 == 0 else "contrib"
+            inventories[distribution][component_type].append(
+                {"name": f"synthetic{index}{component_type}", "metadata": parser.parse(raw)}
+            )
+            index += 1
+    return inventories
+
+
+def generate_collector_registry(
+    inventory_dir: str | Path, versions: int = 50, components: int = 2000, readmes: bool = True
+) -> list[Version]:
+    """Write a synthetic collector registry with core and contrib distributions.
+
+    Args:
+        inventory_dir: Directory to write into (the equivalent of ``ecosystem-registry/collector``)
+        versions: Number of release versions per distribution
+        components: Components per version across both distributions
+        readmes: Whether to write a README per component
+
+    Returns:
+        The versions written, oldest first
+    """
+    manager = InventoryManager(str(inventory_dir))
+    written = collector_versions(versions)
+    for version_index, version in enumerate(written):
+        for distribution, component_lists in make_collector_inventory(version_index, components).items():
+            manager.save_versioned_inventory(
+                distribution,
+                version,
+                component_lists,
+                repository=f"synthetic-collector-{distribution}",
+                schema_hash="000000000000",
+            )
+            if readmes:
+                manager.save_component_readmes(
+                    distribution,
+                    version,
+                    (
+                        (component["name"], make_readme(component["name"], version_index // REVISION_INTERVAL))
+                        for component_list in component_lists.values()
+                        for component in component_list
+                    ),
+                )
+    return written
+
+
+def make_configuration_registry(types: int) -> dict[str, Any]:
+    """A configuration schema registry, ``{file name: parsed YAML}``, with ``types`` object types.
+
+    The root file references one provider file per ``SCHEMA_TYPES_PER_FILE`` types.
+    Each type references the next in its file's ``$defs`` and shared types in
+    ``common.yaml``; the last refers back to the first, like the real schema's
+    recursive types.
+    """
+    files = max(1, types // SCHEMA_TYPES_PER_FILE)
+    registry: dict[str, Any] = {
+        ROOT_SCHEMA_FILE: {
+            "type": "object",
+            "additionalProperties": True,
+            "properties": {
+                "file_format": {"type": "string", "description": "The file format version."},
+                **{f"provider_{file}": {"$ref": f"provider_{file}.yaml"} for file in range(files)},
+            },
+        },
+        "common.yaml": {
+            "$defs": {
+                "Endpoint": {"type": ["string", "null"], "description": "Target endpoint URL."},
+                "NameStringValuePair": {
+                    "type": "object",
+                    "properties": {"name": {"type": "string"}, "value": {"type": ["string", "null"]}},
+                    "required": ["name", "value"],
+                },
+            }
+        },
+    }
+    for file in range(files):
+        count = types // files + (1 if file < types % files else 0)
+        defs = {}
+        for slot in range(count):
+            defs[f"Type{file}x{slot}"] = {
+                "type": ["object", "null"],
+                "additionalProperties": False,
+                "description": f"Synthetic type {slot} of provider {file}.",
+                "properties": {
+                    "enabled": {
+                        "type": ["boolean", "null"],
+                        "description": "Enable this component.",
+                        "defaultBehavior": "true is used",
+                    },
+                    "endpoint": {"$ref": "common.yaml#/$defs/Endpoint", "defaultBehavior": "localhost is used"},
+                    "headers": {"type": "array", "items": {"$ref": "common.yaml#/$defs/NameStringValuePair"}},
+                    "next": {"$ref": f"#/$defs/Type{file}x{(slot + 1) % count}"},
+                },
+            }
+        registry[f"provider_{file}.yaml"] = {
+            "type": "object",
+            "properties": {"root": {"$ref": f"#/$defs/Type{file}x0"}},
+            "$defs": defs,
+        }
+    return registry
+
+
+def generate_configuration_registry(registry_dir: str | Path, versions: int = 3, types: int = 200) -> list[Version]:
+    """Write a synthetic configuration schema registry, one identical schema per version.
+
+    Args:
+        registry_dir: Directory to write into (the equivalent of ``ecosystem-registry/configuration``)
+        versions: Number of release versions
+        types: Object types per schema, see :func:`make_configuration_registry`
+
+    Returns:
+        The versions written, oldest first
+    """
+    registry = make_configuration_registry(types)
+    written = [Version(major=1, minor=index, patch=0) for index in range(versions)]
+    for version in written:
+        version_dir = Path(registry_dir) / f"v{version}"
+        version_dir.mkdir(parents=True, exist_ok=True)
+        for file_name, schema in registry.items():
+            with open(version_dir / file_name, "w", encoding="utf-8") as f:
+                yaml_io.safe_dump(schema, f, default_flow_style=False, sort_keys=False)
+    return written
@@ -0,0 +1,201 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the end-to-end performance regression gate."""
+
+import json
+
+import pytest
+from build_benchmarks import end_to_end
+from build_benchmarks.end_to_end import (
+    BASELINE_FORMAT,
+    DEFAULT_TOLERANCES,
+    WALL_SLACK_SECONDS,
+    Scenario,
+    compare,
+    default_scenarios,
+    format_comparisons,
+    load_baseline,
+    run_scenarios,
+    write_baseline,
+)
+from build_benchmarks.main import run_end_to_end
+from build_benchmarks.micro import Scale
+from build_benchmarks.synthetic_registry import generate_configuration_registry
+
+TINY = Scale(javaagent_versions=2, instrumentations=5, collector_versions=1, components=10, schema_types=10)
+
+
+@pytest.fixture
+def tiny_synthetic(monkeypatch):
+    monkeypatch.setattr(end_to_end, "SYNTHETIC_BASE", TINY)
+
+
+@pytest.fixture
+def checked_in_registry(tmp_path):
+    registry = tmp_path / "ecosystem-registry"
+    generate_configuration_registry(registry / "configuration", versions=1, types=10)
+    return registry
+
+
+def _baseline(scenarios, tolerances=None):
+    baseline = {"format": BASELINE_FORMAT, "scenarios": scenarios}
+    if tolerances is not None:
+        baseline["tolerances"] = tolerances
+    return baseline
+
+
+class TestScenarios:
+    def test_default_scenarios_cover_every_ecosystem_and_the_scanner(self):
+        names = [scenario.name for scenario in default_scenarios()]
+
+        for ecosystem in ("javaagent", "configuration", "collector"):
+            assert f"{ecosystem}/checked-in" in names
+            assert f"{ecosystem}/synthetic-x1" in names
+        assert "scan/synthetic-x1" in names
+        assert len(names) == len(set(names))
+
+    def test_synthetic_scale_multiplies_items_not_versions(self, tiny_synthetic):
+        scale = Scenario("javaagent", "synthetic", 4).scale()
+
+        assert scale.instrumentations == TINY.instrumentations * 4
+        assert scale.javaagent_versions == TINY.javaagent_versions
+
+
+class TestRunScenarios:
+    def test_measures_builds_and_scans(self, tiny_synthetic, checked_in_registry):
+        results = run_scenarios(
+            [
+                Scenario("configuration", "checked-in"),
+                Scenario("collector", "synthetic"),
+                Scenario("scan", "synthetic"),
+            ],
+            checked_in_registry,
+            repeat=1,
+        )
+
+        configuration = results["configuration/checked-in"]
+        assert configuration["files_written"] == 3  # versions-index, one version, its path index
+        assert configuration["output_bytes"] > 0
+        assert configuration["peak_rss_bytes"] > 0
+        assert results["collector/synthetic-x1"]["files_written"] > 0
+        assert results["scan/synthetic-x1"]["components"] == TINY.components
+        assert set(results["scan/synthetic-x1"]) == {"wall_seconds", "peak_rss_bytes", "components"}
+
+    def test_failed_build_raises(self, tmp_path):
+        with pytest.raises(RuntimeError, match="configuration/checked-in"):
+            run_scenarios([Scenario("configuration", "checked-in")], tmp_path / "missing")
+
+
+class TestCompare:
+    def test_flags_growth_beyond_tolerance(self):
+        baseline = _baseline({"collector/checked-in": {"files_written": 100, "output_bytes": 1000}})
+
+        comparisons = compare({"collector/checked-in": {"files_written": 101, "output_bytes": 1010}}, baseline)
+
+        assert {comparison.metric: comparison.regressed for comparison in comparisons} == {
+            "files_written": True,
+            "output_bytes": False,
+        }
+
+    def test_shrinking_is_never_a_regression(self):
+        baseline = _baseline({"scan/synthetic-x1": {"peak_rss_bytes": 1000}})
+
+        (comparison,) = compare({"scan/synthetic-x1": {"peak_rss_bytes": 10}}, baseline)
+
+        assert not comparison.regressed
+        assert comparison.change == pytest.approx(-0.99)
+
+    def test_wall_time_gets_absolute_slack(self):
+        baseline = _baseline({"configuration/checked-in": {"wall_seconds": 0.1}})
+
+        (within,) = compare({"configuration/checked-in": {"wall_seconds": 0.1 + WALL_SLACK_SECONDS}}, baseline)
+        (beyond,) = compare({"configuration/checked-in": {"wall_seconds": 0.2 + WALL_SLACK_SECONDS}}, baseline)
+
+        assert not within.regressed
+        assert beyond.regressed
+
+    def test_tolerance_precedence(self):
+        baseline = _baseline({"s": {"output_bytes": 100, "files_written": 100}}, tolerances={"output_bytes": 0.5})
+        results = {"s": {"output_bytes": 140, "files_written": 140}}
+
+        from_file = {comparison.metric: comparison.regressed for comparison in compare(results, baseline)}
+        overridden = {
+            comparison.metric: comparison.regressed
+            for comparison in compare(results, baseline, {"output_bytes": 0.1, "files_written": 0.5})
+        }
+
+        assert from_file == {"output_bytes": False, "files_written": True}
+        assert overridden == {"output_bytes": True, "files_written": False}
+
+    def test_new_scenarios_and_metrics_pass(self):
+        comparisons = compare({"new/scenario": {"wall_seconds": 99.0}}, _baseline({}))
+
+        assert [comparison.regressed for comparison in comparisons] == [False]
+        assert format_comparisons(comparisons).splitlines()[1].endswith("new")
+
+
+class TestBaseline:
+    def test_missing_baseline_is_none(self, tmp_path):
+        assert load_baseline(tmp_path / "none.json") is None
+
+    def test_rejects_unknown_format(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        path.write_text(json.dumps({"format": 99}), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Unsupported baseline format"):
+            load_baseline(path)
+
+    def test_update_keeps_tolerances_and_other_scenarios(self, tmp_path):
+        path = tmp_path / "baselines" / "end-to-end.json"
+        write_baseline(path, {"a": {"wall_seconds": 1.0}, "b": {"wall_seconds": 2.0}})
+        baseline = load_baseline(path)
+        assert baseline["tolerances"] == DEFAULT_TOLERANCES
+        baseline["tolerances"] = {"wall_seconds": 1.0}
+
+        write_baseline(path, {"b": {"wall_seconds": 3.0}}, baseline)
+
+        updated = load_baseline(path)
+        assert updated["tolerances"] == {"wall_seconds": 1.0}
+        assert updated["scenarios"] == {"a": {"wall_seconds": 1.0}, "b": {"wall_seconds": 3.0}}
+
+
+class TestRunEndToEnd:
+    def test_gate_round_trip(self, checked_in_registry, tmp_path):
+        baseline_path = tmp_path / "baseline.json"
+        scenarios = ["configuration/checked-in"]
+
+        assert run_end_to_end(str(baseline_path), scenarios, registry_dir=str(checked_in_registry), repeat=1) == 1
+
+        assert (
+            run_end_to_end(
+                str(baseline_path), scenarios, update_baseline=True, registry_dir=str(checked_in_registry), repeat=1
+            )
+            == 0
+        )
+        assert run_end_to_end(str(baseline_path), scenarios, registry_dir=str(checked_in_registry), repeat=1) == 0
+
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        baseline["scenarios"]["configuration/checked-in"]["output_bytes"] //= 2
+        baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+        assert run_end_to_end(str(baseline_path), scenarios, registry_dir=str(checked_in_registry), repeat=1) == 1
+        assert (
+            run_end_to_end(
+                str(baseline_path), scenarios, {"output_bytes": 2.0}, registry_dir=str(checked_in_registry), repeat=1
+            )
+            == 0
+        )
+
+    def test_unknown_scenario_fails(self, tmp_path):
+        assert run_end_to_end(str(tmp_path / "baseline.json"), ["nope/checked-in"]) == 1
@@ -0,0 +1,80 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the micro-benchmark runner."""
+
+import json
+
+import pytest
+from build_benchmarks.main import run_micro
+from build_benchmarks.micro import BENCHMARKS, RESULT_FORMAT, Scale, format_results, measure, run_benchmarks
+
+TINY = Scale(javaagent_versions=5, instrumentations=10, collector_versions=1, components=10, schema_types=10)
+
+
+class TestMeasure:
+    def test_sets_up_a_fresh_input_for_every_run(self):
+        setups = []
+
+        result = measure("append", 4, lambda: setups.append(1) or [], lambda items: items.extend(range(1000)), repeat=3)
+
+        # Three timed runs plus the traced one.
+        assert len(setups) == 4
+        assert result.items == 4
+        assert result.seconds > 0
+        assert result.peak_bytes > 0
+        assert result.items_per_second == pytest.approx(4 / result.seconds)
+
+
+class TestRunBenchmarks:
+    def test_runs_every_benchmark(self):
+        results = run_benchmarks(TINY, repeat=1)
+
+        names = [result.name for result in results]
+        for benchmark in BENCHMARKS:
+            assert any(name.startswith(benchmark) for name in names)
+        assert all(result.items > 0 for result in results)
+
+    def test_runs_only_the_named_benchmarks(self):
+        results = run_benchmarks(TINY, ["content_hash", "remove_orphans"], repeat=1)
+
+        assert [result.name for result in results] == ["content_hash", "remove_orphans"]
+
+    def test_rejects_unknown_benchmarks(self):
+        with pytest.raises(KeyError):
+            run_benchmarks(TINY, ["no_such_benchmark"])
+
+    def test_format_results_table(self):
+        table = format_results(run_benchmarks(TINY, ["sanitize_readme"], repeat=1)).splitlines()
+
+        assert table[0].split() == ["benchmark", "items", "seconds", "items/s", "peak", "MB"]
+        assert table[1].startswith("sanitize_readme ")
+
+
+class TestRunMicro:
+    def test_writes_json_results(self, tmp_path):
+        output = tmp_path / "results" / "micro.json"
+
+        assert run_micro(TINY, ["content_hash"], 1, str(output)) == 0
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert report["format"] == RESULT_FORMAT
+        assert report["scale"] == TINY.to_dict()
+        assert [result["name"] for result in report["results"]] == ["content_hash"]
+
+    def test_unwritable_output_fails(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("", encoding="utf-8")
+
+        assert run_micro(TINY, ["content_hash"], 1, str(blocker / "micro.json")) == 1
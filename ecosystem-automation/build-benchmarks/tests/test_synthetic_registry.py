@@ -0,0 +1,167 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the synthetic registry generators."""
+
+from build_benchmarks.synthetic_registry import (
+    JAVAAGENT_FILE_FORMATS,
+    component_counts,
+    generate_collector_registry,
+    generate_collector_repo,
+    generate_configuration_registry,
+    generate_javaagent_registry,
+    make_configuration_registry,
+    make_javaagent_inventory,
+)
+from collector_watcher.component_scanner import ComponentScanner
+from collector_watcher.inventory_manager import InventoryManager
+from collector_watcher.metadata_parser import MetadataParserV1
+from explorer_db_builder.configuration_builder import ROOT_SCHEMA_FILE
+from explorer_db_builder.instrumentation_transformer import transform_instrumentation_format
+from explorer_db_builder.schema_resolver import SchemaResolver
+from watcher_common.inventory_manager import JavaagentInventoryManager
+
+
+def _keys(node):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield key
+            yield from _keys(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _keys(item)
+
+
+def _files(root):
+    return {path.relative_to(root): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+class TestJavaagentRegistry:
+    def test_covers_every_file_format_oldest_first(self, tmp_path):
+        versions = generate_javaagent_registry(tmp_path, versions=10, instrumentations=20)
+
+        manager = JavaagentInventoryManager(str(tmp_path))
+        assert manager.list_release_versions() == sorted(versions, reverse=True)
+        formats = [manager.load_versioned_inventory(version)["file_format"] for version in versions]
+        assert formats == sorted(formats)
+        assert set(formats) == set(JAVAAGENT_FILE_FORMATS)
+
+    def test_every_format_transforms_to_the_same_libraries(self):
+        expected = transform_instrumentation_format(make_javaagent_inventory(3, 20, 0.5))
+
+        for file_format in JAVAAGENT_FILE_FORMATS:
+            transformed = transform_instrumentation_format(make_javaagent_inventory(3, 20, file_format))
+
+            assert transformed["file_format"] == 0.5
+            assert [library["name"] for library in transformed["libraries"]] == [
+                library["name"] for library in expected["libraries"]
+            ]
+            # Only fields the older formats predate are missing.
+            for library, expected_library in zip(transformed["libraries"], expected["libraries"]):
+                assert library["telemetry"] == expected_library["telemetry"]
+                assert [config["name"] for config in library["configurations"]] == [
+                    config["name"] for config in expected_library["configurations"]
+                ]
+
+    def test_0_6_shares_definitions_between_libraries(self):
+        inventory = make_javaagent_inventory(0, 100, 0.6)
+
+        references = sum(len(library["configuration_refs"]) for library in inventory["libraries"])
+        assert len(inventory["definitions"]["configurations"]) < references
+
+    def test_writes_a_readme_per_library(self, tmp_path):
+        versions = generate_javaagent_registry(tmp_path, versions=2, instrumentations=20)
+
+        manager = JavaagentInventoryManager(str(tmp_path))
+        inventory = manager.load_versioned_inventory(versions[0])
+        assert len(manager.load_library_readme_map(versions[0])) == len(inventory["libraries"])
+
+    def test_output_is_deterministic(self, tmp_path):
+        generate_javaagent_registry(tmp_path / "a", versions=5, instrumentations=10)
+        generate_javaagent_registry(tmp_path / "b", versions=5, instrumentations=10)
+
+        assert _files(tmp_path / "a") == _files(tmp_path / "b")
+
+
+class TestCollectorRegistry:
+    def test_splits_components_between_core_and_contrib(self, tmp_path):
+        versions = generate_collector_registry(tmp_path, versions=2, components=50)
+
+        manager = InventoryManager(str(tmp_path))
+        core = manager.load_versioned_inventory("core", versions[0])["components"]
+        contrib = manager.load_versioned_inventory("contrib", versions[0])["components"]
+        for component_type, count in component_counts(50).items():
+            assert len(core[component_type]) + len(contrib[component_type]) == count
+        assert sum(len(components) for components in core.values()) == 5
+        assert manager.list_release_versions("contrib") == sorted(versions, reverse=True)
+
+    def test_metadata_is_in_parsed_form(self, tmp_path):
+        versions = generate_collector_registry(tmp_path, versions=1, components=30, readmes=False)
+
+        manager = InventoryManager(str(tmp_path))
+        parser = MetadataParserV1()
+        for components in manager.load_versioned_inventory("contrib", versions[0])["components"].values():
+            for component in components:
+                assert parser.parse(component["metadata"]) == component["metadata"]
+                assert "tests" not in component["metadata"]
+
+    def test_writes_a_readme_per_component(self, tmp_path):
+        versions = generate_collector_registry(tmp_path, versions=1, components=30)
+
+        manager = InventoryManager(str(tmp_path))
+        assert len(manager.load_component_readme_map("core", versions[0])) == 3
+        assert len(manager.load_component_readme_map("contrib", versions[0])) == 27
+
+
+class TestCollectorRepo:
+    def test_scanner_finds_every_component(self, tmp_path):
+        written = generate_collector_repo(tmp_path, components=60)
+
+        scanned = ComponentScanner(str(tmp_path)).scan_all_components()
+
+        found = [component for components in scanned.values() for component in components]
+        assert len(found) == written == 60
+        assert not any(component["name"] == "internal" for component in found)
+        assert sum(1 for component in found if component.get("has_metadata") is False) == 3
+        assert [component["name"] for component in found if component.get("subtype") == "storage"] == [
+            name for name in (component["name"] for component in scanned["extension"]) if int(name[9:-9]) % 10 == 0
+        ]
+
+    def test_parsed_metadata_matches_the_registry_form(self, tmp_path):
+        generate_collector_repo(tmp_path, components=20)
+
+        scanned = ComponentScanner(str(tmp_path)).scan_all_components()
+
+        receiver = next(component for component in scanned["receiver"] if "metadata" in component)
+        assert "tests" not in receiver["metadata"]
+        assert receiver["metadata"]["status"]["class"] == "receiver"
+
+
+class TestConfigurationRegistry:
+    def test_resolves_every_reference(self):
+        registry = make_configuration_registry(60)
+
+        resolved = SchemaResolver(registry).resolve(ROOT_SCHEMA_FILE)
+
+        keys = list(_keys(resolved))
+        assert "$ref" not in keys
+        assert "$defs" not in keys
+        # Each provider's chain of types ends in a reference back to its first type.
+        assert keys.count("$circular_ref") == len(registry) - 2
+
+    def test_writes_one_schema_per_version(self, tmp_path):
+        versions = generate_configuration_registry(tmp_path, versions=2, types=30)
+
+        for version in versions:
+            assert {path.name for path in (tmp_path / f"v{version}").iterdir()} == set(make_configuration_registry(30))
@@ -15,14 +15,19 @@
 """Collector metadata synchronization to registry."""
 
 import logging
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from typing import Any
 
 from semantic_version import Version
+from watcher_common.git_objects import GitObjectReader
 from watcher_common.version_detector import VersionDetector
 
-from .component_scanner import ComponentScanner
+from .component_scanner import ComponentScanner, component_directory
 from .deprecation_detector import DeprecationDetector
 from .inventory_manager import InventoryManager
+from .metadata_cache import MetadataParseCache, default_metadata_cache
 from .readme_scanner import discover_component_readmes
 from .schema_copier import SCHEMA_RELATIVE_PATH, UNKNOWN_HASH, CollectorSchemaCopier
 from .type_defs import COMPONENT_TYPES, DistributionName
@@ -31,6 +36,18 @@ logger = logging.getLogger(__name__)
 
 DistributionConfig = dict[DistributionName, str]
 
+# Components by type, and README contents by component name, of one version.
+VersionScan = tuple[dict[str, list[dict[str, Any]]], dict[str, str]]
+
+
+def _scan_at_ref(repo_path: str, metadata_cache: MetadataParseCache | None, ref: str) -> VersionScan:
+    """Scan components and discover their READMEs at ``ref``, without touching the working tree.
+
+    Runs in a backfill worker process, so it only reads the repository.
+    """
+    components = ComponentScanner(repo_path, ref=ref, metadata_cache=metadata_cache).scan_all_components()
+    return components, discover_component_readmes(repo_path, components, ref=ref)
+
 
 class CollectorSync:
     """
@@ -47,6 +64,10 @@ class CollectorSync:
         self,
         repos: DistributionConfig,
         inventory_manager: InventoryManager,
+        read_git_objects: bool = False,
+        jobs: int = 1,
+        incremental: bool = False,
+        verify_incremental: bool = False,
     ):
         """
         Initialize the collector sync.
@@ -55,9 +76,26 @@ class CollectorSync:
             repos: Dict mapping distribution name to local repo path
                    e.g., {"core": "/path/to/collector", "contrib": "/path/to/collector-contrib"}
             inventory_manager: InventoryManager instance for saving results
+            read_git_objects: Scan each version, and read its READMEs, at its git
+                ref straight from the object database instead of checking the
+                ref out in the clone
+            jobs: Number of worker processes. A backfill scans that many versions
+                at once, reading them from the object database regardless of
+                ``read_git_objects`` since worker processes can't share one
+                checkout; any other scan parses its metadata files across them.
+            incremental: Scan a new release by rescanning only the component
+                directories changed since the previous release in the inventory,
+                carrying every other component (and its README) forward
+            verify_incremental: Also fully scan each incrementally scanned
+                release and fail if the results differ
         """
         self.repos = repos
         self.inventory_manager = inventory_manager
+        self.read_git_objects = read_git_objects
+        self.jobs = jobs
+        self.metadata_cache = default_metadata_cache()
+        self.incremental = incremental
+        self.verify_incremental = verify_incremental
         self.version_detectors = {dist: VersionDetector(path) for dist, path in repos.items()}
         self.schema_copier = CollectorSchemaCopier()
         self.deprecation_detector = DeprecationDetector()
@@ -87,6 +125,11 @@ class CollectorSync:
         else:
             return f"opentelemetry-collector-{distribution}"
 
+    @staticmethod
+    def version_ref(version: Version) -> str:
+        """Git ref a version is scanned at: its tag for a release, ``main`` for a SNAPSHOT."""
+        return "main" if version.prerelease else f"v{version}"
+
     def scan_version(
         self,
         distribution: DistributionName,
@@ -96,17 +139,35 @@ class CollectorSync:
         """
         Scan a specific version of a distribution.
 
+        With ``read_git_objects``, the version is scanned at its git ref without
+        any checkout; otherwise the ref is checked out first.
+
         Args:
             distribution: Distribution name
             version: Version to scan
-            checkout: Whether to checkout the version tag (default: True)
+            checkout: Whether to scan the version's ref rather than the clone's
+                current working tree (default: True)
 
         Returns:
             Dictionary of component type to component list
         """
+        components = self._scanner(distribution, version, checkout).scan_all_components()
+
+        total = sum(len(comps) for comps in components.values())
+        logger.info("    Found %d components", total)
+
+        return components
+
+    def _scanner(self, distribution: DistributionName, version: Version, checkout: bool) -> ComponentScanner:
+        """A scanner for ``version``, checking its ref out first unless ``read_git_objects`` is set."""
         repo_path = self.repos[distribution]
         detector = self.version_detectors[distribution]
 
+        if checkout and self.read_git_objects:
+            ref = self.version_ref(version)
+            logger.info("  Scanning %s %s at %s...", distribution, version, ref)
+            return ComponentScanner(repo_path, ref=ref, jobs=self.jobs, metadata_cache=self.metadata_cache)
+
         if checkout and not version.prerelease:
             logger.info("  Checking out %s %s...", distribution, version)
             detector.checkout_version(version)
@@ -115,13 +176,91 @@ class CollectorSync:
             detector.checkout_main()
 
         logger.info("  Scanning %s %s...", distribution, version)
-        scanner = ComponentScanner(repo_path)
-        components = scanner.scan_all_components()
+        return ComponentScanner(repo_path, jobs=self.jobs, metadata_cache=self.metadata_cache)
+
+    def scan_version_incrementally(
+        self, distribution: DistributionName, version: Version, previous_version: Version
+    ) -> tuple[dict[str, list[dict[str, Any]]], dict[str, str]]:
+        """
+        Scan a release by rescanning only what changed since an earlier release.
+
+        The component directories touched by ``git diff`` between the two tags are
+        rescanned; every other component, and its README, is carried forward from
+        ``previous_version`` in the inventory. A component's scan depends only on
+        files in its own directory, so the result equals a full scan as long as the
+        inventory's copy of ``previous_version`` came from the current scanner
+        (a parser change requires a backfill anyway). ``verify_incremental`` checks
+        exactly that.
+
+        Args:
+            distribution: Distribution name
+            version: Release to scan
+            previous_version: Earlier release already in the inventory
+
+        Returns:
+            (components by type, README contents by component name), for save_version
+
+        Raises:
+            ValueError: If either release's tag does not exist
+            RuntimeError: If ``verify_incremental`` is set and a full scan differs
+        """
+        repo_path = self.repos[distribution]
+        with GitObjectReader(repo_path) as reader:
+            changed_files = reader.changed_files(self.version_ref(previous_version), self.version_ref(version))
+        touched = ComponentScanner.touched_component_dirs(changed_files)
+        logger.info(
+            "  %d file(s) changed since %s, touching %d component director(ies)",
+            len(changed_files),
+            previous_version,
+            sum(len(dirs) for dirs in touched.values()),
+        )
+
+        previous_components = self.inventory_manager.load_versioned_inventory(distribution, previous_version)[
+            "components"
+        ]
+        scanner = self._scanner(distribution, version, checkout=True)
+        components: dict[str, list[dict[str, Any]]] = {}
+        carried_names: list[str] = []
+        rescanned: dict[str, list[dict[str, Any]]] = {}
+        for component_type in COMPONENT_TYPES:
+            touched_dirs = touched.get(component_type, set())
+            carried = [
+                component
+                for component in previous_components.get(component_type, [])
+                if str(component_directory(component_type, component)) not in touched_dirs
+            ]
+            rescanned[component_type] = scanner.scan_components(component_type, touched_dirs) if touched_dirs else []
+            # Merge in the order a full scan lists components: by directory.
+            entries = [
+                (component_directory(component_type, component).parts, component)
+                for component in carried + rescanned[component_type]
+            ]
+            components[component_type] = [component for _, component in sorted(entries, key=lambda entry: entry[0])]
+            carried_names.extend(component["name"] for component in carried)
 
         total = sum(len(comps) for comps in components.values())
         logger.info("    Found %d components", total)
 
-        return components
+        readmes = self.inventory_manager.load_component_readmes(distribution, previous_version, carried_names)
+        readmes.update(discover_component_readmes(repo_path, rescanned, ref=scanner.ref))
+
+        if self.verify_incremental:
+            logger.info("  Verifying against a full scan of %s %s...", distribution, version)
+            full_components = scanner.scan_all_components()
+            full_readmes = discover_component_readmes(repo_path, full_components, ref=scanner.ref)
+            differing = sorted(
+                component_type
+                for component_type in COMPONENT_TYPES
+                if components[component_type] != full_components.get(component_type, [])
+            )
+            if full_readmes != readmes:
+                differing.append("component READMEs")
+            if differing:
+                raise RuntimeError(
+                    f"Incremental scan of {distribution} {version} differs from a full scan in: {', '.join(differing)}"
+                )
+
+        return components, readmes
 
     def _create_enriched_copy(
         self,
@@ -166,6 +305,7 @@ class CollectorSync:
         distribution: DistributionName,
         version: Version,
         components: dict[str, list[dict[str, Any]]],
+        readmes: dict[str, str] | None = None,
     ) -> None:
         """
         Save scanned components for a specific version.
@@ -195,6 +335,8 @@ class CollectorSync:
             distribution: Distribution name
             version: Version being saved
             components: Scanned components
+            readmes: README contents by component name, when already discovered
+                at this version; None discovers them here
         """
         schema_hash = self._resolve_schema_hash(version)
 
@@ -217,8 +359,10 @@ class CollectorSync:
         # as already tracked despite zero real component data ever being
         # written - causing process_latest_release() to skip it forever.
         repo_path = self.repos[distribution]
+        ref = self.version_ref(version) if self.read_git_objects else None
         try:
-            readmes = discover_component_readmes(repo_path, components)
+            if readmes is None:
+                readmes = discover_component_readmes(repo_path, components, ref=ref)
             written = self.inventory_manager.save_component_readmes(distribution, version, readmes.items())
             if written:
                 logger.info("  Saved %d component README(s)", written)
@@ -380,8 +524,17 @@ class CollectorSync:
         logger.info("Processing new release: %s %s", distribution, latest)
 
         self.initialize_previous_version(distribution)
-        components = self.scan_version(distribution, latest, checkout=True)
-        self.save_version(distribution, latest, components)
+        previous = self.previous_versions[distribution]
+        components = None
+        readmes = None
+        if self.incremental and previous is not None and previous < latest:
+            try:
+                components, readmes = self.scan_version_incrementally(distribution, latest, previous)
+            except ValueError as e:
+                logger.warning("  Incremental scan unavailable (%s); scanning the whole tree", e)
+        if components is None:
+            components = self.scan_version(distribution, latest, checkout=True)
+        self.save_version(distribution, latest, components, readmes=readmes)
         self.detect_and_track_deprecations(distribution, latest, components)
 
         return latest
@@ -496,6 +649,10 @@ class CollectorSync:
         Useful when scanner logic changes (e.g., new exclusions) and you want to
         apply changes to historical versions.
 
+        With ``jobs`` above 1, versions are scanned concurrently in worker
+        processes, while saving and deprecation tracking still happen here, one
+        version at a time in version order, so the result matches a serial run.
+
         Args:
             distribution: Distribution name
             versions: List of versions to backfill, or None to backfill all existing versions
@@ -523,7 +680,7 @@ class CollectorSync:
         self.previous_components[distribution] = {}
 
         processed = []
-        for version in sorted_versions:
+        for version, scan in self._backfill_scans(distribution, sorted_versions):
             logger.info("")
             logger.info("Backfilling %s %s...", distribution, version)
 
@@ -531,8 +688,12 @@ class CollectorSync:
             if deleted:
                 logger.info("  Deleted existing data")
 
-            components = self.scan_version(distribution, version, checkout=True)
-            self.save_version(distribution, version, components)
+            if scan is None:
+                components = self.scan_version(distribution, version, checkout=True)
+                readmes = None
+            else:
+                components, readmes = scan
+            self.save_version(distribution, version, components, readmes=readmes)
             self.detect_and_track_deprecations(distribution, version, components)
             processed.append(str(version))
 
@@ -544,6 +705,29 @@ class CollectorSync:
             "versions_processed": processed,
         }
 
+    def _backfill_scans(
+        self, distribution: DistributionName, versions: list[Version]
+    ) -> Iterator[tuple[Version, VersionScan | None]]:
+        """Yield each version with its scan, in the order of ``versions``.
+
+        The scan is None when the version should be scanned in-process with
+        :meth:`scan_version`, which is the case unless ``jobs`` is above 1.
+        """
+        if self.jobs <= 1 or len(versions) <= 1:
+            for version in versions:
+                yield version, None
+            return
+
+        workers = min(self.jobs, len(versions))
+        logger.info("Scanning %d %s versions across %d worker processes", len(versions), distribution, workers)
+        scan = partial(_scan_at_ref, self.repos[distribution], self.metadata_cache)
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            yield from zip(versions, executor.map(scan, [self.version_ref(v) for v in versions]), strict=True)
+        finally:
+            # Also reached when saving a version fails: drop the queued scans instead of finishing them.
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def backfill(
         self,
         versions_by_dist: dict[DistributionName, list[Version] | None] | None = None,
@@ -16,14 +16,61 @@
 
 This module scans collector repository directories to identify components
 and extract their metadata from metadata.yaml files.
+
+By default the working tree is scanned. Given a git ref, the scanner instead
+reads the tree and metadata.yaml blobs at that ref from the repository's object
+database (see watcher_common.git_objects), applying the same inclusion rules, so
+a version can be scanned without checking it out.
+
+Component directories are always discovered first and their metadata.yaml files
+parsed afterwards, which lets an opt-in worker pool parse them in parallel and a
+metadata cache (see metadata_cache) skip the files parsed in an earlier scan.
+scan_components() scans just some component directories, for incremental scans
+that only revisit what changed since an earlier version.
 """
 
-from pathlib import Path
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
 from typing import Any
 
-from .metadata_parser import MetadataParser
+from watcher_common.git_objects import GitObjectReader, decode_text, git_blob_id
+
+from .metadata_cache import MetadataParseCache
+from .metadata_parser import METADATA_FILENAME, parse_metadata_document
 from .type_defs import COMPONENT_TYPES
 
+# Metadata files handed to each pool worker at a time, per worker; bigger batches cut
+# pickling round-trips, smaller ones balance uneven files across workers.
+_BATCHES_PER_WORKER = 4
+
+
+def component_directory(component_type: str, component: dict[str, Any]) -> PurePosixPath:
+    """Repository-relative directory of a scanned component: ``{type}/{name}`` or ``{type}/{subtype}/{name}``."""
+    subtype = component.get("subtype")
+    if subtype:
+        return PurePosixPath(component_type, subtype, component["name"])
+    return PurePosixPath(component_type, component["name"])
+
+
+class _RefTree:
+    """Directory structure of part of a git tree, built from a flat file listing."""
+
+    def __init__(self, files: dict[str, str]):
+        """
+        Args:
+            files: Map of repository-relative POSIX file path to blob id
+        """
+        self.subdirectories: dict[str, set[str]] = {}
+        self.files: dict[str, dict[str, str]] = {}
+        for file_path, blob_id in files.items():
+            parts = file_path.split("/")
+            for depth in range(1, len(parts)):
+                parent = "/".join(parts[: depth - 1])
+                self.subdirectories.setdefault(parent, set()).add(parts[depth - 1])
+            self.files.setdefault("/".join(parts[:-1]), {})[parts[-1]] = blob_id
+
 
 class ComponentScanner:
     """Scans collector repositories for components."""
@@ -45,14 +92,33 @@ class ComponentScanner:
     # Directories that contain nested components (subtypes)
     NESTED_COMPONENT_DIRS = {"encoding", "observer", "storage"}
 
-    def __init__(self, repo_path: str):
+    def __init__(
+        self,
+        repo_path: str,
+        ref: str | None = None,
+        jobs: int = 1,
+        metadata_cache: MetadataParseCache | None = None,
+    ):
         """
         Args:
             repo_path: Path to the cloned repository
+            ref: Git ref (tag, branch or commit) to scan from the repository's
+                object database instead of the working tree. None scans the
+                working tree.
+            jobs: Number of worker processes metadata.yaml files are parsed in.
+                1 parses them in-process. Results are the same for any value.
+            metadata_cache: Cache of parsed metadata.yaml files by blob id, so only
+                files not seen before are parsed. None parses every file.
         """
         self.repo_path = Path(repo_path)
         if not self.repo_path.exists():
             raise ValueError(f"Repository path does not exist: {repo_path}")
+        self.ref = ref
+        self._reader = GitObjectReader(self.repo_path) if ref is not None else None
+        self._ref_trees: dict[str, _RefTree] = {}
+        self.jobs = jobs
+        self.metadata_cache = metadata_cache
+        self._executor: ProcessPoolExecutor | None = None
 
     def scan_all_components(self) -> dict[str, list[dict[str, Any]]]:
         """
@@ -62,8 +128,9 @@ class ComponentScanner:
             Dictionary mapping component types to lists of component info
         """
         components = {}
-        for component_type in COMPONENT_TYPES:
-            components[component_type] = self.scan_component_type(component_type)
+        with self._metadata_pool():
+            for component_type in COMPONENT_TYPES:
+                components[component_type] = self.scan_component_type(component_type)
         return components
 
     def scan_component_type(self, component_type: str) -> list[dict[str, Any]]:
@@ -76,43 +143,153 @@ class ComponentScanner:
         Returns:
             List of dictionaries containing component information
         """
-        component_dir = self.repo_path / component_type
-        if not component_dir.exists():
-            return []
+        component_dir = PurePosixPath(component_type)
+        try:
+            if not self._directory_exists(component_dir):
+                return []
 
-        components = []
-        for item in sorted(component_dir.iterdir()):
-            if item.is_dir():
+            found: list[tuple[PurePosixPath, str | None]] = []
+            for item in self._subdirectories(component_dir):
                 # Check if this is a nested component directory (e.g., extension/encoding)
                 if item.name in self.NESTED_COMPONENT_DIRS:
-                    nested_components = self._scan_nested_components(item, component_type, item.name)
-                    components.extend(nested_components)
+                    found.extend((nested, item.name) for nested in self._find_nested_components(item))
                 elif self._is_component_directory(item):
-                    component_info = self._extract_component_info(item, component_type)
-                    components.append(component_info)
+                    found.append((item, None))
 
-        return components
+            return self._components(component_type, found)
+        finally:
+            if self._reader is not None:
+                # Don't leave the cat-file process running between scans; the next read restarts it.
+                self._reader.close()
 
-    def _scan_nested_components(self, nested_dir: Path, component_type: str, subtype: str) -> list[dict[str, Any]]:
+    def scan_components(self, component_type: str, component_dirs: Iterable[str]) -> list[dict[str, Any]]:
         """
-        Scan a nested component directory (e.g., extension/encoding).
+        Scan only the given directories of a component type.
+
+        Each directory is judged by the same rules scan_component_type() applies,
+        so one that doesn't exist (or isn't a component) yields nothing.
 
         Args:
-            nested_dir: Path to the nested directory
-            component_type: Type of component (e.g., extension)
-            subtype: Subtype name (e.g., encoding, observer, storage)
+            component_type: Type of component (receiver, processor, exporter etc.)
+            component_dirs: Repository-relative directories under ``component_type``,
+                as ``{type}/{name}`` or, for nested components, ``{type}/{subtype}/{name}``
 
         Returns:
-            List of component dictionaries with subtype field set
+            Information for the directories that are components, in the order
+            scan_component_type() would list them
         """
-        components = []
-        for item in sorted(nested_dir.iterdir()):
-            if item.is_dir() and self._is_nested_component_directory(item):
-                component_info = self._extract_component_info(item, component_type, subtype=subtype)
-                components.append(component_info)
-        return components
+        paths = sorted({PurePosixPath(component_dir) for component_dir in component_dirs}, key=lambda path: path.parts)
+        try:
+            found: list[tuple[PurePosixPath, str | None]] = []
+            for path in paths:
+                if path.parts[0] != component_type or not self._is_directory(path):
+                    continue
+                if len(path.parts) == 2 and self._is_component_directory(path):
+                    found.append((path, None))
+                elif (
+                    len(path.parts) == 3
+                    and path.parts[1] in self.NESTED_COMPONENT_DIRS
+                    and self._is_nested_component_directory(path)
+                ):
+                    found.append((path, path.parts[1]))
+
+            return self._components(component_type, found)
+        finally:
+            if self._reader is not None:
+                self._reader.close()
+
+    @classmethod
+    def touched_component_dirs(cls, changed_files: Iterable[str]) -> dict[str, set[str]]:
+        """
+        Map changed files to the component directories whose scan they can affect.
+
+        A component's scan only depends on files inside its own directory, so a
+        directory is touched when any file below it changed.
 
-    def _is_valid_component_name(self, path: Path) -> bool:
+        Args:
+            changed_files: Repository-relative POSIX paths, e.g. from ``git diff --name-only``
+
+        Returns:
+            Component type to the touched directories of that type, in the form
+            scan_components() takes
+        """
+        touched: dict[str, set[str]] = {}
+        for changed_file in changed_files:
+            parts = changed_file.split("/")
+            if parts[0] not in COMPONENT_TYPES or len(parts) < 3:
+                continue
+            if parts[1] in cls.NESTED_COMPONENT_DIRS:
+                if len(parts) < 4:
+                    continue
+                component_dir = "/".join(parts[:3])
+            else:
+                component_dir = "/".join(parts[:2])
+            touched.setdefault(parts[0], set()).add(component_dir)
+        return touched
+
+    def _components(self, component_type: str, found: list[tuple[PurePosixPath, str | None]]) -> list[dict[str, Any]]:
+        """Component information for discovered (directory, subtype) pairs, metadata included."""
+        with self._metadata_pool():
+            metadata = self._parse_metadata(component_type, [path for path, _subtype in found])
+        return [
+            self._component_info(path, subtype, parsed) for (path, subtype), parsed in zip(found, metadata, strict=True)
+        ]
+
+    def _find_nested_components(self, nested_dir: PurePosixPath) -> list[PurePosixPath]:
+        """
+        Find the components in a nested component directory (e.g., extension/encoding).
+
+        Args:
+            nested_dir: Repository-relative path to the nested directory
+
+        Returns:
+            Repository-relative paths of the component directories, sorted by name
+        """
+        return [item for item in self._subdirectories(nested_dir) if self._is_nested_component_directory(item)]
+
+    @contextmanager
+    def _metadata_pool(self) -> Iterator[None]:
+        """Keep a worker pool for metadata parsing open for the block, if ``jobs`` > 1.
+
+        Nested blocks share the outermost block's pool, so scan_all_components()
+        starts the workers once rather than once per component type.
+        """
+        if self.jobs <= 1 or self._executor is not None:
+            yield
+            return
+
+        self._executor = ProcessPoolExecutor(max_workers=self.jobs)
+        try:
+            yield
+        finally:
+            executor, self._executor = self._executor, None
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _ref_tree(self, component_type: str) -> _RefTree:
+        """The tree of a component type's directory at ``self.ref``, listed once per scanner."""
+        if component_type not in self._ref_trees:
+            self._ref_trees[component_type] = _RefTree(self._reader.list_files(self.ref, [component_type]))
+        return self._ref_trees[component_type]
+
+    def _directory_exists(self, component_dir: PurePosixPath) -> bool:
+        """Whether a top-level component type directory exists."""
+        if self.ref is None:
+            return (self.repo_path / component_dir).exists()
+        return component_dir.name in self._ref_tree(component_dir.name).subdirectories.get("", ())
+
+    def _is_directory(self, path: PurePosixPath) -> bool:
+        """Whether a directory exists at a repository-relative path."""
+        if self.ref is None:
+            return (self.repo_path / path).is_dir()
+        return path.name in self._ref_tree(path.parts[0]).subdirectories.get(str(path.parent), ())
+
+    def _subdirectories(self, path: PurePosixPath) -> list[PurePosixPath]:
+        """Repository-relative paths of the directories directly inside ``path``, sorted by name."""
+        if self.ref is None:
+            return [path / item.name for item in sorted((self.repo_path / path).iterdir()) if item.is_dir()]
+        return [path / name for name in sorted(self._ref_tree(path.parts[0]).subdirectories.get(str(path), ()))]
+
+    def _is_valid_component_name(self, path: PurePosixPath) -> bool:
         """
         Check if a directory name is valid for a component.
 
@@ -135,22 +312,27 @@ class ComponentScanner:
                 return False
         return True
 
-    def _has_go_code(self, path: Path) -> bool:
+    def _has_go_code(self, path: PurePosixPath) -> bool:
         """
         Check if a directory contains Go code.
 
         Args:
-            path: Path to check
+            path: Repository-relative path to check
 
         Returns:
             True if directory has go.mod or .go files
         """
-        has_go_mod = (path / "go.mod").exists()
+        if self.ref is not None:
+            file_names = self._ref_tree(path.parts[0]).files.get(str(path), {})
+            return "go.mod" in file_names or any(name.endswith(".go") for name in file_names)
+
+        directory = self.repo_path / path
+        has_go_mod = (directory / "go.mod").exists()
         # Use next() to short-circuit and avoid scanning entire directory
-        has_go_files = next(path.glob("*.go"), None) is not None
+        has_go_files = next(directory.glob("*.go"), None) is not None
         return has_go_mod or has_go_files
 
-    def _is_nested_component_directory(self, path: Path) -> bool:
+    def _is_nested_component_directory(self, path: PurePosixPath) -> bool:
         """
         Check if a directory is a valid nested component.
 
@@ -164,7 +346,7 @@ class ComponentScanner:
         """
         return self._is_valid_component_name(path) and self._has_go_code(path)
 
-    def _is_component_directory(self, path: Path) -> bool:
+    def _is_component_directory(self, path: PurePosixPath) -> bool:
         """
         Check if a directory is a valid component.
 
@@ -189,24 +371,80 @@ class ComponentScanner:
 
         return self._has_go_code(path)
 
-    def _extract_component_info(
-        self, component_path: Path, component_type: str, subtype: str | None = None
+    def _parse_metadata(self, component_type: str, component_paths: list[PurePosixPath]) -> list[dict[str, Any] | None]:
+        """
+        Parse the metadata.yaml of each component, in the pool if one is open.
+
+        Files found in the metadata cache by blob id are not read (at a git ref) or
+        parsed again; the rest are parsed and added to it.
+
+        Args:
+            component_type: Type of the components
+            component_paths: Repository-relative paths to the component directories
+
+        Returns:
+            Parsed metadata per component, in the order of ``component_paths``; None
+            where a component has no metadata.yaml or it failed to parse
+        """
+        if self.ref is None:
+            metadata_files = {path: self.repo_path / path / METADATA_FILENAME for path in component_paths}
+            contents = {path: file.read_bytes() for path, file in metadata_files.items() if file.exists()}
+            blob_ids = {path: git_blob_id(content) for path, content in contents.items()}
+            sources = {path: str(metadata_files[path]) for path in contents}
+        else:
+            tree = self._ref_tree(component_type)
+            blob_ids = {
+                path: blob_id
+                for path in component_paths
+                if (blob_id := tree.files.get(str(path), {}).get(METADATA_FILENAME)) is not None
+            }
+            sources = {path: f"{self.ref}:{path / METADATA_FILENAME}" for path in blob_ids}
+
+        parsed: dict[PurePosixPath, dict[str, Any] | None] = {}
+        if self.metadata_cache is not None:
+            for path, blob_id in blob_ids.items():
+                cached = self.metadata_cache.get(blob_id)
+                if cached is not None:
+                    parsed[path] = cached
+        misses = [path for path in blob_ids if path not in parsed]
+
+        if self.ref is not None:
+            # Blobs are read here, through the one cat-file process; only parsing is farmed out.
+            contents = {path: self._reader.read_blob(blob_ids[path]) for path in misses}
+            # Stop cat-file before any pool worker starts: a forked worker would inherit its
+            # stdin pipe and keep it from ever seeing EOF, hanging close().
+            self._reader.close()
+
+        documents = [decode_text(contents[path]) for path in misses]
+        miss_sources = [sources[path] for path in misses]
+        if self._executor is None or len(misses) <= 1:
+            results = list(map(parse_metadata_document, documents, miss_sources))
+        else:
+            chunksize = max(1, len(misses) // (self.jobs * _BATCHES_PER_WORKER))
+            results = list(self._executor.map(parse_metadata_document, documents, miss_sources, chunksize=chunksize))
+        parsed.update(zip(misses, results, strict=True))
+
+        if self.metadata_cache is not None:
+            self.metadata_cache.put_many(
+                (blob_ids[path], result) for path, result in zip(misses, results) if result is not None
+            )
+        return [parsed.get(path) for path in component_paths]
+
+    def _component_info(
+        self, component_path: PurePosixPath, subtype: str | None, metadata: dict[str, Any] | None
     ) -> dict[str, Any]:
         """
-        Extract information about a component.
+        Build the information about a component.
 
         Args:
-            component_path: Path to the component directory
-            component_type: Type of component
+            component_path: Repository-relative path to the component directory
             subtype: Optional subtype (e.g., "encoding", "observer", "storage")
+            metadata: The component's parsed metadata, None if it has none
 
         Returns:
             Dictionary with component information
         """
-        parser = MetadataParser(component_path)
-        has_metadata = parser.has_metadata()
-
-        component_info = {
+        component_info: dict[str, Any] = {
             "name": component_path.name,
         }
 
@@ -214,12 +452,8 @@ class ComponentScanner:
         if subtype:
             component_info["subtype"] = subtype
 
-        if has_metadata:
-            parsed_metadata = parser.parse()
-            if parsed_metadata:
-                component_info["metadata"] = parsed_metadata
-            else:
-                component_info["has_metadata"] = False
+        if metadata:
+            component_info["metadata"] = metadata
         else:
             component_info["has_metadata"] = False
 
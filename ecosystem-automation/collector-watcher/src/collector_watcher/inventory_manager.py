@@ -23,7 +23,9 @@ from typing import Any
 
 import yaml
 from semantic_version import Version
+from watcher_common import yaml_io
 from watcher_common.content_hashing import compute_content_hash
+from watcher_common.yaml_cache import load_yaml_file
 
 from .type_defs import COMPONENT_TYPES, DistributionName
 
@@ -95,7 +97,7 @@ class InventoryManager:
                     for component_file in version_dir.glob("*.yaml"):
                         try:
                             with open(component_file, encoding="utf-8") as f:
-                                data = yaml.safe_load(f) or {}
+                                data = yaml_io.safe_load(f) or {}
                         except yaml.YAMLError:
                             continue
                         schema_hash = data.get("schema_hash")
@@ -146,7 +148,7 @@ class InventoryManager:
             }
 
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.dump(component_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+                yaml_io.safe_dump(component_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     def load_versioned_inventory(self, distribution: DistributionName, version: Version) -> dict[str, Any]:
         """
@@ -174,13 +176,12 @@ class InventoryManager:
             file_path = version_dir / f"{component_type}.yaml"
 
             if file_path.exists():
-                with open(file_path, encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-                    components[component_type] = data.get("components", [])
-                    if not repository:
-                        repository = data.get("repository", "")
-                    if schema_hash == "unknown":
-                        schema_hash = data.get("schema_hash", "unknown")
+                data = load_yaml_file(file_path) or {}
+                components[component_type] = data.get("components", [])
+                if not repository:
+                    repository = data.get("repository", "")
+                if schema_hash == "unknown":
+                    schema_hash = data.get("schema_hash", "unknown")
             else:
                 components[component_type] = []
 
@@ -318,6 +319,32 @@ class InventoryManager:
             logger.error("Failed to read README file '%s': %s", file_path, e)
             return None
 
+    def load_component_readmes(
+        self, distribution: DistributionName, version: Version, component_names: Iterable[str]
+    ) -> dict[str, str]:
+        """
+        Load the stored README of each named component that has one.
+
+        Args:
+            distribution: Distribution name (core or contrib)
+            version: Version to load from
+            component_names: Names of the components, as scanned
+
+        Returns:
+            Dictionary mapping component name to README content, in the shape
+            readme_scanner.discover_component_readmes() returns
+        """
+        readme_map = self.load_component_readme_map(distribution, version)
+        readmes = {}
+        for name in component_names:
+            markdown_hash = readme_map.get(self._sanitize_name(name))
+            if markdown_hash is None:
+                continue
+            content = self.load_component_readme_content(distribution, version, name, markdown_hash)
+            if content is not None:
+                readmes[name] = content
+        return readmes
+
     def _parse_readme_filename(self, filename: str) -> tuple[str, str] | None:
         """
         Parse a README filename into (component_name, markdown_hash).
@@ -485,7 +512,7 @@ class InventoryManager:
             }
 
         with open(deprecations_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_io.safe_load(f) or {}
 
         for dist in ["core", "contrib"]:
             if dist not in data:
@@ -507,7 +534,7 @@ class InventoryManager:
         self.inventory_dir.mkdir(parents=True, exist_ok=True)
 
         with open(deprecations_file, "w", encoding="utf-8") as f:
-            yaml.dump(deprecations, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml_io.safe_dump(deprecations, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
         logger.info(f"Saved deprecations index to {deprecations_file}")
 
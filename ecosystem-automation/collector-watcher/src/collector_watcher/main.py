@@ -72,12 +72,44 @@ def main():
         help="Delete existing release versions NOT listed in --versions before backfilling "
         "(SNAPSHOT versions are always kept). Requires --backfill and --versions.",
     )
+    parser.add_argument(
+        "--read-git-objects",
+        action="store_true",
+        help="Scan each version at its git tag (or main) straight from the clone's object database "
+        "instead of checking it out. Leaves the clones' working trees untouched.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes. A backfill scans N versions at once, reading them from the git "
+        "object database (as with --read-git-objects); a sync parses each version's metadata files across "
+        "them. Output is identical for any N.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Scan a new release by rescanning only the component directories changed since the previous "
+        "release in the inventory (git diff between the tags), carrying the rest forward.",
+    )
+    parser.add_argument(
+        "--verify-incremental",
+        action="store_true",
+        help="With --incremental, also fully scan each new release and fail if the results differ.",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     if args.prune_unlisted and not (args.backfill and args.versions):
         logger.error("--prune-unlisted requires both --backfill and --versions")
         sys.exit(1)
 
+    if args.verify_incremental and not args.incremental:
+        logger.error("--verify-incremental requires --incremental")
+        sys.exit(1)
+
     logger.info("Collector Watcher")
     logger.info("Inventory directory: %s", args.inventory_dir)
 
@@ -91,8 +123,12 @@ def main():
             logger.info("Versions: auto-detect all existing versions")
         if args.prune_unlisted:
             logger.info("Prune unlisted: delete release versions not in --versions (keeping SNAPSHOTs)")
+        if args.jobs > 1:
+            logger.info("Jobs: %d worker processes", args.jobs)
     else:
         logger.info("Mode: SYNC")
+        if args.incremental:
+            logger.info("Incremental: rescan only components changed since the previous release")
 
     logger.info("")
 
@@ -115,6 +151,10 @@ def main():
         collector_sync = CollectorSync(
             repos=dist_config,
             inventory_manager=inventory_manager,
+            read_git_objects=args.read_git_objects,
+            jobs=args.jobs,
+            incremental=args.incremental,
+            verify_incremental=args.verify_incremental,
         )
 
         if args.backfill:
@@ -0,0 +1,113 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""On-disk cache of parsed metadata.yaml files, keyed by git blob id.
+
+Between consecutive collector releases only a small fraction of the
+metadata.yaml files change, yet every scan parsed and normalized all of them.
+ComponentScanner looks each file up here by its git blob id (listed by
+``git ls-tree`` when scanning a git ref, hashed from the file otherwise) and
+parses only the misses, so scanning many tags costs roughly what changed
+between them.
+
+Keys also cover the parser itself: a digest of the metadata_parser and yaml_io
+sources and the PyYAML version. Any change to the parser therefore invalidates
+every entry, with no version number to remember to bump before a backfill. Only
+successful parses are stored, so a file that fails to parse is retried (and
+warned about) on every scan. Entries live in a
+:class:`~watcher_common.pickle_store.PickleStore`, evicted least recently used first
+once the cache grows past its size bound.
+
+The cache directory defaults to
+``$XDG_CACHE_HOME/otel-ecosystem-explorer/collector-metadata`` and can be moved
+with ``COLLECTOR_METADATA_CACHE_DIR``; setting that variable to an empty string
+disables caching. Any cache failure falls back to parsing.
+"""
+
+import hashlib
+from collections.abc import Iterable
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+from watcher_common import yaml_io
+from watcher_common.pickle_store import PickleStore, default_store_dir
+
+from . import metadata_parser
+
+CACHE_DIR_ENV_VAR = "COLLECTOR_METADATA_CACHE_DIR"
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+@cache
+def parser_fingerprint() -> bytes:
+    """Digest of everything a parse result depends on besides the file itself."""
+    digest = hashlib.sha256(b"collector-metadata-v1\0" + yaml.__version__.encode())
+    for module in (metadata_parser, yaml_io):
+        digest.update(b"\0" + Path(module.__file__).read_bytes())
+    return digest.digest()
+
+
+class MetadataParseCache:
+    """Size-bounded cache of parsed metadata.yaml files, keyed by blob id and parser."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_bytes: Total entry size above which least recently used entries are evicted
+        """
+        self.store = PickleStore(cache_dir, max_bytes)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache entries."""
+        return self.store.cache_dir
+
+    def get(self, blob_id: str) -> dict[str, Any] | None:
+        """
+        Return the parsed metadata of a blob, or None if it is not cached.
+
+        Every call returns a fresh object, so callers may mutate the result.
+
+        Args:
+            blob_id: Git blob id of the metadata.yaml file
+        """
+        try:
+            return self.store.get(self._key(blob_id))
+        except KeyError:
+            return None
+
+    def put_many(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """
+        Store the parsed metadata of several blobs, then enforce the size bound once.
+
+        Args:
+            items: (git blob id of the metadata.yaml file, its normalized parse result) pairs
+        """
+        stored = False
+        for blob_id, metadata in items:
+            stored |= self.store.put(self._key(blob_id), metadata)
+        if stored:
+            self.store.evict()
+
+    def _key(self, blob_id: str) -> str:
+        return hashlib.sha256(parser_fingerprint() + blob_id.encode("ascii")).hexdigest()
+
+
+def default_metadata_cache() -> MetadataParseCache | None:
+    """The cache in the directory configured by the environment, or None if caching is disabled."""
+    cache_dir = default_store_dir(CACHE_DIR_ENV_VAR, "collector-metadata")
+    return MetadataParseCache(cache_dir) if cache_dir is not None else None
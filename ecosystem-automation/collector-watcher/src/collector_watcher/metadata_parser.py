@@ -38,12 +38,15 @@ import logging
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
+from watcher_common import yaml_io
 
 logger = logging.getLogger(__name__)
 
+METADATA_FILENAME = "metadata.yaml"
+
 
 # ---------------------------------------------------------------------------
 # Abstract base
@@ -346,23 +349,72 @@ def parse_component_metadata(raw: dict[str, Any], schema_version: str | None = N
     return parser.parse(raw)
 
 
+def parse_metadata_document(
+    document: str | bytes | IO[str], source: str, schema_version: str | None = None
+) -> dict[str, Any] | None:
+    """
+    Parse the text of a metadata.yaml file using the appropriate parser version.
+
+    Shared by MetadataParser and ComponentScanner, which reads documents from
+    the working tree or from the object database, so every caller treats a
+    document alike.
+
+    Args:
+        document: The file's content, or a stream of it.
+        source: Where the document came from, for log messages.
+        schema_version: Override the parser version. If None, auto-detection
+            is attempted from the document's schema_version / file_format field;
+            if that field is absent the default parser is used.
+
+    Returns:
+        Normalised metadata dict, or None on failure.
+    """
+    try:
+        raw = yaml_io.safe_load(document)
+    except yaml.YAMLError as e:
+        logger.warning("Failed to parse %s: %s", source, e)
+        return None
+
+    try:
+        if not raw:
+            return None
+
+        if schema_version is None:
+            # Auto-detect from the file itself. The upstream schema does not yet
+            # carry this field; the lookup is a no-op for now and will activate
+            # transparently once the upstream adds file_format or schema_version.
+            schema_version = raw.get("schema_version") or raw.get("file_format")
+
+        return parse_component_metadata(raw, schema_version)
+
+    except ValueError:
+        # Propagate unsupported schema_version as a programming error, not a
+        # data error.  The caller passed (or the file declared) a version string
+        # that has no registered parser.
+        raise
+    except Exception as e:
+        logger.warning("Unexpected error parsing %s: %s", source, e)
+        return None
+
+
 # ---------------------------------------------------------------------------
-# File-I/O wrapper (backward-compatible entry point used by ComponentScanner)
+# File-I/O wrapper (entry point for parsing a single component directory)
 # ---------------------------------------------------------------------------
 
 
 class MetadataParser:
     """File-I/O wrapper around the versioned parser infrastructure.
 
-    ComponentScanner uses this class unchanged: MetadataParser(path).parse().
-    Internally it reads metadata.yaml, auto-detects schema_version from the
-    file's own fields (once the upstream gains a file_format field), and
-    delegates to parse_component_metadata().
+    MetadataParser(path).parse() reads metadata.yaml, auto-detects
+    schema_version from the file's own fields (once the upstream gains a
+    file_format field), and delegates to parse_metadata_document().
+    ComponentScanner reads the files itself, so it can skip those already in
+    the metadata cache, and calls parse_metadata_document() directly.
     """
 
     def __init__(self, component_path: Path):
         self.component_path = Path(component_path)
-        self.metadata_path = self.component_path / "metadata.yaml"
+        self.metadata_path = self.component_path / METADATA_FILENAME
 
     def has_metadata(self) -> bool:
         return self.metadata_path.exists()
@@ -382,30 +434,5 @@ class MetadataParser:
         if not self.has_metadata():
             return None
 
-        try:
-            with open(self.metadata_path, encoding="utf-8") as f:
-                raw = yaml.safe_load(f)
-        except yaml.YAMLError as e:
-            logger.warning("Failed to parse %s: %s", self.metadata_path, e)
-            return None
-
-        try:
-            if not raw:
-                return None
-
-            if schema_version is None:
-                # Auto-detect from the file itself. The upstream schema does not yet
-                # carry this field; the lookup is a no-op for now and will activate
-                # transparently once the upstream adds file_format or schema_version.
-                schema_version = raw.get("schema_version") or raw.get("file_format")
-
-            return parse_component_metadata(raw, schema_version)
-
-        except ValueError:
-            # Propagate unsupported schema_version as a programming error, not a
-            # data error.  The caller passed (or the file declared) a version string
-            # that has no registered parser.
-            raise
-        except Exception as e:
-            logger.warning("Unexpected error parsing %s: %s", self.metadata_path, e)
-            return None
+        with open(self.metadata_path, encoding="utf-8") as f:
+            return parse_metadata_document(f, str(self.metadata_path), schema_version)
@@ -17,19 +17,24 @@
 Unlike java-instrumentation-watcher, which fetches individual files remotely
 over the GitHub API, collector-watcher already works against a full local
 clone (see repository_manager.py), so discovering a component's README is a
-direct filesystem check rather than a tree/blob API call.
+direct filesystem check rather than a tree/blob API call. Given a git ref, the
+READMEs are read at that ref from the clone's object database instead.
 """
 
 import logging
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from typing import Any
 
+from watcher_common.git_objects import GitObjectReader
+
 logger = logging.getLogger(__name__)
 
 README_FILENAME = "README.md"
 
 
-def discover_component_readmes(repo_path: str, components: dict[str, list[dict[str, Any]]]) -> dict[str, str]:
+def discover_component_readmes(
+    repo_path: str, components: dict[str, list[dict[str, Any]]], ref: str | None = None
+) -> dict[str, str]:
     """
     Find and read README.md files for already-scanned components.
 
@@ -41,15 +46,40 @@ def discover_component_readmes(repo_path: str, components: dict[str, list[dict[s
     Args:
         repo_path: Path to the cloned repository (the same one that was scanned)
         components: Output of ComponentScanner.scan_all_components()
+        ref: Git ref the components were scanned at (see ComponentScanner). None
+            reads the working tree.
 
     Returns:
         Dictionary mapping component name to README content. Components with
         no README.md, or whose README couldn't be read, are omitted rather
         than raising - a single unreadable file should never fail a sync.
     """
+    if ref is not None:
+        with GitObjectReader(repo_path) as reader:
+            readmes_at_ref = {
+                name: reader.read_text(f"{ref}:{readme_path}") for name, readme_path in _readme_paths(components)
+            }
+        return {name: readme for name, readme in readmes_at_ref.items() if readme is not None}
+
     base = Path(repo_path)
     readmes: dict[str, str] = {}
 
+    for name, relative_path in _readme_paths(components):
+        readme_path = base / relative_path
+        if not readme_path.is_file():
+            continue
+
+        try:
+            readmes[name] = readme_path.read_text(encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to read README for '%s' at %s: %s", name, readme_path, e)
+
+    return readmes
+
+
+def _readme_paths(components: dict[str, list[dict[str, Any]]]) -> list[tuple[str, PurePosixPath]]:
+    """(component name, repository-relative README path) for every named component."""
+    paths = []
     for component_type, component_list in components.items():
         for component in component_list:
             name = component.get("name")
@@ -57,15 +87,8 @@ def discover_component_readmes(repo_path: str, components: dict[str, list[dict[s
                 continue
 
             subtype = component.get("subtype")
-            component_dir = base / component_type / subtype / name if subtype else base / component_type / name
-
-            readme_path = component_dir / README_FILENAME
-            if not readme_path.is_file():
-                continue
-
-            try:
-                readmes[name] = readme_path.read_text(encoding="utf-8")
-            except OSError as e:
-                logger.warning("Failed to read README for '%s' at %s: %s", name, readme_path, e)
-
-    return readmes
+            component_dir = (
+                PurePosixPath(component_type, subtype, name) if subtype else PurePosixPath(component_type, name)
+            )
+            paths.append((name, component_dir / README_FILENAME))
+    return paths
@@ -24,7 +24,7 @@ holding that schema (no version directory lookup required).
 import logging
 from pathlib import Path
 
-import yaml
+from watcher_common import yaml_io
 from watcher_common.content_hashing import compute_content_hash
 
 logger = logging.getLogger(__name__)
@@ -110,8 +110,8 @@ class CollectorSchemaCopier:
         upgrades. Changing these options re-hashes every schema and requires a
         full backfill to keep the store deduplicated.
         """
-        data = yaml.safe_load(content)
-        return yaml.safe_dump(
+        data = yaml_io.safe_load(content)
+        return yaml_io.safe_dump(
             data,
             sort_keys=True,
             default_flow_style=False,
@@ -26,7 +26,7 @@ import yaml
 from collector_watcher.collector_sync import CollectorSync
 from collector_watcher.inventory_manager import InventoryManager
 from semantic_version import Version
-from watcher_common.testing import init_repo, run_git
+from watcher_common.testing import git_commit, init_repo, run_git
 
 
 def set_core_schema(repo_path, content, tag=None):
@@ -462,6 +462,24 @@ def test_scan_version_release_checkout(collector_sync, sample_components):
             mock_checkout.assert_called_once_with(release_version)
 
 
+def test_scan_version_reading_git_objects_skips_checkout(collector_sync, sample_components):
+    collector_sync.read_git_objects = True
+    detector = collector_sync.version_detectors["core"]
+    with (
+        patch("collector_watcher.collector_sync.ComponentScanner") as mock_scanner,
+        patch.object(detector, "checkout_version") as mock_checkout_version,
+        patch.object(detector, "checkout_main") as mock_checkout_main,
+    ):
+        mock_scanner.return_value.scan_all_components.return_value = sample_components
+
+        collector_sync.scan_version("core", Version("0.112.0"))
+        collector_sync.scan_version("core", Version("0.113.0-SNAPSHOT"))
+
+    mock_checkout_version.assert_not_called()
+    mock_checkout_main.assert_not_called()
+    assert [c.kwargs["ref"] for c in mock_scanner.call_args_list] == ["v0.112.0", "main"]
+
+
 def test_deprecations_not_tracked_for_snapshots(collector_sync):
     previous_components = {
         "receiver": [
@@ -586,6 +604,29 @@ def test_save_version_discovers_and_saves_component_readmes(
     assert content == "# OTLP Receiver"
 
 
+def test_save_version_reading_git_objects_reads_readmes_at_version_tag(
+    collector_sync, sample_components, temp_git_repos
+):
+    repo_path = Path(temp_git_repos["core"])
+    receiver_dir = repo_path / "receiver" / "otlpreceiver"
+    receiver_dir.mkdir(parents=True)
+    (receiver_dir / "README.md").write_text("# OTLP Receiver 0.113.0")
+    run_git(repo_path, "add", "-A")
+    run_git(repo_path, "commit", "-m", "Add README")
+    run_git(repo_path, "tag", "v0.113.0")
+    (receiver_dir / "README.md").write_text("# Not committed")
+    collector_sync.read_git_objects = True
+
+    collector_sync.save_version("core", Version("0.113.0"), sample_components)
+
+    manager = collector_sync.inventory_manager
+    readme_map = manager.load_component_readme_map("core", Version("0.113.0"))
+    content = manager.load_component_readme_content(
+        "core", Version("0.113.0"), "otlpreceiver", readme_map["otlpreceiver"]
+    )
+    assert content == "# OTLP Receiver 0.113.0"
+
+
 def test_save_version_with_no_readmes_persists_no_readme_content(collector_sync, sample_components, temp_inventory_dir):
     """Most components won't have a README - no readme content should be persisted."""
     version = Version("0.112.0")
@@ -885,3 +926,182 @@ def test_backfill_prune_unlisted_resets_deprecations_for_distribution(
 
     # The stale entry is cleared so deprecations.yaml reflects only surviving versions.
     assert collector_sync.deprecations["core"]["receiver"] == []
+
+
+def _commit_components(repo_path, tag, components, readmes=None):
+    """Replace the repo's receivers with ``components`` ({name: metadata yaml}), commit and tag."""
+    shutil.rmtree(repo_path / "receiver", ignore_errors=True)
+    for name, metadata in components.items():
+        component_dir = repo_path / "receiver" / name
+        component_dir.mkdir(parents=True)
+        (component_dir / "go.mod").touch()
+        (component_dir / "metadata.yaml").write_text(metadata)
+        if readmes and name in readmes:
+            (component_dir / "README.md").write_text(readmes[name])
+    run_git(repo_path, "add", "-A")
+    git_commit(repo_path, tag)
+    run_git(repo_path, "tag", tag)
+
+
+def test_parallel_backfill_matches_serial_backfill(tmp_path):
+    repo_path = tmp_path / "core"
+    repo_path.mkdir()
+    init_repo(repo_path)
+    _commit_components(
+        repo_path, "v0.1.0", {"otlpreceiver": "type: otlp\n", "oldreceiver": "type: old\n"}, {"otlpreceiver": "# 1"}
+    )
+    _commit_components(repo_path, "v0.2.0", {"otlpreceiver": "type: otlp\nstatus: {}\n"}, {"otlpreceiver": "# 2"})
+    _commit_components(repo_path, "v0.3.0", {"otlpreceiver": "type: otlp\n", "kafkareceiver": "type: kafka\n"})
+    versions = [Version("0.3.0"), Version("0.1.0"), Version("0.2.0")]
+
+    inventories = {}
+    for jobs in (1, 3):
+        inventory_dir = tmp_path / f"inventory-{jobs}"
+        sync = CollectorSync(
+            repos={"core": str(repo_path)}, inventory_manager=InventoryManager(str(inventory_dir)), jobs=jobs
+        )
+        sync.backfill({"core": versions})
+        inventories[jobs] = {
+            path.relative_to(inventory_dir): path.read_bytes() for path in inventory_dir.rglob("*") if path.is_file()
+        }
+
+    assert inventories[3] == inventories[1]
+    assert any("deprecations" in str(path) for path in inventories[1])
+    assert any("component_readmes" in str(path) for path in inventories[1])
+
+
+def _commit_files(repo_path, tag, files):
+    """Replace every tracked file with ``files`` ({relative path: content}), commit and tag."""
+    for item in repo_path.iterdir():
+        if item.name != ".git":
+            shutil.rmtree(item) if item.is_dir() else item.unlink()
+    for relative_path, content in files.items():
+        (repo_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (repo_path / relative_path).write_text(content)
+    run_git(repo_path, "add", "-A")
+    git_commit(repo_path, tag)
+    run_git(repo_path, "tag", tag)
+
+
+@pytest.fixture
+def two_release_repo(tmp_path):
+    """A core repo whose v0.2.0 changes, removes and adds components relative to v0.1.0."""
+    repo_path = tmp_path / "core"
+    repo_path.mkdir()
+    init_repo(repo_path)
+    unchanged = {
+        "receiver/otlpreceiver/go.mod": "",
+        "receiver/otlpreceiver/metadata.yaml": "type: otlp\n",
+        "receiver/otlpreceiver/README.md": "# OTLP",
+        "extension/storage/filestorage/go.mod": "",
+        "extension/storage/filestorage/metadata.yaml": "type: file_storage\n",
+        "extension/storage/filestorage/README.md": "# File storage",
+    }
+    _commit_files(
+        repo_path,
+        "v0.1.0",
+        {
+            **unchanged,
+            "receiver/kafkareceiver/go.mod": "",
+            "receiver/kafkareceiver/metadata.yaml": "type: kafka\n",
+            "receiver/kafkareceiver/README.md": "# Kafka",
+            "processor/oldprocessor/go.mod": "",
+        },
+    )
+    _commit_files(
+        repo_path,
+        "v0.2.0",
+        {
+            **unchanged,
+            "receiver/kafkareceiver/go.mod": "",
+            "receiver/kafkareceiver/metadata.yaml": "type: kafka\nstatus: {class: receiver}\n",
+            "receiver/kafkareceiver/README.md": "# Kafka, revised",
+            "receiver/zipkinreceiver/zipkin.go": "package zipkinreceiver\n",
+            "extension/storage/dbstorage/go.mod": "",
+        },
+    )
+    return repo_path
+
+
+def _sync_latest_release(repo_path, inventory_dir, **options):
+    """Backfill v0.1.0, then process the latest release; return the written files."""
+    sync = CollectorSync(
+        repos={"core": str(repo_path)}, inventory_manager=InventoryManager(str(inventory_dir)), **options
+    )
+    sync.backfill_versions("core", [Version("0.1.0")])
+    sync.previous_versions.clear()
+    assert sync.process_latest_release("core") == Version("0.2.0")
+    return {path.relative_to(inventory_dir): path.read_bytes() for path in inventory_dir.rglob("*") if path.is_file()}
+
+
+def test_incremental_release_scan_matches_full_scan(two_release_repo, tmp_path):
+    full = _sync_latest_release(two_release_repo, tmp_path / "full")
+
+    with patch.object(
+        CollectorSync, "scan_version", autospec=True, side_effect=CollectorSync.scan_version
+    ) as mock_scan_version:
+        incremental = _sync_latest_release(
+            two_release_repo, tmp_path / "incremental", incremental=True, verify_incremental=True
+        )
+
+    assert incremental == full
+    # Only the backfill of v0.1.0 went through a full scan.
+    assert [c.args[2] for c in mock_scan_version.call_args_list] == [Version("0.1.0")]
+
+
+def test_incremental_release_scan_reading_git_objects(two_release_repo, tmp_path):
+    full = _sync_latest_release(two_release_repo, tmp_path / "full")
+
+    incremental = _sync_latest_release(
+        two_release_repo, tmp_path / "incremental", incremental=True, verify_incremental=True, read_git_objects=True
+    )
+
+    assert incremental == full
+
+
+def test_incremental_release_scan_rescans_only_touched_components(two_release_repo, tmp_path):
+    sync = CollectorSync(
+        repos={"core": str(two_release_repo)}, inventory_manager=InventoryManager(str(tmp_path / "inventory"))
+    )
+    sync.backfill_versions("core", [Version("0.1.0")])
+
+    with patch("collector_watcher.collector_sync.ComponentScanner.scan_components", autospec=True) as mock_scan:
+        mock_scan.return_value = []
+        sync.scan_version_incrementally("core", Version("0.2.0"), Version("0.1.0"))
+
+    scanned = {component_type: set(dirs) for _, component_type, dirs in (c.args for c in mock_scan.call_args_list)}
+    assert scanned == {
+        "extension": {"extension/storage/dbstorage"},
+        "processor": {"processor/oldprocessor"},
+        "receiver": {"receiver/kafkareceiver", "receiver/zipkinreceiver"},
+    }
+
+
+def test_verify_incremental_fails_on_stale_previous_inventory(two_release_repo, tmp_path):
+    inventory_manager = InventoryManager(str(tmp_path / "inventory"))
+    sync = CollectorSync(
+        repos={"core": str(two_release_repo)},
+        inventory_manager=inventory_manager,
+        incremental=True,
+        verify_incremental=True,
+    )
+    sync.backfill_versions("core", [Version("0.1.0")])
+    receivers = inventory_manager.get_version_dir("core", Version("0.1.0")) / "receiver.yaml"
+    receivers.write_text(receivers.read_text().replace("type: otlp", "type: stale"))
+
+    with pytest.raises(RuntimeError, match="receiver"):
+        sync.scan_version_incrementally("core", Version("0.2.0"), Version("0.1.0"))
+
+
+def test_incremental_falls_back_to_full_scan_without_previous_tag(two_release_repo, tmp_path):
+    sync = CollectorSync(
+        repos={"core": str(two_release_repo)},
+        inventory_manager=InventoryManager(str(tmp_path / "inventory")),
+        incremental=True,
+    )
+    sync.save_version("core", Version("0.0.9"), {"receiver": []})
+
+    with patch.object(sync, "scan_version", wraps=sync.scan_version) as mock_scan_version:
+        assert sync.process_latest_release("core") == Version("0.2.0")
+
+    mock_scan_version.assert_called_once_with("core", Version("0.2.0"), checkout=True)
@@ -17,9 +17,13 @@
 import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from collector_watcher.component_scanner import ComponentScanner
+from collector_watcher.component_scanner import ComponentScanner, component_directory
+from collector_watcher.metadata_cache import MetadataParseCache
+from collector_watcher.metadata_parser import parse_metadata_document
+from watcher_common.testing import git_commit, init_repo, run_git
 
 
 @pytest.fixture
@@ -268,3 +272,106 @@ def test_scan_empty_component_type_directory(mock_repo):
     scanner = ComponentScanner(str(mock_repo))
     connectors = scanner.scan_component_type("connector")
     assert len(connectors) == 0
+
+
+def test_scan_at_ref_matches_scan_of_checkout(mock_repo):
+    init_repo(mock_repo)
+    run_git(mock_repo, "add", "-A")
+    git_commit(mock_repo, "components")
+    run_git(mock_repo, "tag", "v0.1.0")
+    expected = ComponentScanner(str(mock_repo)).scan_all_components()
+
+    # Change the working tree after tagging; a ref scan must not see it.
+    shutil.rmtree(mock_repo / "processor" / "batchprocessor")
+    (mock_repo / "receiver" / "otlpreceiver" / "metadata.yaml").write_text("type: changed")
+    (mock_repo / "receiver" / "newreceiver").mkdir()
+    (mock_repo / "receiver" / "newreceiver" / "go.mod").touch()
+
+    assert ComponentScanner(str(mock_repo), ref="v0.1.0").scan_all_components() == expected
+
+
+def test_scan_at_ref_with_nested_subtypes(mock_repo_with_nested):
+    init_repo(mock_repo_with_nested)
+    run_git(mock_repo_with_nested, "add", "-A")
+    git_commit(mock_repo_with_nested, "components")
+
+    scanner = ComponentScanner(str(mock_repo_with_nested), ref="HEAD")
+
+    assert scanner.scan_all_components() == ComponentScanner(str(mock_repo_with_nested)).scan_all_components()
+
+
+def test_parallel_metadata_parsing_matches_serial(mock_repo_with_nested):
+    expected = ComponentScanner(str(mock_repo_with_nested)).scan_all_components()
+
+    assert ComponentScanner(str(mock_repo_with_nested), jobs=2).scan_all_components() == expected
+
+
+def test_parallel_metadata_parsing_at_ref_matches_serial(mock_repo):
+    init_repo(mock_repo)
+    run_git(mock_repo, "add", "-A")
+    git_commit(mock_repo, "components")
+    expected = ComponentScanner(str(mock_repo)).scan_all_components()
+
+    scanner = ComponentScanner(str(mock_repo), ref="HEAD", jobs=2)
+
+    assert scanner.scan_all_components() == expected
+    # The pool is shut down with the scan, and a single component type can be scanned on its own.
+    assert scanner.scan_component_type("receiver") == expected["receiver"]
+
+
+def test_metadata_cache_skips_parsing_unchanged_files(mock_repo, tmp_path):
+    cache = MetadataParseCache(tmp_path / "cache")
+    expected = ComponentScanner(str(mock_repo), metadata_cache=cache).scan_all_components()
+    (mock_repo / "receiver" / "otlpreceiver" / "metadata.yaml").write_text("type: changed")
+
+    with patch(
+        "collector_watcher.component_scanner.parse_metadata_document", wraps=parse_metadata_document
+    ) as mock_parse:
+        rescanned = ComponentScanner(str(mock_repo), metadata_cache=cache).scan_all_components()
+
+    assert [c.args[1] for c in mock_parse.call_args_list] == [
+        str(mock_repo / "receiver" / "otlpreceiver" / "metadata.yaml")
+    ]
+    assert rescanned["receiver"][1]["metadata"] == {"type": "changed"}
+    assert {k: v for k, v in rescanned.items() if k != "receiver"} == {
+        k: v for k, v in expected.items() if k != "receiver"
+    }
+
+
+def test_metadata_cache_is_shared_between_working_tree_and_ref_scans(mock_repo, tmp_path):
+    init_repo(mock_repo)
+    run_git(mock_repo, "add", "-A")
+    git_commit(mock_repo, "components")
+    cache = MetadataParseCache(tmp_path / "cache")
+    expected = ComponentScanner(str(mock_repo), metadata_cache=cache).scan_all_components()
+
+    with patch("collector_watcher.component_scanner.parse_metadata_document") as mock_parse:
+        scanned = ComponentScanner(str(mock_repo), ref="HEAD", metadata_cache=cache).scan_all_components()
+
+    mock_parse.assert_not_called()
+    assert scanned == expected
+
+
+def test_touched_component_dirs():
+    touched = ComponentScanner.touched_component_dirs(
+        [
+            "receiver/otlpreceiver/metadata.yaml",
+            "receiver/otlpreceiver/internal/server.go",
+            "extension/storage/filestorage/README.md",
+            "extension/storage/go.mod",
+            "receiver/go.mod",
+            "cmd/mdatagen/metadata-schema.yaml",
+        ]
+    )
+
+    assert touched == {"receiver": {"receiver/otlpreceiver"}, "extension": {"extension/storage/filestorage"}}
+
+
+def test_scan_components_matches_full_scan(mock_repo_with_nested):
+    expected = ComponentScanner(str(mock_repo_with_nested)).scan_component_type("extension")
+    dirs = [str(component_directory("extension", component)) for component in expected]
+
+    scanner = ComponentScanner(str(mock_repo_with_nested))
+
+    assert scanner.scan_components("extension", reversed(dirs)) == expected
+    assert scanner.scan_components("extension", ["extension/missing", "extension/encoding", "receiver/x"]) == []
@@ -0,0 +1,81 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the parsed metadata cache."""
+
+from unittest.mock import patch
+
+import pytest
+from collector_watcher.metadata_cache import CACHE_DIR_ENV_VAR, MetadataParseCache, default_metadata_cache
+
+BLOB_ID = "3b18e512dba79e4c8300dd08aeb37f8e728b8dad"
+METADATA = {"type": "otlp", "status": {"class": "receiver", "stability": {"stable": ["traces"]}}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetadataParseCache(tmp_path / "cache")
+
+
+def test_miss_returns_none(cache):
+    assert cache.get(BLOB_ID) is None
+
+
+def test_round_trip(cache):
+    cache.put_many([(BLOB_ID, METADATA)])
+
+    assert cache.get(BLOB_ID) == METADATA
+
+
+def test_returns_fresh_objects(cache):
+    cache.put_many([(BLOB_ID, METADATA)])
+
+    cache.get(BLOB_ID)["status"].clear()
+
+    assert cache.get(BLOB_ID) == METADATA
+
+
+def test_parser_change_invalidates_entries(cache):
+    cache.put_many([(BLOB_ID, METADATA)])
+
+    with patch("collector_watcher.metadata_cache.parser_fingerprint", return_value=b"another parser"):
+        assert cache.get(BLOB_ID) is None
+
+
+def test_unreadable_entry_is_a_miss(cache):
+    cache.put_many([(BLOB_ID, METADATA)])
+    (entry,) = cache.cache_dir.glob("*.pickle")
+    entry.write_bytes(b"not a pickle")
+
+    assert cache.get(BLOB_ID) is None
+
+
+def test_evicts_least_recently_used_entries(tmp_path):
+    cache = MetadataParseCache(tmp_path / "cache", max_bytes=0)
+
+    cache.put_many([(BLOB_ID, METADATA), ("0" * 40, METADATA)])
+
+    assert list(cache.cache_dir.glob("*.pickle")) == []
+
+
+def test_default_cache_location(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "custom"))
+    assert default_metadata_cache().cache_dir == tmp_path / "custom"
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, "")
+    assert default_metadata_cache() is None
+
+    monkeypatch.delenv(CACHE_DIR_ENV_VAR)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert default_metadata_cache().cache_dir == tmp_path / "xdg" / "otel-ecosystem-explorer" / "collector-metadata"
@@ -18,6 +18,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 from collector_watcher.readme_scanner import discover_component_readmes
+from watcher_common.testing import git_commit, init_repo, run_git
 
 
 def write_component(
@@ -101,3 +102,22 @@ def test_unreadable_readme_is_skipped_not_raised(tmp_path):
 
     # The bad file is skipped; the function still returns cleanly with no entry for it.
     assert readmes == {}
+
+
+def test_reads_readmes_at_ref(tmp_path):
+    init_repo(tmp_path)
+    write_component(tmp_path, "receiver", "otlpreceiver", readme="# OTLP Receiver\r\n")
+    write_component(tmp_path, "extension", "s3storage", subtype="storage", readme="# S3 Storage")
+    run_git(tmp_path, "add", "-A")
+    git_commit(tmp_path, "components")
+    run_git(tmp_path, "tag", "v0.1.0")
+    (tmp_path / "receiver" / "otlpreceiver" / "README.md").write_text("# Changed after tagging")
+    components = {
+        "receiver": [{"name": "otlpreceiver"}, {"name": "doesnotexist"}],
+        "extension": [{"name": "s3storage", "subtype": "storage"}],
+    }
+
+    readmes = discover_component_readmes(str(tmp_path), components, ref="v0.1.0")
+
+    # Line endings are normalized the same way reading the checked-out file would.
+    assert readmes == {"otlpreceiver": "# OTLP Receiver\n", "s3storage": "# S3 Storage"}
@@ -0,0 +1,30 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pytest fixtures shared by every ecosystem-automation package.
+
+pytest finds its configuration in the repository's pyproject.toml, so this file is
+loaded however the suites are run: all at once from the root, or one package at a time.
+"""
+
+import pytest
+from collector_watcher import metadata_cache
+from watcher_common import yaml_cache
+
+
+@pytest.fixture(autouse=True)
+def disable_parse_caches(monkeypatch):
+    """Keep tests out of the user's on-disk parse caches; tests of a cache point it at their own directory."""
+    monkeypatch.setenv(yaml_cache.CACHE_DIR_ENV_VAR, "")
+    monkeypatch.setenv(metadata_cache.CACHE_DIR_ENV_VAR, "")
@@ -16,8 +16,8 @@
 
 from typing import Any
 
-import yaml
 from semantic_version import Version
+from watcher_common import yaml_io
 from watcher_common.inventory_manager import BaseInventoryManager
 
 
@@ -64,7 +64,7 @@ class InventoryManager(BaseInventoryManager):
         }
 
         with open(file_path, "w") as f:
-            yaml.dump(inventory_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml_io.safe_dump(inventory_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     def load_versioned_inventory(self, version: Version) -> dict[str, Any]:
         """
@@ -83,5 +83,5 @@ class InventoryManager(BaseInventoryManager):
             return {"modules": []}
 
         with open(file_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml_io.safe_load(f) or {}
             return data
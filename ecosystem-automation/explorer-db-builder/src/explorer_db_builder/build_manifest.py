@@ -0,0 +1,212 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Build manifest that lets incremental javaagent builds skip unchanged versions.
+
+A version's output does not depend on its own registry inputs alone. Metadata
+backfill, description normalization and under-documented config back-population
+all carry values from newer versions into older ones, so a version is only
+unchanged if its inputs *and* every newer version's inputs are unchanged.
+
+Each version therefore gets a build key chained newest to oldest:
+``key(v) = hash(builder, v, inputs(v), key(next newer version))``. Adding a new
+release changes every key (history is rebuilt, as backfill requires), while
+runs where only the SNAPSHOT changed — the common nightly case, since SNAPSHOTs
+are not published — leave every key intact and the build becomes a no-op.
+
+Short of a no-op, a matching key saves a version's writes, not its loading: the
+version is still parsed, corrected and backfilled, because older versions, the
+release diffs and the cross-version outputs are derived from its inventory.
+
+The manifest is builder-internal, so it is kept in the database's state directory
+(see :func:`build_state_dir`) rather than with the published data, and committed
+like the database itself, so it survives fresh CI checkouts. It holds no wall-clock
+values, so an unchanged build rewrites it byte-for-byte.
+"""
+
+import functools
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from semantic_version import Version
+from watcher_common.content_hashing import compute_content_hash
+
+from explorer_db_builder.content_hashing import canonical_json
+
+MANIFEST_FILE = "build-manifest.json"
+
+BUILD_STATE_DIR = "build-state"
+
+
+def build_state_dir(database_dir: str | Path) -> Path:
+    """Directory for the builder's own bookkeeping about the database in ``database_dir``.
+
+    Manifests must not be shipped as static assets with the data they describe, so
+    they live beside the ``public`` directory the database is published from:
+    ``ecosystem-explorer/public/data/javaagent`` keeps its state in
+    ``ecosystem-explorer/build-state/javaagent``. A database outside any ``public``
+    directory (e.g. in tests) keeps it in a ``build-state`` directory beside itself.
+    """
+    database_dir = Path(database_dir)
+    for parent in database_dir.parents:
+        if parent.name == "public":
+            return parent.parent / BUILD_STATE_DIR / database_dir.name
+    return database_dir.parent / BUILD_STATE_DIR / database_dir.name
+
+
+def write_state_file(path: Path, data: Any) -> None:
+    """Write a state file atomically, creating its directory if needed.
+
+    State files are not published, so they bypass the writers' ``files_written`` and
+    ``total_bytes`` stats. A build interrupted mid-write leaves the previous file in place.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(canonical_json(data))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@functools.cache
+def builder_fingerprint() -> str:
+    """Hash of this package's source and bundled corrections data.
+
+    Any change to the transforms, corrections or writers can change output, so
+    it invalidates every recorded build key. Computed once per process.
+    """
+    package_dir = Path(__file__).parent
+    parts = []
+    for path in sorted([*package_dir.glob("*.py"), *package_dir.glob("*.yaml")]):
+        parts.append(path.name.encode("utf-8"))
+        parts.append(path.read_bytes())
+    return compute_content_hash(b"\0".join(parts))
+
+
+def compute_build_keys(
+    versions_newest_first: list[Version],
+    input_fingerprints: dict[Version, str],
+    builder: str,
+) -> dict[Version, str]:
+    """Chain each version's input fingerprint with every newer version's.
+
+    Args:
+        versions_newest_first: Release versions, newest first.
+        input_fingerprints: Fingerprint of each version's registry inputs.
+        builder: Fingerprint of the builder itself (see :func:`builder_fingerprint`).
+
+    Returns:
+        Map of version to its build key.
+    """
+    build_keys: dict[Version, str] = {}
+    newer_key = ""
+    for version in versions_newest_first:
+        newer_key = compute_content_hash(f"{builder}:{version}:{input_fingerprints[version]}:{newer_key}")
+        build_keys[version] = newer_key
+    return build_keys
+
+
+def make_build_manifest(
+    builder: str,
+    input_fingerprints: dict[Version, str],
+    build_keys: dict[Version, str],
+    bundle_hashes: dict[Version, str],
+    diff_hashes: dict[Version, str] | None = None,
+) -> dict[str, Any]:
+    """Assemble the manifest recorded after a successful build.
+
+    ``diff_hashes`` maps a version to the hash of its diff from the previous release
+    (see :mod:`release_diff`); it is recorded as ``diff_hash`` where present.
+    """
+    versions: dict[str, dict[str, str]] = {}
+    for version, build_key in build_keys.items():
+        entry = {
+            "input_fingerprint": input_fingerprints[version],
+            "build_key": build_key,
+            "bundle_hash": bundle_hashes.get(version, ""),
+        }
+        diff_hash = (diff_hashes or {}).get(version)
+        if diff_hash:
+            entry["diff_hash"] = diff_hash
+        versions[str(version)] = entry
+    return {"builder_fingerprint": builder, "versions": versions}
+
+
+def reusable_bundle_hashes(manifest: dict[str, Any] | None, build_keys: dict[Version, str]) -> dict[Version, str]:
+    """Versions whose recorded build key still matches, mapped to their recorded bundle hash.
+
+    Args:
+        manifest: The previous run's manifest, or None if there is none.
+        build_keys: Build keys computed for the current run.
+
+    Returns:
+        Map of reusable version to the bundle hash its outputs were written under.
+    """
+    recorded = (manifest or {}).get("versions") or {}
+    reusable: dict[Version, str] = {}
+    for version, build_key in build_keys.items():
+        entry = recorded.get(str(version)) or {}
+        if entry.get("build_key") == build_key and entry.get("bundle_hash"):
+            reusable[version] = entry["bundle_hash"]
+    return reusable
+
+
+def reusable_diff_hashes(
+    manifest: dict[str, Any] | None, build_keys: dict[Version, str], versions_newest_first: list[Version]
+) -> dict[Version, str]:
+    """Versions whose recorded diff from the previous release is still valid, mapped to its hash.
+
+    A diff depends on both releases of the pair. The older release's build key
+    chains the newer one's, and changes if another release lands between them, so
+    a match on the older release's key vouches for the whole pair.
+
+    Args:
+        manifest: The previous run's manifest, or None if there is none.
+        build_keys: Build keys computed for the current run.
+        versions_newest_first: Release versions, newest first.
+
+    Returns:
+        Map of the newer version of each reusable pair to its recorded diff hash.
+    """
+    recorded = (manifest or {}).get("versions") or {}
+    reusable: dict[Version, str] = {}
+    for newer, older in zip(versions_newest_first, versions_newest_first[1:]):
+        older_entry = recorded.get(str(older)) or {}
+        diff_hash = (recorded.get(str(newer)) or {}).get("diff_hash")
+        if older_entry.get("build_key") == build_keys[older] and diff_hash:
+            reusable[newer] = diff_hash
+    return reusable
+
+
+def is_up_to_date(manifest: dict[str, Any] | None, build_keys: dict[Version, str]) -> bool:
+    """Whether the previous build covered exactly these versions with the same build keys.
+
+    A version dropped from the registry still needs a build (versions-index and
+    orphan GC), so the recorded version set must match, not just contain, the
+    current one.
+    """
+    if manifest is None:
+        return False
+    recorded = manifest.get("versions") or {}
+    if set(recorded) != {str(version) for version in build_keys}:
+        return False
+    return len(reusable_bundle_hashes(manifest, build_keys)) == len(build_keys)
@@ -14,7 +14,9 @@
 #
 """Orchestrates the collector database build pipeline."""
 
+import functools
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
@@ -28,6 +30,10 @@ from explorer_db_builder.collector_display_name_audit import (
 )
 from explorer_db_builder.collector_transformer import make_index_component, transform_collector_components
 from explorer_db_builder.ecosystem_stats import count_unique_collector_component_ids
+from explorer_db_builder.parallel import imap_versions
+from explorer_db_builder.profiling import BuildProfiler
+from explorer_db_builder.release_diff import diff_collector_releases
+from explorer_db_builder.search_index import build_collector_search_index
 
 logger = logging.getLogger(__name__)
 
@@ -65,10 +71,24 @@ def _get_merged_release_versions(inventory_manager: InventoryManager) -> list[Ve
     return sorted(version_set, reverse=True)
 
 
+def _load_version_inventories(inventory_manager: InventoryManager, version: Version) -> dict[str, dict]:
+    """Load every distribution's raw inventory for a version.
+
+    Pure (reads the registry only), so it can run in a worker process.
+    """
+    return {
+        distribution: inventory_manager.load_versioned_inventory(distribution, version)
+        for distribution in DISTRIBUTIONS
+    }
+
+
 def _process_version(
     version: Version,
     inventory_manager: InventoryManager,
     db_writer: CollectorDatabaseWriter,
+    inventories: Optional[dict[str, dict]] = None,
+    profiler: Optional[BuildProfiler] = None,
+    readme_results: Optional[dict[tuple[str, str], bool]] = None,
 ) -> tuple[dict[str, str], list[dict], str]:
     """Load, transform, and write all components for a single version.
 
@@ -85,6 +105,12 @@ def _process_version(
         version: The version to process.
         inventory_manager: Source of raw registry data.
         db_writer: Destination writer.
+        inventories: Optional pre-loaded {distribution: inventory} for this version
+            (see :func:`_load_version_inventories`); loaded here if omitted.
+        profiler: Optional profiler recording per-stage metrics (see :mod:`profiling`).
+        readme_results: Optional {(component_name, markdown_hash): published} shared
+            across versions and distributions. A README already in it is not read or
+            published again; its recorded outcome is reused.
 
     Returns:
         Tuple of (component_map, components, bundle_hash) where component_map is
@@ -94,43 +120,57 @@ def _process_version(
         bundle_hash is "" if no components were found.
     """
     logger.info("Processing collector version: %s", version)
+    profiler = profiler or BuildProfiler(enabled=False)
+    readme_results = {} if readme_results is None else readme_results
     all_components = []
 
     for distribution in DISTRIBUTIONS:
-        inventory = inventory_manager.load_versioned_inventory(distribution, version)
+        if inventories is not None:
+            inventory = inventories[distribution]
+        else:
+            with profiler.stage("load"):
+                inventory = inventory_manager.load_versioned_inventory(distribution, version)
 
         published_readmes: dict[str, str] = {}
-        try:
-            readme_map = inventory_manager.load_component_readme_map(distribution, version)
-            for component_name, markdown_hash in readme_map.items():
-                try:
-                    content = inventory_manager.load_component_readme_content(
-                        distribution, version, component_name, markdown_hash
-                    )
-                    if content is not None and db_writer.write_markdown(component_name, markdown_hash, content):
-                        published_readmes[component_name] = markdown_hash
-                except OSError as e:
-                    # Defensive: neither load_component_readme_content nor
-                    # write_markdown currently raise OSError (both swallow
-                    # their own failures and signal via return value - see
-                    # `content is not None and db_writer.write_markdown(...)`
-                    # above, which is what actually gates the stamp). This
-                    # stays as a safety net in case that changes, so one
-                    # component's failure still can't take down the rest of
-                    # this distribution's READMEs or the component inventory.
-                    logger.warning(
-                        "  Failed to load/publish README for component '%s' in %s %s: %s",
-                        component_name,
-                        distribution,
-                        version,
-                        e,
-                    )
-        except OSError as e:
-            # Covers a failure in load_component_readme_map itself (e.g. the
-            # component_readmes directory becoming unreadable mid-scan).
-            logger.warning("  Failed to load component READMEs for %s %s: %s", distribution, version, e)
-
-        components = transform_collector_components(inventory, distribution, published_readmes)
+        with profiler.stage("readmes"):
+            try:
+                readme_map = inventory_manager.load_component_readme_map(distribution, version)
+                for component_name, markdown_hash in readme_map.items():
+                    key = (component_name, markdown_hash)
+                    try:
+                        if key not in readme_results:
+                            content = inventory_manager.load_component_readme_content(
+                                distribution, version, component_name, markdown_hash
+                            )
+                            if content is None:
+                                # Not remembered: another version's copy may still load.
+                                continue
+                            readme_results[key] = db_writer.write_markdown(component_name, markdown_hash, content)
+                        if readme_results[key]:
+                            published_readmes[component_name] = markdown_hash
+                    except OSError as e:
+                        # Defensive: neither load_component_readme_content nor
+                        # write_markdown currently raise OSError (both swallow
+                        # their own failures and signal via return value - see
+                        # the `content is None` check and write_markdown's result
+                        # above, which is what actually gates the stamp). This
+                        # stays as a safety net in case that changes, so one
+                        # component's failure still can't take down the rest of
+                        # this distribution's READMEs or the component inventory.
+                        logger.warning(
+                            "  Failed to load/publish README for component '%s' in %s %s: %s",
+                            component_name,
+                            distribution,
+                            version,
+                            e,
+                        )
+            except OSError as e:
+                # Covers a failure in load_component_readme_map itself (e.g. the
+                # component_readmes directory becoming unreadable mid-scan).
+                logger.warning("  Failed to load component READMEs for %s %s: %s", distribution, version, e)
+
+        with profiler.stage("transform"):
+            components = transform_collector_components(inventory, distribution, published_readmes)
         logger.info("  %s: %d components", distribution, len(components))
         all_components.extend(components)
 
@@ -140,13 +180,14 @@ def _process_version(
         logger.warning("No components found for version %s, skipping", version)
         return {}, [], ""
 
-    component_map = db_writer.write_components(all_components)
-    db_writer.write_version_index(version, component_map)
+    with profiler.stage("write"):
+        component_map = db_writer.write_components(all_components)
+        db_writer.write_version_index(version, component_map)
 
-    # Consolidated per-version bundle the list view loads in a single request.
-    # Slim (make_index_component) shape; full detail stays in components/.
-    bundle_items = [make_index_component(c) for c in all_components]
-    bundle_hash = db_writer.write_version_bundle(version, bundle_items)
+        # Consolidated per-version bundle the list view loads in a single request.
+        # Slim (make_index_component) shape; full detail stays in components/.
+        bundle_items = [make_index_component(c) for c in all_components]
+        bundle_hash = db_writer.write_version_bundle(version, bundle_items)
     return component_map, all_components, bundle_hash
 
 
@@ -155,6 +196,8 @@ def run_collector_builder(
     db_writer: Optional[CollectorDatabaseWriter] = None,
     clean: bool = False,
     audit_report_path: Optional[str] = None,
+    jobs: int = 1,
+    profiler: Optional[BuildProfiler] = None,
 ) -> int:
     """Run the collector database builder pipeline.
 
@@ -165,6 +208,11 @@ def run_collector_builder(
         audit_report_path: If set, write a JSON report of latest-release components
             missing a display_name to this path (a build artifact, not part of the
             database, so it must live outside the database directory).
+        jobs: Number of worker processes used to parse version inventories. With 1
+            (the default) each version is loaded as it is processed; with more, loads
+            run ahead of processing by at most ``2 * jobs`` versions. Writes always
+            happen in this process, in version order.
+        profiler: Optional profiler recording per-stage metrics (see :mod:`profiling`).
 
     Returns:
         Exit code: 0 for success, 1 for failure.
@@ -172,9 +220,12 @@ def run_collector_builder(
     try:
         inventory_manager = inventory_manager or InventoryManager()
         db_writer = db_writer or CollectorDatabaseWriter()
+        profiler = profiler or BuildProfiler(enabled=False)
+        profiler.add_counter_source(db_writer.get_stats)
 
         if clean:
-            db_writer.clean()
+            with profiler.stage("clean"):
+                db_writer.clean()
 
         versions = _get_merged_release_versions(inventory_manager)
         logger.info("Processing %d collector release version(s)", len(versions))
@@ -184,8 +235,21 @@ def run_collector_builder(
         components_by_version: list[list[dict]] = []
         bundle_hashes: dict[Version, str] = {}
 
-        for version in versions:
-            component_map, components, bundle_hash = _process_version(version, inventory_manager, db_writer)
+        # Most READMEs are unchanged between releases; publish each distinct one once.
+        readme_results: dict[tuple[str, str], bool] = {}
+        # Parsing the registry YAML dominates the build, so with jobs > 1 it runs in worker
+        # processes, streamed back in version order so only a few versions are held at once.
+        # Everything else, including every write, stays here.
+        loaded: Iterable[tuple[Version, Optional[dict[str, dict]]]]
+        if jobs > 1:
+            loader = functools.partial(_load_version_inventories, inventory_manager)
+            loaded = profiler.iterate("load", imap_versions(loader, versions, jobs))
+        else:
+            loaded = ((version, None) for version in versions)
+        for version, inventories in loaded:
+            component_map, components, bundle_hash = _process_version(
+                version, inventory_manager, db_writer, inventories, profiler, readme_results
+            )
             if not component_map:
                 continue
 
@@ -198,21 +262,41 @@ def run_collector_builder(
         if not processed_versions:
             raise ValueError("No collector versions were successfully processed")
 
-        db_writer.write_version_list(processed_versions, bundle_hashes)
-        db_writer.write_index(latest_components)
-
-        # Incremental runs never overwrite the store, so files whose hash changed are left
-        # orphaned. Sweep them now that every version index (the reachability source) is on
-        # disk. Skipped after --clean, which already wiped everything.
-        if not clean:
-            db_writer.remove_orphans()
-
-        db_writer.write_ecosystem_stats(
-            {
-                "version_count": len(processed_versions),
-                "component_count": count_unique_collector_component_ids(components_by_version),
-            }
-        )
+        with profiler.stage("release_diffs"):
+            # Each release against the one before it. Unchanged pairs hash to files
+            # already in the store, so only diffs touching a new release are written.
+            diff_hashes: dict[Version, str] = {}
+            for newer_version, older_version, newer_components, older_components in zip(
+                processed_versions, processed_versions[1:], components_by_version, components_by_version[1:]
+            ):
+                release_diff = diff_collector_releases(
+                    str(older_version), str(newer_version), older_components, newer_components
+                )
+                diff_hashes[newer_version] = db_writer.write_release_diff(newer_version, release_diff)
+
+        with profiler.stage("search_index"):
+            search_index_hash = db_writer.write_search_index(build_collector_search_index(latest_components))
+
+        with profiler.stage("indexes"):
+            db_writer.write_version_list(processed_versions, bundle_hashes, diff_hashes)
+            db_writer.write_index(latest_components, search_index_hash=search_index_hash)
+
+        with profiler.stage("orphan_gc"):
+            # Incremental runs never overwrite the store, so files whose hash changed are left
+            # orphaned. Sweep them now that every version index (the reachability source) is on
+            # disk. Skipped after --clean, which already wiped everything.
+            if not clean:
+                db_writer.remove_orphans()
+            # Records each content file's README so the next run's GC needn't reopen them all.
+            db_writer.write_reachability_manifest()
+
+        with profiler.stage("indexes"):
+            db_writer.write_ecosystem_stats(
+                {
+                    "version_count": len(processed_versions),
+                    "component_count": count_unique_collector_component_ids(components_by_version),
+                }
+            )
 
         if audit_report_path:
             # Enforce the "outside the database directory" invariant: a report written
@@ -14,7 +14,6 @@
 #
 """Writes collector data to content-addressed file storage."""
 
-import json
 import logging
 import re
 import shutil
@@ -24,9 +23,13 @@ from typing import Any
 from semantic_version import Version
 
 from explorer_db_builder import orphan_gc
+from explorer_db_builder.build_manifest import build_state_dir, write_state_file
 from explorer_db_builder.collector_transformer import COMPONENT_TYPES, make_index_component
-from explorer_db_builder.content_hashing import content_hash
-from explorer_db_builder.readme_sanitizer import sanitize_readme
+from explorer_db_builder.content_hashing import canonical_json, encode_canonical
+from explorer_db_builder.readme_sanitizer import sanitize_readme, sanitizer_fingerprint
+from explorer_db_builder.release_diff import RELEASE_DIFF_DIR, release_diff_file
+from explorer_db_builder.search_index import SEARCH_INDEX_DIR, encode_search_index, search_index_file
+from explorer_db_builder.store_index import StoreIndex
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +37,39 @@ logger = logging.getLogger(__name__)
 class CollectorDatabaseWriter:
     """Manages writing collector component data to a content-addressed file system database."""
 
-    def __init__(self, database_dir: str = "ecosystem-explorer/public/data/collector") -> None:
+    def __init__(
+        self, database_dir: str = "ecosystem-explorer/public/data/collector", state_dir: str | None = None
+    ) -> None:
         self.database_dir = Path(database_dir)
+        # The reachability manifest is builder-internal, so it is kept out of the published data.
+        self.state_dir = Path(state_dir) if state_dir is not None else build_state_dir(self.database_dir)
         self.files_written = 0
         self.total_bytes = 0
+        # Content items hashed, and content files found already in the store.
+        self.items_hashed = 0
+        self.files_skipped = 0
+        # Content file -> markdown file it references, for the reachability manifest.
+        self._reachability: dict[str, str | None] = {}
+        # Whether the store's markdown was produced by the current sanitizer; loaded on first use.
+        self._markdown_stamped: bool | None = None
+        self._store_index = StoreIndex(
+            self.database_dir, ("components", "markdown", "bundles", RELEASE_DIFF_DIR, SEARCH_INDEX_DIR)
+        )
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitizes a name for use as a filename to prevent path traversal."""
         return re.sub(r"[^a-zA-Z0-9._\-]", "_", name)
 
+    def _is_markdown_stamped(self) -> bool:
+        """Whether the last completed build stamped the store with the current sanitizer fingerprint.
+
+        If so, an existing markdown file is exactly what sanitizing its upstream
+        README would produce now, and can be kept without reading either.
+        """
+        if self._markdown_stamped is None:
+            self._markdown_stamped = orphan_gc.load_sanitizer_fingerprint(self.state_dir) == sanitizer_fingerprint()
+        return self._markdown_stamped
+
     def _is_current(self, file_path: Path, content: str) -> bool:
         """Whether the published markdown already matches what we would write.
 
@@ -59,7 +86,9 @@ class CollectorDatabaseWriter:
     def write_markdown(self, component_name: str, markdown_hash: str, content: str) -> bool:
         """Write a component README to the database, content-addressed.
 
-        Content is run through :func:`sanitize_readme` first.
+        Content is run through :func:`sanitize_readme` first. A file already at the
+        content-addressed path of a store stamped with the current
+        sanitizer fingerprint is kept without sanitizing or reading it.
 
         Args:
             component_name: Name of the component
@@ -76,6 +105,12 @@ class CollectorDatabaseWriter:
             than assuming success.
         """
         safe_name = self._sanitize_name(component_name)
+        file_path = self._markdown_file(component_name, markdown_hash)
+        if self._store_index.exists(file_path) and self._is_markdown_stamped():
+            self.files_skipped += 1
+            logger.debug("Markdown for '%s' with hash %s already exists, skipping write", safe_name, markdown_hash)
+            return True
+
         content = sanitize_readme(content)
 
         if not content.strip():
@@ -85,16 +120,17 @@ class CollectorDatabaseWriter:
             logger.info("README for '%s' is empty after sanitizing, not publishing", safe_name)
             return False
 
-        file_path = self._markdown_file(component_name, markdown_hash)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store_index.ensure_parent(file_path)
 
-        if file_path.exists() and self._is_current(file_path, content):
+        if self._store_index.exists(file_path) and self._is_current(file_path, content):
+            self.files_skipped += 1
             logger.debug("Markdown for '%s' with hash %s already exists, skipping write", safe_name, markdown_hash)
             return True
 
         try:
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
+            self._store_index.add(file_path)
             self.files_written += 1
             self.total_bytes += len(content.encode("utf-8"))
             logger.debug("Wrote markdown for '%s' with hash %s", safe_name, markdown_hash)
@@ -105,12 +141,16 @@ class CollectorDatabaseWriter:
             # the same principle already established for the javaagent writer.
             return False
 
-    def _write_json(self, path: Path, data: Any) -> None:
-        content = json.dumps(data, indent=2, sort_keys=True)
-        with open(path, "w", encoding="utf-8") as f:
+    def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Write already-encoded file content and count it in the session stats."""
+        with open(path, "wb") as f:
             f.write(content)
+        self._store_index.add(path)
         self.files_written += 1
-        self.total_bytes += len(content.encode("utf-8"))
+        self.total_bytes += len(content)
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        self._write_bytes(path, canonical_json(data))
 
     def _component_file(self, component_id: str, component_hash: str) -> Path:
         """Content-addressed path for a component, without creating its directory (unlike _get_component_path).
@@ -124,9 +164,17 @@ class CollectorDatabaseWriter:
         safe_name = self._sanitize_name(component_name)
         return self.database_dir / "markdown" / f"{safe_name}-{markdown_hash}.md"
 
+    def _markdown_key(self, item: dict[str, Any]) -> str | None:
+        """Reachability manifest entry for the README a content file references, if any."""
+        name = item.get("name")
+        markdown_hash = item.get("markdown_hash")
+        if not (name and markdown_hash):
+            return None
+        return orphan_gc.store_key(self.database_dir, self._markdown_file(name, markdown_hash))
+
     def _get_component_path(self, component_id: str, component_hash: str) -> Path:
         file_path = self._component_file(component_id, component_hash)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store_index.ensure_parent(file_path)
         return file_path
 
     def write_components(self, components: list[dict[str, Any]]) -> dict[str, str]:
@@ -157,15 +205,19 @@ class CollectorDatabaseWriter:
                 continue
 
             try:
-                comp_hash = content_hash(component)
+                encoded = encode_canonical(component)
+                self.items_hashed += 1
+                comp_hash = encoded.digest
                 file_path = self._get_component_path(component_id, comp_hash)
 
-                if file_path.exists():
+                if self._store_index.exists(file_path):
+                    self.files_skipped += 1
                     logger.debug("Component '%s' hash %s already exists, skipping", component_id, comp_hash)
                 else:
-                    self._write_json(file_path, component)
+                    self._write_bytes(file_path, encoded.content)
                     logger.debug("Wrote component '%s' hash %s", component_id, comp_hash)
 
+                self._reachability[orphan_gc.store_key(self.database_dir, file_path)] = self._markdown_key(component)
                 component_map[component_id] = comp_hash
 
             except (TypeError, ValueError) as e:
@@ -231,18 +283,20 @@ class CollectorDatabaseWriter:
         if not components:
             raise ValueError("Bundle components cannot be empty")
 
-        bundle_hash = content_hash(components)
+        encoded = encode_canonical(components)
+        self.items_hashed += 1
+        bundle_hash = encoded.digest
 
-        bundles_dir = self.database_dir / "bundles"
-        bundles_dir.mkdir(parents=True, exist_ok=True)
-        bundle_file = bundles_dir / f"{version}-{bundle_hash}.json"
+        bundle_file = self.database_dir / "bundles" / f"{version}-{bundle_hash}.json"
+        self._store_index.ensure_parent(bundle_file)
 
-        if bundle_file.exists():
+        if self._store_index.exists(bundle_file):
+            self.files_skipped += 1
             logger.debug("Collector bundle for %s hash %s already exists, skipping", version, bundle_hash)
             return bundle_hash
 
         try:
-            self._write_json(bundle_file, components)
+            self._write_bytes(bundle_file, encoded.content)
             logger.info("Wrote collector version bundle for %s with %d components", version, len(components))
         except OSError as e:
             logger.error("Failed to write collector version bundle for %s: %s", version, e)
@@ -250,7 +304,47 @@ class CollectorDatabaseWriter:
 
         return bundle_hash
 
-    def write_version_list(self, versions: list[Version], bundle_hashes: dict[Version, str] | None = None) -> None:
+    def write_release_diff(self, version: Version, release_diff: dict[str, Any]) -> str:
+        """Write the comparison of a release with the release before it, content-addressed.
+
+        Args:
+            version: The newer release of the pair, whose versions-index.json entry
+                references the diff.
+            release_diff: Diff from ``diff_collector_releases``.
+
+        Returns:
+            The 12-char content hash, for inclusion in versions-index.json.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        encoded = encode_canonical(release_diff)
+        self.items_hashed += 1
+        diff_hash = encoded.digest
+
+        diff_file = release_diff_file(self.database_dir, str(version), diff_hash)
+        self._store_index.ensure_parent(diff_file)
+
+        if self._store_index.exists(diff_file):
+            self.files_skipped += 1
+            logger.debug("Collector release diff for %s hash %s already exists, skipping", version, diff_hash)
+            return diff_hash
+
+        try:
+            self._write_bytes(diff_file, encoded.content)
+            logger.info("Wrote collector release diff %s -> %s", release_diff["from_version"], version)
+        except OSError as e:
+            logger.error("Failed to write collector release diff for %s: %s", version, e)
+            raise
+
+        return diff_hash
+
+    def write_version_list(
+        self,
+        versions: list[Version],
+        bundle_hashes: dict[Version, str] | None = None,
+        diff_hashes: dict[Version, str] | None = None,
+    ) -> None:
         """Write the top-level versions-index.json listing all available versions.
 
         Args:
@@ -260,6 +354,9 @@ class CollectorDatabaseWriter:
                 the frontend uses to fetch the single per-version bundle. The
                 field is omitted for versions without a hash so old clients and
                 missing bundles degrade gracefully to the per-component fan-out.
+            diff_hashes: Optional map of version to the hash of its diff from the
+                previous release (see :mod:`release_diff`), carried as ``diff_hash``.
+                The oldest release has none.
 
         Raises:
             ValueError: If versions list is empty.
@@ -275,6 +372,9 @@ class CollectorDatabaseWriter:
             bundle_hash = (bundle_hashes or {}).get(v)
             if bundle_hash:
                 entry["bundle_hash"] = bundle_hash
+            diff_hash = (diff_hashes or {}).get(v)
+            if diff_hash:
+                entry["diff_hash"] = diff_hash
             version_list.append(entry)
         versions_file = self.database_dir / "versions-index.json"
 
@@ -285,13 +385,46 @@ class CollectorDatabaseWriter:
             logger.error("Failed to write versions-index: %s", e)
             raise
 
-    def write_index(self, latest_components: list[dict[str, Any]]) -> None:
+    def write_search_index(self, search_index: dict[str, Any]) -> str:
+        """Write the prebuilt search index (see :mod:`explorer_db_builder.search_index`), content-addressed.
+
+        Args:
+            search_index: Index from ``build_collector_search_index``.
+
+        Returns:
+            The 12-char content hash, for index.json's ``search_index_hash``.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        search_index_hash, content = encode_search_index(search_index)
+        self.items_hashed += 1
+        index_file = search_index_file(self.database_dir, search_index_hash)
+        self._store_index.ensure_parent(index_file)
+
+        if self._store_index.exists(index_file):
+            self.files_skipped += 1
+            logger.debug("Search index with hash %s already exists, skipping write", search_index_hash)
+            return search_index_hash
+
+        try:
+            self._write_bytes(index_file, content)
+            logger.info("Wrote search index with %d terms", len(search_index["terms"]))
+        except OSError as e:
+            logger.error("Failed to write search index: %s", e)
+            raise
+
+        return search_index_hash
+
+    def write_index(self, latest_components: list[dict[str, Any]], search_index_hash: str | None = None) -> None:
         """Write the per-ecosystem index.json with taxonomy and lightweight component list.
 
         Derives the taxonomy (distributions, types) from what is actually present in the data.
 
         Args:
             latest_components: Full canonical component dicts from the latest release version.
+            search_index_hash: Hash returned by :meth:`write_search_index`, recorded
+                as ``search_index_hash`` so the frontend can fetch the search index.
         """
         self.database_dir.mkdir(parents=True, exist_ok=True)
 
@@ -317,6 +450,8 @@ class CollectorDatabaseWriter:
             },
             "components": [make_index_component(c) for c in latest_components],
         }
+        if search_index_hash:
+            index_data["search_index_hash"] = search_index_hash
 
         index_file = self.database_dir / "index.json"
         try:
@@ -351,7 +486,12 @@ class CollectorDatabaseWriter:
             raise
 
     def get_stats(self) -> dict[str, Any]:
-        return {"files_written": self.files_written, "total_bytes": self.total_bytes}
+        return {
+            "files_written": self.files_written,
+            "total_bytes": self.total_bytes,
+            "items_hashed": self.items_hashed,
+            "files_skipped": self.files_skipped,
+        }
 
     def remove_orphans(self) -> int:
         """Delete content-addressed files no longer referenced by any version index.
@@ -359,18 +499,49 @@ class CollectorDatabaseWriter:
         See :func:`explorer_db_builder.orphan_gc.remove_orphans`. Markdown is keyed
         by the component's ``name``, not its ``id``.
         """
-        return orphan_gc.remove_orphans(
+        reachability = {**orphan_gc.load_reachability(self.state_dir), **self._reachability}
+        removed = orphan_gc.remove_orphans(
             self.database_dir,
             content_dir="components",
             index_sections=("components",),
             content_file=self._component_file,
             markdown_file=self._markdown_file,
+            reachability=reachability,
         )
+        self._reachability = reachability
+        # The sweep deletes files (and emptied directories) behind the index.
+        self._store_index.invalidate()
+        return removed
+
+    def write_reachability_manifest(self) -> None:
+        """Persist which markdown file each content file references, for the next run's orphan GC.
+
+        Holds the entries for content written this session, plus everything
+        :meth:`remove_orphans` kept live. Call after the GC (or after a clean build):
+        the manifest is stamped with the sanitizer fingerprint, vouching that every
+        markdown file left in the store matches the current sanitizer.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        manifest_file = self.state_dir / orphan_gc.REACHABILITY_FILE
+        try:
+            write_state_file(
+                manifest_file, orphan_gc.make_reachability_manifest(self._reachability, sanitizer_fingerprint())
+            )
+            logger.info("Wrote reachability manifest for %d content files", len(self._reachability))
+        except OSError as e:
+            logger.error("Failed to write reachability manifest: %s", e)
+            raise
 
     def clean(self) -> None:
-        """Remove the collector database directory and recreate it empty."""
+        """Remove the collector database directory and recreate it empty, dropping its state directory."""
         if self.database_dir.exists():
             logger.info("Cleaning collector database directory: %s", self.database_dir)
             shutil.rmtree(self.database_dir)
             logger.info("Collector database directory cleaned")
+        shutil.rmtree(self.state_dir, ignore_errors=True)
         self.database_dir.mkdir(parents=True, exist_ok=True)
+        self._store_index.reset()
+        self._reachability = {}
+        self._markdown_stamped = None
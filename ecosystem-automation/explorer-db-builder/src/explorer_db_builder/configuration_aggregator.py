@@ -44,10 +44,25 @@ def build_global_configurations(inventories_newest_first: list[dict[str, Any]])
     source configs, so the input inventories are never mutated. Returns configs sorted by name, each
     with a sorted "instrumentations" list.
     """
-    merged: dict[str, dict[str, Any]] = {}
-    instrumentation_sets: dict[str, set[str]] = {}
-
+    aggregator = GlobalConfigurationAggregator()
     for inventory in inventories_newest_first:
+        aggregator.add(inventory)
+    return aggregator.build()
+
+
+class GlobalConfigurationAggregator:
+    """Incremental form of :func:`build_global_configurations`, fed one inventory at a time.
+
+    Lets the javaagent build fold each version in as it is written instead of keeping every
+    version's inventory around for a final merge.
+    """
+
+    def __init__(self) -> None:
+        self._merged: dict[str, dict[str, Any]] = {}
+        self._instrumentation_sets: dict[str, set[str]] = {}
+
+    def add(self, inventory: dict[str, Any]) -> None:
+        """Merge one inventory's configurations. Inventories must be added newest-version first."""
         for item in _collect_items(inventory):
             instrumentation_name = item.get("name")
             configurations = item.get("configurations")
@@ -59,20 +74,22 @@ def build_global_configurations(inventories_newest_first: list[dict[str, Any]])
                 if not config_name:
                     continue
 
-                if config_name not in merged:
-                    merged[config_name] = dict(config)
-                    instrumentation_sets[config_name] = set()
+                if config_name not in self._merged:
+                    self._merged[config_name] = dict(config)
+                    self._instrumentation_sets[config_name] = set()
                 else:
-                    existing = merged[config_name]
+                    existing = self._merged[config_name]
                     for field in _MERGE_FIELDS:
                         if not existing.get(field) and config.get(field):
                             existing[field] = config[field]
 
-                instrumentation_sets[config_name].add(instrumentation_name)
+                self._instrumentation_sets[config_name].add(instrumentation_name)
 
-    result: list[dict[str, Any]] = []
-    for config_name in sorted(merged):
-        entry = merged[config_name]
-        entry["instrumentations"] = sorted(instrumentation_sets[config_name])
-        result.append(entry)
-    return result
+    def build(self) -> list[dict[str, Any]]:
+        """Return the merged configs sorted by name, each with a sorted "instrumentations" list."""
+        result: list[dict[str, Any]] = []
+        for config_name in sorted(self._merged):
+            entry = self._merged[config_name]
+            entry["instrumentations"] = sorted(self._instrumentation_sets[config_name])
+            result.append(entry)
+        return result
@@ -12,19 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-"""Builds resolved configuration schema JSON from registry YAML files."""
+"""Builds resolved configuration schema JSON from registry YAML files.
 
+Schema versions are immutable once released, so builds are incremental: a build
+manifest in the output's state directory (see :func:`build_manifest.build_state_dir`)
+records each version's input fingerprint (the names and bytes of its YAML files) and
+the builder fingerprint. A version whose recorded fingerprints still match and whose
+output is on disk is not reloaded. Unlike the javaagent build, versions do not depend
+on each other, so nothing is chained.
+
+Each version also gets a flat path index (see :mod:`schema_ui_mapper`), written
+content-addressed to ``paths/{version}-{hash}.json`` and referenced from its
+``versions-index.json`` entry as ``path_index_hash``.
+"""
+
+import functools
 import json
 import logging
 import shutil
 from pathlib import Path
 from typing import Any
 
-import yaml
+from semantic_version import Version
+from watcher_common import yaml_io
+from watcher_common.content_hashing import compute_content_hash
 from watcher_common.inventory_manager import BaseInventoryManager
 
+from explorer_db_builder.build_manifest import MANIFEST_FILE, build_state_dir, builder_fingerprint, write_state_file
+from explorer_db_builder.content_hashing import canonical_json, encode_canonical
+from explorer_db_builder.parallel import imap_versions
+from explorer_db_builder.profiling import BuildProfiler
 from explorer_db_builder.schema_resolver import SchemaResolver
-from explorer_db_builder.schema_ui_mapper import map_schema_to_ui_tree
+from explorer_db_builder.schema_ui_mapper import PATH_INDEX_FORMAT, map_schema_to_ui_tree
 
 logger = logging.getLogger(__name__)
 
@@ -34,16 +53,104 @@ DEFAULTS_DIR_NAME = "defaults"
 REGISTRY_DIR = "ecosystem-registry/configuration"
 OUTPUT_DIR = "ecosystem-explorer/public/data/configuration"
 
+PATH_INDEX_DIR = "paths"
+
 
 def _load_yaml_registry(version_dir: Path) -> dict[str, Any]:
     """Load all YAML files from a version directory into a registry dict."""
     registry = {}
     for yaml_file in sorted(version_dir.glob("*.yaml")):
         with open(yaml_file, encoding="utf-8") as f:
-            registry[yaml_file.name] = yaml.safe_load(f)
+            registry[yaml_file.name] = yaml_io.safe_load(f)
     return registry
 
 
+def _version_fingerprint(version_dir: Path) -> str:
+    """Hash of the names and bytes of every YAML file :func:`_load_yaml_registry` reads."""
+    parts = []
+    for yaml_file in sorted(version_dir.glob("*.yaml")):
+        parts.append(yaml_file.name.encode("utf-8"))
+        parts.append(yaml_file.read_bytes())
+    return compute_content_hash(b"\0".join(parts))
+
+
+def _path_index_file(output_path: Path, version: Version, path_index_hash: str) -> Path:
+    """Content-addressed path of a version's path index."""
+    return output_path / PATH_INDEX_DIR / f"{version}-{path_index_hash}.json"
+
+
+def _build_version(inventory: BaseInventoryManager, version: Version) -> tuple[bytes, str, bytes]:
+    """Load, resolve and map one schema version.
+
+    Only reads the registry, so it can run in a worker process.
+
+    Returns:
+        The bytes of versions/{version}.json, and the hash and bytes of its path index.
+    """
+    registry = _load_yaml_registry(inventory.get_version_dir(version))
+    resolved = SchemaResolver(registry).resolve(ROOT_SCHEMA_FILE)
+    paths: dict[str, dict[str, Any]] = {}
+    ui_tree = map_schema_to_ui_tree(resolved, path_index=paths)
+    path_index = encode_canonical({"format": PATH_INDEX_FORMAT, "paths": paths})
+    return canonical_json(ui_tree), path_index.digest, path_index.content
+
+
+def _write_output(path: Path, content: bytes, stats: dict[str, int]) -> None:
+    """Write a published file and count it in stats, as the database writers count theirs."""
+    path.write_bytes(content)
+    stats["files_written"] += 1
+    stats["total_bytes"] += len(content)
+
+
+def _load_manifest(manifest_file: Path) -> dict[str, Any] | None:
+    """The previous run's manifest, or None if it is missing or unreadable (which only costs a full rebuild)."""
+    try:
+        manifest = json.loads(manifest_file.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def _up_to_date_versions(
+    manifest: dict[str, Any] | None,
+    builder: str,
+    input_fingerprints: dict[Version, str],
+    output_path: Path,
+) -> dict[Version, str]:
+    """Versions whose recorded fingerprints match this run and whose outputs are on disk.
+
+    Returns:
+        Map of each such version to the hash of its recorded path index.
+    """
+    if manifest is None or manifest.get("builder_fingerprint") != builder:
+        return {}
+    recorded = manifest.get("versions") or {}
+    up_to_date: dict[Version, str] = {}
+    for version, fingerprint in input_fingerprints.items():
+        entry = recorded.get(str(version)) or {}
+        path_index_hash = entry.get("path_index_hash")
+        if (
+            entry.get("input_fingerprint") == fingerprint
+            and path_index_hash
+            and (output_path / "versions" / f"{version}.json").exists()
+            and _path_index_file(output_path, version, path_index_hash).exists()
+        ):
+            up_to_date[version] = path_index_hash
+    return up_to_date
+
+
+def _remove_orphan_path_indexes(output_path: Path, path_index_hashes: dict[Version, str]) -> None:
+    """Delete path indexes no longer referenced, e.g. superseded by a rebuild or of a dropped version."""
+    referenced = {_path_index_file(output_path, v, h) for v, h in path_index_hashes.items()}
+    removed = 0
+    for path_index_file in (output_path / PATH_INDEX_DIR).glob("*.json"):
+        if path_index_file not in referenced:
+            path_index_file.unlink()
+            removed += 1
+    if removed:
+        logger.info(f"Removed {removed} orphaned path indexes")
+
+
 def _clean_output(output_path: Path) -> None:
     """
     Remove all generated content from the output directory while preserving the
@@ -67,13 +174,25 @@ def run_configuration_builder(
     registry_dir: str = REGISTRY_DIR,
     output_dir: str = OUTPUT_DIR,
     clean: bool = False,
+    jobs: int = 1,
+    profiler: BuildProfiler | None = None,
 ) -> int:
-    """Build resolved configuration JSON from registry YAML schemas. Returns 0 on success, 1 on failure."""
+    """Build resolved configuration JSON from registry YAML schemas. Returns 0 on success, 1 on failure.
+
+    Only versions that are new or whose inputs or builder changed since the last
+    run are rebuilt, ``jobs`` of them at a time in worker processes.
+    """
     try:
         output_path = Path(output_dir)
+        profiler = profiler or BuildProfiler(enabled=False)
+        stats = {"files_written": 0, "total_bytes": 0}
+        profiler.add_counter_source(lambda: stats)
 
         if clean and output_path.exists():
-            _clean_output(output_path)
+            with profiler.stage("clean"):
+                _clean_output(output_path)
+                # The manifest describes the output just removed.
+                (build_state_dir(output_path) / MANIFEST_FILE).unlink(missing_ok=True)
 
         inventory = BaseInventoryManager(registry_dir)
         versions = inventory.list_release_versions()
@@ -82,28 +201,52 @@ def run_configuration_builder(
             logger.error("No release versions found in configuration registry")
             return 1
 
-        logger.info(f"Processing {len(versions)} configuration schema versions")
-
         versions_dir = output_path / "versions"
         versions_dir.mkdir(parents=True, exist_ok=True)
+        (output_path / PATH_INDEX_DIR).mkdir(exist_ok=True)
+        manifest_file = build_state_dir(output_path) / MANIFEST_FILE
+
+        with profiler.stage("fingerprint"):
+            builder = builder_fingerprint()
+            input_fingerprints = {
+                version: _version_fingerprint(inventory.get_version_dir(version)) for version in versions
+            }
+            path_index_hashes = _up_to_date_versions(
+                _load_manifest(manifest_file), builder, input_fingerprints, output_path
+            )
+        stale = [version for version in versions if version not in path_index_hashes]
+
+        logger.info(
+            f"Processing {len(stale)} of {len(versions)} configuration schema versions "
+            f"({len(versions) - len(stale)} unchanged since the last build)"
+        )
 
-        for version in versions:
-            logger.info(f"Processing configuration schema version: {version}")
-            version_dir = inventory.get_version_dir(version)
-            registry = _load_yaml_registry(version_dir)
-            resolver = SchemaResolver(registry)
-            resolved = resolver.resolve(ROOT_SCHEMA_FILE)
-            ui_tree = map_schema_to_ui_tree(resolved)
-
-            version_file = versions_dir / f"{version}.json"
-            content = json.dumps(ui_tree, indent=2, sort_keys=True)
-            version_file.write_text(content, encoding="utf-8")
+        built = imap_versions(functools.partial(_build_version, inventory), stale, jobs)
+        for version, (content, path_index_hash, path_index_content) in profiler.iterate("build", built):
+            with profiler.stage("write"):
+                version_file = versions_dir / f"{version}.json"
+                _write_output(version_file, content, stats)
+                _write_output(_path_index_file(output_path, version, path_index_hash), path_index_content, stats)
+                path_index_hashes[version] = path_index_hash
             logger.info(f"Wrote {version_file}")
 
-        version_list = [{"version": str(v), "is_latest": v == versions[0]} for v in versions]
-        index_file = output_path / "versions-index.json"
-        index_content = json.dumps({"versions": version_list}, indent=2, sort_keys=True)
-        index_file.write_text(index_content, encoding="utf-8")
+        with profiler.stage("indexes"):
+            version_list = [
+                {"version": str(v), "is_latest": v == versions[0], "path_index_hash": path_index_hashes[v]}
+                for v in versions
+            ]
+            index_file = output_path / "versions-index.json"
+            _write_output(index_file, canonical_json({"versions": version_list}), stats)
+            _remove_orphan_path_indexes(output_path, path_index_hashes)
+            # Written last, so a failed build never records a version it did not finish.
+            manifest = {
+                "builder_fingerprint": builder,
+                "versions": {
+                    str(v): {"input_fingerprint": input_fingerprints[v], "path_index_hash": path_index_hashes[v]}
+                    for v in versions
+                },
+            }
+            write_state_file(manifest_file, manifest)
         logger.info(f"Wrote {index_file}")
 
         logger.info("Configuration schema build completed successfully")
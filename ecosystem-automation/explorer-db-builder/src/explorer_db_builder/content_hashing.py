@@ -12,8 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-"""Content hashing utilities for generating stable hashes of data structures."""
+"""Content hashing utilities for generating stable hashes of data structures.
 
+Every content-addressed file is identified by a hash of its minified,
+key-sorted JSON and stored as indented, key-sorted JSON. The two forms take one
+encoder pass each. :func:`encode_canonical` runs the minified pass up front, since
+the digest names the file, and the indented pass only when the file is written,
+so an item whose file is already on disk is encoded once.
+"""
+
+import functools
 import hashlib
 import json
 from typing import Any
@@ -49,6 +57,21 @@ def normalize_for_hashing(obj: Any) -> Any:
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
+def canonical_json(data: Any) -> bytes:
+    """Encode data the way every database file is written: indented, keys sorted, UTF-8.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        The file content as bytes
+
+    Raises:
+        TypeError: If data contains non-JSON-serializable types
+    """
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
 def content_hash(data: Any) -> str:
     """Generate a content-addressed hash for the given data.
 
@@ -56,11 +79,17 @@ def content_hash(data: Any) -> str:
     before hashing. This ensures the same data always produces the same hash
     regardless of key ordering or whitespace in the original representation.
 
-    The data is normalized before hashing:
+    The hashed form is normalized:
     * Dictionary keys are sorted alphabetically
     * JSON is minified (no whitespace)
     * Consistent field ordering throughout nested structures
 
+    The C JSON encoder sorts keys itself, so no normalized copy is built; for
+    any value :func:`normalize_for_hashing` accepts, the result is the same as
+    hashing its output. The encoder is less strict, though: tuples are hashed
+    as JSON arrays, exactly as :func:`canonical_json` would write them, instead
+    of raising TypeError.
+
     Args:
         data: The data to hash (dict, list, or JSON-serializable primitive)
 
@@ -68,16 +97,53 @@ def content_hash(data: Any) -> str:
         A 12-character hexadecimal hash string
 
     Raises:
-        TypeError: If data contains non-JSON-serializable types
+        TypeError: If data contains types JSON cannot encode (sets, arbitrary objects)
         ValueError: If data is empty or invalid
     """
     if data is None:
         raise ValueError("Cannot hash None value")
 
-    normalized = normalize_for_hashing(data)
-    json_str = json.dumps(normalized, separators=(",", ":"), sort_keys=True)
+    json_str = json.dumps(data, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()[:12]
 
-    if not json_str:
-        raise ValueError("Normalized data resulted in empty string")
 
-    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()[:12]
+class CanonicalJson:
+    """The content hash of a JSON value together with its canonical file bytes.
+
+    ``digest`` is computed up front because it decides the file path. ``content``
+    is a second, indented encode done on first access, so writers that find the
+    file already on disk never pay for it.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """
+        Args:
+            data: The data to encode (dict, list, or JSON-serializable primitive)
+
+        Raises:
+            TypeError: If data contains non-JSON-serializable types
+            ValueError: If data is None
+        """
+        self.data = data
+        self.digest = content_hash(data)
+
+    @functools.cached_property
+    def content(self) -> bytes:
+        """Canonical file bytes (see :func:`canonical_json`)."""
+        return canonical_json(self.data)
+
+
+def encode_canonical(data: Any) -> CanonicalJson:
+    """Hash data and prepare its canonical encoding in one step.
+
+    Args:
+        data: The data to encode (dict, list, or JSON-serializable primitive)
+
+    Returns:
+        A :class:`CanonicalJson` carrying the 12-character digest and file bytes
+
+    Raises:
+        TypeError: If data contains non-JSON-serializable types
+        ValueError: If data is None
+    """
+    return CanonicalJson(data)
@@ -14,7 +14,6 @@
 #
 """Writes data to content-addressed file storage database."""
 
-import json
 import logging
 import re
 import shutil
@@ -24,9 +23,13 @@ from typing import Any
 from semantic_version import Version
 
 from explorer_db_builder import orphan_gc
-from explorer_db_builder.content_hashing import content_hash
+from explorer_db_builder.build_manifest import MANIFEST_FILE, build_state_dir, write_state_file
+from explorer_db_builder.content_hashing import canonical_json, encode_canonical
 from explorer_db_builder.instrumentation_transformer import make_index_instrumentation
-from explorer_db_builder.readme_sanitizer import sanitize_readme
+from explorer_db_builder.readme_sanitizer import sanitize_readme, sanitizer_fingerprint
+from explorer_db_builder.release_diff import RELEASE_DIFF_DIR, release_diff_file
+from explorer_db_builder.search_index import SEARCH_INDEX_DIR, encode_search_index, search_index_file
+from explorer_db_builder.store_index import StoreIndex
 
 logger = logging.getLogger(__name__)
 
@@ -39,16 +42,31 @@ class DatabaseWriter:
     structure with instrumentations stored by name and hash.
     """
 
-    def __init__(self, database_dir: str = "ecosystem-explorer/public/data/javaagent") -> None:
+    def __init__(
+        self, database_dir: str = "ecosystem-explorer/public/data/javaagent", state_dir: str | None = None
+    ) -> None:
         """Initialize the database writer.
 
         Args:
             database_dir: Root directory for the database files.
                          Defaults to the ecosystem-explorer public data directory.
+            state_dir: Directory for the build and reachability manifests, which are
+                       not published. Defaults to :func:`build_manifest.build_state_dir`.
         """
         self.database_dir = Path(database_dir)
+        self.state_dir = Path(state_dir) if state_dir is not None else build_state_dir(self.database_dir)
         self.files_written = 0
         self.total_bytes = 0
+        # Content items hashed, and content files found already in the store.
+        self.items_hashed = 0
+        self.files_skipped = 0
+        # Content file -> markdown file it references, for the reachability manifest.
+        self._reachability: dict[str, str | None] = {}
+        # Whether the store's markdown was produced by the current sanitizer; loaded on first use.
+        self._markdown_stamped: bool | None = None
+        self._store_index = StoreIndex(
+            self.database_dir, ("instrumentations", "markdown", "bundles", RELEASE_DIFF_DIR, SEARCH_INDEX_DIR)
+        )
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitizes a name for use as a filename to prevent path traversal."""
@@ -67,6 +85,25 @@ class DatabaseWriter:
         safe_name = self._sanitize_name(library_name)
         return self.database_dir / "markdown" / f"{safe_name}-{markdown_hash}.md"
 
+    def _markdown_key(self, item: dict[str, Any]) -> str | None:
+        """Reachability manifest entry for the README a content file references, if any."""
+        name = item.get("name")
+        markdown_hash = item.get("markdown_hash")
+        if not (name and markdown_hash):
+            return None
+        return orphan_gc.store_key(self.database_dir, self._markdown_file(name, markdown_hash))
+
+    def _write_bytes(self, path: Path, content: bytes) -> None:
+        """Write already-encoded file content and count it in the session stats."""
+        with open(path, "wb") as f:
+            f.write(content)
+        self._store_index.add(path)
+        self.files_written += 1
+        self.total_bytes += len(content)
+
+    def _write_json(self, path: Path, data: Any) -> None:
+        self._write_bytes(path, canonical_json(data))
+
     def _get_file_path(self, library_name: str, library_hash: str) -> Path:
         """Get the file path for a library with the given name and hash.
 
@@ -80,7 +117,7 @@ class DatabaseWriter:
             Path to the library JSON file
         """
         file_path = self._instrumentation_file(library_name, library_hash)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store_index.ensure_parent(file_path)
         return file_path
 
     def write_libraries(self, libraries: list[dict[str, Any]]) -> dict[str, str]:
@@ -116,20 +153,19 @@ class DatabaseWriter:
             library_name = library["name"]
 
             try:
-                library_hash = content_hash(library)
+                encoded = encode_canonical(library)
+                self.items_hashed += 1
+                library_hash = encoded.digest
                 file_path = self._get_file_path(library_name, library_hash)
 
-                if file_path.exists():
+                if self._store_index.exists(file_path):
+                    self.files_skipped += 1
                     logger.debug(f"Library '{library_name}' with hash {library_hash} already exists, skipping write")
                 else:
-                    content = json.dumps(library, indent=2, sort_keys=True)
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(content)
-                    file_size = len(content.encode("utf-8"))
-                    self.files_written += 1
-                    self.total_bytes += file_size
+                    self._write_bytes(file_path, encoded.content)
                     logger.debug(f"Wrote library '{library_name}' with hash {library_hash}")
 
+                self._reachability[orphan_gc.store_key(self.database_dir, file_path)] = self._markdown_key(library)
                 library_map[library_name] = library_hash
 
             except (TypeError, ValueError) as e:
@@ -173,12 +209,7 @@ class DatabaseWriter:
             version_data["custom_instrumentations"] = custom_map
 
         try:
-            content = json.dumps(version_data, indent=2, sort_keys=True)
-            with open(version_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            file_size = len(content.encode("utf-8"))
-            self.files_written += 1
-            self.total_bytes += file_size
+            self._write_json(version_file, version_data)
             total_items = len(library_map or {}) + len(custom_map or {})
             logger.info(f"Wrote version index for {version} with {total_items} instrumentations")
         except OSError as e:
@@ -212,22 +243,20 @@ class DatabaseWriter:
         if not instrumentations:
             raise ValueError("Bundle instrumentations cannot be empty")
 
-        bundle_hash = content_hash(instrumentations)
+        encoded = encode_canonical(instrumentations)
+        self.items_hashed += 1
+        bundle_hash = encoded.digest
 
-        bundles_dir = self.database_dir / "bundles"
-        bundles_dir.mkdir(parents=True, exist_ok=True)
-        bundle_file = bundles_dir / f"{version}-{bundle_hash}.json"
+        bundle_file = self.database_dir / "bundles" / f"{version}-{bundle_hash}.json"
+        self._store_index.ensure_parent(bundle_file)
 
-        if bundle_file.exists():
+        if self._store_index.exists(bundle_file):
+            self.files_skipped += 1
             logger.debug(f"Bundle for {version} with hash {bundle_hash} already exists, skipping write")
             return bundle_hash
 
         try:
-            content = json.dumps(instrumentations, indent=2, sort_keys=True)
-            with open(bundle_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.files_written += 1
-            self.total_bytes += len(content.encode("utf-8"))
+            self._write_bytes(bundle_file, encoded.content)
             logger.info(f"Wrote version bundle for {version} with {len(instrumentations)} instrumentations")
         except OSError as e:
             logger.error(f"Failed to write version bundle for {version}: {e}")
@@ -235,7 +264,47 @@ class DatabaseWriter:
 
         return bundle_hash
 
-    def write_version_list(self, versions: list[Version], bundle_hashes: dict[Version, str] | None = None) -> None:
+    def write_release_diff(self, version: Version, release_diff: dict[str, Any]) -> str:
+        """Write the comparison of a release with the release before it, content-addressed.
+
+        Args:
+            version: The newer release of the pair, whose versions-index.json entry
+                references the diff.
+            release_diff: Diff from ``diff_javaagent_releases``.
+
+        Returns:
+            The 12-char content hash, for inclusion in versions-index.json.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        encoded = encode_canonical(release_diff)
+        self.items_hashed += 1
+        diff_hash = encoded.digest
+
+        diff_file = release_diff_file(self.database_dir, str(version), diff_hash)
+        self._store_index.ensure_parent(diff_file)
+
+        if self._store_index.exists(diff_file):
+            self.files_skipped += 1
+            logger.debug(f"Release diff for {version} with hash {diff_hash} already exists, skipping write")
+            return diff_hash
+
+        try:
+            self._write_bytes(diff_file, encoded.content)
+            logger.info(f"Wrote release diff {release_diff['from_version']} -> {version}")
+        except OSError as e:
+            logger.error(f"Failed to write release diff for {version}: {e}")
+            raise
+
+        return diff_hash
+
+    def write_version_list(
+        self,
+        versions: list[Version],
+        bundle_hashes: dict[Version, str] | None = None,
+        diff_hashes: dict[Version, str] | None = None,
+    ) -> None:
         """Write the master version list index.
 
         Creates a top-level index file listing all available versions,
@@ -250,6 +319,9 @@ class DatabaseWriter:
                 field is omitted for versions without a hash so old clients and
                 missing bundles degrade gracefully to the per-instrumentation
                 fan-out.
+            diff_hashes: Optional map of version to the hash of its diff from the
+                previous release (see :mod:`release_diff`), carried as ``diff_hash``.
+                The oldest release has none.
 
         Raises:
             ValueError: If versions list is empty
@@ -268,17 +340,15 @@ class DatabaseWriter:
             bundle_hash = (bundle_hashes or {}).get(version)
             if bundle_hash:
                 entry["bundle_hash"] = bundle_hash
+            diff_hash = (diff_hashes or {}).get(version)
+            if diff_hash:
+                entry["diff_hash"] = diff_hash
             version_list_data.append(entry)
 
         final_data = {"versions": version_list_data}
 
         try:
-            content = json.dumps(final_data, indent=2, sort_keys=True)
-            with open(version_list_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            file_size = len(content.encode("utf-8"))
-            self.files_written += 1
-            self.total_bytes += file_size
+            self._write_json(version_list_file, final_data)
             logger.info(f"Wrote version list with {len(versions)} versions (latest: {versions[0]})")
         except OSError as e:
             logger.error(f"Failed to write version list: {e}")
@@ -298,12 +368,7 @@ class DatabaseWriter:
 
         output_file = self.database_dir / "global-configurations.json"
         try:
-            content = json.dumps(configurations, indent=2, sort_keys=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            file_size = len(content.encode("utf-8"))
-            self.files_written += 1
-            self.total_bytes += file_size
+            self._write_json(output_file, configurations)
             logger.info(f"Wrote global configurations with {len(configurations)} entries")
         except OSError as e:
             logger.error(f"Failed to write global configurations: {e}")
@@ -322,17 +387,73 @@ class DatabaseWriter:
 
         output_file = self.database_dir / "ecosystem-stats.json"
         try:
-            content = json.dumps(stats, indent=2, sort_keys=True)
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            file_size = len(content.encode("utf-8"))
-            self.files_written += 1
-            self.total_bytes += file_size
+            self._write_json(output_file, stats)
             logger.info(f"Wrote javaagent ecosystem stats: {stats}")
         except OSError as e:
             logger.error(f"Failed to write ecosystem stats: {e}")
             raise
 
+    def load_build_manifest(self) -> dict[str, Any] | None:
+        """Load the previous run's build manifest.
+
+        Returns:
+            The manifest dict, or None if it is missing or unreadable (a corrupt
+            manifest only costs a full rebuild, so it is never an error).
+        """
+        manifest_file = self.state_dir / MANIFEST_FILE
+        if not manifest_file.exists():
+            return None
+        manifest = orphan_gc.read_json(manifest_file)
+        return manifest if isinstance(manifest, dict) else None
+
+    def write_build_manifest(self, manifest: dict[str, Any]) -> None:
+        """Write the build manifest to the state directory.
+
+        Args:
+            manifest: Manifest produced by :func:`build_manifest.make_build_manifest`.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        manifest_file = self.state_dir / MANIFEST_FILE
+        try:
+            write_state_file(manifest_file, manifest)
+            logger.info(f"Wrote build manifest for {len(manifest.get('versions') or {})} versions")
+        except OSError as e:
+            logger.error(f"Failed to write build manifest: {e}")
+            raise
+
+    def has_version_outputs(self, version: Version, bundle_hash: str) -> bool:
+        """Whether the version index and bundle a previous build wrote for this version are on disk."""
+        return (self.database_dir / "versions" / f"{version}-index.json").exists() and self._store_index.exists(
+            self.database_dir / "bundles" / f"{version}-{bundle_hash}.json"
+        )
+
+    def has_release_diff(self, version: Version, diff_hash: str) -> bool:
+        """Whether the release diff a previous build wrote for this version is on disk."""
+        return self._store_index.exists(release_diff_file(self.database_dir, str(version), diff_hash))
+
+    def has_index_outputs(self) -> bool:
+        """Whether every cross-version output (indexes, aggregates, stats, search index) is on disk."""
+        if not all(
+            (self.database_dir / name).exists()
+            for name in ("index.json", "versions-index.json", "global-configurations.json", "ecosystem-stats.json")
+        ):
+            return False
+        index = orphan_gc.read_json(self.database_dir / "index.json")
+        search_index_hash = index.get("search_index_hash") if isinstance(index, dict) else None
+        return bool(search_index_hash) and search_index_file(self.database_dir, search_index_hash).exists()
+
+    def _is_markdown_stamped(self) -> bool:
+        """Whether the last completed build stamped the store with the current sanitizer fingerprint.
+
+        If so, an existing markdown file is exactly what sanitizing its upstream
+        README would produce now, and can be kept without reading either.
+        """
+        if self._markdown_stamped is None:
+            self._markdown_stamped = orphan_gc.load_sanitizer_fingerprint(self.state_dir) == sanitizer_fingerprint()
+        return self._markdown_stamped
+
     def _is_current(self, file_path: Path, content: str) -> bool:
         """Whether the published markdown already matches what we would write.
 
@@ -349,7 +470,9 @@ class DatabaseWriter:
     def write_markdown(self, library_name: str, markdown_hash: str, content: str) -> bool:
         """Write markdown file to the database.
 
-        Content is run through :func:`sanitize_readme` first.
+        Content is run through :func:`sanitize_readme` first. A file already at the
+        content-addressed path of a store stamped with the current
+        sanitizer fingerprint is kept without sanitizing or reading it.
 
         Args:
             library_name: Name of the library
@@ -362,6 +485,12 @@ class DatabaseWriter:
             must check this before stamping markdown_hash.
         """
         safe_name = self._sanitize_name(library_name)
+        file_path = self._markdown_file(library_name, markdown_hash)
+        if self._store_index.exists(file_path) and self._is_markdown_stamped():
+            self.files_skipped += 1
+            logger.debug(f"Markdown for '{safe_name}' with hash {markdown_hash} already exists, skipping write")
+            return True
+
         content = sanitize_readme(content)
 
         if not content.strip():
@@ -370,16 +499,17 @@ class DatabaseWriter:
             logger.info(f"README for '{safe_name}' is empty after sanitizing, not publishing")
             return False
 
-        file_path = self._markdown_file(library_name, markdown_hash)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._store_index.ensure_parent(file_path)
 
-        if file_path.exists() and self._is_current(file_path, content):
+        if self._store_index.exists(file_path) and self._is_current(file_path, content):
+            self.files_skipped += 1
             logger.debug(f"Markdown for '{safe_name}' with hash {markdown_hash} already exists, skipping write")
             return True
 
         try:
             with open(file_path, "w", encoding="utf-8") as f:
                 f.write(content)
+            self._store_index.add(file_path)
             file_size = len(content.encode("utf-8"))
             self.files_written += 1
             self.total_bytes += file_size
@@ -390,7 +520,38 @@ class DatabaseWriter:
             # README publishing failures must never fail DB generation as per requirements
             return False
 
-    def write_index(self, latest_instrumentations: list[dict[str, Any]]) -> None:
+    def write_search_index(self, search_index: dict[str, Any]) -> str:
+        """Write the prebuilt search index (see :mod:`explorer_db_builder.search_index`), content-addressed.
+
+        Args:
+            search_index: Index from ``build_javaagent_search_index``.
+
+        Returns:
+            The 12-char content hash, for index.json's ``search_index_hash``.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        search_index_hash, content = encode_search_index(search_index)
+        self.items_hashed += 1
+        index_file = search_index_file(self.database_dir, search_index_hash)
+        self._store_index.ensure_parent(index_file)
+
+        if self._store_index.exists(index_file):
+            self.files_skipped += 1
+            logger.debug(f"Search index with hash {search_index_hash} already exists, skipping write")
+            return search_index_hash
+
+        try:
+            self._write_bytes(index_file, content)
+            logger.info(f"Wrote search index with {len(search_index['terms'])} terms")
+        except OSError as e:
+            logger.error(f"Failed to write search index: {e}")
+            raise
+
+        return search_index_hash
+
+    def write_index(self, latest_instrumentations: list[dict[str, Any]], search_index_hash: str | None = None) -> None:
         """Write the javaagent index.json: a flat, lightweight list of the latest
         version's instrumentations for browsing and client-side search.
 
@@ -402,6 +563,8 @@ class DatabaseWriter:
         Args:
             latest_instrumentations: Full canonical instrumentation dicts from
                 the latest release version. Items without a "name" are skipped.
+            search_index_hash: Hash returned by :meth:`write_search_index`, recorded
+                as ``search_index_hash`` so the frontend can fetch the search index.
         """
         self.database_dir.mkdir(parents=True, exist_ok=True)
 
@@ -414,14 +577,12 @@ class DatabaseWriter:
         components.sort(key=lambda component: component["name"])
 
         index_data: dict[str, Any] = {"ecosystem": "javaagent", "components": components}
+        if search_index_hash:
+            index_data["search_index_hash"] = search_index_hash
         index_file = self.database_dir / "index.json"
 
         try:
-            content = json.dumps(index_data, indent=2, sort_keys=True)
-            with open(index_file, "w", encoding="utf-8") as f:
-                f.write(content)
-            self.files_written += 1
-            self.total_bytes += len(content.encode("utf-8"))
+            self._write_json(index_file, index_data)
             logger.info("Wrote javaagent index with %d instrumentations", len(components))
         except OSError as e:
             logger.error("Failed to write index.json: %s", e)
@@ -431,9 +592,15 @@ class DatabaseWriter:
         """Get statistics about files written during this session.
 
         Returns:
-            Dictionary with 'files_written' (int) and 'total_bytes' (int)
+            Dictionary with 'files_written', 'total_bytes', 'items_hashed' and
+            'files_skipped' (all int)
         """
-        return {"files_written": self.files_written, "total_bytes": self.total_bytes}
+        return {
+            "files_written": self.files_written,
+            "total_bytes": self.total_bytes,
+            "items_hashed": self.items_hashed,
+            "files_skipped": self.files_skipped,
+        }
 
     def remove_orphans(self) -> int:
         """Delete content-addressed files no longer referenced by any version index.
@@ -442,18 +609,46 @@ class DatabaseWriter:
         instrumentations are referenced from two index sections (regular and
         custom); markdown is keyed by the instrumentation's ``name``.
         """
-        return orphan_gc.remove_orphans(
+        reachability = {**orphan_gc.load_reachability(self.state_dir), **self._reachability}
+        removed = orphan_gc.remove_orphans(
             self.database_dir,
             content_dir="instrumentations",
             index_sections=("instrumentations", "custom_instrumentations"),
             content_file=self._instrumentation_file,
             markdown_file=self._markdown_file,
+            reachability=reachability,
         )
+        self._reachability = reachability
+        # The sweep deletes files (and emptied directories) behind the index.
+        self._store_index.invalidate()
+        return removed
+
+    def write_reachability_manifest(self) -> None:
+        """Persist which markdown file each content file references, for the next run's orphan GC.
+
+        Holds the entries for content written this session, plus everything
+        :meth:`remove_orphans` kept live. Call after the GC (or after a clean build):
+        the manifest is stamped with the sanitizer fingerprint, vouching that every
+        markdown file left in the store matches the current sanitizer.
+
+        Raises:
+            OSError: If file writing fails.
+        """
+        manifest_file = self.state_dir / orphan_gc.REACHABILITY_FILE
+        try:
+            write_state_file(
+                manifest_file, orphan_gc.make_reachability_manifest(self._reachability, sanitizer_fingerprint())
+            )
+            logger.info(f"Wrote reachability manifest for {len(self._reachability)} content files")
+        except OSError as e:
+            logger.error(f"Failed to write reachability manifest: {e}")
+            raise
 
     def clean(self) -> None:
         """Remove all files in the database directory.
 
-        This completely removes the database directory and recreates it empty.
+        This completely removes the database directory and recreates it empty, and
+        removes the state directory, whose manifests describe the old contents.
 
         Raises:
             OSError: If directory removal or creation fails
@@ -462,5 +657,9 @@ class DatabaseWriter:
             logger.info(f"Cleaning database directory: {self.database_dir}")
             shutil.rmtree(self.database_dir)
             logger.info("Database directory cleaned")
+        shutil.rmtree(self.state_dir, ignore_errors=True)
 
         self.database_dir.mkdir(parents=True, exist_ok=True)
+        self._store_index.reset()
+        self._reachability = {}
+        self._markdown_stamped = None
@@ -78,11 +78,14 @@ UNDERDOCUMENTED_CONFIG_BACKFILL: dict[str, str | None] = {
 
 
 def apply_declarative_name_corrections(inventory: dict[str, Any]) -> dict[str, Any]:
-    """Rewrite known-bad configuration ``declarative_name`` values in place.
+    """Rewrite known-bad configuration ``declarative_name`` values.
 
     Walks every configuration entry under the inventory's ``libraries`` and ``custom`` lists and
     replaces any ``declarative_name`` found in ``DECLARATIVE_NAME_CORRECTIONS`` with its corrected
-    value. The inventory is mutated in place and also returned for convenience.
+    value. A corrected configuration replaces the original in its ``configurations`` list rather
+    than being edited in place, so a definition shared between libraries (see
+    :func:`instrumentation_transformer.transform_instrumentation_format`) is never modified. The
+    inventory is mutated in place and also returned for convenience.
 
     Args:
         inventory: Raw inventory data from the registry.
@@ -97,78 +100,86 @@ def apply_declarative_name_corrections(inventory: dict[str, Any]) -> dict[str, A
         for item in inventory.get(key) or []:
             if not isinstance(item, dict):
                 continue
-            for config in item.get("configurations") or []:
-                if not isinstance(config, dict):
-                    continue
-                original_name = config.get("declarative_name")
-                corrected = DECLARATIVE_NAME_CORRECTIONS.get(original_name)
-
-                if corrected is not None:
-                    config["declarative_name"] = corrected
-                    logger.debug(
-                        "Corrected declarative_name %r -> %r for config %r",
-                        original_name,
-                        corrected,
-                        config.get("name"),
-                    )
-
-                current_name = config.get("declarative_name")
-                # Key off the stable config ``name`` (not declarative_name): the registry shape of
-                # peer-service-mapping drifted across releases and converges only here.
-                #   <=2.27.0 : declarative_name unset, type=map, no schema
-                #   2.28.x   : declarative_name set, type=map, structured schema present
-                #   2.29.0   : type regressed to structured_list
-                # Forcing the full canonical shape on every version (see upstream PR #19077) removes
-                # the spurious cross-version diff: type=map on the system-property/env-var form,
-                # declarative_type=structured_list only on the declarative form. This is idempotent
-                # once #19077 lands in a release.
-                if config.get("name") == "otel.instrumentation.common.peer-service-mapping":
-                    config["declarative_name"] = "java.common.service_peer_mapping"
-                    config["type"] = "map"
-                    config["declarative_type"] = "structured_list"
-                    config["declarative_schema"] = {
-                        "type": "object",
-                        "required": ["peer", "service_name"],
-                        "properties": {
-                            "peer": {"type": "string", "description": "Host name or IP address to match against."},
-                            "service_name": {
-                                "type": "string",
-                                "description": "Peer service name to record for matching peers.",
-                            },
-                        },
-                    }
-                elif current_name and current_name.endswith("url_template_rules"):
-                    config["declarative_type"] = "structured_list"
-                    config["declarative_schema"] = {
-                        "type": "object",
-                        "required": ["pattern", "template"],
-                        "properties": {
-                            "pattern": {
-                                "type": "string",
-                                "description": "Regular expression matched against the request URL.",
-                            },
-                            "template": {
-                                "type": "string",
-                                "description": "Template used to derive the low-cardinality route.",
-                            },
-                            "override": {
-                                "type": "boolean",
-                                "default": False,
-                                "description": "Whether this rule overrides an already-applied template.",
-                            },
-                        },
-                    }
-
-                # Name fallback for declarative-only configs (file_format 0.6+): downstream keys
-                # configs on ``name``, so use the declarative_name as the stable identifier when the
-                # legacy system-property name is absent. Done last so it sees the corrected
-                # declarative_name above.
-                if not config.get("name") and current_name:
-                    config["name"] = current_name
+            configurations = item.get("configurations") or []
+            for index, config in enumerate(configurations):
+                if isinstance(config, dict):
+                    configurations[index] = _correct_config(config)
 
     return inventory
 
 
+def _correct_config(original: dict[str, Any]) -> dict[str, Any]:
+    """Return a corrected copy of one configuration, or the original itself if nothing changed."""
+    config = original.copy()
+    original_name = config.get("declarative_name")
+    corrected = DECLARATIVE_NAME_CORRECTIONS.get(original_name)
+
+    if corrected is not None:
+        config["declarative_name"] = corrected
+        logger.debug(
+            "Corrected declarative_name %r -> %r for config %r",
+            original_name,
+            corrected,
+            config.get("name"),
+        )
+
+    current_name = config.get("declarative_name")
+    # Key off the stable config ``name`` (not declarative_name): the registry shape of
+    # peer-service-mapping drifted across releases and converges only here.
+    #   <=2.27.0 : declarative_name unset, type=map, no schema
+    #   2.28.x   : declarative_name set, type=map, structured schema present
+    #   2.29.0   : type regressed to structured_list
+    # Forcing the full canonical shape on every version (see upstream PR #19077) removes
+    # the spurious cross-version diff: type=map on the system-property/env-var form,
+    # declarative_type=structured_list only on the declarative form. This is idempotent
+    # once #19077 lands in a release.
+    if config.get("name") == "otel.instrumentation.common.peer-service-mapping":
+        config["declarative_name"] = "java.common.service_peer_mapping"
+        config["type"] = "map"
+        config["declarative_type"] = "structured_list"
+        config["declarative_schema"] = {
+            "type": "object",
+            "required": ["peer", "service_name"],
+            "properties": {
+                "peer": {"type": "string", "description": "Host name or IP address to match against."},
+                "service_name": {
+                    "type": "string",
+                    "description": "Peer service name to record for matching peers.",
+                },
+            },
+        }
+    elif current_name and current_name.endswith("url_template_rules"):
+        config["declarative_type"] = "structured_list"
+        config["declarative_schema"] = {
+            "type": "object",
+            "required": ["pattern", "template"],
+            "properties": {
+                "pattern": {
+                    "type": "string",
+                    "description": "Regular expression matched against the request URL.",
+                },
+                "template": {
+                    "type": "string",
+                    "description": "Template used to derive the low-cardinality route.",
+                },
+                "override": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Whether this rule overrides an already-applied template.",
+                },
+            },
+        }
+
+    # Name fallback for declarative-only configs (file_format 0.6+): downstream keys
+    # configs on ``name``, so use the declarative_name as the stable identifier when the
+    # legacy system-property name is absent. Done last so it sees the corrected
+    # declarative_name above.
+    if not config.get("name") and current_name:
+        config["name"] = current_name
+
+    return original if config == original else config
+
+
 def _iter_configs(inventory: dict[str, Any]):
     """Yield every configuration dict from an inventory's ``libraries`` and ``custom`` lists,
     paired with its owning instrumentation name: ``(instrumentation_name, config)``."""
@@ -182,6 +193,40 @@ def _iter_configs(inventory: dict[str, Any]):
                     yield instrumentation_name, config
 
 
+def _record_newest_descriptions(
+    inventory: dict[str, Any], newest_description: dict[tuple[str | None, str | None], str]
+) -> None:
+    """Record the first non-empty description seen per whitelisted (instrumentation, config name).
+
+    Inventories must be fed newest-first, so the first one recorded is the newest.
+    """
+    for instrumentation_name, config in _iter_configs(inventory):
+        if config.get("declarative_name") not in DESCRIPTION_NORMALIZATION_DECLARATIVE_NAMES:
+            continue
+        key = (instrumentation_name, config.get("name"))
+        description = config.get("description")
+        if description and key not in newest_description:
+            newest_description[key] = description
+
+
+def _apply_newest_description(
+    instrumentation_name: str | None,
+    config: dict[str, Any],
+    newest_description: dict[tuple[str | None, str | None], str],
+) -> None:
+    """Pin one whitelisted config's description to its recorded newest value."""
+    if config.get("declarative_name") not in DESCRIPTION_NORMALIZATION_DECLARATIVE_NAMES:
+        return
+    canonical = newest_description.get((instrumentation_name, config.get("name")))
+    if canonical is not None and config.get("description") != canonical:
+        logger.debug(
+            "Normalized description for %s/%s to newest-version value",
+            instrumentation_name,
+            config.get("name"),
+        )
+        config["description"] = canonical
+
+
 def normalize_config_descriptions(inventories_newest_first: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Pin whitelisted configs' ``description`` to their newest-version value across all versions.
 
@@ -203,31 +248,70 @@ def normalize_config_descriptions(inventories_newest_first: list[dict[str, Any]]
     # Pass 1: record the newest non-empty description per (instrumentation, config name).
     newest_description: dict[tuple[str | None, str | None], str] = {}
     for inventory in inventories_newest_first:
-        for instrumentation_name, config in _iter_configs(inventory):
-            if config.get("declarative_name") not in DESCRIPTION_NORMALIZATION_DECLARATIVE_NAMES:
-                continue
-            key = (instrumentation_name, config.get("name"))
-            description = config.get("description")
-            if description and key not in newest_description:
-                newest_description[key] = description
+        _record_newest_descriptions(inventory, newest_description)
 
     # Pass 2: apply the newest description to every version.
     for inventory in inventories_newest_first:
         for instrumentation_name, config in _iter_configs(inventory):
-            if config.get("declarative_name") not in DESCRIPTION_NORMALIZATION_DECLARATIVE_NAMES:
-                continue
-            canonical = newest_description.get((instrumentation_name, config.get("name")))
-            if canonical is not None and config.get("description") != canonical:
-                logger.debug(
-                    "Normalized description for %s/%s to newest-version value",
-                    instrumentation_name,
-                    config.get("name"),
-                )
-                config["description"] = canonical
+            _apply_newest_description(instrumentation_name, config, newest_description)
 
     return inventories_newest_first
 
 
+# {declarative_name: {instrumentation_name: (version, newest config carrying it)}}
+_Templates = dict[str, dict[str | None, tuple[Version, dict[str, Any]]]]
+
+
+def _record_templates(version: Version, inventory: dict[str, Any], templates: _Templates) -> None:
+    """Record the first config seen per instrumentation for each under-documented declarative_name.
+
+    Inventories must be fed newest-first, so the first one recorded is the newest.
+    """
+    for instrumentation_name, config in _iter_configs(inventory):
+        declarative_name = config.get("declarative_name")
+        if declarative_name not in UNDERDOCUMENTED_CONFIG_BACKFILL:
+            continue
+        by_instrumentation = templates.setdefault(declarative_name, {})
+        if instrumentation_name not in by_instrumentation:
+            by_instrumentation[instrumentation_name] = (version, config)
+
+
+def _inject_templates(version: Version, inventory: dict[str, Any], templates: _Templates) -> None:
+    """Back-populate recorded templates into one (older) version's instrumentations."""
+    for declarative_name, floor in UNDERDOCUMENTED_CONFIG_BACKFILL.items():
+        template_by_instrumentation = templates.get(declarative_name)
+        if not template_by_instrumentation:
+            continue
+        if floor is not None and version < Version(floor):
+            continue
+        for key in ("libraries", "custom"):
+            for item in inventory.get(key) or []:
+                if not isinstance(item, dict):
+                    continue
+                entry = template_by_instrumentation.get(item.get("name"))
+                if entry is None:
+                    continue
+                template_version, template = entry
+                if version > template_version:
+                    continue
+                configurations = item.get("configurations")
+                if not isinstance(configurations, list):
+                    configurations = []
+                    item["configurations"] = configurations
+                already_present = any(
+                    isinstance(c, dict) and c.get("declarative_name") == declarative_name for c in configurations
+                )
+                if already_present:
+                    continue
+                configurations.append(copy.deepcopy(template))
+                logger.debug(
+                    "Back-populated under-documented config %s into %s @ %s",
+                    declarative_name,
+                    item.get("name"),
+                    version,
+                )
+
+
 def backfill_underdocumented_configs(
     versioned_inventories_newest_first: list[tuple[Version, dict[str, Any]]],
 ) -> list[tuple[Version, dict[str, Any]]]:
@@ -249,53 +333,51 @@ def backfill_underdocumented_configs(
     Returns:
         The same list, with under-documented configs back-populated.
     """
-    for declarative_name, floor in UNDERDOCUMENTED_CONFIG_BACKFILL.items():
-        floor_version = Version(floor) if floor else None
-
-        # Template = the newest config object per instrumentation that carries this declarative_name.
-        template_by_instrumentation: dict[str | None, dict[str, Any]] = {}
-        template_version_by_instrumentation: dict[str | None, Version] = {}
-        for template_version, inventory in versioned_inventories_newest_first:
-            for instrumentation_name, config in _iter_configs(inventory):
-                if (
-                    config.get("declarative_name") == declarative_name
-                    and instrumentation_name not in template_by_instrumentation
-                ):
-                    template_by_instrumentation[instrumentation_name] = config
-                    template_version_by_instrumentation[instrumentation_name] = template_version
+    # Injected copies carry their own declarative_name, so recording every template up
+    # front sees the same newest occurrences as searching again after each injection.
+    templates: _Templates = {}
+    for version, inventory in versioned_inventories_newest_first:
+        _record_templates(version, inventory, templates)
 
-        if not template_by_instrumentation:
-            continue
-
-        for version, inventory in versioned_inventories_newest_first:
-            if floor_version is not None and version < floor_version:
-                continue
-            for key in ("libraries", "custom"):
-                for item in inventory.get(key) or []:
-                    if not isinstance(item, dict):
-                        continue
-                    instrumentation_name = item.get("name")
-                    template = template_by_instrumentation.get(instrumentation_name)
-                    template_version = template_version_by_instrumentation.get(instrumentation_name)
-                    if template is None or template_version is None:
-                        continue
-                    if version > template_version:
-                        continue
-                    configurations = item.get("configurations")
-                    if not isinstance(configurations, list):
-                        configurations = []
-                        item["configurations"] = configurations
-                    already_present = any(
-                        isinstance(c, dict) and c.get("declarative_name") == declarative_name for c in configurations
-                    )
-                    if already_present:
-                        continue
-                    configurations.append(copy.deepcopy(template))
-                    logger.debug(
-                        "Back-populated under-documented config %s into %s @ %s",
-                        declarative_name,
-                        item.get("name"),
-                        version,
-                    )
+    for version, inventory in versioned_inventories_newest_first:
+        _inject_templates(version, inventory, templates)
 
     return versioned_inventories_newest_first
+
+
+class CrossVersionConfigCorrections:
+    """Streaming form of :func:`normalize_config_descriptions` followed by
+    :func:`backfill_underdocumented_configs`.
+
+    Both corrections need facts from every version before they can touch any of them.
+    Feed every version to :meth:`observe` newest-first, then each version to :meth:`apply`;
+    only the newest descriptions and the template configs are held in between, never
+    whole inventories.
+    """
+
+    def __init__(self) -> None:
+        self._newest_description: dict[tuple[str | None, str | None], str] = {}
+        self._templates: _Templates = {}
+        self._templates_normalized = False
+
+    def observe(self, version: Version, inventory: dict[str, Any]) -> None:
+        """Record what a version contributes. Versions must be observed newest-first.
+
+        Template configs are kept by reference, so the inventory must not be mutated afterwards.
+        """
+        _record_newest_descriptions(inventory, self._newest_description)
+        _record_templates(version, inventory, self._templates)
+
+    def apply(self, version: Version, inventory: dict[str, Any]) -> dict[str, Any]:
+        """Apply both corrections to one version's inventory, in place, once every version is observed."""
+        if not self._templates_normalized:
+            # A template is itself a config in its own version, so it is normalized before being copied.
+            for template_by_instrumentation in self._templates.values():
+                for instrumentation_name, (_, template) in template_by_instrumentation.items():
+                    _apply_newest_description(instrumentation_name, template, self._newest_description)
+            self._templates_normalized = True
+
+        for instrumentation_name, config in _iter_configs(inventory):
+            _apply_newest_description(instrumentation_name, config, self._newest_description)
+        _inject_templates(version, inventory, self._templates)
+        return inventory
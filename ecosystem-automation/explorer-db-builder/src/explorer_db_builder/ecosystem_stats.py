@@ -37,14 +37,25 @@ def count_unique_java_library_names(inventories: list[dict[str, Any]]) -> int:
     """
     names: set[str] = set()
     for inventory in inventories:
-        for key in ("libraries", "custom"):
-            for item in inventory.get(key) or []:
-                name = item.get("name")
-                if name:
-                    names.add(name)
+        names.update(java_library_names(inventory))
     return len(names)
 
 
+def java_library_names(inventory: dict[str, Any]) -> set[str]:
+    """Instrumentation names in one version's inventory (libraries and custom together).
+
+    Lets a streaming build count unique names without keeping every inventory; see
+    :func:`count_unique_java_library_names`.
+    """
+    names: set[str] = set()
+    for key in ("libraries", "custom"):
+        for item in inventory.get(key) or []:
+            name = item.get("name")
+            if name:
+                names.add(name)
+    return names
+
+
 def count_unique_collector_component_ids(components_by_version: list[list[dict[str, Any]]]) -> int:
     """Count unique collector component ids across all versions.
 
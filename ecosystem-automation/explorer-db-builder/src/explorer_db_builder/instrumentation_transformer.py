@@ -21,13 +21,17 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
-def transform_instrumentation_format(inventory_data: dict[str, Any]) -> dict[str, Any]:
+def transform_instrumentation_format(inventory_data: dict[str, Any], share_definitions: bool = False) -> dict[str, Any]:
     """Transform instrumentation inventory data to the latest format.
 
     Handles transformation from different file_format versions to the current schema.
 
     Args:
         inventory_data: Raw inventory data from registry
+        share_definitions: For 0.6 inventories, inline the same definition object into
+            every library that references it instead of a deep copy per reference.
+            Only safe when every later pass copies a configuration or metric before
+            modifying it, as the javaagent pipeline's corrections and backfill do.
 
     Returns:
         Transformed inventory data with libraries in the latest format
@@ -43,7 +47,7 @@ def transform_instrumentation_format(inventory_data: dict[str, Any]) -> dict[str
 
     if file_format == 0.6:
         logger.debug("File format 0.6 detected, resolving definition references to 0.5 inline shape")
-        return _transform_0_6_to_0_5(inventory_data)
+        return _transform_0_6_to_0_5(inventory_data, share_definitions)
     if file_format == 0.5:
         logger.debug("File format 0.5 detected, no transformation needed")
         return inventory_data
@@ -188,16 +192,20 @@ def _resolve_refs(
     library: dict[str, Any],
     configuration_defs: dict[str, Any],
     metric_defs: dict[str, Any],
+    share_definitions: bool = False,
 ) -> dict[str, Any]:
     """Resolve a single library's ``*_refs`` into the inline 0.5 shape.
 
     ``configuration_refs`` becomes an inline ``configurations`` list and each
     telemetry entry's ``metric_refs`` becomes an inline ``metrics`` list, looked
-    up in the top-level definitions catalog. Definitions are deep-copied so the
-    same shared definition referenced by multiple libraries yields independent
-    objects (downstream passes mutate these in place). Refs with no matching
-    definition are logged and skipped rather than crashing the build.
+    up in the top-level definitions catalog. By default definitions are
+    deep-copied so the same shared definition referenced by multiple libraries
+    yields independent objects; with ``share_definitions`` they are shared and
+    callers must copy before modifying one. The lists themselves are always
+    the library's own. Refs with no matching definition are logged and skipped
+    rather than crashing the build.
     """
+    resolve = (lambda definition: definition) if share_definitions else copy.deepcopy
     resolved = library.copy()
 
     config_refs = resolved.pop("configuration_refs", None)
@@ -208,7 +216,7 @@ def _resolve_refs(
             if definition is None:
                 logger.warning("Library %s references unknown configuration '%s'", library.get("name"), ref)
                 continue
-            configurations.append(copy.deepcopy(definition))
+            configurations.append(resolve(definition))
         resolved["configurations"] = configurations
 
     telemetry = resolved.get("telemetry")
@@ -224,7 +232,7 @@ def _resolve_refs(
                     if definition is None:
                         logger.warning("Library %s references unknown metric '%s'", library.get("name"), ref)
                         continue
-                    metrics.append(copy.deepcopy(definition))
+                    metrics.append(resolve(definition))
                 resolved_entry["metrics"] = metrics
             resolved_telemetry.append(resolved_entry)
         resolved["telemetry"] = resolved_telemetry
@@ -232,7 +240,7 @@ def _resolve_refs(
     return resolved
 
 
-def _transform_0_6_to_0_5(inventory_data: dict[str, Any]) -> dict[str, Any]:
+def _transform_0_6_to_0_5(inventory_data: dict[str, Any], share_definitions: bool = False) -> dict[str, Any]:
     """Transform file_format 0.6 to the inline 0.5 common schema.
 
     0.6 hoists shared metrics and configurations into a top-level ``definitions``
@@ -244,6 +252,7 @@ def _transform_0_6_to_0_5(inventory_data: dict[str, Any]) -> dict[str, Any]:
 
     Args:
         inventory_data: Inventory data in format 0.6
+        share_definitions: Share definition objects between libraries (see :func:`_resolve_refs`)
 
     Returns:
         Inventory data with references resolved inline, tagged as format 0.5
@@ -259,7 +268,7 @@ def _transform_0_6_to_0_5(inventory_data: dict[str, Any]) -> dict[str, Any]:
         library_list = inventory_data.get(key)
         if library_list is not None:
             transformed_data[key] = [
-                _resolve_refs(library, configuration_defs, metric_defs) for library in library_list
+                _resolve_refs(library, configuration_defs, metric_defs, share_definitions) for library in library_list
             ]
 
     transformed_data["file_format"] = 0.5
@@ -0,0 +1,81 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Park per-version inventories on disk between two passes of a build.
+
+The javaagent pipeline needs facts from every version before it can finish any
+of them, but holding every version's inventory until then makes memory grow
+with the release history. The first pass loads, corrects and backfills each
+version once and spools the result here; the second pass takes each one back
+in turn, so only one version is in memory at a time and nothing is loaded or
+backfilled twice.
+
+Entries are pickles in a private temporary directory, removed when the spool is
+closed. Unlike the parsed-YAML cache this is not optional: it is what keeps the
+second pass from redoing the first.
+"""
+
+import pickle
+import tempfile
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from semantic_version import Version
+
+
+class InventorySpool:
+    """Temporary on-disk store of one inventory per version.
+
+    Use as a context manager; the directory and anything left in it are removed on exit.
+    """
+
+    def __init__(self) -> None:
+        self._dir = tempfile.TemporaryDirectory(prefix="explorer-db-builder-spool-")
+
+    def __enter__(self) -> "InventorySpool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def put(self, version: Version, inventory: dict[str, Any]) -> None:
+        """Spool a version's inventory, replacing any earlier one for the same version."""
+        self._entry(version).write_bytes(pickle.dumps(inventory, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def take(self, version: Version) -> dict[str, Any]:
+        """Return a version's spooled inventory and remove it from the spool.
+
+        Raises:
+            KeyError: If no inventory is spooled for ``version``
+        """
+        entry = self._entry(version)
+        try:
+            data = entry.read_bytes()
+        except FileNotFoundError:
+            raise KeyError(version) from None
+        entry.unlink()
+        return pickle.loads(data)  # noqa: S301 - private spool, written only by put
+
+    def close(self) -> None:
+        """Remove the spool directory and every inventory still in it."""
+        self._dir.cleanup()
+
+    def _entry(self, version: Version) -> Path:
+        return Path(self._dir.name) / f"{version}.pickle"
@@ -15,28 +15,42 @@
 """Main entry point for the Explorer Database Builder."""
 
 import argparse
+import functools
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 from semantic_version import Version
 from watcher_common.inventory_manager import JavaagentInventoryManager
 
+from explorer_db_builder.build_manifest import (
+    builder_fingerprint,
+    compute_build_keys,
+    is_up_to_date,
+    make_build_manifest,
+    reusable_bundle_hashes,
+    reusable_diff_hashes,
+)
 from explorer_db_builder.collector_builder import run_collector_builder
-from explorer_db_builder.configuration_aggregator import build_global_configurations
+from explorer_db_builder.configuration_aggregator import GlobalConfigurationAggregator
 from explorer_db_builder.configuration_builder import run_configuration_builder
 from explorer_db_builder.database_writer import DatabaseWriter
 from explorer_db_builder.declarative_name_corrections import (
+    CrossVersionConfigCorrections,
     apply_declarative_name_corrections,
-    backfill_underdocumented_configs,
-    normalize_config_descriptions,
 )
-from explorer_db_builder.ecosystem_stats import count_unique_java_library_names
+from explorer_db_builder.ecosystem_stats import java_library_names
 from explorer_db_builder.instrumentation_transformer import (
     make_list_instrumentation,
     transform_instrumentation_format,
 )
-from explorer_db_builder.metadata_backfiller import backfill_metadata
+from explorer_db_builder.inventory_spool import InventorySpool
+from explorer_db_builder.metadata_backfiller import MetadataBackfiller
+from explorer_db_builder.parallel import imap_versions
+from explorer_db_builder.profiling import BuildProfiler
+from explorer_db_builder.release_diff import diff_javaagent_releases
+from explorer_db_builder.search_index import build_javaagent_search_index
 from explorer_db_builder.telemetry_when_corrections import apply_telemetry_when_corrections
 
 logger = logging.getLogger(__name__)
@@ -64,7 +78,7 @@ def get_release_versions(inventory_manager: JavaagentInventoryManager) -> list[V
         inventory_manager: Manager for accessing inventory data
 
     Returns:
-        List of release versions (no prereleases)
+        List of release versions (no prereleases), newest first
 
     Raises:
         ValueError: If no versions or no release versions are found
@@ -73,13 +87,29 @@ def get_release_versions(inventory_manager: JavaagentInventoryManager) -> list[V
     if not versions:
         raise ValueError("No versions found in inventory")
 
-    release_versions = [v for v in versions if not v.prerelease]
+    # Newest first is what the streaming backfill and is_latest rely on; list_versions
+    # already returns that order, but the builder should not depend on it.
+    release_versions = sorted((v for v in versions if not v.prerelease), reverse=True)
     if not release_versions:
         raise ValueError("No release versions found in inventory (only prereleases)")
 
     return release_versions
 
 
+def _load_transformed_inventory(inventory_manager: JavaagentInventoryManager, version: Version) -> dict:
+    """Load a version's inventory and resolve it to the inline 0.5 shape.
+
+    Pure (reads the registry only), so it can run in a worker process.
+    """
+    # Resolve catalog/ref file formats (e.g. 0.6) to the inline 0.5 shape up front so every
+    # downstream correction/backfill step operates on inline `configurations`/`metrics`
+    # regardless of the registry file format. Corrections that walk inline configs were
+    # silent no-ops for 0.6 when this transform still ran later in process_version.
+    # Shared 0.6 definitions stay shared: the corrections and backfill below copy a
+    # configuration before changing it and never modify metrics.
+    return transform_instrumentation_format(inventory_manager.load_versioned_inventory(version), share_definitions=True)
+
+
 def process_version(
     version: Version,
     inventory_manager: JavaagentInventoryManager,
@@ -151,6 +181,9 @@ def run_javaagent_builder(
     inventory_manager: Optional[JavaagentInventoryManager] = None,
     db_writer: Optional[DatabaseWriter] = None,
     clean: bool = False,
+    incremental: bool = False,
+    jobs: int = 1,
+    profiler: Optional[BuildProfiler] = None,
 ) -> int:
     """Run the javaagent database builder process.
 
@@ -158,6 +191,17 @@ def run_javaagent_builder(
         inventory_manager: Optional inventory manager (for testing)
         db_writer: Optional database writer (for testing)
         clean: If True, clean the database directory before building
+        incremental: If True, consult the build manifest from the previous run and
+            return early when no build key (see :mod:`build_manifest`) changed.
+            Otherwise every version is still loaded, corrected, backfilled and
+            spooled, since older versions and the cross-version outputs depend on
+            it; a version whose key is unchanged only skips writing its content,
+            version index and bundle, and a release diff whose pair of versions is
+            unchanged is not recomputed. Keys are chained, so a new release
+            invalidates all of them. The manifest is rewritten after a successful build.
+        jobs: Number of worker processes used to load and transform version
+            inventories. Writes always happen in this process.
+        profiler: Optional profiler recording per-stage metrics (see :mod:`profiling`)
 
     Returns:
         Exit code (0 for success, 1 for failure)
@@ -165,38 +209,78 @@ def run_javaagent_builder(
     try:
         inventory_manager = inventory_manager or JavaagentInventoryManager()
         db_writer = db_writer or DatabaseWriter()
+        profiler = profiler or BuildProfiler(enabled=False)
+        profiler.add_counter_source(db_writer.get_stats)
 
         if clean:
-            db_writer.clean()
+            with profiler.stage("clean"):
+                db_writer.clean()
 
         versions = get_release_versions(inventory_manager)
         logger.info(f"Processing {len(versions)} release versions")
 
-        # Pre-load README maps for all versions to enable augmentation and backfilling
-        readme_maps = {v: inventory_manager.load_library_readme_map(v) for v in versions}
-
-        # Publish all READMEs to the database. Only those that actually landed get a
-        # markdown_hash below - sanitizing can leave a README empty, and stamping one
-        # that was never written would point the frontend at a missing file.
-        published_readmes: dict[Version, dict[str, str]] = {}
-        for version, readme_map in readme_maps.items():
-            published = {}
-            for library_name, markdown_hash in readme_map.items():
-                content = inventory_manager.load_library_readme_content(version, library_name, markdown_hash)
-                if content is not None and db_writer.write_markdown(library_name, markdown_hash, content):
-                    published[library_name] = markdown_hash
-            published_readmes[version] = published
-
-        def load_and_augment_inventory(version: Version) -> dict:
-            inventory = inventory_manager.load_versioned_inventory(version)
+        builder = ""
+        input_fingerprints: dict[Version, str] = {}
+        build_keys: dict[Version, str] = {}
+        reusable: dict[Version, str] = {}
+        reusable_diffs: dict[Version, str] = {}
+        if incremental:
+            with profiler.stage("build_keys"):
+                builder = builder_fingerprint()
+                input_fingerprints = {v: inventory_manager.version_fingerprint(v) for v in versions}
+                build_keys = compute_build_keys(versions, input_fingerprints, builder)
+                manifest = db_writer.load_build_manifest()
+                # A key match only vouches for outputs that are still on disk.
+                reusable = {
+                    v: h
+                    for v, h in reusable_bundle_hashes(manifest, build_keys).items()
+                    if db_writer.has_version_outputs(v, h)
+                }
+                reusable_diffs = {
+                    v: h
+                    for v, h in reusable_diff_hashes(manifest, build_keys, versions).items()
+                    if db_writer.has_release_diff(v, h)
+                }
+
+            if (
+                is_up_to_date(manifest, build_keys)
+                and len(reusable) == len(versions)
+                and len(reusable_diffs) == len(versions) - 1
+                and db_writer.has_index_outputs()
+            ):
+                logger.info("[*] All release versions unchanged since the last build, nothing to do")
+                return 0
+
+            logger.info(f"Rebuilding {len(versions) - len(reusable)} version(s), reusing {len(reusable)} unchanged")
+
+        with profiler.stage("readmes"):
+            # Pre-load README maps for all versions to enable augmentation and backfilling
+            readme_maps = {v: inventory_manager.load_library_readme_map(v) for v in versions}
+
+            # Publish all READMEs to the database. Only those that actually landed get a
+            # markdown_hash below - sanitizing can leave a README empty, and stamping one
+            # that was never written would point the frontend at a missing file.
+            # A README usually keeps its hash across many releases, so each distinct
+            # (library, hash) is read and published once and the outcome shared.
+            published_readmes: dict[Version, dict[str, str]] = {}
+            publish_results: dict[tuple[str, str], bool] = {}
+            for version, readme_map in readme_maps.items():
+                published = {}
+                for library_name, markdown_hash in readme_map.items():
+                    key = (library_name, markdown_hash)
+                    if key not in publish_results:
+                        content = inventory_manager.load_library_readme_content(version, library_name, markdown_hash)
+                        if content is None:
+                            # Not remembered: another version's copy may still load.
+                            continue
+                        publish_results[key] = db_writer.write_markdown(library_name, markdown_hash, content)
+                    if publish_results[key]:
+                        published[library_name] = markdown_hash
+                published_readmes[version] = published
+
+        def augment_inventory(version: Version, inventory: dict) -> dict:
             readme_map = published_readmes.get(version, {})
 
-            # Resolve catalog/ref file formats (e.g. 0.6) to the inline 0.5 shape up front so every
-            # downstream correction/backfill step operates on inline `configurations`/`metrics`
-            # regardless of the registry file format. Corrections that walk inline configs were
-            # silent no-ops for 0.6 when this transform still ran later in process_version.
-            inventory = transform_instrumentation_format(inventory)
-
             # Correct known-bad declarative_name values (and backfill missing config names) before
             # backfill and aggregation so the fix lands in both the per-version files and
             # global-configurations.json.
@@ -223,58 +307,106 @@ def run_javaagent_builder(
 
             return inventory
 
-        backfilled_libraries = backfill_metadata(
-            versions,
-            load_and_augment_inventory,
-            item_key="libraries",
-        )
-        backfilled_inventories = backfill_metadata(
-            versions,
-            lambda v: backfilled_libraries[v],
-            item_key="custom",
-        )
-
-        # Pin reworded-but-unchanged config descriptions to their newest value across versions so
-        # cosmetic upstream rewordings of shared configs don't show as per-library changes in the
-        # release comparison. Runs after backfill (so config names are populated) and before both
-        # per-version writes and global-configurations aggregation. versions is newest-first.
-        normalize_config_descriptions([backfilled_inventories[v] for v in versions])
-
-        # Back-populate configs the agent supported before upstream documented them (e.g.
-        # url_template_rules, new in 2.29.1) into earlier versions, so they don't read as spuriously
-        # "added" in the release comparison.
-        backfill_underdocumented_configs([(v, backfilled_inventories[v]) for v in versions])
-
-        # versions[0] is the latest release (the same version write_version_list
-        # flags as is_latest), so the first processed version's instrumentations
-        # feed the lightweight index.
-        latest_instrumentations: list[dict] = []
-        bundle_hashes: dict[Version, str] = {}
-        for version in versions:
-            inventory = backfilled_inventories.get(version)
-            instrumentations, bundle_hash = process_version(version, inventory_manager, db_writer, inventory=inventory)
-            bundle_hashes[version] = bundle_hash
-            if not latest_instrumentations:
-                latest_instrumentations = instrumentations
-
-        db_writer.write_version_list(versions, bundle_hashes)
-        db_writer.write_index(latest_instrumentations)
-
-        # Incremental runs never overwrite the store, so files whose hash changed are left
-        # orphaned. Sweep them now that every version index (the reachability source) is on
-        # disk. Skipped after --clean, which already wiped everything.
-        if not clean:
-            db_writer.remove_orphans()
-
-        global_configurations = build_global_configurations([backfilled_inventories[v] for v in versions])
-        db_writer.write_global_configurations(global_configurations)
-
-        db_writer.write_ecosystem_stats(
-            {
-                "version_count": len(versions),
-                "library_count": count_unique_java_library_names([backfilled_inventories[v] for v in versions]),
-            }
-        )
+        with InventorySpool() as spool:
+            # Phase 1: load, correct and backfill each version once, newest first, collecting the
+            # only cross-version facts the per-version outputs depend on. Pinning reworded-but-unchanged
+            # config descriptions to their newest value keeps cosmetic upstream rewordings of shared
+            # configs from showing as per-library changes in the release comparison; back-populating
+            # configs the agent supported before upstream documented them (e.g. url_template_rules,
+            # new in 2.29.1) keeps them from reading as spuriously "added". Both run after backfill,
+            # so config names are populated. Backfill only ever copies values from newer releases
+            # into older ones, so walking newest first it needs no inventory but the current one.
+            # Parsing the registry YAML dominates the build, so it is the part fanned out to worker
+            # processes. Each backfilled inventory is spooled to disk until phase 2 needs it.
+            config_corrections = CrossVersionConfigCorrections()
+            backfiller = MetadataBackfiller(item_keys=("libraries", "custom"))
+            loader = functools.partial(_load_transformed_inventory, inventory_manager)
+            for version, inventory in profiler.iterate("load", imap_versions(loader, versions, jobs)):
+                with profiler.stage("augment"):
+                    inventory = augment_inventory(version, inventory)
+                with profiler.stage("backfill"):
+                    inventory = backfiller.backfill(version, inventory)
+                with profiler.stage("normalize"):
+                    config_corrections.observe(version, inventory)
+                with profiler.stage("spool"):
+                    spool.put(version, inventory)
+
+            # Phase 2: take each version back, apply those facts, write it and fold it into the
+            # cross-version outputs, keeping only one version's inventory (and the next newer
+            # version's instrumentations, for its release diff) in memory at a time.
+            # versions[0] is the latest release (the same version write_version_list
+            # flags as is_latest), so the first processed version's instrumentations
+            # feed the lightweight index.
+            global_configurations = GlobalConfigurationAggregator()
+            library_names: set[str] = set()
+            latest_instrumentations: list[dict] = []
+            bundle_hashes: dict[Version, str] = {}
+            diff_hashes: dict[Version, str] = {}
+            newer: Optional[tuple[Version, list[dict]]] = None
+            for version in versions:
+                with profiler.stage("spool"):
+                    inventory = spool.take(version)
+                with profiler.stage("normalize"):
+                    config_corrections.apply(version, inventory)
+                if version in reusable:
+                    # Same build key as the last successful build, so the version index and
+                    # bundle on disk are exactly what process_version would write. Its
+                    # inventory was still loaded and backfilled in phase 1, since the
+                    # cross-version outputs below need it; only its writes are skipped.
+                    logger.info(f"Java Agent version {version} unchanged, reusing its outputs")
+                    instrumentations = [*(inventory.get("libraries") or []), *(inventory.get("custom") or [])]
+                    bundle_hash = reusable[version]
+                else:
+                    with profiler.stage("process_version"):
+                        instrumentations, bundle_hash = process_version(
+                            version, inventory_manager, db_writer, inventory=inventory
+                        )
+                bundle_hashes[version] = bundle_hash
+                if newer is not None:
+                    newer_version, newer_instrumentations = newer
+                    with profiler.stage("release_diffs"):
+                        if newer_version in reusable_diffs:
+                            diff_hashes[newer_version] = reusable_diffs[newer_version]
+                        else:
+                            release_diff = diff_javaagent_releases(
+                                str(version), str(newer_version), instrumentations, newer_instrumentations
+                            )
+                            diff_hashes[newer_version] = db_writer.write_release_diff(newer_version, release_diff)
+                newer = (version, instrumentations)
+                if not latest_instrumentations:
+                    latest_instrumentations = instrumentations
+                with profiler.stage("global_configurations"):
+                    global_configurations.add(inventory)
+                library_names.update(java_library_names(inventory))
+
+        with profiler.stage("search_index"):
+            search_index_hash = db_writer.write_search_index(build_javaagent_search_index(latest_instrumentations))
+
+        with profiler.stage("indexes"):
+            db_writer.write_version_list(versions, bundle_hashes, diff_hashes)
+            db_writer.write_index(latest_instrumentations, search_index_hash=search_index_hash)
+
+        with profiler.stage("orphan_gc"):
+            # Incremental runs never overwrite the store, so files whose hash changed are left
+            # orphaned. Sweep them now that every version index (the reachability source) is on
+            # disk. Skipped after --clean, which already wiped everything.
+            if not clean:
+                db_writer.remove_orphans()
+            # Records each content file's README so the next run's GC needn't reopen them all.
+            db_writer.write_reachability_manifest()
+
+        with profiler.stage("global_configurations"):
+            db_writer.write_global_configurations(global_configurations.build())
+
+        with profiler.stage("indexes"):
+            db_writer.write_ecosystem_stats({"version_count": len(versions), "library_count": len(library_names)})
+
+            if incremental:
+                # Written last so a run that fails part-way leaves the previous manifest in
+                # place, and the versions it didn't finish are rebuilt next time.
+                db_writer.write_build_manifest(
+                    make_build_manifest(builder, input_fingerprints, build_keys, bundle_hashes, diff_hashes)
+                )
 
         stats = db_writer.get_stats()
         total_mb = stats["total_bytes"] / (1024 * 1024)
@@ -301,7 +433,128 @@ def run_javaagent_builder(
         return 1
 
 
-def run_builder(clean: bool = False, ecosystem: str = "all", collector_audit_report: Optional[str] = None) -> int:
+PIPELINES = ("javaagent", "configuration", "collector")
+
+PIPELINE_TITLES = {
+    "javaagent": "Java Agent",
+    "configuration": "Configuration Schema",
+    "collector": "Collector",
+}
+
+
+def _run_pipeline(
+    name: str,
+    profiler: BuildProfiler,
+    clean: bool,
+    collector_audit_report: Optional[str],
+    jobs: int,
+) -> int:
+    """Run one pipeline inside a profiler stage named after it."""
+    with profiler.stage(name):
+        if name == "javaagent":
+            return run_javaagent_builder(clean=clean, incremental=True, jobs=jobs, profiler=profiler)
+        if name == "configuration":
+            return run_configuration_builder(clean=clean, jobs=jobs, profiler=profiler)
+        return run_collector_builder(
+            clean=clean, audit_report_path=collector_audit_report, jobs=jobs, profiler=profiler
+        )
+
+
+def _run_pipeline_process(
+    name: str,
+    clean: bool,
+    collector_audit_report: Optional[str],
+    jobs: int,
+    log_level: int,
+) -> tuple[int, dict]:
+    """Worker entry point for a concurrent build: run one pipeline in this process.
+
+    Log lines are prefixed with the pipeline name so interleaved output stays readable.
+    The pipeline is always profiled (the overhead is a few counter reads per stage) so
+    the parent can summarise it.
+
+    Returns:
+        The pipeline's exit code and this process's profile report.
+    """
+    logging.basicConfig(
+        level=log_level,
+        format=f"[{name}] %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+        force=True,
+    )
+    profiler = BuildProfiler()
+    exit_code = _run_pipeline(name, profiler, clean, collector_audit_report, jobs)
+    return exit_code, profiler.report()
+
+
+def _run_pipelines_concurrently(
+    names: list[str],
+    profiler: BuildProfiler,
+    clean: bool,
+    collector_audit_report: Optional[str],
+    jobs: int,
+) -> list[int]:
+    """Run each pipeline in its own process and merge their profiles into profiler.
+
+    The pipelines read disjoint registry trees and write disjoint output directories,
+    so running them side by side produces the same files as running them in turn.
+
+    Returns:
+        Exit codes in the order of names; a pipeline whose process failed counts as 1.
+    """
+    logger.info(f"Running {len(names)} pipelines concurrently: {', '.join(names)}")
+    worker = functools.partial(
+        _run_pipeline_process,
+        clean=clean,
+        collector_audit_report=collector_audit_report,
+        jobs=jobs,
+        log_level=logging.getLogger().getEffectiveLevel(),
+    )
+    results: list[int] = []
+    rows = [("pipeline", "status", "wall s", "files written", "bytes written")]
+    with ProcessPoolExecutor(max_workers=len(names)) as executor:
+        futures = {name: executor.submit(worker, name) for name in names}
+        for name, future in futures.items():
+            try:
+                exit_code, report = future.result()
+            except Exception as e:
+                logger.error(f"❌ {PIPELINE_TITLES[name]} pipeline process failed: {e}")
+                results.append(1)
+                rows.append((name, "crashed", "-", "-", "-"))
+                continue
+            results.append(exit_code)
+            profiler.merge_report(report)
+            stage = next(stage for stage in report["stages"] if stage["name"] == name)
+            counters = stage["counters"]
+            rows.append(
+                (
+                    name,
+                    "ok" if exit_code == 0 else "failed",
+                    f"{stage['wall_seconds']:.3f}",
+                    f"{counters.get('files_written', 0):,}",
+                    f"{counters.get('total_bytes', 0):,}",
+                )
+            )
+
+    logger.info("")
+    logger.info("Pipelines:")
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        cells = [row[0].ljust(widths[0]), row[1].ljust(widths[1])]
+        cells += [cell.rjust(width) for cell, width in zip(row[2:], widths[2:])]
+        logger.info(f"  {'  '.join(cells)}")
+    logger.info("")
+    return results
+
+
+def run_builder(
+    clean: bool = False,
+    ecosystem: str = "all",
+    collector_audit_report: Optional[str] = None,
+    jobs: int = 1,
+    profile: Optional[str] = None,
+    concurrent: bool = False,
+) -> int:
     """Run the selected database builder pipelines.
 
     Args:
@@ -309,26 +562,38 @@ def run_builder(clean: bool = False, ecosystem: str = "all", collector_audit_rep
         ecosystem: Which pipeline to run: "javaagent", "configuration", "collector", or "all".
         collector_audit_report: If set, the collector build writes a JSON report of
             latest-release components missing a display_name to this path.
+        jobs: Number of worker processes each pipeline may use for per-version work.
+        profile: If set, record per-stage metrics for every pipeline, write them as a
+            JSON report to this path and log a summary table.
+        concurrent: If True and more than one pipeline is selected, run each pipeline
+            in its own process at the same time, with log lines prefixed by pipeline
+            name and a per-pipeline summary at the end.
 
     Returns:
         0 if all selected pipelines succeed, 1 if any fail.
     """
-    results: list[int] = []
-
-    if ecosystem in ("javaagent", "all"):
-        logger.info("--- Java Agent ---")
-        results.append(run_javaagent_builder(clean=clean))
-        logger.info("")
-
-    if ecosystem in ("configuration", "all"):
-        logger.info("--- Configuration Schema ---")
-        results.append(run_configuration_builder(clean=clean))
-        logger.info("")
-
-    if ecosystem in ("collector", "all"):
-        logger.info("--- Collector ---")
-        results.append(run_collector_builder(clean=clean, audit_report_path=collector_audit_report))
-        logger.info("")
+    profiler = BuildProfiler(enabled=profile is not None)
+    names = [name for name in PIPELINES if ecosystem in (name, "all")]
+
+    if concurrent and len(names) > 1:
+        results = _run_pipelines_concurrently(names, profiler, clean, collector_audit_report, jobs)
+    else:
+        results = []
+        for name in names:
+            logger.info(f"--- {PIPELINE_TITLES[name]} ---")
+            results.append(_run_pipeline(name, profiler, clean, collector_audit_report, jobs))
+            logger.info("")
+
+    if profile is not None:
+        logger.info("Build profile:")
+        for line in profiler.summary_table().splitlines():
+            logger.info(f"  {line}")
+        try:
+            profiler.write_report(profile)
+            logger.info(f"Wrote build profile to {profile}")
+        except OSError as e:
+            logger.error(f"❌ Failed to write build profile: {e}")
+            results.append(1)
 
     return 1 if any(r != 0 for r in results) else 0
 
@@ -359,8 +624,35 @@ def main() -> None:
             "display_name to PATH. Only produced when the collector pipeline runs."
         ),
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Number of worker processes for per-version work (default: 1). Output is identical for any N.",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        metavar="PATH",
+        help=(
+            "Record wall time, CPU time, peak memory and counters for every build stage, "
+            "write them as a JSON report to PATH and log a summary table."
+        ),
+    )
+
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help=(
+            "With --ecosystem all, run the javaagent, configuration and collector pipelines "
+            "in parallel processes. Each may still use --jobs workers."
+        ),
+    )
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     configure_logging()
 
@@ -373,6 +665,9 @@ def main() -> None:
         clean=args.clean,
         ecosystem=args.ecosystem,
         collector_audit_report=args.collector_audit_report,
+        jobs=args.jobs,
+        profile=args.profile,
+        concurrent=args.concurrent,
     )
     sys.exit(exit_code)
 
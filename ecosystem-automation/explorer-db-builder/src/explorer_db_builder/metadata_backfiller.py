@@ -15,7 +15,6 @@
 """Backfills missing metadata fields across versions."""
 
 import logging
-from collections import defaultdict
 from typing import Any, Callable
 
 from semantic_version import Version
@@ -31,7 +30,7 @@ NESTED_BACKFILLABLE_FIELDS: dict[str, list[str]] = {
 def backfill_metadata(
     versions: list[Version],
     load_inventory_fn: Callable[[Version], dict[str, Any]],
-    item_key: str = "libraries",
+    item_keys: tuple[str, ...] = ("libraries",),
 ) -> dict[Version, dict[str, Any]]:
     """Backfill metadata across versions.
 
@@ -43,10 +42,14 @@ def backfill_metadata(
     (e.g. per-configuration ``declarative_name`` and ``examples``) across
     versions, matching nested items by their ``name``.
 
+    Every item list in ``item_keys`` is backfilled in the same pass, each against
+    its own history (a custom instrumentation never borrows from a library of the
+    same name), so each inventory is loaded exactly once.
+
     Args:
         versions: List of versions (unordered)
         load_inventory_fn: Function that loads inventory for a version
-        item_key: Key for items list in inventory (e.g., "libraries", "components")
+        item_keys: Keys of the item lists in inventory (e.g., ("libraries", "custom"))
 
     Returns:
         Dict mapping version to backfilled inventory data
@@ -59,19 +62,91 @@ def backfill_metadata(
 
     logger.info(f"Backfilling metadata across {len(versions)} versions")
 
-    inventories: dict[Version, dict[str, Any]] = {}
-    metadata_timeline, nested_timelines = _build_timelines(versions, load_inventory_fn, item_key, inventories)
+    backfiller = MetadataBackfiller(item_keys)
+    backfilled = {
+        version: backfiller.backfill(version, load_inventory_fn(version)) for version in sorted(versions, reverse=True)
+    }
+
+    logger.info("Metadata backfill completed")
+    return {version: backfilled[version] for version in versions}
+
 
-    backfilled_inventories = {}
-    for version in versions:
-        inventory = inventories[version]
+class MetadataBackfiller:
+    """Streaming form of :func:`backfill_metadata`, fed one version at a time, newest first.
+
+    A missing field takes the value from the nearest version at or after the one
+    being filled. Walking newest first, that is simply the last value seen for the
+    same (item, field), so the backfiller only remembers one value per field rather
+    than every version's inventory.
+    """
+
+    def __init__(self, item_keys: tuple[str, ...] = ("libraries",)) -> None:
+        """
+        Args:
+            item_keys: Keys of the item lists in each inventory
+        """
+        self.item_keys = item_keys
+        self._previous_version: Version | None = None
+        # {(item_key, item_name, field): value} and
+        # {(item_key, item_name, nested_key, nested_name, field): value}
+        self._latest: dict[tuple[str, str, str], Any] = {}
+        self._latest_nested: dict[tuple[str, str, str, str, str], Any] = {}
+
+    def backfill(self, version: Version, inventory: dict[str, Any]) -> dict[str, Any]:
+        """Backfill one version's inventory.
+
+        Args:
+            version: The inventory's version; must be older than every version already backfilled
+            inventory: The version's inventory (not mutated)
+
+        Returns:
+            A copy of the inventory with every item list in ``item_keys`` backfilled
+
+        Raises:
+            ValueError: If versions are not fed newest first
+        """
+        if self._previous_version is not None and version >= self._previous_version:
+            raise ValueError(f"Versions must be backfilled newest first, got {version} after {self._previous_version}")
+        self._previous_version = version
+
+        # Record the whole version before filling any of it, so items sharing a name
+        # within a version can fill each other, exactly as later versions do.
+        for item_key in self.item_keys:
+            self._record(item_key, inventory)
+
+        backfilled_inventory = inventory.copy()
+        for item_key in self.item_keys:
+            backfilled_inventory[item_key] = self._backfill_items(item_key, inventory, version)
+        return backfilled_inventory
+
+    def _record(self, item_key: str, inventory: dict[str, Any]) -> None:
         # `or []` (not a .get default) so an explicit "<item_key>": None (malformed or
         # partial inventory, since YAML `libraries:` parses as None) normalizes to a list
         # instead of raising TypeError when iterating below.
-        items = inventory.get(item_key) or []
+        for item in inventory.get(item_key) or []:
+            item_name = item.get("name")
+            if not item_name:
+                continue
+
+            for field in BACKFILLABLE_FIELDS:
+                if _has_value(item, field):
+                    self._latest[(item_key, item_name, field)] = item[field]
+
+            for nested_key, fields in NESTED_BACKFILLABLE_FIELDS.items():
+                for nested_item in item.get(nested_key) or []:
+                    if not isinstance(nested_item, dict):
+                        continue
+                    nested_name = nested_item.get("name")
+                    if not nested_name:
+                        continue
+                    for field in fields:
+                        if _has_value(nested_item, field):
+                            key = (item_key, item_name, nested_key, nested_name, field)
+                            self._latest_nested[key] = nested_item[field]
 
+    def _backfill_items(self, item_key: str, inventory: dict[str, Any], version: Version) -> list[Any]:
         backfilled_items = []
-        for item in items:
+        for item in inventory.get(item_key) or []:
             item_name = item.get("name")
             if not item_name:
                 backfilled_items.append(item)
@@ -81,7 +156,7 @@ def backfill_metadata(
 
             for field in BACKFILLABLE_FIELDS:
                 if _needs_backfill(item, field):
-                    backfilled_value = _find_backfill_value(item_name, field, version, metadata_timeline)
+                    backfilled_value = self._latest.get((item_key, item_name, field))
                     if backfilled_value is not None:
                         backfilled_item[field] = backfilled_value
                         logger.debug(f"Backfilled {field} for {item_name} in {version}")
@@ -90,119 +165,52 @@ def backfill_metadata(
                 nested_items = backfilled_item.get(nested_key)
                 if not nested_items:
                     continue
-                per_item_timeline = nested_timelines[nested_key].get(item_name, {})
-                backfilled_item[nested_key] = _backfill_nested_items(
-                    nested_items, nested_fields, version, per_item_timeline, item_name, nested_key
+                backfilled_item[nested_key] = self._backfill_nested_items(
+                    nested_items, nested_fields, version, (item_key, item_name, nested_key)
                 )
 
             backfilled_items.append(backfilled_item)
-
-        backfilled_inventory = inventory.copy()
-        backfilled_inventory[item_key] = backfilled_items
-        backfilled_inventories[version] = backfilled_inventory
-
-    logger.info("Metadata backfill completed")
-    return backfilled_inventories
-
-
-def _backfill_nested_items(
-    nested_items: list[Any],
-    nested_fields: list[str],
-    version: Version,
-    per_item_timeline: dict,
-    parent_name: str,
-    nested_key: str,
-) -> list[Any]:
-    """Backfill fields on a list of nested items (e.g. configurations).
-
-    Args:
-        nested_items: The nested items for the current version
-        nested_fields: Field names to backfill
-        version: Version being processed
-        per_item_timeline: Timeline scoped to the parent item,
-            shape {nested_name: {field: {version: value}}}
-        parent_name: Name of the parent item (for logging)
-        nested_key: Name of the nested collection (for logging)
-
-    Returns:
-        New list with backfilled nested items
-    """
-    result = []
-    for nested_item in nested_items:
-        if not isinstance(nested_item, dict):
-            result.append(nested_item)
-            continue
-
-        nested_name = nested_item.get("name")
-        if not nested_name:
-            result.append(nested_item)
-            continue
-
-        backfilled = nested_item.copy()
-        for field in nested_fields:
-            if _needs_backfill(nested_item, field):
-                backfilled_value = _find_backfill_value(nested_name, field, version, per_item_timeline)
-                if backfilled_value is not None:
-                    backfilled[field] = backfilled_value
-                    logger.debug(f"Backfilled {nested_key}.{field} for {parent_name}/{nested_name} in {version}")
-        result.append(backfilled)
-    return result
-
-
-def _build_timelines(
-    versions: list[Version],
-    load_inventory_fn: Callable[[Version], dict[str, Any]],
-    item_key: str,
-    inventories: dict[Version, dict[str, Any]],
-) -> tuple[dict, dict]:
-    """Build timelines of metadata changes.
-
-    Args:
-        versions: List of versions in any order
-        load_inventory_fn: Function that loads inventory for a version
-        item_key: Key for items list in inventory
-        inventories: Dict to populate with loaded inventories
-
-    Returns:
-        Tuple of:
-        - metadata_timeline: {item_name: {field: {version: value}}}
-        - nested_timelines: {nested_key: {item_name: {nested_name: {field: {version: value}}}}}
-    """
-    metadata_timeline: dict = defaultdict(lambda: defaultdict(dict))
-    nested_timelines: dict[str, dict] = {
-        nested_key: defaultdict(lambda: defaultdict(lambda: defaultdict(dict)))
-        for nested_key in NESTED_BACKFILLABLE_FIELDS
-    }
-
-    for version in versions:
-        inventory = load_inventory_fn(version)
-        inventories[version] = inventory
-
-        # `or []` (not a .get default) so an explicit "<item_key>": None normalizes to a
-        # list instead of raising TypeError when iterating below (see backfill_metadata).
-        items = inventory.get(item_key) or []
-        for item in items:
-            item_name = item.get("name")
-            if not item_name:
+        return backfilled_items
+
+    def _backfill_nested_items(
+        self,
+        nested_items: list[Any],
+        nested_fields: list[str],
+        version: Version,
+        parent: tuple[str, str, str],
+    ) -> list[Any]:
+        """Backfill fields on a list of nested items (e.g. configurations).
+
+        Args:
+            nested_items: The nested items for the current version
+            nested_fields: Field names to backfill
+            version: Version being processed (for logging)
+            parent: (item_key, item_name, nested_key) of the collection being backfilled
+
+        Returns:
+            New list with backfilled nested items
+        """
+        _, parent_name, nested_key = parent
+        result = []
+        for nested_item in nested_items:
+            if not isinstance(nested_item, dict):
+                result.append(nested_item)
                 continue
 
-            for field in BACKFILLABLE_FIELDS:
-                if _has_value(item, field):
-                    metadata_timeline[item_name][field][version] = item[field]
-
-            for nested_key, fields in NESTED_BACKFILLABLE_FIELDS.items():
-                nested_items = item.get(nested_key) or []
-                for nested_item in nested_items:
-                    if not isinstance(nested_item, dict):
-                        continue
-                    nested_name = nested_item.get("name")
-                    if not nested_name:
-                        continue
-                    for field in fields:
-                        if _has_value(nested_item, field):
-                            nested_timelines[nested_key][item_name][nested_name][field][version] = nested_item[field]
+            nested_name = nested_item.get("name")
+            if not nested_name:
+                result.append(nested_item)
+                continue
 
-    return metadata_timeline, nested_timelines
+            backfilled = nested_item.copy()
+            for field in nested_fields:
+                if _needs_backfill(nested_item, field):
+                    backfilled_value = self._latest_nested.get((*parent, nested_name, field))
+                    if backfilled_value is not None:
+                        backfilled[field] = backfilled_value
+                        logger.debug(f"Backfilled {nested_key}.{field} for {parent_name}/{nested_name} in {version}")
+            result.append(backfilled)
+        return result
 
 
 def _has_value(item: dict[str, Any], field: str) -> bool:
@@ -226,36 +234,3 @@ def _has_value(item: dict[str, Any], field: str) -> bool:
 def _needs_backfill(item: dict[str, Any], field: str) -> bool:
     """Check if a field needs backfilling."""
     return not _has_value(item, field)
-
-
-def _find_backfill_value(item_name: str, field: str, current_version: Version, timeline: dict) -> Any | None:
-    """Find the appropriate backfill value for a field.
-
-    Searches forward in time to find the next available value for the field.
-
-    Args:
-        item_name: Name of the item
-        field: Field name to backfill
-        current_version: Version being processed
-        timeline: Timeline shape {item_name: {field: {version: value}}}
-
-    Returns:
-        The backfill value, or None if no value found
-    """
-    if item_name not in timeline:
-        return None
-
-    if field not in timeline[item_name]:
-        return None
-
-    field_timeline = timeline[item_name][field]
-    if not field_timeline:
-        return None
-
-    sorted_versions = sorted(field_timeline.keys())
-
-    for version in sorted_versions:
-        if version >= current_version:
-            return field_timeline[version]
-
-    return None
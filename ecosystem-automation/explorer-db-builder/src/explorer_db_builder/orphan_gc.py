@@ -18,16 +18,35 @@ DatabaseWriter and CollectorDatabaseWriter both keep an append-only,
 content-addressed store and must sweep files no longer referenced by any version
 index. The stores differ only in directory names and how a content file's path is
 derived, so the reachability walk lives here, parameterized by those two things.
+
+Markdown is referenced only from inside content files, so finding live READMEs
+used to mean opening every live content file. The writers instead record which
+markdown file each content file points at as they write it, and persist that
+map as a reachability manifest in the database's unpublished state directory
+(see :func:`build_manifest.build_state_dir`). Content addresses are immutable,
+so an entry never goes stale; content files the manifest does not cover (an
+older store, or a missing or unreadable manifest) are read as before.
+
+The manifest also carries the fingerprint of the README sanitizer that produced every
+markdown file in the store, so writers can trust an existing README without re-reading it.
 """
 
 import json
 import logging
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+from explorer_db_builder.release_diff import RELEASE_DIFF_DIR, release_diff_file
+from explorer_db_builder.search_index import SEARCH_INDEX_DIR, search_index_file
+
 logger = logging.getLogger(__name__)
 
+REACHABILITY_FILE = "reachability.json"
+# Bump if the manifest's shape changes; a manifest in another format is ignored.
+_REACHABILITY_FORMAT = 1
+
 
 def read_json(path: Path) -> dict[str, Any] | None:
     """Read and parse a JSON file, returning None (with a warning) on failure.
@@ -42,24 +61,103 @@ def read_json(path: Path) -> dict[str, Any] | None:
         return None
 
 
-def _sweep(root: Path, pattern: str, live_paths: set[Path]) -> int:
-    """Delete files under ``root`` matching ``pattern`` that aren't in ``live_paths``.
+def store_key(database_dir: Path, path: Path) -> str:
+    """Key for a store file in the reachability manifest: its POSIX path relative to the store root."""
+    return path.relative_to(database_dir).as_posix()
+
+
+def load_reachability(state_dir: Path) -> dict[str, str | None]:
+    """Load the persisted content-file -> markdown-file map from the database's state directory.
+
+    Returns:
+        The map (markdown is None for content without a README), or an empty dict
+        if the manifest is missing, unreadable or in another format, in which case
+        GC falls back to reading each live content file.
+    """
+    manifest_file = state_dir / REACHABILITY_FILE
+    if not manifest_file.exists():
+        return {}
+    data = read_json(manifest_file)
+    if (
+        not isinstance(data, dict)
+        or data.get("format") != _REACHABILITY_FORMAT
+        or not isinstance(data.get("markdown"), dict)
+    ):
+        logger.info("Ignoring reachability manifest %s in an unexpected format", manifest_file)
+        return {}
+    return dict(data["markdown"])
+
+
+def load_sanitizer_fingerprint(state_dir: Path) -> str | None:
+    """The README sanitizer fingerprint stamped by the last completed build, or None if unknown."""
+    manifest_file = state_dir / REACHABILITY_FILE
+    if not manifest_file.exists():
+        return None
+    data = read_json(manifest_file)
+    if not isinstance(data, dict) or data.get("format") != _REACHABILITY_FORMAT:
+        return None
+    fingerprint = data.get("sanitizer_fingerprint")
+    return fingerprint if isinstance(fingerprint, str) else None
+
+
+def make_reachability_manifest(
+    reachability: dict[str, str | None], sanitizer_fingerprint: str | None = None
+) -> dict[str, Any]:
+    """Build the JSON document persisted as REACHABILITY_FILE.
+
+    Args:
+        reachability: Content-file -> markdown-file map.
+        sanitizer_fingerprint: If set, vouches that every markdown file in the store
+            was produced by the README sanitizer with this fingerprint.
+    """
+    manifest: dict[str, Any] = {"format": _REACHABILITY_FORMAT, "markdown": reachability}
+    if sanitizer_fingerprint is not None:
+        manifest["sanitizer_fingerprint"] = sanitizer_fingerprint
+    return manifest
+
+
+def _sweep(directory: str, suffix: str, live_paths: set[str]) -> tuple[int, int]:
+    """Delete files directly in ``directory`` ending in ``suffix`` that aren't in ``live_paths``.
 
-    Returns the number of files deleted.
+    Returns:
+        (files deleted, entries left in the directory)
     """
-    if not root.is_dir():
+    removed = 0
+    remaining = 0
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
+        return 0, 0
+    with it:
+        for entry in it:
+            if entry.path in live_paths or not entry.name.endswith(suffix) or not entry.is_file():
+                remaining += 1
+                continue
+            try:
+                os.unlink(entry.path)
+                removed += 1
+                logger.debug("Removed orphaned file %s", entry.path)
+            except OSError as e:
+                remaining += 1
+                logger.warning("Failed to remove orphaned file %s: %s", entry.path, e)
+    return removed, remaining
+
+
+def _sweep_content(content_root: str, live_paths: set[str]) -> int:
+    """Sweep ``{content_root}/*/*.json``, pruning subdirectories the sweep leaves empty."""
+    try:
+        it = os.scandir(content_root)
+    except FileNotFoundError:
         return 0
+    with it:
+        subdirs = [entry.path for entry in it if entry.is_dir()]
 
     removed = 0
-    for path in root.glob(pattern):
-        if path in live_paths:
-            continue
-        try:
-            path.unlink()
-            removed += 1
-            logger.debug("Removed orphaned file %s", path)
-        except OSError as e:
-            logger.warning("Failed to remove orphaned file %s: %s", path, e)
+    for subdir in subdirs:
+        subdir_removed, remaining = _sweep(subdir, ".json", live_paths)
+        removed += subdir_removed
+        if not remaining:
+            os.rmdir(subdir)
     return removed
 
 
@@ -70,6 +168,7 @@ def remove_orphans(
     index_sections: tuple[str, ...],
     content_file: Callable[[str, str], Path],
     markdown_file: Callable[[str, str], Path],
+    reachability: dict[str, str | None] | None = None,
 ) -> int:
     """Delete content-addressed files no longer referenced by any version index.
 
@@ -85,6 +184,10 @@ def remove_orphans(
             maps reference live content files.
         content_file: Maps ``(index key, hash)`` to a content file path.
         markdown_file: Maps ``(name, markdown_hash)`` to a markdown file path.
+        reachability: Known content-file -> markdown-file entries (see
+            :func:`load_reachability`). Updated in place: live content files it did
+            not cover are read and added, entries for anything not live are dropped,
+            leaving exactly what the next manifest should hold.
 
     Returns:
         The number of files deleted.
@@ -110,39 +213,64 @@ def remove_orphans(
         logger.warning("Skipping orphan GC: no readable version index found in %s", versions_dir)
         return 0
 
-    # Markdown is reachable only via markdown_hash inside each live content file.
-    live_markdown: set[Path] = set()
+    # Markdown is reachable only via markdown_hash inside each live content file, so
+    # content the reachability manifest doesn't cover has to be opened.
+    known = reachability if reachability is not None else {}
+    live_keys: set[str] = set()
+    live_markdown: set[str] = set()
+    fallback_reads = 0
     for path in live_content:
-        data = read_json(path)
-        if data is None:
-            continue
-        name = data.get("name")
-        markdown_hash = data.get("markdown_hash")
-        if name and markdown_hash:
-            live_markdown.add(markdown_file(name, markdown_hash))
+        key = store_key(database_dir, path)
+        live_keys.add(key)
+        if key in known:
+            markdown_key = known[key]
+        else:
+            fallback_reads += 1
+            data = read_json(path)
+            if data is None:
+                continue
+            name = data.get("name")
+            markdown_hash = data.get("markdown_hash")
+            markdown_key = (
+                store_key(database_dir, markdown_file(name, markdown_hash)) if name and markdown_hash else None
+            )
+            known[key] = markdown_key
+        if markdown_key:
+            live_markdown.add(os.fspath(database_dir / markdown_key))
+
+    for key in [key for key in known if key not in live_keys]:
+        del known[key]
+    if fallback_reads:
+        logger.info("Read %d content file(s) not covered by the reachability manifest", fallback_reads)
 
-    # Bundle hashes live only in the top-level versions-index.json.
-    live_bundles: set[Path] = set()
+    # Bundle and release diff hashes live only in the top-level versions-index.json.
+    live_bundles: set[str] = set()
+    live_diffs: set[str] = set()
     versions_index = database_dir / "versions-index.json"
     version_list = read_json(versions_index) if versions_index.exists() else None
     if version_list is not None:
         for entry in version_list.get("versions") or []:
             bundle_hash = entry.get("bundle_hash")
+            diff_hash = entry.get("diff_hash")
             version = entry.get("version")
             if bundle_hash and version:
-                live_bundles.add(database_dir / "bundles" / f"{version}-{bundle_hash}.json")
+                live_bundles.add(os.fspath(database_dir / "bundles" / f"{version}-{bundle_hash}.json"))
+            if diff_hash and version:
+                live_diffs.add(os.fspath(release_diff_file(database_dir, version, diff_hash)))
 
-    removed = 0
-    removed += _sweep(database_dir / content_dir, "*/*.json", live_content)
-    removed += _sweep(database_dir / "bundles", "*.json", live_bundles)
-    removed += _sweep(database_dir / "markdown", "*.md", live_markdown)
-
-    # Prune content subdirectories emptied by the sweep above.
-    content_root = database_dir / content_dir
-    if content_root.is_dir():
-        for child in content_root.iterdir():
-            if child.is_dir() and not any(child.iterdir()):
-                child.rmdir()
+    removed = _sweep_content(os.fspath(database_dir / content_dir), {os.fspath(path) for path in live_content})
+    removed += _sweep(os.fspath(database_dir / "bundles"), ".json", live_bundles)[0]
+    removed += _sweep(os.fspath(database_dir / RELEASE_DIFF_DIR), ".json", live_diffs)[0]
+    removed += _sweep(os.fspath(database_dir / "markdown"), ".md", live_markdown)[0]
+
+    # The search index is referenced only from the top-level index.json. If that can't
+    # be read, which one is live is unknown, so leave them all.
+    index_file = database_dir / "index.json"
+    index = read_json(index_file) if index_file.exists() else None
+    if index is not None:
+        search_index_hash = index.get("search_index_hash")
+        live_search = {os.fspath(search_index_file(database_dir, search_index_hash))} if search_index_hash else set()
+        removed += _sweep(os.fspath(database_dir / SEARCH_INDEX_DIR), ".json", live_search)[0]
 
     if removed:
         logger.info("Removed %d orphaned file(s) from %s", removed, database_dir)
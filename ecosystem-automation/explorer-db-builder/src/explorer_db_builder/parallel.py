@@ -0,0 +1,77 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Fan per-version work out to a process pool.
+
+Builders only hand *pure* work to the pool (parsing registry YAML and
+transforming it). Every write to the content-addressed store stays in the
+parent process, in version order, so the store has a single writer and the
+output is byte-identical to a serial build.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+R = TypeVar("R")
+
+
+def imap_versions(fn: Callable[[K], R], keys: Sequence[K], jobs: int = 1) -> Iterator[tuple[K, R]]:
+    """Lazily apply ``fn`` to every key, yielding ``(key, result)`` in the order of ``keys``.
+
+    Results are never all held at once: with ``jobs`` > 1 at most ``2 * jobs`` keys are
+    in flight or waiting to be consumed, so memory stays proportional to the pool size
+    rather than to the number of keys.
+
+    Args:
+        fn: Picklable callable (a module-level function or a ``functools.partial``
+            of one) that must not write to the database.
+        keys: Keys to process, typically versions.
+        jobs: Maximum number of worker processes. 1 runs in-process.
+
+    Yields:
+        ``(key, fn(key))`` pairs, in the order of ``keys``.
+
+    Raises:
+        Whatever ``fn`` raises; a worker's exception is re-raised in the parent.
+    """
+    if jobs <= 1 or len(keys) <= 1:
+        for key in keys:
+            yield key, fn(key)
+        return
+
+    workers = min(jobs, len(keys))
+    logger.info("Streaming %d versions through %d worker processes", len(keys), workers)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: deque[tuple[K, Future[R]]] = deque()
+    submitted = 0
+    try:
+        while submitted < len(keys) and len(pending) < 2 * workers:
+            pending.append((keys[submitted], executor.submit(fn, keys[submitted])))
+            submitted += 1
+        while pending:
+            key, future = pending.popleft()
+            result = future.result()
+            if submitted < len(keys):
+                pending.append((keys[submitted], executor.submit(fn, keys[submitted])))
+                submitted += 1
+            yield key, result
+    finally:
+        # Also reached when the consumer stops early: drop queued work instead of finishing it.
+        executor.shutdown(wait=True, cancel_futures=True)
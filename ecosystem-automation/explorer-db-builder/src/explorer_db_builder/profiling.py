@@ -0,0 +1,220 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-stage build profiling (``--profile``).
+
+Each pipeline wraps its stages in :meth:`BuildProfiler.stage`. A stage records wall
+time, CPU time, the process's peak RSS when it finished, and how much each counter
+source (YAML loads, writer stats) moved while it ran. Stages nest, and their names
+are joined with "/" (e.g. ``javaagent/backfill``). A stage entered several times,
+such as once per version, accumulates into one entry with a call count.
+
+The report is JSON so the nightly build can compare runs. CPU time and counters
+cover this process only; work done in ``--jobs`` worker processes shows up as wall
+time in the stage that waits for it. Pipelines run with ``--concurrent`` are profiled
+in their own processes and merged in with :meth:`BuildProfiler.merge_report`. Peak
+RSS is a process high-water mark, so a stage only raises it if it set a new peak.
+
+A disabled profiler (the default everywhere) makes every stage a no-op.
+"""
+
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Iterable, Iterator, TypeVar
+
+from watcher_common.yaml_cache import load_stats
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_FORMAT = 1
+
+CounterSource = Callable[[], dict[str, Any]]
+T = TypeVar("T")
+
+
+def peak_rss_bytes() -> int:
+    """High-water resident set size of this process, or 0 where it is unavailable."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class StageMetrics:
+    """Accumulated measurements for one named stage."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes = 0
+        self.counters: dict[str, int] = {}
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "counters": dict(sorted(self.counters.items())),
+        }
+
+
+class BuildProfiler:
+    """Records per-stage metrics across a build and reports them."""
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Args:
+            enabled: If False, stages and counter sources are ignored
+        """
+        self.enabled = enabled
+        self._stages: dict[str, StageMetrics] = {}
+        self._stack: list[str] = []
+        self._sources: list[CounterSource] = [load_stats]
+        self._started = time.perf_counter()
+
+    def add_counter_source(self, source: CounterSource) -> None:
+        """Register a callable returning cumulative counts (e.g. a writer's get_stats).
+
+        Each stage records how much every integer count moved while it ran. Sources
+        reporting the same key are summed.
+        """
+        if self.enabled:
+            self._sources.append(source)
+
+    def stage(self, name: str) -> ContextManager[None]:
+        """Context manager measuring one run of a stage, nested under any enclosing stage."""
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        path = "/".join([*self._stack, name])
+        # Created on entry so stages are reported in the order they first started.
+        metrics = self._stages.setdefault(path, StageMetrics(path))
+        self._stack.append(name)
+        counters_before = self._counters()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            metrics.calls += 1
+            metrics.wall_seconds += time.perf_counter() - wall_start
+            metrics.cpu_seconds += time.process_time() - cpu_start
+            metrics.peak_rss_bytes = max(metrics.peak_rss_bytes, peak_rss_bytes())
+            for key, value in self._counters().items():
+                delta = value - counters_before.get(key, 0)
+                if delta:
+                    metrics.counters[key] = metrics.counters.get(key, 0) + delta
+            self._stack.pop()
+
+    def _counters(self) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for source in self._sources:
+            for key, value in source().items():
+                if isinstance(value, int):
+                    totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Yield from iterable, measuring each step as a run of stage name.
+
+        For producers whose work happens on demand, such as a generator loading
+        versions: the time to produce each item is attributed to name rather than to
+        whatever stage the consumer is in.
+        """
+        if not self.enabled:
+            yield from iterable
+            return
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def merge_report(self, report: dict[str, Any]) -> None:
+        """Add the stages of another process's :meth:`report`, e.g. a concurrently run pipeline.
+
+        Stages with the same name accumulate, as if they had run here. Totals still
+        cover this process only.
+        """
+        if not self.enabled:
+            return
+        for stage in report["stages"]:
+            metrics = self._stages.setdefault(stage["name"], StageMetrics(stage["name"]))
+            metrics.calls += stage["calls"]
+            metrics.wall_seconds += stage["wall_seconds"]
+            metrics.cpu_seconds += stage["cpu_seconds"]
+            metrics.peak_rss_bytes = max(metrics.peak_rss_bytes, stage["peak_rss_bytes"])
+            for key, value in stage["counters"].items():
+                metrics.counters[key] = metrics.counters.get(key, 0) + value
+
+    def report(self) -> dict[str, Any]:
+        """The machine-readable report: totals plus every stage in the order it first ran."""
+        return {
+            "format": REPORT_FORMAT,
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "cpu_seconds": round(time.process_time(), 6),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "stages": [metrics.to_dict() for metrics in self._stages.values()],
+        }
+
+    def write_report(self, path: str | Path) -> None:
+        """Write :meth:`report` as JSON to path.
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        report_path = Path(path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+    def summary_table(self) -> str:
+        """Human-readable table of every stage, nested stages indented under their parent."""
+        rows = [("stage", "calls", "wall s", "cpu s", "peak MB", "counters")]
+        for metrics in self._stages.values():
+            depth = metrics.name.count("/")
+            label = "  " * depth + metrics.name.rsplit("/", 1)[-1]
+            counters = ", ".join(f"{key}={value:,}" for key, value in sorted(metrics.counters.items()))
+            rows.append(
+                (
+                    label,
+                    str(metrics.calls),
+                    f"{metrics.wall_seconds:.3f}",
+                    f"{metrics.cpu_seconds:.3f}",
+                    f"{metrics.peak_rss_bytes / (1024 * 1024):.1f}",
+                    counters,
+                )
+            )
+        widths = [max(len(row[column]) for row in rows) for column in range(5)]
+        lines = []
+        for row in rows:
+            cells = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:5], widths[1:])]
+            lines.append("  ".join([*cells, row[5]]).rstrip())
+        return "\n".join(lines)
@@ -22,7 +22,10 @@ Both rules skip fenced code blocks: Java instrumentation READMEs embed pom.xml
 and logback.xml snippets whose comments are part of the sample being copied.
 """
 
+import functools
+import hashlib
 import re
+from pathlib import Path
 
 _SECTION_RE = re.compile(
     r"<!--\s*status autogenerated section\s*-->.*?<!--\s*end autogenerated section\s*-->[ \t]*\n?",
@@ -47,6 +50,17 @@ _REF_USE_RE = re.compile(r"\[([^\]\[]+)\](?![(:])")
 _REMOVED = "\x00"
 
 
+@functools.cache
+def sanitizer_fingerprint() -> str:
+    """Hash of this module's source.
+
+    The writers stamp the store with the fingerprint of the sanitizer that produced its
+    markdown, and only compare existing files with freshly sanitized content while the
+    stamp differs. Any edit here may change the output, so it invalidates the stamp.
+    """
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
 def _normalize_label(label: str) -> str:
     """Fold a link label the way CommonMark matches them: case- and whitespace-insensitive."""
     return " ".join(label.split()).lower()
@@ -0,0 +1,252 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Precomputed comparisons between adjacent releases.
+
+Comparing two releases in the browser means loading both version manifests and
+every instrumentation or component whose hash differs between them. The builder
+already holds each release in memory, so it diffs every release against the one
+before it. The respective DatabaseWriter writes the result to
+``diffs/{version}-{hash}.json``, and ``versions-index.json`` references it from the
+newer release's entry as ``diff_hash``. Pure (no I/O).
+
+Shape (``RELEASE_DIFF_FORMAT`` 1)::
+
+    {
+      "format": 1,
+      "ecosystem": "javaagent",
+      "from_version": "2.27.0",
+      "to_version": "2.28.0",
+      "added": ["new-library-1.0", ...],
+      "removed": [...],
+      "changed": {
+        "jdbc": {
+          "configurations": {"added": [...], "removed": [...], "changed": [...]},
+          "metrics": {...}, "spans": {...}, "attributes": {...},
+          "fields": ["description", ...]
+        }
+      },
+      "totals": {"added": 1, "removed": 0, "changed": 1}
+    }
+
+``changed`` lists only entries that differ, and within an entry only the sections
+that differ. A section lists keys (configuration names, metric names, span kinds,
+attribute names) under whichever of added/removed/changed is non-empty. ``fields``
+names the remaining top-level fields whose value changed.
+"""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+RELEASE_DIFF_FORMAT = 1
+
+RELEASE_DIFF_DIR = "diffs"
+
+Keyed = dict[str, Any]
+
+
+def release_diff_file(database_dir: Path, version: str, diff_hash: str) -> Path:
+    """Content-addressed path of the diff from the release before ``version`` to ``version``."""
+    return database_dir / RELEASE_DIFF_DIR / f"{version}-{diff_hash}.json"
+
+
+def _diff_keyed(before: Keyed, after: Keyed) -> dict[str, list[str]]:
+    """Added, removed and changed keys between two keyed maps, omitting empty lists."""
+    changes = {
+        "added": sorted(key for key in after if key not in before),
+        "removed": sorted(key for key in before if key not in after),
+        "changed": sorted(key for key in after if key in before and before[key] != after[key]),
+    }
+    return {status: keys for status, keys in changes.items() if keys}
+
+
+def _diff_item(
+    before: dict[str, Any],
+    after: dict[str, Any],
+    sections: dict[str, Callable[[dict], Keyed]],
+    section_fields: frozenset[str],
+) -> dict[str, Any]:
+    """The sections and remaining top-level fields that differ between two versions of an entry."""
+    changes: dict[str, Any] = {}
+    for section, keyed in sections.items():
+        section_changes = _diff_keyed(keyed(before), keyed(after))
+        if section_changes:
+            changes[section] = section_changes
+    fields = sorted(
+        field
+        for field in before.keys() | after.keys()
+        if field not in section_fields and before.get(field) != after.get(field)
+    )
+    if fields:
+        changes["fields"] = fields
+    return changes
+
+
+def _telemetry_blocks(instrumentation: dict[str, Any]) -> list[dict[str, Any]]:
+    return [block for block in instrumentation.get("telemetry") or [] if isinstance(block, dict)]
+
+
+def _javaagent_configurations(instrumentation: dict[str, Any]) -> Keyed:
+    return {
+        configuration["name"]: configuration
+        for configuration in instrumentation.get("configurations") or []
+        if isinstance(configuration, dict) and configuration.get("name")
+    }
+
+
+def _javaagent_metrics(instrumentation: dict[str, Any]) -> Keyed:
+    # A metric moved to another when-condition is a change to that metric, not a removal and an addition.
+    metrics: dict[str, dict[str, Any]] = {}
+    for block in _telemetry_blocks(instrumentation):
+        for metric in block.get("metrics") or []:
+            if isinstance(metric, dict) and metric.get("name"):
+                metrics.setdefault(metric["name"], {})[block.get("when") or "default"] = metric
+    return metrics
+
+
+def _javaagent_spans(instrumentation: dict[str, Any]) -> Keyed:
+    spans: dict[str, dict[str, Any]] = {}
+    for block in _telemetry_blocks(instrumentation):
+        for span in block.get("spans") or []:
+            if isinstance(span, dict) and span.get("span_kind"):
+                spans.setdefault(span["span_kind"], {})[block.get("when") or "default"] = span
+    return spans
+
+
+def _javaagent_attributes(instrumentation: dict[str, Any]) -> Keyed:
+    """Every telemetry attribute name, mapped to the sorted types it is emitted with."""
+    types: dict[str, set[str]] = {}
+    for block in _telemetry_blocks(instrumentation):
+        for signal in [*(block.get("metrics") or []), *(block.get("spans") or [])]:
+            if not isinstance(signal, dict):
+                continue
+            for attribute in signal.get("attributes") or []:
+                if isinstance(attribute, dict) and attribute.get("name"):
+                    types.setdefault(attribute["name"], set()).add(str(attribute.get("type")))
+    return {name: sorted(attribute_types) for name, attribute_types in types.items()}
+
+
+def _collector_metrics(component: dict[str, Any]) -> Keyed:
+    metrics = dict(component.get("metrics") or {})
+    telemetry = component.get("telemetry") or {}
+    if isinstance(telemetry, dict):
+        metrics.update(telemetry.get("metrics") or {})
+    return metrics
+
+
+def _collector_attributes(component: dict[str, Any]) -> Keyed:
+    return dict(component.get("attributes") or {})
+
+
+_JAVAAGENT_SECTIONS: dict[str, Callable[[dict], Keyed]] = {
+    "configurations": _javaagent_configurations,
+    "metrics": _javaagent_metrics,
+    "spans": _javaagent_spans,
+    "attributes": _javaagent_attributes,
+}
+
+_COLLECTOR_SECTIONS: dict[str, Callable[[dict], Keyed]] = {
+    "metrics": _collector_metrics,
+    "attributes": _collector_attributes,
+}
+
+# Top-level fields the sections above are read from, so "fields" doesn't repeat them.
+_JAVAAGENT_SECTION_FIELDS = frozenset({"configurations", "telemetry"})
+
+_COLLECTOR_SECTION_FIELDS = frozenset({"metrics", "attributes", "telemetry"})
+
+
+def diff_releases(
+    ecosystem: str,
+    from_version: str,
+    to_version: str,
+    before: dict[str, dict[str, Any]],
+    after: dict[str, dict[str, Any]],
+    sections: dict[str, Callable[[dict], Keyed]],
+    section_fields: frozenset[str],
+) -> dict[str, Any]:
+    """Compare two releases' entries into the diff described in the module docstring.
+
+    Entries equal in both releases are skipped before any section is computed, so
+    the cost follows what changed rather than the size of the release.
+
+    Args:
+        ecosystem: "javaagent" or "collector", recorded in the diff.
+        from_version: The older release.
+        to_version: The newer release.
+        before: The older release's entries, by id.
+        after: The newer release's entries, by id.
+        sections: Section name -> function keying an entry's part of that section.
+        section_fields: Top-level entry fields the sections are read from.
+    """
+    added = sorted(key for key in after if key not in before)
+    removed = sorted(key for key in before if key not in after)
+    changed: dict[str, dict[str, Any]] = {}
+    for key in sorted(after.keys() & before.keys()):
+        if before[key] == after[key]:
+            continue
+        item_changes = _diff_item(before[key], after[key], sections, section_fields)
+        if item_changes:
+            changed[key] = item_changes
+    return {
+        "format": RELEASE_DIFF_FORMAT,
+        "ecosystem": ecosystem,
+        "from_version": from_version,
+        "to_version": to_version,
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "totals": {"added": len(added), "removed": len(removed), "changed": len(changed)},
+    }
+
+
+def diff_javaagent_releases(
+    from_version: str,
+    to_version: str,
+    from_instrumentations: list[dict[str, Any]],
+    to_instrumentations: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Diff two releases' full instrumentations (libraries and custom), keyed by name."""
+
+    def by_name(instrumentations: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        return {item["name"]: item for item in instrumentations if isinstance(item, dict) and item.get("name")}
+
+    return diff_releases(
+        "javaagent",
+        from_version,
+        to_version,
+        by_name(from_instrumentations),
+        by_name(to_instrumentations),
+        _JAVAAGENT_SECTIONS,
+        _JAVAAGENT_SECTION_FIELDS,
+    )
+
+
+def diff_collector_releases(
+    from_version: str,
+    to_version: str,
+    from_components: list[dict[str, Any]],
+    to_components: list[dict[str, Any]],
+) -> dict[str, Any]:
+    """Diff two releases' full canonical components, keyed by component id."""
+    return diff_releases(
+        "collector",
+        from_version,
+        to_version,
+        {component["id"]: component for component in from_components},
+        {component["id"]: component for component in to_components},
+        _COLLECTOR_SECTIONS,
+        _COLLECTOR_SECTION_FIELDS,
+    )
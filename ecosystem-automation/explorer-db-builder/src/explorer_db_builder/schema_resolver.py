@@ -17,16 +17,47 @@
 import copy
 from typing import Any
 
+# A $ref target: (file, pointer into it), the pointer None for the whole file.
+RefKey = tuple[str, str | None]
+
+
+class _RefFrame:
+    """A $ref being resolved, with what its result turned out to depend on."""
+
+    def __init__(self, key: RefKey, depth: int) -> None:
+        self.key = key
+        self.depth = depth
+        # Every ref whose in-progress state was consulted while resolving this one.
+        self.reach: set[RefKey] = {key}
+        # Depth of the outermost in-progress ref a circular marker pointed at.
+        self.low = depth
+
 
 class SchemaResolver:
-    """Resolves $ref references in a registry of {filename: parsed_yaml} dicts."""
+    """Resolves $ref references in a registry of {filename: parsed_yaml} dicts.
+
+    A definition is usually referenced from many places, so each one is resolved once
+    and the result shared by every reference to it. Circular references make that
+    subtle: where a ``$circular_ref`` marker lands depends on which refs enclose the
+    one being resolved. A resolved ref is therefore memoized only if none of its markers
+    point at an enclosing ref, and reused only where none of the refs it consulted
+    (its reach) is being resolved, which is exactly when resolving it again would give
+    the same tree.
+    """
 
     def __init__(self, registry: dict[str, Any]) -> None:
         self._registry = registry
-        self._resolution_stack: list[str] = []
+        self._resolution_stack: list[_RefFrame] = []
+        # Keys on the resolution stack, mapped to their depth in it.
+        self._in_progress: dict[RefKey, int] = {}
+        self._resolved: dict[RefKey, tuple[Any, frozenset[RefKey]]] = {}
 
     def resolve(self, entry_file: str) -> dict[str, Any]:
-        """Resolve all $refs starting from entry_file. Returns fully inlined schema with $defs stripped."""
+        """Resolve all $refs starting from entry_file. Returns fully inlined schema with $defs stripped.
+
+        The result never aliases the registry, but every reference to the same
+        definition shares one resolved subtree, so it must not be modified in place.
+        """
         return self._resolve_node(self._registry[entry_file], entry_file)
 
     def _resolve_node(self, node: Any, current_file: str) -> Any:
@@ -42,49 +73,70 @@ class SchemaResolver:
         """Resolve a $ref node. Siblings override resolved ref properties."""
         ref_value = node["$ref"]
         siblings = {k: self._resolve_node(v, current_file) for k, v in node.items() if k != "$ref"}
+        key = self._ref_key(ref_value, current_file)
+        enclosing = self._resolution_stack[-1] if self._resolution_stack else None
 
-        stack_key = f"{current_file}{ref_value}" if ref_value.startswith("#/") else ref_value
-
-        if stack_key in self._resolution_stack:
+        depth = self._in_progress.get(key)
+        if depth is not None:
+            if enclosing is not None:
+                enclosing.reach.add(key)
+                enclosing.low = min(enclosing.low, depth)
             marker = {"$circular_ref": ref_value}
             if siblings:
                 marker.update(siblings)
             return marker
 
-        self._resolution_stack.append(stack_key)
+        memo = self._resolved.get(key)
+        if memo is not None and memo[1].isdisjoint(self._in_progress):
+            resolved, reach = memo
+            if enclosing is not None:
+                enclosing.reach |= reach
+        else:
+            resolved = self._resolve_target(key)
+
+        if isinstance(resolved, dict) and siblings:
+            return {**resolved, **siblings}
+        return resolved
+
+    def _resolve_target(self, key: RefKey) -> Any:
+        """Resolve the node a ref points at, memoizing it if the result doesn't depend on where it was reached."""
+        frame = _RefFrame(key, len(self._resolution_stack))
+        self._resolution_stack.append(frame)
+        self._in_progress[key] = frame.depth
         try:
-            resolved = self._lookup_ref(ref_value, current_file)
-
-            if isinstance(resolved, dict):
-                resolved = self._resolve_node(resolved, self._ref_file(ref_value, current_file))
-                if siblings:
-                    return {**resolved, **siblings}
-                return resolved
-            return resolved
+            target = self._lookup_ref(key)
+            if isinstance(target, dict):
+                resolved = self._resolve_node(target, key[0])
+            else:
+                # Only a dict target is rebuilt by _resolve_node; anything else is copied so the
+                # result never aliases the registry.
+                resolved = copy.deepcopy(target)
         finally:
             self._resolution_stack.pop()
+            del self._in_progress[key]
 
-    def _lookup_ref(self, ref: str, current_file: str) -> Any:
-        if ref.startswith("#/"):
-            path_parts = ref[2:].split("/")
-            target = self._registry[current_file]
-            for part in path_parts:
-                target = target[part]
-            return copy.deepcopy(target)
+        if frame.low >= frame.depth:
+            self._resolved[key] = (resolved, frozenset(frame.reach))
+        if self._resolution_stack:
+            enclosing = self._resolution_stack[-1]
+            enclosing.reach |= frame.reach
+            enclosing.low = min(enclosing.low, frame.low)
+        return resolved
 
+    def _ref_key(self, ref: str, current_file: str) -> RefKey:
+        """The (file, pointer) a $ref in current_file points at."""
+        if ref.startswith("#/"):
+            return current_file, ref[2:]
         if "#" in ref:
             file_name, fragment = ref.split("#", 1)
-            target = self._registry[file_name]
-            path_parts = fragment.lstrip("/").split("/")
-            for part in path_parts:
-                target = target[part]
-            return copy.deepcopy(target)
+            return file_name, fragment.lstrip("/")
+        return ref, None
 
-        return copy.deepcopy(self._registry[ref])
-
-    def _ref_file(self, ref: str, current_file: str) -> str:
-        if ref.startswith("#/"):
-            return current_file
-        if "#" in ref:
-            return ref.split("#")[0]
-        return ref
+    def _lookup_ref(self, key: RefKey) -> Any:
+        """Return the registry node a $ref points at, shared rather than copied; callers must not mutate it."""
+        file_name, pointer = key
+        target = self._registry[file_name]
+        if pointer is not None:
+            for part in pointer.split("/"):
+                target = target[part]
+        return target
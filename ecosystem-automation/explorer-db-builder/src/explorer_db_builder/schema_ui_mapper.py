@@ -12,7 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-"""Transforms resolved JSON Schema into a UI-friendly tree."""
+"""Transforms resolved JSON Schema into a UI-friendly tree.
+
+Alongside the tree, :func:`map_schema_to_ui_tree` can fill a flat path index: every
+node's ``path`` mapped to a summary of it, so a consumer can look a path up, or walk
+to a subtree, without parsing the whole tree. Shape (``PATH_INDEX_FORMAT`` 1)::
+
+    {
+      "format": 1,
+      "paths": {
+        "": {"controlType": "group", "type": "object", "children": ["file_format", ...]},
+        "tracer_provider.sampler": {
+          "controlType": "plugin_select",
+          "type": "object",
+          "parent": "tracer_provider",
+          "children": ["always_on", ...]
+        },
+        ...
+      }
+    }
+
+``type``, ``required``, ``stability``, ``parent`` (absent only for the root) and
+``children`` are left out when they don't apply. ``children`` lists the keys of the
+node's ``children``, ``options``, ``variants`` or ``itemSchema``, whichever its
+``controlType`` has; a child's path is ``f"{path}.{key}"``, or just ``key`` under the root.
+"""
 
 from typing import Any
 
@@ -93,10 +117,21 @@ def _classify_node(node: dict[str, Any]) -> str:
 CONSTRAINT_KEYS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "minItems", "maxItems")
 PASSTHROUGH_KEYS = ("description", "defaultBehavior", "nullBehavior")
 
+PATH_INDEX_FORMAT = 1
 
-def map_schema_to_ui_tree(resolved_schema: dict[str, Any]) -> dict[str, Any]:
-    """Transform a resolved JSON Schema into a UI-friendly tree."""
-    return _map_node(resolved_schema, key="root", parent_path="", parent_required_keys=set())
+# UI node fields holding child nodes; a node has at most one of them.
+CHILD_LIST_KEYS = ("children", "options", "variants")
+
+
+def map_schema_to_ui_tree(
+    resolved_schema: dict[str, Any], path_index: dict[str, dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    """Transform a resolved JSON Schema into a UI-friendly tree.
+
+    If ``path_index`` is given, the summary of every node is added to it by path
+    (the ``paths`` of the index described in the module docstring).
+    """
+    return _map_node(resolved_schema, key="root", parent_path="", parent_required_keys=set(), path_index=path_index)
 
 
 def _map_node(
@@ -104,11 +139,13 @@ def _map_node(
     key: str,
     parent_path: str,
     parent_required_keys: set[str],
+    path_index: dict[str, dict[str, Any]] | None = None,
 ) -> dict[str, Any]:
     """Recursively map a schema node to a UI node."""
     control_type = _classify_node(node)
+    is_root = key == "root" and parent_path == ""
     path = f"{parent_path}.{key}" if parent_path else key
-    if key == "root" and parent_path == "":
+    if is_root:
         path = ""
 
     effective_type, nullable = _extract_type_info(node)
@@ -144,14 +181,14 @@ def _map_node(
         if isinstance(additional, dict):
             result["allowAdditional"] = True
         result["children"] = [
-            _map_node(prop_schema, prop_key, path, required_keys)
+            _map_node(prop_schema, prop_key, path, required_keys, path_index)
             for prop_key, prop_schema in node.get("properties", {}).items()
         ]
 
     elif control_type == "plugin_select":
         result["allowCustom"] = bool(node.get("isSdkExtensionPlugin"))
         result["options"] = [
-            _map_node(prop_schema, prop_key, path, set())
+            _map_node(prop_schema, prop_key, path, set(), path_index)
             for prop_key, prop_schema in node.get("properties", {}).items()
         ]
 
@@ -164,7 +201,7 @@ def _map_node(
     elif control_type == "list":
         items = node.get("items", {})
         if isinstance(items, dict):
-            result["itemSchema"] = _map_node(items, "item", path, set())
+            result["itemSchema"] = _map_node(items, "item", path, set(), path_index)
 
     elif control_type == "circular_ref":
         ref_value = node.get("$circular_ref", "")
@@ -173,7 +210,24 @@ def _map_node(
 
     elif control_type == "union":
         result["variants"] = [
-            _map_node(variant, f"variant_{i}", path, set()) for i, variant in enumerate(node.get("oneOf", []))
+            _map_node(variant, f"variant_{i}", path, set(), path_index)
+            for i, variant in enumerate(node.get("oneOf", []))
         ]
 
+    if path_index is not None:
+        summary: dict[str, Any] = {"controlType": control_type}
+        if effective_type is not None:
+            summary["type"] = effective_type
+        for field in ("required", "stability"):
+            if field in result:
+                summary[field] = result[field]
+        if not is_root:
+            summary["parent"] = parent_path
+        children = [child for field in CHILD_LIST_KEYS for child in result.get(field, [])]
+        if "itemSchema" in result:
+            children.append(result["itemSchema"])
+        if children:
+            summary["children"] = [child["key"] for child in children]
+        path_index[path] = summary
+
     return result
@@ -0,0 +1,203 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Prebuilt inverted search index for the explorer's client-side search.
+
+Searching index.json means scanning every entry's terms for every query. This index
+inverts that: each token maps to a posting list of the documents it occurs in, so a
+query becomes a few lookups. Pure (no I/O); the respective DatabaseWriter writes it,
+content-addressed, and index.json references it by ``search_index_hash``.
+
+Shape (``SEARCH_INDEX_FORMAT`` 1)::
+
+    {
+      "format": 1,
+      "ecosystem": "collector",
+      "fields": {"name": 16, ...},           # weight of each field
+      "documents": ["core-otlpreceiver", ...],
+      "terms": ["kafka", "otlp", ...],       # sorted, so a prefix is a binary search
+      "postings": [[0, 20, 7, 4], ...],      # per term: flat (document, score) pairs
+      "trigrams": {"mvc": [12, ...], ...}    # trigram -> positions in "terms"
+    }
+
+A document is its position in ``documents``. A term's score for a document is the sum
+of the weights of the distinct fields it occurs in, and posting lists are ordered by
+document. Trigrams cover every term of three or more characters, so a fragment from the
+middle of a word (``mvc`` in ``webmvc``) finds its candidate terms without a scan.
+"""
+
+import json
+import re
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from explorer_db_builder.content_hashing import content_hash
+
+SEARCH_INDEX_FORMAT = 1
+
+SEARCH_INDEX_DIR = "search"
+
+# A hit on an entry's own name outranks one on its display name, which outranks
+# anything found only in its configuration, telemetry or prose.
+FIELD_WEIGHTS = {
+    "name": 16,
+    "display_name": 8,
+    "configuration": 4,
+    "metric": 4,
+    "keyword": 2,
+    "description": 1,
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Single characters (version digits, the "s" of "aws-s3") would post to most documents.
+_MIN_TOKEN_LENGTH = 2
+
+
+def search_index_file(database_dir: Path, search_index_hash: str) -> Path:
+    """Content-addressed path of a search index inside a store."""
+    return database_dir / SEARCH_INDEX_DIR / f"search-index-{search_index_hash}.json"
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase alphanumeric runs of text, in order, without single characters."""
+    return [token for token in _TOKEN_RE.findall(text.lower()) if len(token) >= _MIN_TOKEN_LENGTH]
+
+
+def _strings(values: Iterable[Any]) -> list[str]:
+    return [value for value in values if isinstance(value, str) and value]
+
+
+def javaagent_search_fields(instrumentation: dict[str, Any]) -> dict[str, list[str]]:
+    """Searchable text of a full canonical instrumentation, by field."""
+    configurations = [c for c in instrumentation.get("configurations") or [] if isinstance(c, dict)]
+    metrics = [
+        metric
+        for telemetry in instrumentation.get("telemetry") or []
+        if isinstance(telemetry, dict)
+        for metric in telemetry.get("metrics") or []
+        if isinstance(metric, dict)
+    ]
+    scope = instrumentation.get("scope") or {}
+    return {
+        "name": _strings([instrumentation.get("name")]),
+        "display_name": _strings([instrumentation.get("display_name")]),
+        "configuration": _strings(
+            value for c in configurations for value in (c.get("name"), c.get("declarative_name"))
+        ),
+        "metric": _strings(metric.get("name") for metric in metrics),
+        "keyword": _strings(
+            [
+                scope.get("name") if isinstance(scope, dict) else None,
+                *(instrumentation.get("semantic_conventions") or []),
+                *(instrumentation.get("features") or []),
+                *(instrumentation.get("javaagent_target_versions") or []),
+            ]
+        ),
+        "description": _strings([instrumentation.get("description")]),
+    }
+
+
+def collector_search_fields(component: dict[str, Any]) -> dict[str, list[str]]:
+    """Searchable text of a full canonical collector component, by field.
+
+    Collector metadata carries no configuration options, so that field stays empty.
+    """
+    metrics = list(component.get("metrics") or {})
+    telemetry = component.get("telemetry") or {}
+    if isinstance(telemetry, dict):
+        metrics.extend(telemetry.get("metrics") or {})
+    return {
+        "name": _strings([component.get("name")]),
+        "display_name": _strings([component.get("display_name")]),
+        "configuration": [],
+        "metric": _strings(metrics),
+        "keyword": _strings(component.get("attributes") or {}),
+        "description": _strings([component.get("description")]),
+    }
+
+
+def build_search_index(ecosystem: str, documents: Iterable[tuple[str, dict[str, list[str]]]]) -> dict[str, Any]:
+    """Invert per-document fields into the search index described in the module docstring.
+
+    Args:
+        ecosystem: "javaagent" or "collector", recorded in the index.
+        documents: (document id, fields) pairs, fields as returned by
+            :func:`javaagent_search_fields` or :func:`collector_search_fields`.
+            Fields of a repeated id are merged.
+
+    Returns:
+        The index, deterministic for a given set of documents.
+    """
+    merged: dict[str, dict[str, list[str]]] = {}
+    for document_id, fields in documents:
+        document_fields = merged.setdefault(document_id, {})
+        for field, values in fields.items():
+            document_fields.setdefault(field, []).extend(values)
+
+    document_ids = sorted(merged)
+    postings: dict[str, list[int]] = {}
+    for document, document_id in enumerate(document_ids):
+        token_fields: dict[str, set[str]] = {}
+        for field, values in merged[document_id].items():
+            for value in values:
+                for token in tokenize(value):
+                    token_fields.setdefault(token, set()).add(field)
+        for token, fields in token_fields.items():
+            postings.setdefault(token, []).extend((document, sum(FIELD_WEIGHTS[field] for field in fields)))
+
+    terms = sorted(postings)
+    trigrams: dict[str, list[int]] = {}
+    for position, term in enumerate(terms):
+        for trigram in sorted({term[i : i + 3] for i in range(len(term) - 2)}):
+            trigrams.setdefault(trigram, []).append(position)
+
+    return {
+        "format": SEARCH_INDEX_FORMAT,
+        "ecosystem": ecosystem,
+        "fields": dict(FIELD_WEIGHTS),
+        "documents": document_ids,
+        "terms": terms,
+        "postings": [postings[term] for term in terms],
+        "trigrams": trigrams,
+    }
+
+
+def build_javaagent_search_index(instrumentations: list[dict[str, Any]]) -> dict[str, Any]:
+    """Search index over the latest release's instrumentations, keyed by name like index.json."""
+    return build_search_index(
+        "javaagent",
+        (
+            (instrumentation["name"], javaagent_search_fields(instrumentation))
+            for instrumentation in instrumentations
+            if isinstance(instrumentation, dict) and instrumentation.get("name")
+        ),
+    )
+
+
+def build_collector_search_index(components: list[dict[str, Any]]) -> dict[str, Any]:
+    """Search index over the latest release's components, keyed by component id."""
+    return build_search_index(
+        "collector", ((component["id"], collector_search_fields(component)) for component in components)
+    )
+
+
+def encode_search_index(search_index: dict[str, Any]) -> tuple[str, bytes]:
+    """The content hash and file bytes of a search index.
+
+    Unlike the other database files it is written minified: only the frontend reads
+    it, and indenting would put every posting on a line of its own.
+    """
+    return content_hash(search_index), json.dumps(search_index, separators=(",", ":"), sort_keys=True).encode("utf-8")
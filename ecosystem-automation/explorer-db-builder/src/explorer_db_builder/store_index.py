@@ -0,0 +1,108 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""In-memory index of the files in a content-addressed store.
+
+Every write into the store first asks whether the content-addressed file already
+exists and makes sure its directory does. Across hundreds of versions that is
+hundreds of thousands of ``stat``/``mkdir`` syscalls for a few thousand distinct
+files. The index lists the content subdirectories once with ``os.scandir`` and
+answers those questions from memory, creating a directory only the first time a
+new name needs one.
+
+The writer owning the index must record every file it creates (:meth:`add`) and
+drop the index after anything else deletes files (:meth:`invalidate`). Paths
+outside the indexed subdirectories are passed through to the filesystem.
+"""
+
+import os
+from pathlib import Path
+
+
+class StoreIndex:
+    """Lazily scanned set of the files and directories under a store's content subdirectories."""
+
+    def __init__(self, root: Path, subdirs: tuple[str, ...]) -> None:
+        """
+        Args:
+            root: Root directory of the store
+            subdirs: Subdirectories of root to index (e.g. "markdown", "bundles")
+        """
+        self.root = root
+        self._prefixes = tuple(os.path.join(os.fspath(root), subdir) + os.sep for subdir in subdirs)
+        self._subdirs = subdirs
+        self._files: set[str] | None = None
+        self._dirs: set[str] = set()
+
+    def _covers(self, path: str) -> bool:
+        return path.startswith(self._prefixes)
+
+    def _load(self) -> set[str]:
+        """Scan the indexed subdirectories on first use, so a store cleaned or seeded
+        right after the writer is created is seen as it is when writing starts."""
+        if self._files is None:
+            files: set[str] = set()
+            self._dirs = set()
+            for subdir in self._subdirs:
+                self._scan(os.path.join(os.fspath(self.root), subdir), files)
+            self._files = files
+        return self._files
+
+    def _scan(self, directory: str, files: set[str]) -> None:
+        try:
+            it = os.scandir(directory)
+        except FileNotFoundError:
+            return
+        self._dirs.add(directory)
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    self._scan(entry.path, files)
+                else:
+                    files.add(entry.path)
+
+    def exists(self, path: Path) -> bool:
+        """Whether a file exists at path, answered from memory for indexed paths."""
+        key = os.fspath(path)
+        if not self._covers(key):
+            return path.exists()
+        return key in self._load()
+
+    def ensure_parent(self, path: Path) -> None:
+        """Create path's parent directory unless the index already knows it exists."""
+        parent = os.fspath(path.parent)
+        if not self._covers(parent + os.sep):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return
+        self._load()
+        if parent in self._dirs:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._dirs.add(parent)
+
+    def add(self, path: Path) -> None:
+        """Record a file just written to the store."""
+        key = os.fspath(path)
+        if self._covers(key):
+            self._load().add(key)
+
+    def reset(self) -> None:
+        """Mark the store as empty, e.g. right after it was wiped and recreated."""
+        self._files = set()
+        self._dirs = set()
+
+    def invalidate(self) -> None:
+        """Forget everything; the next query rescans. Call after files are deleted behind the index."""
+        self._files = None
+        self._dirs = set()
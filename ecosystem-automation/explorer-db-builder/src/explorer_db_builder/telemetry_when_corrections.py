@@ -36,8 +36,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
 from semantic_version import Version
+from watcher_common import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +46,7 @@ _CORRECTIONS_FILE = Path(__file__).parent / "telemetry_when_corrections.yaml"
 
 def _load_corrections() -> dict[str, Any]:
     with open(_CORRECTIONS_FILE) as fh:
-        return yaml.safe_load(fh)
+        return yaml_io.safe_load(fh)
 
 
 # Loaded once at import time, consistent with how DECLARATIVE_NAME_CORRECTIONS works in the
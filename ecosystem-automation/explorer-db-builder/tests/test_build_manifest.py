@@ -0,0 +1,151 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the incremental build manifest."""
+
+import json
+from pathlib import Path
+
+import pytest
+from explorer_db_builder.build_manifest import (
+    build_state_dir,
+    builder_fingerprint,
+    compute_build_keys,
+    is_up_to_date,
+    make_build_manifest,
+    reusable_bundle_hashes,
+    reusable_diff_hashes,
+    write_state_file,
+)
+from semantic_version import Version
+
+NEW = Version("2.1.0")
+OLD = Version("2.0.0")
+
+
+def _keys(new_fp="a", old_fp="b", builder="x"):
+    return compute_build_keys([NEW, OLD], {NEW: new_fp, OLD: old_fp}, builder)
+
+
+class TestComputeBuildKeys:
+    def test_deterministic(self):
+        assert _keys() == _keys()
+
+    def test_older_change_leaves_newer_key(self):
+        base, changed = _keys(), _keys(old_fp="changed")
+        assert changed[NEW] == base[NEW]
+        assert changed[OLD] != base[OLD]
+
+    def test_newer_change_propagates_to_older(self):
+        base, changed = _keys(), _keys(new_fp="changed")
+        assert changed[NEW] != base[NEW]
+        assert changed[OLD] != base[OLD]
+
+    def test_builder_change_invalidates_all(self):
+        base, changed = _keys(), _keys(builder="y")
+        assert all(changed[v] != base[v] for v in (NEW, OLD))
+
+
+class TestManifest:
+    def _manifest(self, keys):
+        return make_build_manifest("x", {NEW: "a", OLD: "b"}, keys, {NEW: "h-new", OLD: "h-old"})
+
+    def test_shape(self):
+        keys = _keys()
+        manifest = self._manifest(keys)
+        assert manifest["builder_fingerprint"] == "x"
+        assert manifest["versions"]["2.0.0"] == {
+            "input_fingerprint": "b",
+            "build_key": keys[OLD],
+            "bundle_hash": "h-old",
+        }
+
+    def test_reusable_matches_keys(self):
+        manifest = self._manifest(_keys())
+        assert reusable_bundle_hashes(manifest, _keys(old_fp="changed")) == {NEW: "h-new"}
+
+    def test_reusable_without_manifest(self):
+        assert reusable_bundle_hashes(None, _keys()) == {}
+
+    def test_up_to_date(self):
+        assert is_up_to_date(self._manifest(_keys()), _keys())
+        assert not is_up_to_date(self._manifest(_keys()), _keys(old_fp="changed"))
+        assert not is_up_to_date(None, _keys())
+
+    def test_dropped_version_is_not_up_to_date(self):
+        keys = _keys()
+        assert not is_up_to_date(self._manifest(keys), {NEW: keys[NEW]})
+
+    def test_missing_bundle_hash_is_not_reusable(self):
+        keys = _keys()
+        manifest = make_build_manifest("x", {NEW: "a", OLD: "b"}, keys, {NEW: "h-new"})
+        assert reusable_bundle_hashes(manifest, keys) == {NEW: "h-new"}
+
+
+class TestReusableDiffHashes:
+    def _manifest(self, keys):
+        return make_build_manifest("x", {NEW: "a", OLD: "b"}, keys, {NEW: "h-new", OLD: "h-old"}, {NEW: "d-new"})
+
+    def test_diff_hash_recorded_on_newer_version(self):
+        manifest = self._manifest(_keys())
+        assert manifest["versions"]["2.1.0"]["diff_hash"] == "d-new"
+        assert "diff_hash" not in manifest["versions"]["2.0.0"]
+
+    def test_reusable_while_older_key_matches(self):
+        assert reusable_diff_hashes(self._manifest(_keys()), _keys(), [NEW, OLD]) == {NEW: "d-new"}
+
+    def test_changed_older_version_invalidates_the_pair(self):
+        assert reusable_diff_hashes(self._manifest(_keys()), _keys(old_fp="changed"), [NEW, OLD]) == {}
+
+    def test_release_inserted_between_invalidates_the_pair(self):
+        middle = Version("2.0.1")
+        keys = compute_build_keys([NEW, middle, OLD], {NEW: "a", middle: "m", OLD: "b"}, "x")
+        assert reusable_diff_hashes(self._manifest(_keys()), keys, [NEW, middle, OLD]) == {}
+
+    def test_without_manifest(self):
+        assert reusable_diff_hashes(None, _keys(), [NEW, OLD]) == {}
+
+
+def test_builder_fingerprint_is_short_hash():
+    assert len(builder_fingerprint()) == 12
+
+
+class TestBuildStateDir:
+    def test_published_database_keeps_state_outside_public(self):
+        assert build_state_dir("ecosystem-explorer/public/data/javaagent") == Path(
+            "ecosystem-explorer/build-state/javaagent"
+        )
+
+    def test_other_database_keeps_state_beside_it(self, tmp_path):
+        assert build_state_dir(tmp_path / "out") == tmp_path / "build-state" / "out"
+
+
+class TestWriteStateFile:
+    def test_creates_directory_and_writes_json(self, tmp_path):
+        path = tmp_path / "build-state" / "javaagent" / "build-manifest.json"
+
+        write_state_file(path, {"b": 1, "a": [2]})
+
+        assert json.loads(path.read_bytes()) == {"a": [2], "b": 1}
+        assert [p.name for p in path.parent.iterdir()] == ["build-manifest.json"]
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "build-manifest.json"
+        write_state_file(path, {"run": 1})
+
+        with pytest.raises(TypeError):
+            write_state_file(path, {"run": object()})
+
+        assert json.loads(path.read_bytes()) == {"run": 1}
+        assert [p.name for p in tmp_path.iterdir()] == ["build-manifest.json"]
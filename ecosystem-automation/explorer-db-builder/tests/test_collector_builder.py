@@ -19,6 +19,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from collector_watcher.inventory_manager import InventoryManager
 from explorer_db_builder.collector_builder import (
     MINIMUM_VERSION,
     _get_merged_release_versions,
@@ -259,6 +260,26 @@ class TestRunCollectorBuilder:
             for entry in bundle
         )
 
+    def test_writes_release_diffs_referenced_by_versions_index(self, tmp_path):
+        inventories = {
+            ("core", Version("0.156.0")): _make_core_inventory("0.156.0"),
+            ("core", Version("0.155.0")): _make_core_inventory("0.155.0"),
+            ("contrib", Version("0.156.0")): _make_contrib_inventory("0.156.0"),
+        }
+        manager = _make_mock_inventory_manager(inventories=inventories)
+        db_writer = CollectorDatabaseWriter(database_dir=str(tmp_path / "collector"))
+
+        run_collector_builder(inventory_manager=manager, db_writer=db_writer)
+
+        with open(tmp_path / "collector" / "versions-index.json") as f:
+            newest, oldest = json.load(f)["versions"]
+        assert "diff_hash" not in oldest
+        with open(tmp_path / "collector" / "diffs" / f"0.156.0-{newest['diff_hash']}.json") as f:
+            release_diff = json.load(f)
+        assert (release_diff["from_version"], release_diff["to_version"]) == ("0.155.0", "0.156.0")
+        assert release_diff["added"] == ["contrib-otlpreceiver", "contrib-prometheusreceiver"]
+        assert release_diff["changed"] == {}
+
     def test_clean_flag(self, tmp_path):
         manager = _make_mock_inventory_manager()
         out_dir = tmp_path / "collector"
@@ -298,6 +319,7 @@ class TestRunCollectorBuilder:
         run_collector_builder(inventory_manager=manager, db_writer=db_writer, clean=True)
 
         db_writer.remove_orphans.assert_not_called()
+        db_writer.write_reachability_manifest.assert_called_once()
 
     def test_orphaned_component_removed_on_incremental_rebuild(self, tmp_path):
         """End-to-end: a stale component file from a prior run is swept on the next incremental build."""
@@ -461,6 +483,27 @@ class TestRunCollectorBuilder:
         assert result == 1
 
 
+class TestRunCollectorBuilderJobs:
+    def test_jobs_output_matches_serial(self, tmp_path):
+        """Parsing in worker processes writes exactly the same files as a serial build."""
+        inventory_manager = InventoryManager(str(tmp_path / "registry"))
+        for version in ("0.155.0", "0.154.0"):
+            for inventory in (_make_core_inventory(version), _make_contrib_inventory(version)):
+                inventory_manager.save_versioned_inventory(
+                    inventory["distribution"], Version(version), inventory["components"], inventory["repository"]
+                )
+
+        outputs = {}
+        for jobs in (1, 2):
+            out_dir = tmp_path / f"jobs-{jobs}"
+            exit_code = run_collector_builder(inventory_manager, CollectorDatabaseWriter(str(out_dir)), jobs=jobs)
+            assert exit_code == 0
+            outputs[jobs] = {str(p.relative_to(out_dir)): p.read_bytes() for p in out_dir.rglob("*") if p.is_file()}
+
+        assert outputs[1] == outputs[2]
+        assert "versions/0.154.0-index.json" in outputs[2]
+
+
 class TestRunCollectorBuilderAuditReport:
     def test_no_report_written_without_path(self, tmp_path):
         manager = _make_mock_inventory_manager()
@@ -617,6 +660,28 @@ class TestRunCollectorBuilderReadmes:
         otlp_entry = next(c for c in index_data["components"] if c["name"] == "otlpreceiver")
         assert otlp_entry["has_readme"] is True
 
+    def test_readme_shared_across_versions_is_published_once(self, tmp_path):
+        manager = _make_mock_inventory_manager()
+        manager.load_component_readme_map.side_effect = lambda dist, ver: (
+            {"nopreceiver": "abc123def456"} if dist == "core" else {}
+        )
+        manager.load_component_readme_content.return_value = "# No-op Receiver"
+
+        db_writer = CollectorDatabaseWriter(database_dir=str(tmp_path / "collector"))
+        with patch.object(db_writer, "write_markdown", wraps=db_writer.write_markdown) as write_markdown:
+            exit_code = run_collector_builder(inventory_manager=manager, db_writer=db_writer)
+
+        assert exit_code == 0
+        manager.load_component_readme_content.assert_called_once()
+        write_markdown.assert_called_once_with("nopreceiver", "abc123def456", "# No-op Receiver")
+        # Both versions still reference the README.
+        for version in ("0.156.0", "0.155.0"):
+            with open(tmp_path / "collector" / "versions" / f"{version}-index.json") as f:
+                component_hash = json.load(f)["components"]["core-nopreceiver"]
+            component_file = tmp_path / "collector" / "components" / "core-nopreceiver"
+            with open(component_file / f"core-nopreceiver-{component_hash}.json") as f:
+                assert json.load(f)["markdown_hash"] == "abc123def456"
+
     def test_readme_load_failure_does_not_fail_the_build(self, tmp_path):
         """A README-loading failure for one distribution must not block the whole build."""
         version = Version("0.155.0")
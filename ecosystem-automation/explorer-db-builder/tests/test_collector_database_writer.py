@@ -16,9 +16,14 @@
 
 import json
 import logging
+from unittest.mock import patch
 
 import pytest
+from explorer_db_builder import orphan_gc
 from explorer_db_builder.collector_database_writer import CollectorDatabaseWriter
+from explorer_db_builder.readme_sanitizer import sanitizer_fingerprint
+from explorer_db_builder.release_diff import diff_collector_releases
+from explorer_db_builder.search_index import build_collector_search_index
 from semantic_version import Version
 
 
@@ -189,6 +194,34 @@ class TestWriteVersionList:
         assert "bundle_hash" not in data["versions"][1]
 
 
+class TestWriteReleaseDiff:
+    def test_writes_content_addressed_file_referenced_by_version_list(self, db_writer, temp_db_dir, sample_components):
+        new, old = Version("0.150.0"), Version("0.149.0")
+        release_diff = diff_collector_releases("0.149.0", "0.150.0", sample_components[:1], sample_components)
+
+        diff_hash = db_writer.write_release_diff(new, release_diff)
+        db_writer.write_version_list([new, old], diff_hashes={new: diff_hash})
+
+        diff_file = temp_db_dir / "diffs" / f"0.150.0-{diff_hash}.json"
+        assert json.loads(diff_file.read_text(encoding="utf-8")) == release_diff
+        versions = json.loads((temp_db_dir / "versions-index.json").read_text(encoding="utf-8"))["versions"]
+        assert versions[0]["diff_hash"] == diff_hash
+        assert "diff_hash" not in versions[1]
+
+    def test_orphaned_release_diff_removed(self, db_writer, temp_db_dir, sample_components):
+        new, old = Version("0.150.0"), Version("0.149.0")
+        db_writer.write_version_index(new, db_writer.write_components(sample_components))
+        stale_hash = db_writer.write_release_diff(new, diff_collector_releases("0.149.0", "0.150.0", [], []))
+        live_hash = db_writer.write_release_diff(
+            new, diff_collector_releases("0.149.0", "0.150.0", [], sample_components)
+        )
+        db_writer.write_version_list([new, old], diff_hashes={new: live_hash})
+
+        assert db_writer.remove_orphans() == 1
+        assert not (temp_db_dir / "diffs" / f"0.150.0-{stale_hash}.json").exists()
+        assert (temp_db_dir / "diffs" / f"0.150.0-{live_hash}.json").exists()
+
+
 class TestWriteVersionBundle:
     def test_writes_bundle_and_returns_hash(self, db_writer, temp_db_dir, sample_components):
         bundle_hash = db_writer.write_version_bundle(Version("0.150.0"), sample_components)
@@ -254,6 +287,14 @@ class TestWriteIndex:
         assert "repository" not in otlp
         assert "attributes" not in otlp
 
+    def test_write_index_references_search_index(self, db_writer, sample_components, temp_db_dir):
+        search_index_hash = db_writer.write_search_index(build_collector_search_index(sample_components))
+        db_writer.write_index(sample_components, search_index_hash=search_index_hash)
+
+        data = json.loads((temp_db_dir / "index.json").read_text(encoding="utf-8"))
+        assert data["search_index_hash"] == search_index_hash
+        assert (temp_db_dir / "search" / f"search-index-{search_index_hash}.json").exists()
+
 
 class TestWriteEcosystemStats:
     def test_writes_deterministic_file(self, db_writer, temp_db_dir):
@@ -294,6 +335,14 @@ class TestGetStats:
         assert stats["files_written"] == 2
         assert stats["total_bytes"] > 0
 
+    def test_stats_count_hashed_items_and_skipped_files(self, db_writer, sample_components):
+        db_writer.write_components(sample_components)
+        db_writer.write_components(sample_components)
+
+        stats = db_writer.get_stats()
+        assert stats["items_hashed"] == 4
+        assert stats["files_skipped"] == 2
+
 
 class TestClean:
     def test_clean_removes_directory(self, db_writer, temp_db_dir):
@@ -441,6 +490,19 @@ class TestWriteMarkdown:
         assert markdown_file.read_text(encoding="utf-8") == "Body.\n"
         assert db_writer.files_written == 1
 
+    def test_write_markdown_trusts_a_store_stamped_with_the_current_sanitizer(self, db_writer, temp_db_dir):
+        db_writer.write_markdown("otlpreceiver", "abc123def456", "Body.\n")
+        db_writer.write_reachability_manifest()
+
+        fresh_writer = CollectorDatabaseWriter(database_dir=str(temp_db_dir))
+        # A store stamped by this sanitizer is trusted: the existing file is neither read nor rewritten.
+        with patch.object(CollectorDatabaseWriter, "_is_current") as is_current:
+            assert fresh_writer.write_markdown("otlpreceiver", "abc123def456", "Body.\n") is True
+
+        is_current.assert_not_called()
+        assert fresh_writer.files_skipped == 1
+        assert fresh_writer.files_written == 0
+
 
 class TestRemoveOrphans:
     """Tests for the incremental orphan-GC sweep."""
@@ -527,6 +589,45 @@ class TestRemoveOrphans:
         assert (temp_db_dir / "markdown" / f"otlpreceiver-{live_hash}.md").exists()
         assert not (temp_db_dir / "markdown" / f"otlpreceiver-{orphan_hash}.md").exists()
 
+    def test_removes_superseded_search_index(self, db_writer, temp_db_dir, sample_components):
+        version = Version("0.150.0")
+        component_map = db_writer.write_components(sample_components)
+        db_writer.write_version_index(version, component_map)
+        old_hash = db_writer.write_search_index(build_collector_search_index(sample_components[:1]))
+        live_hash = db_writer.write_search_index(build_collector_search_index(sample_components))
+        db_writer.write_index(sample_components, search_index_hash=live_hash)
+
+        removed = db_writer.remove_orphans()
+
+        assert removed == 1
+        assert not (temp_db_dir / "search" / f"search-index-{old_hash}.json").exists()
+        assert (temp_db_dir / "search" / f"search-index-{live_hash}.json").exists()
+
+    def test_reachability_manifest_maps_component_to_markdown_by_name(self, db_writer, temp_db_dir):
+        db_writer.write_markdown("otlpreceiver", "livehash1234", "# live")
+        component = {
+            "id": "contrib-otlp",
+            "name": "otlpreceiver",
+            "distribution": "contrib",
+            "type": "receiver",
+            "markdown_hash": "livehash1234",
+        }
+        component_map = db_writer.write_components([component])
+        db_writer.write_version_index(Version("0.150.0"), component_map)
+        db_writer.write_reachability_manifest()
+
+        with open(db_writer.state_dir / orphan_gc.REACHABILITY_FILE) as f:
+            manifest = json.load(f)
+        assert manifest["sanitizer_fingerprint"] == sanitizer_fingerprint()
+        entries = manifest["markdown"]
+        assert entries == {
+            f"components/contrib-otlp/contrib-otlp-{component_map['contrib-otlp']}.json": (
+                "markdown/otlpreceiver-livehash1234.md"
+            )
+        }
+        # A fresh writer keeps the README live from the manifest alone.
+        assert CollectorDatabaseWriter(database_dir=str(temp_db_dir)).remove_orphans() == 0
+
     def test_skips_unreadable_index(self, db_writer, temp_db_dir, sample_components, caplog):
         version = Version("0.150.0")
         component_map = db_writer.write_components(sample_components)
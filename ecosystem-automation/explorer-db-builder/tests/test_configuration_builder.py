@@ -15,10 +15,14 @@
 """Tests for configuration builder."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 import yaml
+from explorer_db_builder import configuration_builder
+from explorer_db_builder.build_manifest import MANIFEST_FILE, build_state_dir
 from explorer_db_builder.configuration_builder import run_configuration_builder
+from explorer_db_builder.profiling import BuildProfiler
 
 
 @pytest.fixture
@@ -96,6 +100,39 @@ class TestRunConfigurationBuilder:
         assert data["versions"][0]["version"] == "1.0.0"
         assert data["versions"][0]["is_latest"] is True
 
+    def test_profiler_counts_published_files(self, config_registry, output_dir):
+        profiler = BuildProfiler()
+
+        run_configuration_builder(registry_dir=str(config_registry), output_dir=str(output_dir), profiler=profiler)
+
+        published = [p for p in output_dir.rglob("*") if p.is_file()]
+        totals = {"files_written": 0, "total_bytes": 0}
+        for stage in profiler.report()["stages"]:
+            if "/" not in stage["name"]:
+                for key in totals:
+                    totals[key] += stage["counters"].get(key, 0)
+        assert totals == {
+            "files_written": len(published),
+            "total_bytes": sum(p.stat().st_size for p in published),
+        }
+
+    def test_produces_path_index_referenced_by_versions_index(self, config_registry, output_dir):
+        run_configuration_builder(
+            registry_dir=str(config_registry),
+            output_dir=str(output_dir),
+        )
+
+        entry = json.loads((output_dir / "versions-index.json").read_text())["versions"][0]
+        path_index_file = output_dir / "paths" / f"1.0.0-{entry['path_index_hash']}.json"
+        path_index = json.loads(path_index_file.read_text())
+        assert path_index["format"] == 1
+        assert path_index["paths"][""]["children"] == ["file_format", "propagator"]
+        assert path_index["paths"]["propagator.composite"] == {
+            "controlType": "string_list",
+            "type": "array",
+            "parent": "propagator",
+        }
+
     def test_filters_snapshot_versions(self, config_registry, output_dir):
         snapshot_dir = config_registry / "v1.0.1-SNAPSHOT"
         snapshot_dir.mkdir()
@@ -179,3 +216,87 @@ class TestRunConfigurationBuilder:
 
         assert not stale_file.exists()
         assert (output_dir / "versions" / "1.0.0.json").exists()
+
+
+class TestIncrementalConfigurationBuild:
+    def _add_version(self, registry, version, properties):
+        version_dir = registry / f"v{version}"
+        version_dir.mkdir()
+        with open(version_dir / "opentelemetry_configuration.yaml", "w", encoding="utf-8") as f:
+            yaml.dump({"type": "object", "properties": properties}, f)
+        return version_dir
+
+    def _build(self, registry, output_dir, **kwargs):
+        with patch.object(
+            configuration_builder, "_load_yaml_registry", wraps=configuration_builder._load_yaml_registry
+        ) as load:
+            assert run_configuration_builder(registry_dir=str(registry), output_dir=str(output_dir), **kwargs) == 0
+        return sorted(call.args[0].name for call in load.call_args_list)
+
+    def test_unchanged_versions_are_not_reloaded(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+        first = (output_dir / "versions" / "1.0.0.json").read_bytes()
+
+        assert self._build(config_registry, output_dir) == []
+        assert (output_dir / "versions" / "1.0.0.json").read_bytes() == first
+        assert json.loads((output_dir / "versions-index.json").read_text())["versions"][0]["version"] == "1.0.0"
+
+    def test_only_new_and_changed_versions_are_rebuilt(self, config_registry, output_dir):
+        self._add_version(config_registry, "2.0.0", {"x": {"type": "string"}})
+        self._build(config_registry, output_dir)
+
+        self._add_version(config_registry, "3.0.0", {"y": {"type": "string"}})
+        with open(config_registry / "v2.0.0" / "extra.yaml", "w", encoding="utf-8") as f:
+            yaml.dump({"type": "string"}, f)
+
+        assert self._build(config_registry, output_dir) == ["v2.0.0", "v3.0.0"]
+
+    def test_missing_output_is_rebuilt(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+        (output_dir / "versions" / "1.0.0.json").unlink()
+
+        assert self._build(config_registry, output_dir) == ["v1.0.0"]
+        assert (output_dir / "versions" / "1.0.0.json").exists()
+
+    def test_missing_path_index_is_rebuilt(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+        for path_index_file in (output_dir / "paths").iterdir():
+            path_index_file.unlink()
+
+        assert self._build(config_registry, output_dir) == ["v1.0.0"]
+        assert len(list((output_dir / "paths").iterdir())) == 1
+
+    def test_superseded_path_index_is_removed(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+        with open(config_registry / "v1.0.0" / "propagator.yaml", "w", encoding="utf-8") as f:
+            yaml.dump({"type": "object", "properties": {"composite_list": {"type": "string"}}}, f)
+
+        self._build(config_registry, output_dir)
+
+        path_index_hash = json.loads((output_dir / "versions-index.json").read_text())["versions"][0]["path_index_hash"]
+        assert [f.name for f in (output_dir / "paths").iterdir()] == [f"1.0.0-{path_index_hash}.json"]
+
+    def test_builder_change_rebuilds_every_version(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+
+        with patch.object(configuration_builder, "builder_fingerprint", return_value="changed"):
+            assert self._build(config_registry, output_dir) == ["v1.0.0"]
+
+    def test_unreadable_manifest_rebuilds_every_version(self, config_registry, output_dir):
+        self._build(config_registry, output_dir)
+        (build_state_dir(output_dir) / MANIFEST_FILE).write_text("{not json")
+
+        assert self._build(config_registry, output_dir) == ["v1.0.0"]
+
+    def test_parallel_build_matches_serial(self, config_registry, tmp_path):
+        self._add_version(config_registry, "2.0.0", {"x": {"type": "string"}})
+        serial = tmp_path / "serial"
+        parallel = tmp_path / "parallel"
+
+        run_configuration_builder(registry_dir=str(config_registry), output_dir=str(serial))
+        run_configuration_builder(registry_dir=str(config_registry), output_dir=str(parallel), jobs=2)
+
+        serial_files = sorted(p.relative_to(serial) for p in serial.rglob("*.json"))
+        assert serial_files == sorted(p.relative_to(parallel) for p in parallel.rglob("*.json"))
+        for name in serial_files:
+            assert (parallel / name).read_bytes() == (serial / name).read_bytes()
@@ -14,8 +14,17 @@
 #
 """Tests for content hashing utilities."""
 
+import hashlib
+import json
+from unittest.mock import patch
+
 import pytest
-from explorer_db_builder.content_hashing import content_hash, normalize_for_hashing
+from explorer_db_builder.content_hashing import (
+    canonical_json,
+    content_hash,
+    encode_canonical,
+    normalize_for_hashing,
+)
 
 
 class TestNormalizeForHashing:
@@ -148,6 +157,17 @@ class TestContentHash:
         with pytest.raises(TypeError, match="not JSON serializable"):
             content_hash({"key": object()})
 
+    def test_hash_tuples_as_arrays(self):
+        """Tuples hash like the JSON arrays they are written as, unlike normalize_for_hashing."""
+        assert content_hash({"key": (1, 2)}) == content_hash({"key": [1, 2]})
+
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            normalize_for_hashing({"key": (1, 2)})
+
+    def test_hash_set_raises_error(self):
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            content_hash({"key": {1, 2}})
+
     def test_hash_complex_structure(self):
         """Complex realistic structure produces valid hash."""
         data = {
@@ -200,3 +220,43 @@ class TestContentHash:
         assert content_hash(data1) != content_hash(data2)
         assert content_hash(data1) != content_hash(data3)
         assert content_hash(data2) != content_hash(data3)
+
+
+class TestEncodeCanonical:
+    SAMPLE = {
+        "name": "jdbc",
+        "tags": ["db", "sql"],
+        "configurations": [{"name": "otel.x", "default": True, "examples": [1, 2.5, None]}],
+        "description": 'Unicode ✓ and "quotes"',
+    }
+
+    def test_digest_matches_normalized_hash(self):
+        """The hash is unchanged from hashing a normalize_for_hashing copy, so published addresses stay put."""
+        minified = json.dumps(normalize_for_hashing(self.SAMPLE), separators=(",", ":"), sort_keys=True)
+        expected = hashlib.sha256(minified.encode("utf-8")).hexdigest()[:12]
+
+        assert encode_canonical(self.SAMPLE).digest == expected
+        assert content_hash(self.SAMPLE) == expected
+
+    def test_content_is_indented_sorted_utf8(self):
+        content = encode_canonical(self.SAMPLE).content
+
+        assert isinstance(content, bytes)
+        assert content == json.dumps(self.SAMPLE, indent=2, sort_keys=True).encode("utf-8")
+        assert content == canonical_json(self.SAMPLE)
+
+    def test_content_encoded_lazily_and_once(self):
+        with patch("explorer_db_builder.content_hashing.canonical_json", wraps=canonical_json) as spy:
+            encoded = encode_canonical(self.SAMPLE)
+            spy.assert_not_called()
+
+            assert encoded.content == encoded.content
+            spy.assert_called_once()
+
+    def test_none_raises(self):
+        with pytest.raises(ValueError, match="Cannot hash None value"):
+            encode_canonical(None)
+
+    def test_non_serializable_raises(self):
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            encode_canonical({"key": object()})
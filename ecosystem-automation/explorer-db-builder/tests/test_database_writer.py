@@ -16,9 +16,14 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from explorer_db_builder import orphan_gc
 from explorer_db_builder.database_writer import DatabaseWriter
+from explorer_db_builder.readme_sanitizer import sanitizer_fingerprint
+from explorer_db_builder.release_diff import diff_javaagent_releases
+from explorer_db_builder.search_index import build_javaagent_search_index
 from semantic_version import Version
 
 
@@ -185,6 +190,13 @@ class TestWriteLibraries:
         assert library_map["test-lib"] == first_hash
         assert "already exists" in caplog.text
 
+    def test_write_libraries_counts_encoded_bytes(self, db_writer):
+        """total_bytes counts UTF-8 bytes on disk, not characters."""
+        library_map = db_writer.write_libraries([{"name": "unicode", "description": "✓ café"}])
+
+        file_path = db_writer._get_file_path("unicode", library_map["unicode"])
+        assert db_writer.get_stats()["total_bytes"] == file_path.stat().st_size
+
     def test_write_libraries_non_serializable(self, db_writer, caplog):
         libraries = [
             {"name": "valid-lib", "version": "1.0"},
@@ -312,6 +324,30 @@ class TestWriteVersionList:
         assert "bundle_hash" not in data["versions"][1]
 
 
+class TestWriteReleaseDiff:
+    def test_writes_content_addressed_file_referenced_by_version_list(self, db_writer, temp_db_dir):
+        new, old = Version("2.0.0"), Version("1.0.0")
+        release_diff = diff_javaagent_releases("1.0.0", "2.0.0", [{"name": "lib1"}], [{"name": "lib2"}])
+
+        diff_hash = db_writer.write_release_diff(new, release_diff)
+        db_writer.write_version_list([new, old], diff_hashes={new: diff_hash})
+
+        diff_file = temp_db_dir / "diffs" / f"2.0.0-{diff_hash}.json"
+        assert json.loads(diff_file.read_text(encoding="utf-8")) == release_diff
+        assert db_writer.has_release_diff(new, diff_hash)
+        versions = json.loads((temp_db_dir / "versions-index.json").read_text(encoding="utf-8"))["versions"]
+        assert versions[0]["diff_hash"] == diff_hash
+        assert "diff_hash" not in versions[1]
+
+    def test_skips_existing_file(self, db_writer):
+        release_diff = diff_javaagent_releases("1.0.0", "2.0.0", [], [{"name": "lib1"}])
+        first = db_writer.write_release_diff(Version("2.0.0"), release_diff)
+
+        assert db_writer.write_release_diff(Version("2.0.0"), release_diff) == first
+        assert db_writer.files_written == 1
+        assert db_writer.files_skipped == 1
+
+
 class TestWriteVersionBundle:
     def test_writes_bundle_and_returns_hash(self, db_writer, temp_db_dir):
         entries = [
@@ -407,6 +443,18 @@ class TestGetStats:
         assert second_stats["files_written"] == first_stats["files_written"]
         assert second_stats["total_bytes"] == first_stats["total_bytes"]
 
+    def test_get_stats_counts_hashed_items_and_skipped_files(self, db_writer):
+        libraries = [{"name": "test-lib", "version": "1.0"}]
+
+        db_writer.write_libraries(libraries)
+        db_writer.write_libraries(libraries)
+        db_writer.write_version_bundle(Version("1.0.0"), libraries)
+        db_writer.write_version_bundle(Version("1.0.0"), libraries)
+
+        stats = db_writer.get_stats()
+        assert stats["items_hashed"] == 4
+        assert stats["files_skipped"] == 2
+
 
 class TestClean:
     def test_clean_removes_existing_directory(self, db_writer, temp_db_dir):
@@ -579,6 +627,34 @@ class TestWriteMarkdown:
         assert markdown_file.read_text(encoding="utf-8") == "# Test README\n"
         assert db_writer.files_written == 1
 
+    def test_write_markdown_trusts_a_store_stamped_with_the_current_sanitizer(self, db_writer, temp_db_dir):
+        db_writer.write_markdown("test-lib", "abc123def456", "# Test README\n")
+        db_writer.write_reachability_manifest()
+        markdown_file = temp_db_dir / "markdown" / "test-lib-abc123def456.md"
+
+        fresh_writer = DatabaseWriter(database_dir=str(temp_db_dir))
+        with patch("explorer_db_builder.database_writer.sanitize_readme") as sanitize:
+            assert fresh_writer.write_markdown("test-lib", "abc123def456", "# Test README\n") is True
+
+        sanitize.assert_not_called()
+        assert markdown_file.read_text(encoding="utf-8") == "# Test README\n"
+        assert fresh_writer.files_skipped == 1
+        assert fresh_writer.files_written == 0
+
+    def test_write_markdown_rechecks_a_store_stamped_by_another_sanitizer(self, db_writer, temp_db_dir):
+        markdown_file = temp_db_dir / "markdown" / "test-lib-abc123def456.md"
+        markdown_file.parent.mkdir(parents=True, exist_ok=True)
+        markdown_file.write_text("<!-- hidden note -->\n# Test README\n", encoding="utf-8")
+        db_writer.state_dir.mkdir(parents=True)
+        (db_writer.state_dir / orphan_gc.REACHABILITY_FILE).write_text(
+            json.dumps(orphan_gc.make_reachability_manifest({}, "0" * 64)), encoding="utf-8"
+        )
+
+        db_writer.write_markdown("test-lib", "abc123def456", "<!-- hidden note -->\n# Test README\n")
+
+        assert markdown_file.read_text(encoding="utf-8") == "# Test README\n"
+        assert db_writer.files_written == 1
+
 
 @pytest.fixture
 def sample_index_instrumentations():
@@ -727,6 +803,45 @@ class TestWriteIndex:
         assert db_writer.files_written == 1
         assert db_writer.total_bytes > 0
 
+    def test_write_index_references_search_index(self, db_writer, sample_index_instrumentations, temp_db_dir):
+        db_writer.write_index(sample_index_instrumentations, search_index_hash="abc123def456")
+
+        data = json.loads((temp_db_dir / "index.json").read_text(encoding="utf-8"))
+        assert data["search_index_hash"] == "abc123def456"
+
+
+class TestWriteSearchIndex:
+    def test_writes_minified_content_addressed_file(self, db_writer, temp_db_dir):
+        search_index = build_javaagent_search_index([{"name": "jdbc", "display_name": "JDBC"}])
+
+        search_index_hash = db_writer.write_search_index(search_index)
+
+        index_file = temp_db_dir / "search" / f"search-index-{search_index_hash}.json"
+        raw = index_file.read_text(encoding="utf-8")
+        assert "\n" not in raw
+        assert json.loads(raw) == search_index
+        assert db_writer.files_written == 1
+
+    def test_skips_existing_file(self, db_writer):
+        search_index = build_javaagent_search_index([{"name": "jdbc"}])
+        first = db_writer.write_search_index(search_index)
+
+        assert db_writer.write_search_index(search_index) == first
+        assert db_writer.files_written == 1
+        assert db_writer.files_skipped == 1
+
+    def test_has_index_outputs_requires_the_referenced_search_index(self, db_writer, temp_db_dir):
+        search_index_hash = db_writer.write_search_index(build_javaagent_search_index([{"name": "jdbc"}]))
+        db_writer.write_index([{"name": "jdbc"}], search_index_hash=search_index_hash)
+        db_writer.write_version_list([Version("1.0.0")], {})
+        db_writer.write_global_configurations([])
+        db_writer.write_ecosystem_stats({})
+        assert db_writer.has_index_outputs()
+
+        (temp_db_dir / "search" / f"search-index-{search_index_hash}.json").unlink()
+
+        assert not db_writer.has_index_outputs()
+
 
 class TestWriteGlobalConfigurations:
     def test_writes_deterministic_file(self, db_writer, temp_db_dir):
@@ -871,6 +986,34 @@ class TestRemoveOrphans:
         assert (temp_db_dir / "markdown" / f"lib1-{live_hash}.md").exists()
         assert not (temp_db_dir / "markdown" / f"lib1-{orphan_hash}.md").exists()
 
+    def test_removes_orphaned_release_diff(self, db_writer, temp_db_dir):
+        new, old = Version("2.0.0"), Version("1.0.0")
+        library_map = db_writer.write_libraries([{"name": "lib1", "version": "1.0"}])
+        db_writer.write_version_index(new, library_map)
+        stale_hash = db_writer.write_release_diff(new, diff_javaagent_releases("1.0.0", "2.0.0", [], []))
+        live_hash = db_writer.write_release_diff(new, diff_javaagent_releases("1.0.0", "2.0.0", [], [{"name": "lib1"}]))
+        db_writer.write_version_list([new, old], diff_hashes={new: live_hash})
+
+        removed = db_writer.remove_orphans()
+
+        assert removed == 1
+        assert not (temp_db_dir / "diffs" / f"2.0.0-{stale_hash}.json").exists()
+        assert (temp_db_dir / "diffs" / f"2.0.0-{live_hash}.json").exists()
+
+    def test_removes_superseded_search_index(self, db_writer, temp_db_dir):
+        version = Version("1.0.0")
+        library_map = db_writer.write_libraries([{"name": "lib1", "version": "1.0"}])
+        db_writer.write_version_index(version, library_map)
+        old_hash = db_writer.write_search_index(build_javaagent_search_index([{"name": "lib0"}]))
+        live_hash = db_writer.write_search_index(build_javaagent_search_index([{"name": "lib1"}]))
+        db_writer.write_index([{"name": "lib1"}], search_index_hash=live_hash)
+
+        removed = db_writer.remove_orphans()
+
+        assert removed == 1
+        assert not (temp_db_dir / "search" / f"search-index-{old_hash}.json").exists()
+        assert (temp_db_dir / "search" / f"search-index-{live_hash}.json").exists()
+
     def test_skips_unreadable_index(self, db_writer, temp_db_dir, caplog):
         version = Version("1.0.0")
         library_map = db_writer.write_libraries([{"name": "lib1", "version": "1.0"}])
@@ -893,3 +1036,98 @@ class TestRemoveOrphans:
         assert db_writer.remove_orphans() == 0
         assert "Skipping orphan GC: no readable version index found" in caplog.text
         assert db_writer._instrumentation_file("lib1", library_map["lib1"]).exists()
+
+    def test_rewrites_content_swept_since_the_index_was_built(self, db_writer, temp_db_dir):
+        version = Version("1.0.0")
+        library_map = db_writer.write_libraries([{"name": "lib1", "version": "1.0"}])
+        db_writer.write_libraries([{"name": "lib1", "version": "0.9"}])
+        db_writer.write_version_index(version, library_map)
+        assert db_writer.remove_orphans() == 1
+
+        # The swept hash comes back; the writer must not trust its pre-sweep view of the store.
+        old_map = db_writer.write_libraries([{"name": "lib1", "version": "0.9"}])
+
+        assert db_writer._instrumentation_file("lib1", old_map["lib1"]).exists()
+
+
+class TestReachabilityManifest:
+    """Orphan GC reads README references from the manifest instead of every live content file."""
+
+    def _build(self, db_writer, live_hash="livehash1234"):
+        db_writer.write_markdown("lib1", live_hash, "# live")
+        db_writer.write_markdown("lib1", "orphanhash56", "# orphan")
+        library_map = db_writer.write_libraries([{"name": "lib1", "version": "1.0", "markdown_hash": live_hash}])
+        db_writer.write_version_index(Version("1.0.0"), library_map)
+        return library_map
+
+    def test_writes_content_to_markdown_map(self, db_writer, temp_db_dir):
+        library_map = self._build(db_writer)
+        lib2_hash = db_writer.write_libraries([{"name": "lib2", "version": "1.0"}])["lib2"]
+
+        db_writer.write_reachability_manifest()
+
+        with open(db_writer.state_dir / orphan_gc.REACHABILITY_FILE) as f:
+            manifest = json.load(f)
+        assert manifest["format"] == 1
+        assert manifest["sanitizer_fingerprint"] == sanitizer_fingerprint()
+        assert manifest["markdown"] == {
+            f"instrumentations/lib1/lib1-{library_map['lib1']}.json": "markdown/lib1-livehash1234.md",
+            f"instrumentations/lib2/lib2-{lib2_hash}.json": None,
+        }
+
+    def test_not_counted_as_published(self, db_writer):
+        self._build(db_writer)
+        stats = db_writer.get_stats()
+
+        db_writer.write_reachability_manifest()
+        db_writer.write_build_manifest({"versions": {}})
+
+        assert db_writer.get_stats() == stats
+
+    def test_gc_does_not_reopen_content_covered_by_the_manifest(self, db_writer, temp_db_dir):
+        self._build(db_writer)
+        db_writer.write_reachability_manifest()
+
+        fresh_writer = DatabaseWriter(database_dir=str(temp_db_dir))
+        with patch("explorer_db_builder.orphan_gc.read_json", wraps=orphan_gc.read_json) as read_json:
+            removed = fresh_writer.remove_orphans()
+
+        assert removed == 1
+        assert not any("instrumentations" in Path(call.args[0]).parts for call in read_json.call_args_list)
+        assert (temp_db_dir / "markdown" / "lib1-livehash1234.md").exists()
+        assert not (temp_db_dir / "markdown" / "lib1-orphanhash56.md").exists()
+
+    @pytest.mark.parametrize("manifest_text", [None, "{ not json", '{"format": 0, "markdown": {}}'])
+    def test_gc_falls_back_to_reading_content(self, db_writer, temp_db_dir, manifest_text):
+        self._build(db_writer)
+        manifest_file = db_writer.state_dir / orphan_gc.REACHABILITY_FILE
+        if manifest_text is not None:
+            manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            manifest_file.write_text(manifest_text, encoding="utf-8")
+
+        removed = DatabaseWriter(database_dir=str(temp_db_dir)).remove_orphans()
+
+        assert removed == 1
+        assert (temp_db_dir / "markdown" / "lib1-livehash1234.md").exists()
+        assert not (temp_db_dir / "markdown" / "lib1-orphanhash56.md").exists()
+
+    def test_gc_prunes_manifest_to_live_content(self, db_writer, temp_db_dir):
+        self._build(db_writer)
+        stale_map = db_writer.write_libraries([{"name": "lib1", "version": "0.9"}])
+
+        db_writer.remove_orphans()
+        db_writer.write_reachability_manifest()
+
+        with open(db_writer.state_dir / orphan_gc.REACHABILITY_FILE) as f:
+            entries = json.load(f)["markdown"]
+        assert f"instrumentations/lib1/lib1-{stale_map['lib1']}.json" not in entries
+        assert len(entries) == 1
+
+    def test_clean_forgets_recorded_content(self, db_writer, temp_db_dir):
+        self._build(db_writer)
+
+        db_writer.clean()
+        db_writer.write_reachability_manifest()
+
+        with open(db_writer.state_dir / orphan_gc.REACHABILITY_FILE) as f:
+            assert json.load(f)["markdown"] == {}
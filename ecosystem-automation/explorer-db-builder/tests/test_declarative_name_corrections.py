@@ -14,7 +14,10 @@
 #
 """Tests for declarative_name corrections."""
 
+import copy
+
 from explorer_db_builder.declarative_name_corrections import (
+    CrossVersionConfigCorrections,
     apply_declarative_name_corrections,
     backfill_underdocumented_configs,
     normalize_config_descriptions,
@@ -239,6 +242,25 @@ class TestApplyDeclarativeNameCorrections:
         assert "template" in config["declarative_schema"]["required"]
         assert "override" in config["declarative_schema"]["properties"]
 
+    def test_corrects_a_shared_config_without_mutating_it(self):
+        """A definition shared between libraries is replaced by a corrected copy in each list."""
+        shared = _config("otel.instrumentation.common.peer-service-mapping", "java.common.peer_service_mapping")
+        untouched = _config("otel.instrumentation.real.name", "java.common.real")
+        inventory = {
+            "libraries": [
+                {"name": "dubbo-2.7", "configurations": [shared, untouched]},
+                {"name": "armeria-1.3", "configurations": [shared]},
+            ]
+        }
+
+        apply_declarative_name_corrections(inventory)
+
+        assert shared == _config("otel.instrumentation.common.peer-service-mapping", "java.common.peer_service_mapping")
+        for library in inventory["libraries"]:
+            assert library["configurations"][0]["declarative_name"] == "java.common.service_peer_mapping"
+        # Configs needing no correction are kept as-is rather than copied.
+        assert inventory["libraries"][0]["configurations"][1] is untouched
+
 
 class TestConfigNameFallback:
     def test_declarative_only_config_gets_name_from_declarative_name(self):
@@ -421,3 +443,39 @@ class TestBackfillUnderdocumentedConfigs:
         # other-lib doesn't carry the config in the newest version, so it isn't a template target.
         assert older["libraries"][0]["configurations"] == []
         assert len(older["libraries"]) == 1
+
+
+class TestCrossVersionConfigCorrections:
+    _SANITIZATION = "java.common.db.query_sanitization.enabled"
+    _URL_TEMPLATE_RULES = "java.common.http.client.url_template_rules"
+
+    def _versioned_inventories(self):
+        def lib(description, with_url_rules):
+            configs = [{"name": "sanitize", "declarative_name": self._SANITIZATION, "description": description}]
+            if with_url_rules:
+                configs.append({"name": "rules", "declarative_name": self._URL_TEMPLATE_RULES, "type": "list"})
+            return {"libraries": [{"name": "lib", "configurations": configs}]}
+
+        return [
+            (Version("2.30.0"), lib("", with_url_rules=True)),
+            (Version("2.29.1"), lib("Newest wording.", with_url_rules=True)),
+            (Version("2.29.0"), lib("Old wording.", with_url_rules=False)),
+        ]
+
+    def test_matches_the_batch_corrections(self):
+        batch = self._versioned_inventories()
+        normalize_config_descriptions([inventory for _, inventory in batch])
+        backfill_underdocumented_configs(batch)
+
+        streamed = self._versioned_inventories()
+        corrections = CrossVersionConfigCorrections()
+        for version, inventory in copy.deepcopy(streamed):
+            corrections.observe(version, inventory)
+        for version, inventory in streamed:
+            corrections.apply(version, inventory)
+
+        assert streamed == batch
+        # The newest non-empty description wins even though an even newer version lacks one.
+        oldest_configs = streamed[2][1]["libraries"][0]["configurations"]
+        assert oldest_configs[0]["description"] == "Newest wording."
+        assert [c["declarative_name"] for c in oldest_configs] == [self._SANITIZATION, self._URL_TEMPLATE_RULES]
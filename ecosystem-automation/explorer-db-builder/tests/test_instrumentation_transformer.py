@@ -14,6 +14,8 @@
 #
 """Tests for instrumentation transformer."""
 
+import copy
+
 import pytest
 from explorer_db_builder.instrumentation_transformer import (
     _collect_search_terms,
@@ -421,6 +423,18 @@ class TestTransform06To05:
         assert config_a is not config_b
         assert metric_a is not metric_b
 
+    def test_shared_definitions_mode_shares_objects(self):
+        data = self._catalog_data()
+        shared = transform_instrumentation_format(copy.deepcopy(data), share_definitions=True)
+
+        # Equal output, but each definition is one object referenced from every library.
+        assert shared == transform_instrumentation_format(data)
+        libraries = shared["libraries"]
+        assert libraries[0]["configurations"][0] is libraries[1]["configurations"][0]
+        assert libraries[0]["telemetry"][0]["metrics"][0] is libraries[1]["telemetry"][0]["metrics"][0]
+        # The lists are still per library.
+        assert libraries[0]["configurations"] is not libraries[1]["configurations"]
+
     def test_unknown_ref_is_skipped(self):
         data = {
             "file_format": 0.6,
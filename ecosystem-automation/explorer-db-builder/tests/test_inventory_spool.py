@@ -0,0 +1,47 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the on-disk inventory spool."""
+
+from pathlib import Path
+
+import pytest
+from explorer_db_builder.inventory_spool import InventorySpool
+from semantic_version import Version
+
+
+class TestInventorySpool:
+    def test_take_returns_what_was_put_and_removes_it(self):
+        shared = {"name": "otel.instrumentation.common.enabled"}
+        inventory = {
+            "libraries": [{"name": "a", "configurations": [shared]}, {"name": "b", "configurations": [shared]}]
+        }
+
+        with InventorySpool() as spool:
+            spool.put(Version("2.0.0"), inventory)
+            taken = spool.take(Version("2.0.0"))
+
+            assert taken == inventory
+            # Definitions shared between libraries stay shared.
+            assert taken["libraries"][0]["configurations"][0] is taken["libraries"][1]["configurations"][0]
+            with pytest.raises(KeyError):
+                spool.take(Version("2.0.0"))
+
+    def test_close_removes_the_spool_directory(self):
+        with InventorySpool() as spool:
+            spool.put(Version("1.0.0"), {"libraries": []})
+            spool_dir = Path(spool._dir.name)
+            assert spool_dir.is_dir()
+
+        assert not spool_dir.exists()
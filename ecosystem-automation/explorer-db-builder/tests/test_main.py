@@ -14,10 +14,14 @@
 #
 """Tests for main entry point."""
 
+import copy
 import json
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from explorer_db_builder import orphan_gc
+from explorer_db_builder.build_manifest import MANIFEST_FILE, build_state_dir
 from explorer_db_builder.database_writer import DatabaseWriter
 from explorer_db_builder.main import (
     get_release_versions,
@@ -26,6 +30,7 @@ from explorer_db_builder.main import (
     run_javaagent_builder,
 )
 from semantic_version import Version
+from watcher_common.inventory_manager import JavaagentInventoryManager
 
 
 @pytest.fixture
@@ -176,15 +181,20 @@ class TestRunJavaagentBuilder:
         mock_inventory_manager.load_versioned_inventory.return_value = inventory_data
         mock_db_writer.write_libraries.return_value = library_map
         mock_db_writer.write_version_bundle.side_effect = ["hash-2.0.0", "hash-1.0.0"]
+        mock_db_writer.write_release_diff.return_value = "diff-2.0.0"
 
         exit_code = run_javaagent_builder(mock_inventory_manager, mock_db_writer)
 
         assert exit_code == 0
         assert mock_db_writer.write_version_list.called
-        # write_version_list now also receives the per-version bundle hash map.
+        # write_version_list also receives the per-version bundle and release diff hash maps.
         mock_db_writer.write_version_list.assert_called_once_with(
-            versions, {versions[0]: "hash-2.0.0", versions[1]: "hash-1.0.0"}
+            versions, {versions[0]: "hash-2.0.0", versions[1]: "hash-1.0.0"}, {versions[0]: "diff-2.0.0"}
         )
+        # Only the pair of adjacent releases is diffed, newer release first.
+        [(diff_version, release_diff)] = [c.args for c in mock_db_writer.write_release_diff.call_args_list]
+        assert diff_version == versions[0]
+        assert (release_diff["from_version"], release_diff["to_version"]) == ("1.0.0", "2.0.0")
 
     def test_run_builder_value_error(self, mock_inventory_manager, mock_db_writer):
         mock_inventory_manager.list_versions.return_value = []
@@ -294,6 +304,25 @@ class TestRunJavaagentBuilder:
         assert custom[0]["name"] == "custom1"
         assert custom[0]["markdown_hash"] == "fed4321cba98"
 
+    def test_run_builder_publishes_each_distinct_readme_once(self, mock_inventory_manager, mock_db_writer):
+        """A README unchanged across releases is read and published once, and stamped on every version."""
+        versions = [Version("2.0.0"), Version("1.0.0")]
+        inventory_data = {"file_format": 0.2, "libraries": [{"name": "lib1"}]}
+
+        mock_inventory_manager.list_versions.return_value = versions
+        mock_inventory_manager.load_versioned_inventory.return_value = inventory_data
+        mock_inventory_manager.load_library_readme_map.return_value = {"lib1": "abc123def456"}
+        mock_inventory_manager.load_library_readme_content.return_value = "# README content"
+        mock_db_writer.write_libraries.return_value = {"lib1": "hash1"}
+
+        exit_code = run_javaagent_builder(mock_inventory_manager, mock_db_writer)
+
+        assert exit_code == 0
+        mock_inventory_manager.load_library_readme_content.assert_called_once()
+        mock_db_writer.write_markdown.assert_called_once_with("lib1", "abc123def456", "# README content")
+        stamped = [call[0][0][0]["markdown_hash"] for call in mock_db_writer.write_libraries.call_args_list]
+        assert stamped == ["abc123def456", "abc123def456"]
+
     def test_run_builder_skips_markdown_hash_when_readme_was_not_published(
         self, mock_inventory_manager, mock_db_writer
     ):
@@ -353,11 +382,10 @@ class TestRunJavaagentBuilder:
         }
         library_map = {"lib1": "hash1"}
 
+        inventories = {Version("1.0.0"): inventory_1_0, Version("2.0.0"): inventory_2_0}
+
         mock_inventory_manager.list_versions.return_value = versions
-        mock_inventory_manager.load_versioned_inventory.side_effect = [
-            inventory_1_0,
-            inventory_2_0,
-        ]
+        mock_inventory_manager.load_versioned_inventory.side_effect = lambda v: copy.deepcopy(inventories[v])
         mock_db_writer.write_libraries.return_value = library_map
 
         exit_code = run_javaagent_builder(mock_inventory_manager, mock_db_writer)
@@ -367,17 +395,18 @@ class TestRunJavaagentBuilder:
 
         # Verify backfilled data is written: version 1.0.0 should have display_name backfilled
         write_calls = mock_db_writer.write_libraries.call_args_list
-        # We expect 2 calls: one for version 1.0.0 libraries, one for version 2.0.0 libraries
+        # We expect 2 calls: one for version 2.0.0 libraries, one for version 1.0.0 libraries
         # (Custom instrumentations are empty, so they aren't called)
         assert len(write_calls) == 2
 
-        # First call is for version 1.0.0 libraries - should have backfilled display_name
-        libraries_v1 = write_calls[0][0][0]
+        # Versions are written newest first. Second call is for version 1.0.0 libraries -
+        # should have backfilled display_name
+        libraries_v1 = write_calls[1][0][0]
         assert libraries_v1[0]["name"] == "lib1"
         assert libraries_v1[0]["display_name"] == "Library 1"
 
-        # Second call is for version 2.0.0 libraries - should have original display_name
-        libraries_v2 = write_calls[1][0][0]
+        # First call is for version 2.0.0 libraries - should have original display_name
+        libraries_v2 = write_calls[0][0][0]
         assert libraries_v2[0]["name"] == "lib1"
         assert libraries_v2[0]["display_name"] == "Library 1"
 
@@ -447,6 +476,7 @@ class TestRunJavaagentBuilder:
         run_javaagent_builder(mock_inventory_manager, mock_db_writer, clean=True)
 
         mock_db_writer.remove_orphans.assert_not_called()
+        mock_db_writer.write_reachability_manifest.assert_called_once()
 
     def test_aggregates_global_configurations(self, tmp_path):
         """run_javaagent_builder writes global-configurations.json with newest-version-wins."""
@@ -503,6 +533,141 @@ class TestRunJavaagentBuilder:
         assert data["library_count"] == 3
 
 
+class TestIncrementalJavaagentBuild:
+    INVENTORIES = {
+        Version("2.1.0"): {"file_format": 0.5, "libraries": [{"name": "jdbc", "description": "JDBC"}]},
+        Version("2.0.0"): {"file_format": 0.5, "libraries": [{"name": "jdbc"}]},
+    }
+
+    @pytest.fixture
+    def fingerprints(self):
+        return {Version("2.1.0"): "fp-new", Version("2.0.0"): "fp-old"}
+
+    @pytest.fixture
+    def inventory_manager(self, fingerprints):
+        mock = MagicMock()
+        mock.list_versions.return_value = list(self.INVENTORIES)
+        mock.load_library_readme_map.return_value = {}
+        mock.load_versioned_inventory.side_effect = lambda v: json.loads(json.dumps(self.INVENTORIES[v]))
+        mock.version_fingerprint.side_effect = lambda v: fingerprints[v]
+        return mock
+
+    def _build(self, inventory_manager, tmp_path):
+        with patch("explorer_db_builder.main.process_version", wraps=process_version) as spy:
+            exit_code = run_javaagent_builder(inventory_manager, DatabaseWriter(str(tmp_path)), incremental=True)
+        assert exit_code == 0
+        return [c.args[0] for c in spy.call_args_list]
+
+    def _snapshot(self, tmp_path):
+        return {str(p.relative_to(tmp_path)): p.read_bytes() for p in sorted(tmp_path.rglob("*")) if p.is_file()}
+
+    def test_first_run_builds_everything_and_writes_manifest(self, inventory_manager, tmp_path):
+        assert self._build(inventory_manager, tmp_path) == [Version("2.1.0"), Version("2.0.0")]
+
+        manifest = json.loads((build_state_dir(tmp_path) / MANIFEST_FILE).read_text(encoding="utf-8"))
+        # Builder-internal state is never published with the data.
+        assert not (tmp_path / MANIFEST_FILE).exists()
+        assert not (tmp_path / orphan_gc.REACHABILITY_FILE).exists()
+        assert set(manifest["versions"]) == {"2.1.0", "2.0.0"}
+        assert manifest["versions"]["2.0.0"]["input_fingerprint"] == "fp-old"
+
+    def test_unchanged_run_is_a_no_op(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        before = self._snapshot(tmp_path)
+        inventory_manager.load_versioned_inventory.reset_mock()
+
+        assert self._build(inventory_manager, tmp_path) == []
+        inventory_manager.load_versioned_inventory.assert_not_called()
+        assert self._snapshot(tmp_path) == before
+
+    def test_changed_oldest_version_rebuilds_only_it(self, inventory_manager, fingerprints, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        before = self._snapshot(tmp_path)
+        fingerprints[Version("2.0.0")] = "fp-old-changed"
+
+        assert self._build(inventory_manager, tmp_path) == [Version("2.0.0")]
+        # Inputs did not actually change, so the reused and rebuilt outputs match a full build.
+        assert self._snapshot(tmp_path) == before
+
+    def test_changed_newest_version_rebuilds_history(self, inventory_manager, fingerprints, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        fingerprints[Version("2.1.0")] = "fp-new-changed"
+
+        assert self._build(inventory_manager, tmp_path) == [Version("2.1.0"), Version("2.0.0")]
+
+    def test_missing_outputs_are_rebuilt(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        (tmp_path / "versions" / "2.0.0-index.json").unlink()
+
+        assert self._build(inventory_manager, tmp_path) == [Version("2.0.0")]
+        assert (tmp_path / "versions" / "2.0.0-index.json").exists()
+
+    def test_release_diff_is_written_and_referenced(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+
+        versions_index = json.loads((tmp_path / "versions-index.json").read_text(encoding="utf-8"))
+        newest, oldest = versions_index["versions"]
+        assert "diff_hash" not in oldest
+        release_diff = json.loads(
+            (tmp_path / "diffs" / f"2.1.0-{newest['diff_hash']}.json").read_text(encoding="utf-8")
+        )
+        assert (release_diff["from_version"], release_diff["to_version"]) == ("2.0.0", "2.1.0")
+
+    def test_missing_release_diff_is_rewritten(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        before = self._snapshot(tmp_path)
+        [diff_file] = (tmp_path / "diffs").iterdir()
+        diff_file.unlink()
+
+        # Every version is still reusable; only the diff is recomputed.
+        assert self._build(inventory_manager, tmp_path) == []
+        assert self._snapshot(tmp_path) == before
+
+    def test_removed_version_triggers_build(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        inventory_manager.list_versions.return_value = [Version("2.1.0")]
+
+        self._build(inventory_manager, tmp_path)
+
+        versions_index = json.loads((tmp_path / "versions-index.json").read_text(encoding="utf-8"))
+        assert [v["version"] for v in versions_index["versions"]] == ["2.1.0"]
+
+    def test_corrupt_manifest_falls_back_to_full_build(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        (build_state_dir(tmp_path) / MANIFEST_FILE).write_text("{not json", encoding="utf-8")
+
+        assert self._build(inventory_manager, tmp_path) == [Version("2.1.0"), Version("2.0.0")]
+
+    def test_not_incremental_ignores_manifest(self, inventory_manager, tmp_path):
+        self._build(inventory_manager, tmp_path)
+        inventory_manager.reset_mock()
+
+        assert run_javaagent_builder(inventory_manager, DatabaseWriter(str(tmp_path))) == 0
+
+        inventory_manager.version_fingerprint.assert_not_called()
+        assert inventory_manager.load_versioned_inventory.call_count == 2
+
+
+class TestParallelJavaagentBuild:
+    def test_jobs_output_matches_serial(self, tmp_path):
+        """A pooled build writes exactly the same files as a serial one."""
+        inventory_manager = JavaagentInventoryManager(str(tmp_path / "registry"))
+        inventory_manager.save_versioned_inventory(
+            Version("2.1.0"), {"file_format": 0.5, "libraries": [{"name": "jdbc", "description": "JDBC"}]}
+        )
+        inventory_manager.save_versioned_inventory(
+            Version("2.0.0"), {"file_format": 0.5, "libraries": [{"name": "jdbc"}, {"name": "kafka"}]}
+        )
+
+        outputs = {}
+        for jobs in (1, 2):
+            out_dir = tmp_path / f"jobs-{jobs}"
+            assert run_javaagent_builder(inventory_manager, DatabaseWriter(str(out_dir)), jobs=jobs) == 0
+            outputs[jobs] = {str(p.relative_to(out_dir)): p.read_bytes() for p in out_dir.rglob("*") if p.is_file()}
+
+        assert outputs[1] == outputs[2]
+
+
 class TestMain:
     @patch("explorer_db_builder.main.run_builder")
     @patch("explorer_db_builder.main.sys.exit")
@@ -514,12 +679,17 @@ class TestMain:
         mock_args.clean = False
         mock_args.ecosystem = "all"
         mock_args.collector_audit_report = None
+        mock_args.jobs = 1
+        mock_args.profile = None
+        mock_args.concurrent = False
         mock_parse_args.return_value = mock_args
         mock_run_builder.return_value = 0
 
         main()
 
-        mock_run_builder.assert_called_once_with(clean=False, ecosystem="all", collector_audit_report=None)
+        mock_run_builder.assert_called_once_with(
+            clean=False, ecosystem="all", collector_audit_report=None, jobs=1, profile=None, concurrent=False
+        )
         mock_exit.assert_called_once_with(0)
 
     @patch("explorer_db_builder.main.run_builder")
@@ -532,12 +702,17 @@ class TestMain:
         mock_args.clean = False
         mock_args.ecosystem = "all"
         mock_args.collector_audit_report = None
+        mock_args.jobs = 1
+        mock_args.profile = None
+        mock_args.concurrent = False
         mock_parse_args.return_value = mock_args
         mock_run_builder.return_value = 1
 
         main()
 
-        mock_run_builder.assert_called_once_with(clean=False, ecosystem="all", collector_audit_report=None)
+        mock_run_builder.assert_called_once_with(
+            clean=False, ecosystem="all", collector_audit_report=None, jobs=1, profile=None, concurrent=False
+        )
         mock_exit.assert_called_once_with(1)
 
     @patch("explorer_db_builder.main.run_builder")
@@ -550,12 +725,17 @@ class TestMain:
         mock_args.clean = True
         mock_args.ecosystem = "all"
         mock_args.collector_audit_report = None
+        mock_args.jobs = 1
+        mock_args.profile = None
+        mock_args.concurrent = False
         mock_parse_args.return_value = mock_args
         mock_run_builder.return_value = 0
 
         main()
 
-        mock_run_builder.assert_called_once_with(clean=True, ecosystem="all", collector_audit_report=None)
+        mock_run_builder.assert_called_once_with(
+            clean=True, ecosystem="all", collector_audit_report=None, jobs=1, profile=None, concurrent=False
+        )
         mock_exit.assert_called_once_with(0)
 
     @patch("explorer_db_builder.main.run_builder")
@@ -569,14 +749,55 @@ class TestMain:
         mock_args.clean = False
         mock_args.ecosystem = "collector"
         mock_args.collector_audit_report = None
+        mock_args.jobs = 1
+        mock_args.profile = None
+        mock_args.concurrent = False
         mock_parse_args.return_value = mock_args
         mock_run_builder.return_value = 0
 
         main()
 
-        mock_run_builder.assert_called_once_with(clean=False, ecosystem="collector", collector_audit_report=None)
+        mock_run_builder.assert_called_once_with(
+            clean=False, ecosystem="collector", collector_audit_report=None, jobs=1, profile=None, concurrent=False
+        )
         mock_exit.assert_called_once_with(0)
 
+    @patch("explorer_db_builder.main.run_builder")
+    @patch("explorer_db_builder.main.sys.exit")
+    def test_main_with_jobs_flag(self, mock_exit, mock_run_builder):
+        from explorer_db_builder.main import main
+
+        mock_run_builder.return_value = 0
+
+        with patch("sys.argv", ["explorer-db-builder", "--jobs", "4"]):
+            main()
+
+        mock_run_builder.assert_called_once_with(
+            clean=False, ecosystem="all", collector_audit_report=None, jobs=4, profile=None, concurrent=False
+        )
+
+    @patch("explorer_db_builder.main.run_builder")
+    @patch("explorer_db_builder.main.sys.exit")
+    def test_main_with_concurrent_flag(self, mock_exit, mock_run_builder):
+        from explorer_db_builder.main import main
+
+        mock_run_builder.return_value = 0
+
+        with patch("sys.argv", ["explorer-db-builder", "--concurrent"]):
+            main()
+
+        mock_run_builder.assert_called_once_with(
+            clean=False, ecosystem="all", collector_audit_report=None, jobs=1, profile=None, concurrent=True
+        )
+
+    def test_main_rejects_non_positive_jobs(self):
+        from explorer_db_builder.main import main
+
+        with patch("sys.argv", ["explorer-db-builder", "--jobs", "0"]), pytest.raises(SystemExit) as exc_info:
+            main()
+
+        assert exc_info.value.code == 2
+
 
 class TestRunBuilderOrchestrator:
     @patch("explorer_db_builder.main.run_collector_builder")
@@ -643,9 +864,9 @@ class TestRunBuilderOrchestrator:
 
         run_builder(clean=True)
 
-        mock_java.assert_called_once_with(clean=True)
-        mock_config.assert_called_once_with(clean=True)
-        mock_collector.assert_called_once_with(clean=True, audit_report_path=None)
+        mock_java.assert_called_once_with(clean=True, incremental=True, jobs=1, profiler=ANY)
+        mock_config.assert_called_once_with(clean=True, jobs=1, profiler=ANY)
+        mock_collector.assert_called_once_with(clean=True, audit_report_path=None, jobs=1, profiler=ANY)
 
     @patch("explorer_db_builder.main.run_collector_builder")
     @patch("explorer_db_builder.main.run_configuration_builder")
@@ -694,4 +915,149 @@ class TestRunBuilderOrchestrator:
 
         run_builder(clean=False, ecosystem="collector", collector_audit_report="audit/report.json")
 
-        mock_collector.assert_called_once_with(clean=False, audit_report_path="audit/report.json")
+        mock_collector.assert_called_once_with(clean=False, audit_report_path="audit/report.json", jobs=1, profiler=ANY)
+
+    @patch("explorer_db_builder.main.run_collector_builder")
+    @patch("explorer_db_builder.main.run_configuration_builder")
+    @patch("explorer_db_builder.main.run_javaagent_builder")
+    def test_profile_writes_a_report_covering_every_pipeline(self, mock_java, mock_config, mock_collector, tmp_path):
+        mock_java.return_value = 0
+        mock_config.return_value = 0
+        mock_collector.return_value = 0
+
+        def run_stage(**kwargs):
+            with kwargs["profiler"].stage("process_version"):
+                pass
+            return 0
+
+        mock_java.side_effect = run_stage
+        report_path = tmp_path / "profile.json"
+
+        result = run_builder(clean=False, profile=str(report_path))
+
+        assert result == 0
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert [stage["name"] for stage in report["stages"]] == [
+            "javaagent",
+            "javaagent/process_version",
+            "configuration",
+            "collector",
+        ]
+
+    @patch("explorer_db_builder.main.run_collector_builder")
+    @patch("explorer_db_builder.main.run_configuration_builder")
+    @patch("explorer_db_builder.main.run_javaagent_builder")
+    def test_profile_write_failure_fails_the_build(self, mock_java, mock_config, mock_collector, tmp_path):
+        mock_java.return_value = 0
+        mock_config.return_value = 0
+        mock_collector.return_value = 0
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+
+        assert run_builder(clean=False, profile=str(blocker / "profile.json")) == 1
+
+
+def _pipeline_report(name, counters=None):
+    return {
+        "stages": [
+            {
+                "name": name,
+                "calls": 1,
+                "wall_seconds": 0.5,
+                "cpu_seconds": 0.1,
+                "peak_rss_bytes": 1024,
+                "counters": counters or {},
+            }
+        ]
+    }
+
+
+@patch("explorer_db_builder.main.ProcessPoolExecutor", ThreadPoolExecutor)
+@patch("explorer_db_builder.main._run_pipeline_process")
+class TestConcurrentPipelines:
+    def test_runs_every_pipeline_once(self, mock_process):
+        mock_process.side_effect = lambda name, **kwargs: (0, _pipeline_report(name))
+
+        assert run_builder(clean=True, jobs=2, concurrent=True) == 0
+
+        assert sorted(call.args[0] for call in mock_process.call_args_list) == [
+            "collector",
+            "configuration",
+            "javaagent",
+        ]
+        assert mock_process.call_args.kwargs == {
+            "clean": True,
+            "collector_audit_report": None,
+            "jobs": 2,
+            "log_level": ANY,
+        }
+
+    def test_failed_pipeline_fails_the_build(self, mock_process):
+        mock_process.side_effect = lambda name, **kwargs: (int(name == "configuration"), _pipeline_report(name))
+
+        assert run_builder(concurrent=True) == 1
+
+    def test_crashed_pipeline_fails_the_build(self, mock_process):
+        def run(name, **kwargs):
+            if name == "collector":
+                raise RuntimeError("worker died")
+            return 0, _pipeline_report(name)
+
+        mock_process.side_effect = run
+
+        assert run_builder(concurrent=True) == 1
+        assert mock_process.call_count == 3
+
+    def test_summary_lists_each_pipeline(self, mock_process, caplog):
+        mock_process.side_effect = lambda name, **kwargs: (
+            0,
+            _pipeline_report(name, {"files_written": 12, "total_bytes": 3400} if name != "configuration" else None),
+        )
+
+        with caplog.at_level("INFO"):
+            run_builder(concurrent=True)
+
+        rows = {line.split()[0]: line.split() for line in caplog.messages if line.startswith("  ")}
+        assert rows["javaagent"] == ["javaagent", "ok", "0.500", "12", "3,400"]
+        # A pipeline that wrote nothing moved no counters.
+        assert rows["configuration"] == ["configuration", "ok", "0.500", "0", "0"]
+
+    def test_summary_marks_crashed_pipeline(self, mock_process, caplog):
+        def run(name, **kwargs):
+            if name == "collector":
+                raise RuntimeError("worker died")
+            return 0, _pipeline_report(name)
+
+        mock_process.side_effect = run
+
+        with caplog.at_level("INFO"):
+            run_builder(concurrent=True)
+
+        rows = {line.split()[0]: line.split() for line in caplog.messages if line.startswith("  ")}
+        assert rows["collector"] == ["collector", "crashed", "-", "-", "-"]
+
+    def test_profile_merges_pipeline_reports_in_pipeline_order(self, mock_process, tmp_path):
+        mock_process.side_effect = lambda name, **kwargs: (0, _pipeline_report(name))
+        report_path = tmp_path / "profile.json"
+
+        assert run_builder(concurrent=True, profile=str(report_path)) == 0
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert [stage["name"] for stage in report["stages"]] == ["javaagent", "configuration", "collector"]
+
+    @patch("explorer_db_builder.main.run_javaagent_builder")
+    def test_single_ecosystem_runs_in_process(self, mock_java, mock_process):
+        mock_java.return_value = 0
+
+        assert run_builder(ecosystem="javaagent", concurrent=True) == 0
+
+        mock_java.assert_called_once()
+        mock_process.assert_not_called()
+
+
+class TestConcurrentPipelineProcesses:
+    def test_worker_failures_are_reported_per_pipeline(self, tmp_path, monkeypatch):
+        """Real worker processes: with no registry on disk every pipeline fails cleanly."""
+        monkeypatch.chdir(tmp_path)
+
+        assert run_builder(concurrent=True) == 1
@@ -14,7 +14,8 @@
 #
 """Tests for metadata backfiller."""
 
-from explorer_db_builder.metadata_backfiller import backfill_metadata
+import pytest
+from explorer_db_builder.metadata_backfiller import MetadataBackfiller, backfill_metadata
 from semantic_version import Version
 
 
@@ -421,3 +422,73 @@ class TestBackfillMetadata:
         result = backfill_metadata(versions, load_fn)
 
         assert result[Version("1.1.0")]["libraries"][0]["configurations"][0]["examples"] == ["one", "two"]
+
+    def test_backfills_several_item_lists_in_one_pass(self):
+        """Each item list is backfilled from its own timelines, loading every inventory once."""
+        versions = [Version("1.2.0"), Version("1.1.0")]
+
+        inventories = {
+            Version("1.1.0"): {
+                "libraries": [{"name": "shared"}],
+                "custom": [{"name": "shared"}, {"name": "custom-only"}],
+            },
+            Version("1.2.0"): {
+                "libraries": [{"name": "shared", "display_name": "Library"}],
+                "custom": [{"name": "custom-only", "display_name": "Custom"}],
+            },
+        }
+        loaded = []
+
+        def load_fn(version):
+            loaded.append(version)
+            return inventories[version]
+
+        result = backfill_metadata(versions, load_fn, item_keys=("libraries", "custom"))
+
+        assert sorted(loaded) == sorted(versions)
+        assert result[Version("1.1.0")]["libraries"][0]["display_name"] == "Library"
+        # A custom instrumentation never borrows from a library of the same name.
+        assert "display_name" not in result[Version("1.1.0")]["custom"][0]
+        assert result[Version("1.1.0")]["custom"][1]["display_name"] == "Custom"
+
+    def test_missing_item_list_is_normalized_to_empty(self):
+        versions = [Version("1.1.0")]
+        inventories = {Version("1.1.0"): {"libraries": [{"name": "lib"}]}}
+
+        result = backfill_metadata(versions, inventories.__getitem__, item_keys=("libraries", "custom"))
+
+        assert result[Version("1.1.0")]["custom"] == []
+
+    def test_picks_nearest_later_value_regardless_of_input_order(self):
+        versions = [Version("1.10.0"), Version("1.2.0"), Version("1.9.0"), Version("1.1.0")]
+        inventories = {
+            Version("1.1.0"): {"libraries": [{"name": "lib"}]},
+            Version("1.2.0"): {"libraries": [{"name": "lib"}]},
+            Version("1.9.0"): {"libraries": [{"name": "lib", "description": "nine"}]},
+            Version("1.10.0"): {"libraries": [{"name": "lib", "description": "ten"}]},
+        }
+
+        result = backfill_metadata(versions, inventories.__getitem__)
+
+        assert result[Version("1.1.0")]["libraries"][0]["description"] == "nine"
+        assert result[Version("1.2.0")]["libraries"][0]["description"] == "nine"
+        assert result[Version("1.10.0")]["libraries"][0]["description"] == "ten"
+        assert list(result) == versions
+
+
+class TestMetadataBackfiller:
+    def test_fills_from_the_nearest_newer_version_seen(self):
+        backfiller = MetadataBackfiller()
+
+        newest = backfiller.backfill(Version("1.2.0"), {"libraries": [{"name": "lib", "description": "new"}]})
+        older = backfiller.backfill(Version("1.1.0"), {"libraries": [{"name": "lib"}]})
+
+        assert newest["libraries"][0]["description"] == "new"
+        assert older["libraries"][0]["description"] == "new"
+
+    def test_rejects_versions_out_of_order(self):
+        backfiller = MetadataBackfiller()
+        backfiller.backfill(Version("1.1.0"), {"libraries": []})
+
+        with pytest.raises(ValueError, match="newest first"):
+            backfiller.backfill(Version("1.2.0"), {"libraries": []})
@@ -0,0 +1,60 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for process-pool fan-out."""
+
+import pytest
+from explorer_db_builder.parallel import imap_versions
+
+
+class TestImapVersions:
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_yields_in_input_order(self, jobs):
+        assert list(imap_versions(str, [3, 1, 2, 5, 4, 7, 6, 9, 8], jobs)) == [
+            (3, "3"),
+            (1, "1"),
+            (2, "2"),
+            (5, "5"),
+            (4, "4"),
+            (7, "7"),
+            (6, "6"),
+            (9, "9"),
+            (8, "8"),
+        ]
+
+    def test_serial_is_lazy(self):
+        seen = []
+
+        def record(v):
+            seen.append(v)
+            return v
+
+        results = imap_versions(record, [1, 2, 3], jobs=1)
+        assert next(results) == (1, 1)
+        assert seen == [1]
+
+    def test_serial_accepts_unpicklable_callables(self):
+        assert list(imap_versions(lambda v: v * 2, [1, 2], jobs=1)) == [(1, 2), (2, 4)]
+
+    def test_empty(self):
+        assert list(imap_versions(str, [], jobs=4)) == []
+
+    def test_worker_exception_propagates(self):
+        with pytest.raises(ValueError):
+            list(imap_versions(int, ["1", "not-a-number", "3"], jobs=2))
+
+    def test_consumer_may_stop_early(self):
+        results = imap_versions(str, list(range(20)), jobs=2)
+        assert next(results) == (0, "0")
+        results.close()
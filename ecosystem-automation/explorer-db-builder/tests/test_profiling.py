@@ -0,0 +1,137 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for per-stage build profiling."""
+
+import json
+
+import pytest
+from explorer_db_builder.profiling import REPORT_FORMAT, BuildProfiler
+
+
+def _stages(profiler):
+    return {stage["name"]: stage for stage in profiler.report()["stages"]}
+
+
+class TestBuildProfiler:
+    def test_nested_stages_are_named_by_path(self):
+        profiler = BuildProfiler()
+
+        with profiler.stage("javaagent"):
+            with profiler.stage("backfill"):
+                pass
+
+        assert list(_stages(profiler)) == ["javaagent", "javaagent/backfill"]
+
+    def test_repeated_stage_accumulates(self):
+        profiler = BuildProfiler()
+
+        for _ in range(3):
+            with profiler.stage("process_version"):
+                sum(range(1000))
+
+        stage = _stages(profiler)["process_version"]
+        assert stage["calls"] == 3
+        assert stage["wall_seconds"] > 0
+        assert stage["cpu_seconds"] >= 0
+        assert stage["peak_rss_bytes"] >= 0
+
+    def test_records_counter_deltas_per_stage(self):
+        profiler = BuildProfiler()
+        stats = {"files_written": 5, "files_skipped": 0}
+        profiler.add_counter_source(lambda: dict(stats))
+
+        with profiler.stage("write"):
+            stats["files_written"] += 2
+            stats["files_skipped"] += 1
+        with profiler.stage("idle"):
+            pass
+
+        stages = _stages(profiler)
+        assert stages["write"]["counters"] == {"files_skipped": 1, "files_written": 2}
+        assert stages["idle"]["counters"] == {}
+
+    def test_stage_is_recorded_when_it_raises(self):
+        profiler = BuildProfiler()
+
+        with pytest.raises(ValueError), profiler.stage("load"):
+            raise ValueError("boom")
+
+        assert _stages(profiler)["load"]["calls"] == 1
+
+    def test_iterate_times_each_item_as_a_stage(self):
+        profiler = BuildProfiler()
+
+        with profiler.stage("javaagent"):
+            items = list(profiler.iterate("load", iter([1, 2, 3])))
+
+        assert items == [1, 2, 3]
+        # One run per item plus the final step that finds the iterator exhausted.
+        assert _stages(profiler)["javaagent/load"]["calls"] == 4
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = BuildProfiler(enabled=False)
+        profiler.add_counter_source(lambda: {"files_written": 1})
+
+        with profiler.stage("javaagent"):
+            assert list(profiler.iterate("load", [1, 2])) == [1, 2]
+
+        assert profiler.report()["stages"] == []
+
+    def test_merge_report_adds_another_process_stages(self):
+        child = BuildProfiler()
+        stats = {"files_written": 0}
+        child.add_counter_source(lambda: dict(stats))
+        with child.stage("collector"):
+            stats["files_written"] += 3
+        profiler = BuildProfiler()
+        with profiler.stage("javaagent"):
+            pass
+
+        profiler.merge_report(child.report())
+        profiler.merge_report(child.report())
+
+        stages = _stages(profiler)
+        assert list(stages) == ["javaagent", "collector"]
+        assert stages["collector"]["calls"] == 2
+        assert stages["collector"]["counters"] == {"files_written": 6}
+
+    def test_disabled_profiler_ignores_merged_reports(self):
+        child = BuildProfiler()
+        with child.stage("collector"):
+            pass
+        profiler = BuildProfiler(enabled=False)
+
+        profiler.merge_report(child.report())
+
+        assert profiler.report()["stages"] == []
+
+    def test_write_report_and_summary_table(self, tmp_path):
+        profiler = BuildProfiler()
+        profiler.add_counter_source(lambda: {"files_written": 0})
+        with profiler.stage("collector"):
+            with profiler.stage("orphan_gc"):
+                pass
+
+        report_path = tmp_path / "profile" / "build.json"
+        profiler.write_report(report_path)
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["format"] == REPORT_FORMAT
+        assert [stage["name"] for stage in report["stages"]] == ["collector", "collector/orphan_gc"]
+
+        table = profiler.summary_table().splitlines()
+        assert table[0].split() == ["stage", "calls", "wall", "s", "cpu", "s", "peak", "MB", "counters"]
+        assert table[1].startswith("collector ")
+        assert table[2].startswith("  orphan_gc ")
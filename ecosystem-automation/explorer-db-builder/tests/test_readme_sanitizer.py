@@ -14,7 +14,11 @@
 #
 """Tests for autogenerated-section and HTML comment removal in published README markdown."""
 
-from explorer_db_builder.readme_sanitizer import sanitize_readme
+import hashlib
+from pathlib import Path
+
+from explorer_db_builder import readme_sanitizer
+from explorer_db_builder.readme_sanitizer import sanitize_readme, sanitizer_fingerprint
 
 
 class TestRemovesAutogeneratedSection:
@@ -245,3 +249,12 @@ class TestPreservesCodeFences:
         content = "```\nx\n```\n<!-- dropped -->\n"
 
         assert sanitize_readme(content) == "```\nx\n```\n"
+
+
+class TestSanitizerFingerprint:
+    """The store's README stamp follows the sanitizer's source, so no version needs bumping by hand."""
+
+    def test_is_a_hash_of_the_module_source(self):
+        source = Path(readme_sanitizer.__file__).read_bytes()
+
+        assert sanitizer_fingerprint() == hashlib.sha256(source).hexdigest()
@@ -0,0 +1,178 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the precomputed release-to-release diffs."""
+
+from explorer_db_builder.release_diff import (
+    RELEASE_DIFF_FORMAT,
+    diff_collector_releases,
+    diff_javaagent_releases,
+)
+
+
+def _jdbc(**overrides):
+    instrumentation = {
+        "name": "jdbc",
+        "display_name": "JDBC",
+        "configurations": [
+            {"name": "otel.instrumentation.jdbc.statement-sanitizer.enabled", "type": "boolean", "default": True},
+        ],
+        "telemetry": [
+            {
+                "when": "default",
+                "metrics": [
+                    {
+                        "name": "db.client.operation.duration",
+                        "unit": "s",
+                        "attributes": [{"name": "db.system.name", "type": "STRING"}],
+                    }
+                ],
+                "spans": [{"span_kind": "CLIENT", "attributes": [{"name": "db.system.name", "type": "STRING"}]}],
+            }
+        ],
+    }
+    instrumentation.update(overrides)
+    return instrumentation
+
+
+class TestDiffJavaagentReleases:
+    def test_shape_and_totals(self):
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [_jdbc(), {"name": "old"}], [_jdbc(), {"name": "new"}])
+
+        assert diff == {
+            "format": RELEASE_DIFF_FORMAT,
+            "ecosystem": "javaagent",
+            "from_version": "2.0.0",
+            "to_version": "2.1.0",
+            "added": ["new"],
+            "removed": ["old"],
+            "changed": {},
+            "totals": {"added": 1, "removed": 1, "changed": 0},
+        }
+
+    def test_configuration_changes(self):
+        after = _jdbc(
+            configurations=[
+                {"name": "otel.instrumentation.jdbc.statement-sanitizer.enabled", "type": "boolean", "default": False},
+                {"name": "otel.instrumentation.jdbc.experimental.transaction.enabled", "type": "boolean"},
+            ]
+        )
+
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [_jdbc()], [after])
+
+        assert diff["changed"] == {
+            "jdbc": {
+                "configurations": {
+                    "added": ["otel.instrumentation.jdbc.experimental.transaction.enabled"],
+                    "changed": ["otel.instrumentation.jdbc.statement-sanitizer.enabled"],
+                }
+            }
+        }
+
+    def test_telemetry_changes(self):
+        after = _jdbc(
+            telemetry=[
+                {
+                    "when": "default",
+                    "metrics": [
+                        {
+                            "name": "db.client.operation.duration",
+                            "unit": "s",
+                            "attributes": [
+                                {"name": "db.system.name", "type": "STRING"},
+                                {"name": "db.namespace", "type": "STRING"},
+                            ],
+                        }
+                    ],
+                }
+            ]
+        )
+
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [_jdbc()], [after])
+
+        assert diff["changed"]["jdbc"] == {
+            "metrics": {"changed": ["db.client.operation.duration"]},
+            "spans": {"removed": ["CLIENT"]},
+            "attributes": {"added": ["db.namespace"]},
+        }
+
+    def test_signal_moved_to_another_when_condition_is_changed(self):
+        before = _jdbc()
+        after = _jdbc(telemetry=[{**before["telemetry"][0], "when": "otel.semconv-stability.opt-in=database"}])
+
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [before], [after])
+
+        assert diff["changed"]["jdbc"] == {
+            "metrics": {"changed": ["db.client.operation.duration"]},
+            "spans": {"changed": ["CLIENT"]},
+        }
+
+    def test_other_fields_are_listed_by_name(self):
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [_jdbc()], [_jdbc(description="JDBC calls")])
+
+        assert diff["changed"]["jdbc"] == {"fields": ["description"]}
+
+    def test_telemetry_reordering_is_not_a_change(self):
+        before = _jdbc(
+            telemetry=[{"when": "a", "metrics": [{"name": "m1"}]}, {"when": "b", "metrics": [{"name": "m2"}]}]
+        )
+        after = _jdbc(telemetry=before["telemetry"][::-1])
+
+        assert diff_javaagent_releases("2.0.0", "2.1.0", [before], [after])["changed"] == {}
+
+    def test_tolerates_missing_and_none_sections(self):
+        before = {"name": "x", "configurations": None, "telemetry": None}
+        after = {"name": "x", "telemetry": [{"when": "default", "metrics": None, "spans": [{"span_kind": "SERVER"}]}]}
+
+        diff = diff_javaagent_releases("2.0.0", "2.1.0", [before], [after])
+
+        assert diff["changed"]["x"] == {"spans": {"added": ["SERVER"]}}
+
+
+class TestDiffCollectorReleases:
+    def _component(self, **overrides):
+        component = {
+            "id": "contrib-kafkareceiver",
+            "name": "kafkareceiver",
+            "status": {"stability": {"beta": ["traces"]}},
+            "metrics": {"kafka.brokers": {"enabled": True}},
+            "attributes": {"topic": {"type": "string"}},
+        }
+        component.update(overrides)
+        return component
+
+    def test_keyed_by_component_id(self):
+        core = {"id": "core-otlpreceiver", "name": "otlpreceiver"}
+
+        diff = diff_collector_releases("0.155.0", "0.156.0", [self._component()], [self._component(), core])
+
+        assert diff["ecosystem"] == "collector"
+        assert diff["added"] == ["core-otlpreceiver"]
+        assert diff["totals"] == {"added": 1, "removed": 0, "changed": 0}
+
+    def test_metric_attribute_and_status_changes(self):
+        after = self._component(
+            status={"stability": {"stable": ["traces"]}},
+            metrics={"kafka.brokers": {"enabled": False}},
+            attributes={"topic": {"type": "string"}, "partition": {"type": "int"}},
+            telemetry={"metrics": {"kafka_receiver_messages": {}}},
+        )
+
+        diff = diff_collector_releases("0.155.0", "0.156.0", [self._component()], [after])
+
+        assert diff["changed"]["contrib-kafkareceiver"] == {
+            "metrics": {"added": ["kafka_receiver_messages"], "changed": ["kafka.brokers"]},
+            "attributes": {"added": ["partition"]},
+            "fields": ["status"],
+        }
@@ -14,8 +14,10 @@
 #
 """Tests for schema resolver."""
 
+import copy
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
@@ -221,6 +223,50 @@ class TestSiblingMerging:
 
         assert result["properties"]["x"] == "plain_string_value"
 
+    def test_resolved_refs_do_not_alias_the_registry(self):
+        registry = {
+            "root.yaml": {
+                "properties": {
+                    "foo": {"$ref": "#/$defs/Foo"},
+                    "bar": {"$ref": "#/$defs/Foo"},
+                    "levels": {"$ref": "#/$defs/Levels"},
+                },
+                "$defs": {
+                    "Foo": {"type": "object", "properties": {"x": {"type": "integer"}}},
+                    "Levels": ["debug", "info"],
+                },
+            },
+        }
+        snapshot = copy.deepcopy(registry)
+        result = SchemaResolver(registry).resolve("root.yaml")
+
+        result["properties"]["foo"]["properties"]["x"]["type"] = "string"
+        result["properties"]["levels"].append("warn")
+
+        assert registry == snapshot
+
+    def test_references_to_one_definition_share_its_resolved_subtree(self):
+        registry = {
+            "root.yaml": {
+                "properties": {
+                    "foo": {"$ref": "#/$defs/Foo"},
+                    "bar": {"$ref": "root.yaml#/$defs/Foo"},
+                    "baz": {"$ref": "#/$defs/Foo", "description": "baz"},
+                },
+                "$defs": {"Foo": {"type": "object", "properties": {"x": {"type": "integer"}}}},
+            },
+        }
+        resolver = SchemaResolver(registry)
+
+        with patch.object(resolver, "_lookup_ref", wraps=resolver._lookup_ref) as lookup:
+            result = resolver.resolve("root.yaml")
+
+        assert lookup.call_count == 1
+        properties = result["properties"]
+        assert properties["foo"] is properties["bar"]
+        assert properties["baz"] == {**properties["foo"], "description": "baz"}
+        assert properties["baz"]["properties"] is properties["foo"]["properties"]
+
     def test_ref_only_no_siblings(self):
         registry = {
             "root.yaml": {
@@ -312,6 +358,47 @@ class TestCircularRefDetection:
 
         assert result["properties"]["x"]["properties"]["y"]["properties"]["z"] == {"$circular_ref": "a.yaml"}
 
+    def test_definition_resolved_inside_a_cycle_is_not_reused_outside_it(self):
+        registry = {
+            "root.yaml": {
+                "properties": {
+                    "start": {"$ref": "#/$defs/A"},
+                    "b": {"$ref": "#/$defs/B"},
+                },
+                "$defs": {
+                    "A": {"properties": {"b": {"$ref": "#/$defs/B"}}},
+                    "B": {"properties": {"a": {"$ref": "#/$defs/A"}}},
+                },
+            },
+        }
+
+        result = SchemaResolver(registry).resolve("root.yaml")
+
+        # Inside A, B's reference back to A is the cycle; reached directly, B's own cycle closes on B.
+        assert result["properties"]["start"] == {
+            "properties": {"b": {"properties": {"a": {"$circular_ref": "#/$defs/A"}}}}
+        }
+        assert result["properties"]["b"] == {"properties": {"a": {"properties": {"b": {"$circular_ref": "#/$defs/B"}}}}}
+
+    def test_memoized_definition_is_not_reused_while_a_ref_it_reached_is_in_progress(self):
+        registry = {
+            "root.yaml": {
+                "properties": {
+                    "c": {"$ref": "#/$defs/C"},
+                    "d": {"$ref": "#/$defs/D"},
+                },
+                "$defs": {
+                    "C": {"properties": {"d": {"$ref": "#/$defs/D"}}},
+                    "D": {"properties": {"c": {"$ref": "#/$defs/C"}}},
+                },
+            },
+        }
+
+        result = SchemaResolver(registry).resolve("root.yaml")
+
+        # C is memoized from the first property, but within D it must close the cycle on D.
+        assert result["properties"]["d"] == {"properties": {"c": {"properties": {"d": {"$circular_ref": "#/$defs/D"}}}}}
+
     def test_sampler_like_cycle(self):
         """Simulates the real Sampler -> ParentBased -> root -> Sampler cycle."""
         registry = {
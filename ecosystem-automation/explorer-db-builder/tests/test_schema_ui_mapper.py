@@ -414,6 +414,85 @@ class TestMapSchemaToUiTree:
         assert node["nullBehavior"] == "dependent on usage context"
 
 
+class TestPathIndex:
+    SCHEMA = {
+        "type": "object",
+        "required": ["tracer_provider"],
+        "properties": {
+            "tracer_provider": {
+                "type": "object",
+                "properties": {
+                    "processors": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "isSdkExtensionPlugin": True,
+                            "properties": {"batch/development": {"type": ["object", "null"]}},
+                        },
+                    },
+                    "limit": {"oneOf": [{"type": "integer"}, {"type": "string"}]},
+                },
+            },
+        },
+    }
+
+    def test_summarizes_every_node_by_path(self):
+        path_index = {}
+        map_schema_to_ui_tree(self.SCHEMA, path_index=path_index)
+
+        assert path_index == {
+            "": {"controlType": "group", "type": "object", "children": ["tracer_provider"]},
+            "tracer_provider": {
+                "controlType": "group",
+                "type": "object",
+                "required": True,
+                "parent": "",
+                "children": ["processors", "limit"],
+            },
+            "tracer_provider.processors": {
+                "controlType": "list",
+                "type": "array",
+                "parent": "tracer_provider",
+                "children": ["item"],
+            },
+            "tracer_provider.processors.item": {
+                "controlType": "plugin_select",
+                "type": "object",
+                "parent": "tracer_provider.processors",
+                "children": ["batch/development"],
+            },
+            "tracer_provider.processors.item.batch/development": {
+                "controlType": "group",
+                "type": "object",
+                "stability": "development",
+                "parent": "tracer_provider.processors.item",
+            },
+            "tracer_provider.limit": {
+                "controlType": "union",
+                "parent": "tracer_provider",
+                "children": ["variant_0", "variant_1"],
+            },
+            "tracer_provider.limit.variant_0": {
+                "controlType": "number_input",
+                "type": "integer",
+                "parent": "tracer_provider.limit",
+            },
+            "tracer_provider.limit.variant_1": {
+                "controlType": "text_input",
+                "type": "string",
+                "parent": "tracer_provider.limit",
+            },
+        }
+
+    def test_matches_the_tree(self):
+        path_index = {}
+        tree = map_schema_to_ui_tree(self.SCHEMA, path_index=path_index)
+
+        assert tree == map_schema_to_ui_tree(self.SCHEMA)
+        node = tree["children"][0]["children"][0]["itemSchema"]
+        assert path_index[node["path"]]["children"] == [option["key"] for option in node["options"]]
+
+
 class TestIntegrationWithRealSchemas:
     SCHEMA_DIR = Path(__file__).parent.parent.parent.parent / "ecosystem-registry" / "configuration" / "v1.0.0"
 
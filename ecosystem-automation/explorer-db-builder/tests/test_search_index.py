@@ -0,0 +1,158 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the prebuilt inverted search index."""
+
+import json
+
+from explorer_db_builder.content_hashing import content_hash
+from explorer_db_builder.search_index import (
+    FIELD_WEIGHTS,
+    SEARCH_INDEX_FORMAT,
+    build_collector_search_index,
+    build_javaagent_search_index,
+    build_search_index,
+    collector_search_fields,
+    encode_search_index,
+    javaagent_search_fields,
+    tokenize,
+)
+
+
+def _postings(index, term):
+    """{document id: score} for a term."""
+    flat = index["postings"][index["terms"].index(term)]
+    return {index["documents"][document]: score for document, score in zip(flat[::2], flat[1::2])}
+
+
+class TestTokenize:
+    def test_splits_on_punctuation_and_lowercases(self):
+        assert tokenize("otel.instrumentation.Spring-WebMVC") == ["otel", "instrumentation", "spring", "webmvc"]
+
+    def test_drops_single_characters(self):
+        assert tokenize("aws-sdk-2.2 s3") == ["aws", "sdk", "s3"]
+
+
+class TestSearchFields:
+    def test_javaagent_fields(self):
+        instrumentation = {
+            "name": "jdbc",
+            "display_name": "JDBC",
+            "description": "Database calls",
+            "scope": {"name": "io.opentelemetry.jdbc"},
+            "semantic_conventions": ["DATABASE_CLIENT_SPANS"],
+            "configurations": [
+                {"name": "otel.instrumentation.jdbc.enabled", "declarative_name": "java.jdbc.enabled"},
+            ],
+            "telemetry": [{"when": "default", "metrics": [{"name": "db.client.operation.duration"}]}],
+        }
+
+        fields = javaagent_search_fields(instrumentation)
+
+        assert fields["name"] == ["jdbc"]
+        assert fields["configuration"] == ["otel.instrumentation.jdbc.enabled", "java.jdbc.enabled"]
+        assert fields["metric"] == ["db.client.operation.duration"]
+        assert fields["keyword"] == ["io.opentelemetry.jdbc", "DATABASE_CLIENT_SPANS"]
+
+    def test_javaagent_fields_tolerate_missing_and_none(self):
+        fields = javaagent_search_fields({"name": "x", "configurations": None, "telemetry": None, "scope": None})
+
+        assert fields["configuration"] == []
+        assert fields["metric"] == []
+
+    def test_collector_fields_take_metric_names_from_metadata_and_internal_telemetry(self):
+        component = {
+            "id": "contrib-kafkareceiver",
+            "name": "kafkareceiver",
+            "display_name": "Kafka Receiver",
+            "metrics": {"kafka.brokers": {"enabled": True}},
+            "telemetry": {"metrics": {"kafka_broker_closed": {}}},
+            "attributes": {"topic": {}},
+        }
+
+        fields = collector_search_fields(component)
+
+        assert fields["metric"] == ["kafka.brokers", "kafka_broker_closed"]
+        assert fields["keyword"] == ["topic"]
+        assert fields["configuration"] == []
+
+
+class TestBuildSearchIndex:
+    def test_shape(self):
+        index = build_search_index("collector", [("core-otlpreceiver", {"name": ["otlpreceiver"]})])
+
+        assert index["format"] == SEARCH_INDEX_FORMAT
+        assert index["ecosystem"] == "collector"
+        assert index["fields"] == FIELD_WEIGHTS
+        assert index["documents"] == ["core-otlpreceiver"]
+        assert index["terms"] == ["otlpreceiver"]
+        assert index["postings"] == [[0, FIELD_WEIGHTS["name"]]]
+
+    def test_score_sums_the_distinct_fields_a_term_occurs_in(self):
+        index = build_search_index(
+            "javaagent",
+            [
+                ("kafka-clients", {"name": ["kafka-clients"], "display_name": ["Kafka Clients", "kafka"]}),
+                ("spring-kafka", {"name": ["spring-kafka"], "description": ["Kafka listeners"]}),
+            ],
+        )
+
+        assert _postings(index, "kafka") == {
+            "kafka-clients": FIELD_WEIGHTS["name"] + FIELD_WEIGHTS["display_name"],
+            "spring-kafka": FIELD_WEIGHTS["name"] + FIELD_WEIGHTS["description"],
+        }
+
+    def test_terms_are_sorted_and_trigrams_point_at_them(self):
+        index = build_search_index("javaagent", [("spring-webmvc", {"name": ["spring-webmvc"]})])
+
+        assert index["terms"] == sorted(index["terms"]) == ["spring", "webmvc"]
+        assert [index["terms"][position] for position in index["trigrams"]["mvc"]] == ["webmvc"]
+        assert "sp" not in index["trigrams"]
+
+    def test_repeated_document_ids_are_merged(self):
+        index = build_search_index(
+            "javaagent", [("jdbc", {"name": ["jdbc"]}), ("jdbc", {"metric": ["db.client.operation.duration"]})]
+        )
+
+        assert index["documents"] == ["jdbc"]
+        assert _postings(index, "duration") == {"jdbc": FIELD_WEIGHTS["metric"]}
+
+    def test_is_independent_of_document_order(self):
+        documents = [("b", {"name": ["beta"]}), ("a", {"name": ["alpha"], "description": ["beta"]})]
+
+        assert build_search_index("javaagent", documents) == build_search_index("javaagent", documents[::-1])
+
+    def test_javaagent_index_is_keyed_by_name(self):
+        index = build_javaagent_search_index([{"name": "jdbc", "display_name": "JDBC"}, {"display_name": "no name"}])
+
+        assert index["documents"] == ["jdbc"]
+
+    def test_collector_index_is_keyed_by_component_id(self):
+        index = build_collector_search_index(
+            [{"id": "core-otlpreceiver", "name": "otlpreceiver"}, {"id": "contrib-otlpreceiver", "name": "otlp"}]
+        )
+
+        assert index["documents"] == ["contrib-otlpreceiver", "core-otlpreceiver"]
+        assert _postings(index, "otlpreceiver") == {"core-otlpreceiver": FIELD_WEIGHTS["name"]}
+
+
+class TestEncodeSearchIndex:
+    def test_minified_and_content_hashed(self):
+        index = build_search_index("javaagent", [("jdbc", {"name": ["jdbc"]})])
+
+        search_index_hash, content = encode_search_index(index)
+
+        assert search_index_hash == content_hash(index)
+        assert b"\n" not in content and b", " not in content
+        assert json.loads(content) == index
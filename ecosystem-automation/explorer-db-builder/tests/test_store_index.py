@@ -0,0 +1,102 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for the in-memory store index."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from explorer_db_builder.store_index import StoreIndex
+
+
+@pytest.fixture
+def store(tmp_path):
+    (tmp_path / "components" / "core-nop").mkdir(parents=True)
+    (tmp_path / "components" / "core-nop" / "core-nop-aaaaaaaaaaaa.json").write_text("{}")
+    (tmp_path / "markdown").mkdir()
+    (tmp_path / "markdown" / "nop-bbbbbbbbbbbb.md").write_text("# nop")
+    return tmp_path
+
+
+class TestStoreIndex:
+    def test_answers_existence_from_a_single_scan(self, store):
+        index = StoreIndex(store, ("components", "markdown", "bundles"))
+
+        with patch("explorer_db_builder.store_index.os.scandir", wraps=os.scandir) as scandir:
+            assert index.exists(store / "components" / "core-nop" / "core-nop-aaaaaaaaaaaa.json")
+            assert index.exists(store / "markdown" / "nop-bbbbbbbbbbbb.md")
+            assert not index.exists(store / "components" / "core-nop" / "core-nop-cccccccccccc.json")
+            assert not index.exists(store / "bundles" / "1.0.0-dddddddddddd.json")
+
+        # components/, components/core-nop/, markdown/ and the missing bundles/
+        assert scandir.call_count == 4
+
+    def test_scan_is_deferred_to_first_use(self, store):
+        index = StoreIndex(store, ("markdown",))
+        late = store / "markdown" / "late-cccccccccccc.md"
+        late.write_text("# late")
+
+        assert index.exists(late)
+
+    def test_paths_outside_indexed_subdirs_go_to_the_filesystem(self, store):
+        index = StoreIndex(store, ("markdown",))
+        (store / "versions").mkdir()
+        version_index = store / "versions" / "1.0.0-index.json"
+
+        assert not index.exists(version_index)
+        version_index.write_text("{}")
+        assert index.exists(version_index)
+
+    def test_ensure_parent_creates_only_unknown_directories(self, store):
+        index = StoreIndex(store, ("components",))
+        known = store / "components" / "core-nop" / "core-nop-cccccccccccc.json"
+        new = store / "components" / "core-new" / "core-new-cccccccccccc.json"
+
+        with patch("pathlib.Path.mkdir") as mkdir:
+            index.ensure_parent(known)
+        mkdir.assert_not_called()
+
+        index.ensure_parent(new)
+        assert new.parent.is_dir()
+
+        with patch("pathlib.Path.mkdir") as mkdir:
+            index.ensure_parent(new)
+        mkdir.assert_not_called()
+
+    def test_add_records_new_files(self, store):
+        index = StoreIndex(store, ("bundles",))
+        bundle = store / "bundles" / "1.0.0-dddddddddddd.json"
+        assert not index.exists(bundle)
+
+        index.add(bundle)
+
+        assert index.exists(bundle)
+
+    def test_reset_treats_the_store_as_empty(self, store):
+        index = StoreIndex(store, ("markdown",))
+
+        index.reset()
+
+        assert not index.exists(store / "markdown" / "nop-bbbbbbbbbbbb.md")
+
+    def test_invalidate_rescans_after_external_deletes(self, store):
+        index = StoreIndex(store, ("markdown",))
+        markdown = store / "markdown" / "nop-bbbbbbbbbbbb.md"
+        assert index.exists(markdown)
+
+        markdown.unlink()
+        index.invalidate()
+
+        assert not index.exists(markdown)
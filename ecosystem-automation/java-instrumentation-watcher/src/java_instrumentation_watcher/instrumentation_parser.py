@@ -18,6 +18,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 import yaml
+from watcher_common import yaml_io
 
 
 class InstrumentationParser(ABC):
@@ -82,7 +83,7 @@ class ParserV01(InstrumentationParser):
             Normalized data dictionary with cleaned strings and flattened libraries
         """
         try:
-            data = yaml.safe_load(yaml_content) or {}
+            data = yaml_io.safe_load(yaml_content) or {}
             cleaned_data = self._clean_strings(data)
             return self._flatten_libraries(cleaned_data)
         except yaml.YAMLError as e:
@@ -136,7 +137,7 @@ class ParserV02(ParserV01):
             Normalized data dictionary with cleaned strings and flattened libraries
         """
         try:
-            data = yaml.safe_load(yaml_content) or {}
+            data = yaml_io.safe_load(yaml_content) or {}
             cleaned_data = self._clean_strings(data)
             flattened_data = self._flatten_libraries(cleaned_data)
             return flattened_data
@@ -158,7 +159,7 @@ class ParserV03(ParserV02):
         - 'type' field renamed to 'data_type'
         """
         try:
-            data = yaml.safe_load(yaml_content) or {}
+            data = yaml_io.safe_load(yaml_content) or {}
             cleaned_data = self._clean_strings(data)
             flattened_data = self._flatten_libraries(cleaned_data)
             return self._normalize_metrics(flattened_data)
@@ -199,7 +200,7 @@ class ParserV05(ParserV03):
         - Flattened library list (no more nested groups)
         """
         try:
-            data = yaml.safe_load(yaml_content) or {}
+            data = yaml_io.safe_load(yaml_content) or {}
             return self._clean_strings(data)
         except yaml.YAMLError as e:
             raise ValueError(f"Error parsing instrumentation YAML: {e}") from e
@@ -286,7 +287,7 @@ def parse_instrumentation_yaml(yaml_content: str, file_format: float | None = No
     """
     if file_format is None:
         try:
-            data = yaml.safe_load(yaml_content)
+            data = yaml_io.safe_load(yaml_content)
             file_format = data.get("file_format") if data else None
         except yaml.YAMLError:
             # If auto-detection fails due to invalid YAML, fall back to the default parser below.
@@ -416,3 +416,33 @@ class TestLibraryReadme:
         # Should be able to load it using the original (unsanitized) name
         content = inventory_manager.load_library_readme_content(version, library_name, markdown_hash)
         assert content == "safe content"
+
+
+class TestVersionFingerprint:
+    def test_stable_for_same_inputs(self, inventory_manager):
+        version = Version("2.10.0")
+        inventory_manager.save_versioned_inventory(version, {"file_format": 0.1, "libraries": [{"name": "a"}]})
+        inventory_manager.save_library_readmes(version, [("a", "# A")])
+
+        assert inventory_manager.version_fingerprint(version) == inventory_manager.version_fingerprint(version)
+
+    def test_changes_with_inventory(self, inventory_manager):
+        version = Version("2.10.0")
+        inventory_manager.save_versioned_inventory(version, {"file_format": 0.1, "libraries": [{"name": "a"}]})
+        before = inventory_manager.version_fingerprint(version)
+
+        inventory_manager.save_versioned_inventory(version, {"file_format": 0.1, "libraries": [{"name": "b"}]})
+
+        assert inventory_manager.version_fingerprint(version) != before
+
+    def test_changes_with_readmes(self, inventory_manager):
+        version = Version("2.10.0")
+        inventory_manager.save_versioned_inventory(version, {"file_format": 0.1, "libraries": [{"name": "a"}]})
+        before = inventory_manager.version_fingerprint(version)
+
+        inventory_manager.save_library_readmes(version, [("a", "# A")])
+
+        assert inventory_manager.version_fingerprint(version) != before
+
+    def test_missing_version(self, inventory_manager):
+        assert len(inventory_manager.version_fingerprint(Version("9.9.9"))) == 12
@@ -18,7 +18,7 @@
 import logging
 from pathlib import Path
 
-import yaml
+from watcher_common import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +64,7 @@ class InventoryManager:
         path.parent.mkdir(parents=True, exist_ok=True)
 
         with path.open("w") as f:
-            yaml.dump(
+            yaml_io.safe_dump(
                 data,
                 f,
                 default_flow_style=False,
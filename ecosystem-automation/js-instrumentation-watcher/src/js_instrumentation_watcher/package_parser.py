@@ -21,6 +21,7 @@ import re
 from pathlib import Path
 
 import yaml
+from watcher_common import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -211,7 +212,7 @@ class PackageParser:
             return []
 
         try:
-            data = yaml.safe_load(tav_path.read_text())
+            data = yaml_io.safe_load(tav_path.read_text())
         except (yaml.YAMLError, OSError) as e:
             logger.debug("Could not parse .tav.yml for %s: %s", self.package_path.name, e)
             return []
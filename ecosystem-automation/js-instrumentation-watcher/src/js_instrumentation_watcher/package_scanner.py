@@ -20,6 +20,7 @@ import logging
 from pathlib import Path
 
 import yaml
+from watcher_common import yaml_io
 
 logger = logging.getLogger(__name__)
 
@@ -109,7 +110,7 @@ class PackageScanner:
             return {}
 
         try:
-            data = yaml.safe_load(owners_path.read_text())
+            data = yaml_io.safe_load(owners_path.read_text())
             if not isinstance(data, dict):
                 return {}
 
@@ -0,0 +1,206 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Read files at any git ref straight from a repository's object database.
+
+Checking out a tag rewrites the working tree (tens of thousands of files in
+collector-contrib) and ``git show`` costs a process per file. GitObjectReader
+instead lists a ref's files with a single ``git ls-tree -r`` and reads blobs
+through one long-lived ``git cat-file --batch`` process, so any number of refs
+can be read from one clone without touching its working tree.
+"""
+
+import hashlib
+import os
+import subprocess
+from collections.abc import Iterable
+from pathlib import Path
+from types import TracebackType
+
+from watcher_common.repository_manager import _GIT
+
+
+def decode_text(content: bytes) -> str:
+    """Decode file bytes the way ``Path.read_text(encoding="utf-8")`` would.
+
+    Text mode translates ``\\r\\n`` and ``\\r`` line endings to ``\\n``, so this does
+    too; a blob read from git then matches the same file read from a checkout.
+
+    Raises:
+        UnicodeDecodeError: If the content is not valid UTF-8
+    """
+    return content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def git_blob_id(content: bytes) -> str:
+    """The id git gives a blob of ``content``, as ``git hash-object`` would compute it."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content, usedforsecurity=False).hexdigest()
+
+
+class GitObjectReader:
+    """Reads trees and blobs of a git repository at arbitrary refs.
+
+    The ``cat-file`` process is started on the first read and kept until
+    :meth:`close`; a read after closing starts a new one. Use the reader as a
+    context manager to close it. Not thread-safe: reads share one process.
+    """
+
+    def __init__(self, repo_path: str | Path):
+        """
+        Args:
+            repo_path: Path to the git repository
+
+        Raises:
+            ValueError: If repository path does not exist
+        """
+        self.repo_path = Path(repo_path)
+        if not self.repo_path.exists():
+            raise ValueError(f"Repository path does not exist: {repo_path}")
+        self._process: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> "GitObjectReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def list_files(self, ref: str, paths: Iterable[str] = ()) -> dict[str, str]:
+        """List the files of ``ref``, recursively.
+
+        Args:
+            ref: Git ref to list (tag like ``v0.145.0``, branch like ``main``, or
+                any commit-ish)
+            paths: Repository-relative directories or files to restrict the
+                listing to. Empty lists the whole tree.
+
+        Returns:
+            Map of repository-relative POSIX path to blob id. Submodules are left out.
+
+        Raises:
+            ValueError: If ``ref`` does not exist
+        """
+        result = subprocess.run(
+            [_GIT, "ls-tree", "-r", "-z", "--full-tree", ref, "--", *paths],
+            cwd=self.repo_path,
+            check=False,
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            raise ValueError(f"Failed to list files at {ref}: {stderr}")
+
+        files: dict[str, str] = {}
+        for record in result.stdout.split(b"\0"):
+            if not record:
+                continue
+            info, path = record.split(b"\t", 1)
+            _mode, object_type, object_id = info.split(b" ")
+            if object_type == b"blob":
+                files[os.fsdecode(path)] = object_id.decode("ascii")
+        return files
+
+    def changed_files(self, from_ref: str, to_ref: str) -> list[str]:
+        """List the files that differ between two refs, like ``git diff --name-only``.
+
+        A renamed file is listed under both its old and its new path, since both
+        locations changed.
+
+        Args:
+            from_ref: The older ref
+            to_ref: The newer ref
+
+        Returns:
+            Repository-relative POSIX paths of the added, removed and modified files
+
+        Raises:
+            ValueError: If either ref does not exist
+        """
+        result = subprocess.run(
+            [_GIT, "diff-tree", "-r", "--name-only", "--no-renames", "-z", from_ref, to_ref],
+            cwd=self.repo_path,
+            check=False,
+            capture_output=True,
+        )
+        if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace").strip()
+            raise ValueError(f"Failed to diff {from_ref} against {to_ref}: {stderr}")
+        return [os.fsdecode(path) for path in result.stdout.split(b"\0") if path]
+
+    def read_blob(self, object_name: str) -> bytes | None:
+        """Return the content of a blob.
+
+        Args:
+            object_name: A blob id, or ``<ref>:<path>`` for the file at a
+                repository-relative path in ``ref``
+
+        Returns:
+            The blob's bytes, or None if the object does not exist or is not a
+            blob (e.g. ``<ref>:<path>`` names a directory)
+
+        Raises:
+            ValueError: If ``object_name`` contains a newline
+            RuntimeError: If the ``cat-file`` process exits unexpectedly
+        """
+        if "\n" in object_name:
+            raise ValueError(f"Object name must not contain a newline: {object_name!r}")
+
+        process = self._batch_process()
+        process.stdin.write(object_name.encode("utf-8") + b"\n")
+        process.stdin.flush()
+
+        header = process.stdout.readline()
+        if not header:
+            self.close()
+            raise RuntimeError(f"git cat-file exited unexpectedly in {self.repo_path}")
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+
+        _object_id, object_type, size = header.split()
+        # The content is followed by a newline, which is not part of it.
+        content = process.stdout.read(int(size) + 1)[:-1]
+        return content if object_type == b"blob" else None
+
+    def read_file(self, ref: str, rel_path: str) -> bytes | None:
+        """Return the content of ``rel_path`` at ``ref``, or None if it is absent there."""
+        return self.read_blob(f"{ref}:{rel_path}")
+
+    def read_text(self, object_name: str) -> str | None:
+        """Like :meth:`read_blob`, decoded with :func:`decode_text`."""
+        content = self.read_blob(object_name)
+        return decode_text(content) if content is not None else None
+
+    def close(self) -> None:
+        """Stop the ``cat-file`` process, if one is running."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        process.stdin.close()
+        process.stdout.close()
+        process.wait()
+
+    def _batch_process(self) -> subprocess.Popen[bytes]:
+        if self._process is None:
+            self._process = subprocess.Popen(
+                [_GIT, "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
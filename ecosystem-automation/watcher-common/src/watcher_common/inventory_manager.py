@@ -21,10 +21,11 @@ from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-import yaml
 from semantic_version import Version
 
+from . import yaml_io
 from .content_hashing import compute_content_hash
+from .yaml_cache import load_yaml_file
 
 logger = logging.getLogger(__name__)
 
@@ -190,7 +191,7 @@ class JavaagentInventoryManager(BaseInventoryManager):
         }
 
         with open(file_path, "w", encoding="utf-8") as f:
-            yaml.safe_dump(inventory_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+            yaml_io.safe_dump(inventory_data, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     def load_versioned_inventory(self, version: Version) -> dict[str, Any]:
         """
@@ -211,14 +212,40 @@ class JavaagentInventoryManager(BaseInventoryManager):
                 "libraries": [],
             }
 
-        with open(file_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = load_yaml_file(file_path) or {}
 
         if not isinstance(data, dict):
             raise ValueError(f"Inventory file for version {version} must contain a mapping")
 
         return data
 
+    def version_fingerprint(self, version: Version) -> str:
+        """
+        Fingerprint the registry inputs of a specific version.
+
+        Covers the raw bytes of the instrumentation file and the listing of
+        library_readmes/. README filenames embed their content hash, so the
+        listing alone tracks README changes without reading every file.
+        Consumers (e.g. the explorer DB builder) compare fingerprints across
+        runs to skip versions whose inputs are unchanged.
+
+        Args:
+            version: Version to fingerprint
+
+        Returns:
+            Content hash of the version's inputs
+        """
+        version_dir = self.get_version_dir(version)
+        file_path = version_dir / self.FILE_NAME
+        inventory_bytes = file_path.read_bytes() if file_path.exists() else b""
+
+        readme_dir = version_dir / self.README_DIR
+        readme_names: list[str] = []
+        if readme_dir.exists():
+            readme_names = sorted(item.name for item in readme_dir.iterdir() if item.is_file())
+
+        return compute_content_hash(inventory_bytes + b"\0" + "\n".join(readme_names).encode("utf-8"))
+
     def readme_dir_exists(self, version: Version) -> bool:
         """Return True if the library_readmes directory exists for this version."""
         return (self.get_version_dir(version) / self.README_DIR).exists()
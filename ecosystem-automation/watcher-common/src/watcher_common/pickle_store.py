@@ -0,0 +1,141 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Size-bounded on-disk store of pickled values, shared by the watchers' parse caches.
+
+Each value is a file named after its key. Writes go through a temporary file and
+``os.replace``, since concurrent builders and scans may share a store. A read
+refreshes the entry's mtime, and once the store grows past its size bound the
+least recently used entries are evicted first.
+
+Callers choose the keys (content digests, so an entry never goes stale) and what
+a miss means. Every entry is written by :meth:`PickleStore.put`, so unpickling
+them is safe. Any store failure is logged at debug level and reads as a miss.
+"""
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_ROOT = "otel-ecosystem-explorer"
+
+_ENTRY_SUFFIX = ".pickle"
+
+
+class PickleStore:
+    """A directory of pickled values, evicted least recently used first."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int):
+        """
+        Args:
+            cache_dir: Directory holding the entries (created on first write)
+            max_bytes: Total entry size above which least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def entry(self, key: str) -> Path:
+        """The file holding the value stored under key."""
+        return self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Any:
+        """
+        Return a fresh copy of the value stored under key.
+
+        Args:
+            key: Entry key, safe for use in a file name
+
+        Raises:
+            KeyError: If nothing readable is stored under key
+        """
+        entry = self.entry(key)
+        try:
+            value = pickle.loads(entry.read_bytes())  # noqa: S301 - private store, written only by put
+            os.utime(entry)  # recency for LRU eviction
+            return value
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug("Discarding unreadable cache entry %s: %s", entry, e)
+        raise KeyError(key)
+
+    def put(self, key: str, value: Any) -> bool:
+        """
+        Store value under key, atomically. Does not enforce the size bound; see :meth:`evict`.
+
+        Args:
+            key: Entry key, safe for use in a file name
+            value: Picklable value
+
+        Returns:
+            Whether the entry was written
+        """
+        entry = self.entry(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, entry)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            return True
+        except Exception as e:
+            logger.debug("Could not write cache entry %s: %s", entry, e)
+            return False
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the store fits in max_bytes."""
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for item in it:
+                    if item.is_file() and item.name.endswith(_ENTRY_SUFFIX):
+                        stat = item.stat()
+                        entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+                        total += stat.st_size
+
+            for _, size, entry_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                Path(entry_path).unlink(missing_ok=True)
+                total -= size
+        except OSError as e:
+            logger.debug("Could not evict cache entries in %s: %s", self.cache_dir, e)
+
+
+def default_store_dir(env_var: str, name: str) -> Path | None:
+    """
+    Resolve a store's directory from the environment.
+
+    Args:
+        env_var: Variable that moves the store; set to an empty string, it disables it
+        name: Directory name under ``$XDG_CACHE_HOME/otel-ecosystem-explorer`` otherwise
+
+    Returns:
+        The directory, or None if the store is disabled
+    """
+    configured = os.environ.get(env_var)
+    if configured is not None:
+        return Path(configured) if configured else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / CACHE_ROOT / name
@@ -0,0 +1,149 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""On-disk cache of parsed registry YAML.
+
+Registry inventories are large (hundreds of KB per javaagent version, several MB
+per collector version) and parsing them dominates every build and watcher run,
+while the files themselves rarely change. This cache stores the parsed structure
+as a pickle keyed by a digest of the raw file bytes, so an unchanged file is
+read, hashed and unpickled instead of parsed.
+
+Keying on content rather than path/size/mtime means invalidation is automatic
+and can never serve stale data (a same-size rewrite within the filesystem's
+timestamp granularity would fool a stat-based key). Entries live in a
+:class:`~watcher_common.pickle_store.PickleStore`, evicted least recently used first
+once the cache grows past its size bound.
+
+The cache directory defaults to ``$XDG_CACHE_HOME/otel-ecosystem-explorer/parsed-yaml``
+and can be moved with ``WATCHER_YAML_CACHE_DIR``; setting that variable to an
+empty string disables caching. Any cache failure falls back to parsing.
+
+Every load in the process is tallied (files, bytes read and parsed, cache hits
+and misses) for build profiling; see :func:`load_stats`.
+"""
+
+import hashlib
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from . import yaml_io
+from .pickle_store import PickleStore, default_store_dir
+
+CACHE_DIR_ENV_VAR = "WATCHER_YAML_CACHE_DIR"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump to invalidate every existing entry (e.g. if the parse step changes).
+_CACHE_FORMAT = b"parsed-yaml-v1"
+
+# Process-wide tallies of every load, reported by load_stats().
+_load_stats: Counter[str] = Counter()
+
+
+class ParsedYamlCache:
+    """Size-bounded, content-addressed cache of parsed YAML files."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_bytes: Total entry size above which least recently used entries are evicted
+        """
+        self.store = PickleStore(cache_dir, max_bytes)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache entries."""
+        return self.store.cache_dir
+
+    def load(self, path: str | Path) -> Any:
+        """
+        Parse a YAML file, serving the result from the cache when the file is unchanged.
+
+        Every call returns a fresh object, so callers may mutate the result.
+
+        Args:
+            path: YAML file to load
+
+        Returns:
+            The parsed document, exactly as yaml.safe_load would return it
+
+        Raises:
+            OSError: If the YAML file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        raw = Path(path).read_bytes()
+        key = self._key(raw)
+        _load_stats["yaml_files_loaded"] += 1
+        _load_stats["yaml_bytes_read"] += len(raw)
+
+        try:
+            data = self.store.get(key)
+            _load_stats["yaml_cache_hits"] += 1
+            return data
+        except KeyError:
+            pass
+
+        _load_stats["yaml_cache_misses"] += 1
+        _load_stats["yaml_bytes_parsed"] += len(raw)
+        data = yaml_io.safe_load(raw.decode("utf-8"))
+        if self.store.put(key, data):
+            self.store.evict()
+        return data
+
+    def _key(self, raw: bytes) -> str:
+        return hashlib.sha256(_CACHE_FORMAT + b"\0" + yaml.__version__.encode() + b"\0" + raw).hexdigest()
+
+
+def default_cache_dir() -> Path | None:
+    """Resolve the cache directory from the environment, or None if caching is disabled."""
+    return default_store_dir(CACHE_DIR_ENV_VAR, "parsed-yaml")
+
+
+def load_yaml_file(path: str | Path) -> Any:
+    """
+    Parse a YAML file through the default parsed-YAML cache.
+
+    Args:
+        path: YAML file to load
+
+    Returns:
+        The parsed document, exactly as yaml.safe_load would return it
+    """
+    cache_dir = default_cache_dir()
+    if cache_dir is None:
+        size = os.path.getsize(path)
+        _load_stats["yaml_files_loaded"] += 1
+        _load_stats["yaml_bytes_read"] += size
+        _load_stats["yaml_bytes_parsed"] += size
+        with open(path, encoding="utf-8") as f:
+            return yaml_io.safe_load(f)
+    return ParsedYamlCache(cache_dir).load(path)
+
+
+def load_stats() -> dict[str, int]:
+    """
+    Tallies of every YAML load made in this process so far.
+
+    Loads done in worker processes are counted there, not here.
+
+    Returns:
+        Counts keyed yaml_files_loaded, yaml_bytes_read, yaml_bytes_parsed,
+        yaml_cache_hits and yaml_cache_misses (absent keys are zero)
+    """
+    return dict(_load_stats)
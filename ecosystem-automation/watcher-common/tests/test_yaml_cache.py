@@ -0,0 +1,166 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for watcher_common.yaml_cache."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+from watcher_common.yaml_cache import CACHE_DIR_ENV_VAR, ParsedYamlCache, default_cache_dir, load_stats, load_yaml_file
+
+DOCUMENT = "libraries:\n  - name: jdbc\n    tags: [db, sql]\n    since: 2024-01-02\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParsedYamlCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    path = tmp_path / "instrumentation.yaml"
+    path.write_text(DOCUMENT, encoding="utf-8")
+    return path
+
+
+def _entries(cache):
+    return sorted(cache.cache_dir.glob("*.pickle"))
+
+
+def test_matches_safe_load(cache, yaml_file):
+    assert cache.load(yaml_file) == yaml.safe_load(DOCUMENT)
+    # Second load is served from the cache and still matches.
+    assert cache.load(yaml_file) == yaml.safe_load(DOCUMENT)
+
+
+def test_hit_skips_parsing(cache, yaml_file):
+    cache.load(yaml_file)
+
+    with patch("watcher_common.yaml_cache.yaml_io.safe_load") as mock_load:
+        cache.load(yaml_file)
+
+    mock_load.assert_not_called()
+
+
+def test_returns_fresh_objects(cache, yaml_file):
+    first = cache.load(yaml_file)
+    first["libraries"].clear()
+
+    assert cache.load(yaml_file)["libraries"][0]["name"] == "jdbc"
+
+
+def test_same_size_rewrite_is_not_stale(cache, yaml_file):
+    cache.load(yaml_file)
+    stat = yaml_file.stat()
+    yaml_file.write_text(DOCUMENT.replace("jdbc", "kafk"), encoding="utf-8")
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache.load(yaml_file)["libraries"][0]["name"] == "kafk"
+
+
+def test_identical_content_shares_an_entry(cache, yaml_file, tmp_path):
+    copy = tmp_path / "copy.yaml"
+    copy.write_bytes(yaml_file.read_bytes())
+
+    cache.load(yaml_file)
+    cache.load(copy)
+
+    assert len(_entries(cache)) == 1
+
+
+def test_corrupt_entry_is_reparsed(cache, yaml_file):
+    cache.load(yaml_file)
+    _entries(cache)[0].write_bytes(b"not a pickle")
+
+    assert cache.load(yaml_file) == yaml.safe_load(DOCUMENT)
+
+
+def test_evicts_least_recently_used(tmp_path):
+    files = []
+    for i in range(3):
+        path = tmp_path / f"f{i}.yaml"
+        path.write_text(f"value: {i}\n", encoding="utf-8")
+        files.append(path)
+
+    cache = ParsedYamlCache(tmp_path / "cache")
+    cache.load(files[0])
+    cache.load(files[1])
+    first, second = (cache.cache_dir / f"{cache._key(f.read_bytes())}.pickle" for f in files[:2])
+    # Touch the first entry more recently than the second, so the second is evicted.
+    os.utime(second, ns=(1, 1))
+    os.utime(first, ns=(2, 2))
+    cache.store.max_bytes = first.stat().st_size * 2
+
+    cache.load(files[2])
+
+    assert first.exists()
+    assert not second.exists()
+    assert len(_entries(cache)) == 2
+
+
+def test_unwritable_cache_falls_back_to_parsing(tmp_path, yaml_file):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    cache = ParsedYamlCache(blocker / "cache")
+
+    assert cache.load(yaml_file) == yaml.safe_load(DOCUMENT)
+
+
+def test_invalid_yaml_raises(cache, tmp_path):
+    path = tmp_path / "bad.yaml"
+    path.write_text("key: [unclosed\n", encoding="utf-8")
+
+    with pytest.raises(yaml.YAMLError):
+        cache.load(path)
+
+
+def test_load_stats_tally_hits_misses_and_bytes(cache, yaml_file):
+    before = load_stats()
+    cache.load(yaml_file)
+    cache.load(yaml_file)
+    after = load_stats()
+
+    def delta(key):
+        return after.get(key, 0) - before.get(key, 0)
+
+    size = len(DOCUMENT.encode("utf-8"))
+    assert delta("yaml_files_loaded") == 2
+    assert delta("yaml_bytes_read") == 2 * size
+    assert delta("yaml_bytes_parsed") == size
+    assert delta("yaml_cache_misses") == 1
+    assert delta("yaml_cache_hits") == 1
+
+
+class TestDefaultCache:
+    def test_env_var_overrides_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "custom"))
+        assert default_cache_dir() == tmp_path / "custom"
+
+    def test_empty_env_var_disables(self, tmp_path, monkeypatch, yaml_file):
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, "")
+        assert default_cache_dir() is None
+        assert load_yaml_file(yaml_file) == yaml.safe_load(DOCUMENT)
+
+    def test_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(CACHE_DIR_ENV_VAR, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "otel-ecosystem-explorer" / "parsed-yaml"
+
+    def test_load_yaml_file_uses_cache(self, tmp_path, monkeypatch, yaml_file):
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "custom"))
+
+        assert load_yaml_file(yaml_file) == yaml.safe_load(DOCUMENT)
+        assert len(list((tmp_path / "custom").glob("*.pickle"))) == 1
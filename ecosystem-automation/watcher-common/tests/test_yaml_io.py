@@ -0,0 +1,127 @@
+# Copyright The OpenTelemetry Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tests for watcher_common.yaml_io: output must match pure-Python PyYAML."""
+
+import importlib
+import io
+from pathlib import Path
+
+import pytest
+import yaml
+from watcher_common import yaml_io
+
+REGISTRY_DIR = Path(__file__).resolve().parents[3] / "ecosystem-registry"
+
+REGISTRY_DUMP_OPTIONS = {"default_flow_style": False, "sort_keys": False, "allow_unicode": True}
+
+DOCUMENTS = [
+    "",
+    "key: value\n",
+    "libraries:\n  - name: jdbc\n    tags: [db, sql]\n  - name: kafka\n",
+    "flags: [yes, no, on, off, true, false, ~, null]\n",
+    "numbers: [0o17, 017, 0x1f, 1_000, 1.5e3, .inf, -.inf, .nan]\n",
+    "when: 2024-01-02\nat: 2024-01-02T03:04:05Z\n",
+    "anchors:\n  base: &base {a: 1}\n  derived:\n    <<: *base\n    b: 2\n",
+    "text: |\n  line one\n  line two\nfolded: >\n  folded\n  text\n",
+    "quoted: \"tab\\tnewline\\n\\u00e9\"\nsingle: 'it''s'\n",
+    "unicode: héllo ✓ 日本\n",
+    "﻿bom: true\n",
+    "multi: 'ends with colon:'\nempty_map: {}\nempty_list: []\n",
+]
+
+
+def _registry_samples() -> list[Path]:
+    """The smallest YAML file of each registry ecosystem, keeping the pure-Python parse cheap."""
+    if not REGISTRY_DIR.exists():
+        return []
+    samples = []
+    for ecosystem_dir in sorted(p for p in REGISTRY_DIR.iterdir() if p.is_dir()):
+        files = sorted(ecosystem_dir.rglob("*.yaml"), key=lambda p: (p.stat().st_size, str(p)))
+        if files:
+            samples.append(files[0])
+    return samples
+
+
+class TestSafeLoad:
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_matches_pure_python(self, document):
+        expected = yaml.load(document, Loader=yaml.SafeLoader)  # noqa: S506
+        result = yaml_io.safe_load(document)
+
+        # repr, not ==, so that .nan and type differences (int vs bool, date vs str) count.
+        assert repr(result) == repr(expected)
+
+    def test_accepts_streams_and_bytes(self):
+        document = "a: [1, 2]\n"
+        assert yaml_io.safe_load(io.StringIO(document)) == {"a": [1, 2]}
+        assert yaml_io.safe_load(document.encode("utf-8")) == {"a": [1, 2]}
+
+    def test_invalid_yaml_raises_yaml_error(self):
+        with pytest.raises(yaml.YAMLError):
+            yaml_io.safe_load("key: [unclosed\n")
+
+    def test_rejects_python_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            yaml_io.safe_load("!!python/object/apply:os.system ['true']\n")
+
+    @pytest.mark.parametrize("path", _registry_samples(), ids=lambda p: str(p.relative_to(REGISTRY_DIR)))
+    def test_registry_files_match_pure_python(self, path):
+        text = path.read_text(encoding="utf-8")
+        assert yaml_io.safe_load(text) == yaml.load(text, Loader=yaml.SafeLoader)  # noqa: S506
+
+
+class TestSafeDump:
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_matches_yaml_safe_dump(self, document):
+        data = yaml.safe_load(document)
+        assert yaml_io.safe_dump(data, **REGISTRY_DUMP_OPTIONS) == yaml.safe_dump(data, **REGISTRY_DUMP_OPTIONS)
+
+    def test_long_double_quoted_scalars_fold_like_pure_python(self):
+        # libyaml's emitter folds these differently; committed registry files depend on this layout.
+        data = {"description": "first line\n" + " ".join(["word"] * 40) + "\n  - bullet\n"}
+        assert yaml_io.safe_dump(data, **REGISTRY_DUMP_OPTIONS) == yaml.safe_dump(data, **REGISTRY_DUMP_OPTIONS)
+
+    def test_writes_to_stream(self):
+        stream = io.StringIO()
+        assert yaml_io.safe_dump({"a": 1}, stream) is None
+        assert stream.getvalue() == "a: 1\n"
+
+    @pytest.mark.parametrize("path", _registry_samples(), ids=lambda p: str(p.relative_to(REGISTRY_DIR)))
+    def test_registry_data_matches_pure_python(self, path):
+        data = yaml_io.safe_load(path.read_text(encoding="utf-8"))
+        assert yaml_io.safe_dump(data, **REGISTRY_DUMP_OPTIONS) == yaml.safe_dump(data, **REGISTRY_DUMP_OPTIONS)
+
+
+class TestFallback:
+    @pytest.fixture
+    def pure_python_yaml_io(self, monkeypatch):
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        yield importlib.reload(yaml_io)
+        monkeypatch.undo()
+        importlib.reload(yaml_io)
+
+    def test_uses_pure_python_loader_without_libyaml(self, pure_python_yaml_io):
+        assert pure_python_yaml_io.HAS_LIBYAML is False
+        assert pure_python_yaml_io.SafeLoader is yaml.SafeLoader
+
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_fallback_matches(self, pure_python_yaml_io, document):
+        assert repr(pure_python_yaml_io.safe_load(document)) == repr(yaml.safe_load(document))
+
+    def test_uses_libyaml_when_available(self):
+        if not getattr(yaml, "__with_libyaml__", False):
+            pytest.skip("PyYAML built without libyaml")
+        assert yaml_io.HAS_LIBYAML is True
+        assert yaml_io.SafeLoader is yaml.CSafeLoader